@@ -26,6 +26,7 @@ from src.streamlit_app.screens import (
     show_upload_screen,
 )
 from src.streamlit_app.screens.execution import reset_execution_state
+from src.validation import start_validator_warmup
 
 # Page configuration - must be first Streamlit command
 st.set_page_config(
@@ -38,6 +39,9 @@ st.set_page_config(
 # Initialize session state
 init_session_state()
 
+# Compile schema validators in the background (once per server process)
+start_validator_warmup()
+
 
 def main():
     """Main application entry point."""
@@ -0,0 +1,13 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Pipeline benchmark suite.
+
+Times every pipeline stage against a fixed corpus of recorded LLM responses
+(see src/llm/replay_provider.py) plus fixture-driven component stages, and
+gates regressions against a saved baseline. Run with:
+
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+"""
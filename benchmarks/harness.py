@@ -0,0 +1,274 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Timing, statistics and baseline comparison for the benchmark suite.
+
+Kept free of pipeline imports so results can be compared without the full
+dependency set. A results file looks like:
+
+    {
+        "format_version": 1,
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "environment": {"python": "3.11.9", "platform": "Linux-..."},
+        "config": {"repeat": 5, "warmup": 1, ...},
+        "stages": {
+            "pipeline.extraction": {"status": "ok", "n": 5, "p50_s": 0.12, "p95_s": 0.15, ...},
+            "render_report_with_weasyprint": {"status": "skipped", "reason": "..."}
+        }
+    }
+
+Stages are compared on one metric (p50 by default). A stage regresses when it
+is more than max_regression_pct slower than the baseline and the absolute
+difference exceeds a small noise floor, so millisecond-scale stages do not
+fail the gate on timer jitter.
+"""
+
+import json
+import math
+import platform
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULTS_FORMAT_VERSION = 1
+
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+METRICS = ("p50_s", "p95_s", "mean_s")
+
+# Differences below this many seconds never count as regressions
+DEFAULT_MIN_DELTA_S = 0.005
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """
+    Percentile with linear interpolation between closest ranks (numpy's default).
+
+    Args:
+        samples: Non-empty list of measurements
+        pct: Percentile in [0, 100]
+
+    Raises:
+        ValueError: If samples is empty or pct is out of range
+    """
+    if not samples:
+        raise ValueError("percentile() requires at least one sample")
+    if not 0 <= pct <= 100:
+        raise ValueError(f"Percentile must be within [0, 100], got {pct}")
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(samples: list[float]) -> dict[str, float | int]:
+    """Return n, mean, p50, p95, min and max (seconds) for a list of timings."""
+    return {
+        "n": len(samples),
+        "mean_s": sum(samples) / len(samples),
+        "p50_s": percentile(samples, 50),
+        "p95_s": percentile(samples, 95),
+        "min_s": min(samples),
+        "max_s": max(samples),
+    }
+
+
+@dataclass
+class StageResult:
+    """
+    Timings of one benchmark stage.
+
+    Attributes:
+        name: Stage name, e.g. "pipeline.extraction" or "repair_schema_violations"
+        samples: Wall-clock seconds per measured run
+        status: "ok", "skipped" (dependency or corpus missing) or "error"
+        reason: Why the stage was skipped or failed
+        params: Stage variant details worth keeping with the numbers (e.g. compile mode)
+    """
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    status: str = STATUS_OK
+    reason: str | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def skipped(cls, name: str, reason: str, **params: Any) -> "StageResult":
+        return cls(name, status=STATUS_SKIPPED, reason=reason, params=params)
+
+    @classmethod
+    def failed(cls, name: str, error: BaseException, **params: Any) -> "StageResult":
+        return cls(
+            name, status=STATUS_ERROR, reason=f"{type(error).__name__}: {error}", params=params
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"status": self.status}
+        if self.reason:
+            data["reason"] = self.reason
+        if self.params:
+            data["params"] = self.params
+        if self.status == STATUS_OK and self.samples:
+            data.update(summarize(self.samples))
+            data["samples_s"] = self.samples
+        return data
+
+
+def time_call(
+    fn: Callable[..., Any],
+    repeat: int,
+    warmup: int = 0,
+    setup: Callable[[], tuple] | None = None,
+) -> list[float]:
+    """
+    Time fn() repeat times after warmup unmeasured runs.
+
+    Args:
+        fn: Callable to measure
+        repeat: Number of measured runs
+        warmup: Number of unmeasured runs first (imports, caches, font loading)
+        setup: Optional untimed callable returning fn's positional arguments for each
+            run, e.g. a fresh deep copy of an input that fn mutates
+
+    Returns:
+        Wall-clock seconds of each measured run
+    """
+    samples = []
+    for run in range(warmup + repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - start
+        if run >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def build_results(stages: list[StageResult], config: dict[str, Any]) -> dict[str, Any]:
+    """Assemble the JSON results document for a benchmark run."""
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "config": config,
+        "stages": {stage.name: stage.to_dict() for stage in stages},
+    }
+
+
+def write_results(results: dict[str, Any], path: Path) -> Path:
+    """Write a results document as indented JSON, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """
+    Load a results (or baseline) document.
+
+    Raises:
+        ValueError: If the file is not a benchmark results document of a known format
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("format_version") != RESULTS_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} is not a benchmark results file (format_version {RESULTS_FORMAT_VERSION})"
+        )
+    return data
+
+
+@dataclass(frozen=True)
+class StageComparison:
+    """
+    One stage compared against the baseline.
+
+    Attributes:
+        stage: Stage name
+        baseline_s: Baseline metric value (None if not comparable)
+        current_s: Current metric value (None if not comparable)
+        change_pct: Relative change in percent (positive = slower)
+        regressed: True if the change exceeds the allowed regression
+        note: Why the stage was not compared, if it was not
+    """
+
+    stage: str
+    baseline_s: float | None = None
+    current_s: float | None = None
+    change_pct: float | None = None
+    regressed: bool = False
+    note: str | None = None
+
+
+def compare_to_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    max_regression_pct: float,
+    metric: str = "p50_s",
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> list[StageComparison]:
+    """
+    Compare every stage of a results document with a baseline document.
+
+    Stages that were skipped or failed on either side, or that exist on only one
+    side, are listed with a note and never count as regressions; a failed stage
+    is reported by the runner on its own.
+
+    Args:
+        current: Results of this run
+        baseline: Saved baseline results
+        max_regression_pct: Allowed slowdown in percent before a stage regresses
+        metric: Statistic to compare ("p50_s", "p95_s" or "mean_s")
+        min_delta_s: Absolute slowdown (seconds) that must also be exceeded
+
+    Returns:
+        One comparison per stage, in current-run order followed by baseline-only stages
+
+    Raises:
+        ValueError: If metric is unknown
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}. Supported: {list(METRICS)}")
+
+    current_stages = current.get("stages", {})
+    baseline_stages = baseline.get("stages", {})
+    comparisons = []
+
+    for name, stage in current_stages.items():
+        base = baseline_stages.get(name)
+        if base is None:
+            comparisons.append(StageComparison(name, note="not in baseline"))
+            continue
+        if stage.get("status") != STATUS_OK or metric not in stage:
+            comparisons.append(StageComparison(name, note=f"{stage.get('status')} in this run"))
+            continue
+        if base.get("status") != STATUS_OK or metric not in base:
+            comparisons.append(StageComparison(name, note=f"{base.get('status')} in baseline"))
+            continue
+        if base.get("params", {}) != stage.get("params", {}):
+            comparisons.append(StageComparison(name, note="stage parameters differ"))
+            continue
+
+        baseline_s = base[metric]
+        current_s = stage[metric]
+        delta = current_s - baseline_s
+        change_pct = delta / baseline_s * 100 if baseline_s > 0 else 0.0
+        regressed = change_pct > max_regression_pct and delta > min_delta_s
+        comparisons.append(StageComparison(name, baseline_s, current_s, change_pct, regressed))
+
+    for name in baseline_stages:
+        if name not in current_stages:
+            comparisons.append(StageComparison(name, note="missing from this run"))
+
+    return comparisons
@@ -0,0 +1,101 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Cold import time of the pipeline entry points.
+
+Each sample imports one module in a fresh interpreter with `python -X importtime`
+and takes the module's cumulative import time from that report, so interpreter
+startup and process spawn are excluded. Short-lived workers and CLI calls such
+as `run_pipeline.py --help` pay this on every start.
+
+    import.src.config            Settings only
+    import.src.llm               Provider layer (SDKs are deferred, see src/lazy_import.py)
+    import.src.pipeline          Package facade (submodules load on first use)
+    import.src.pipeline.orchestrator   Everything a full run imports up front
+    import.run_pipeline          CLI entry point
+
+Like harness.py this module imports nothing from src, so the measured imports
+are always cold.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from .harness import StageResult
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_TARGETS = (
+    "src.config",
+    "src.llm",
+    "src.pipeline",
+    "src.pipeline.orchestrator",
+    "run_pipeline",
+)
+
+# Heavy optional dependencies that must only load on first use
+DEFERRED_MODULES = ("openai", "anthropic", "jsonschema", "pypdf", "matplotlib", "weasyprint")
+
+_PROBE = "import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+
+
+def measure_import(module: str) -> tuple[float, list[str]]:
+    """
+    Import module in a fresh interpreter.
+
+    Returns:
+        (cumulative import time in seconds, names of all modules loaded afterwards)
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        last_line = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        raise RuntimeError(f"import {module} failed: {last_line}")
+
+    # Lines look like "import time:   self [us] | cumulative | <indent>name"; the
+    # requested module is the last unindented entry with its name
+    cumulative_us = None
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if name.rstrip() == f" {module}":
+            cumulative_us = int(cumulative)
+    if cumulative_us is None:
+        raise RuntimeError(f"import {module} missing from the -X importtime report")
+    return cumulative_us / 1_000_000, json.loads(completed.stdout)
+
+
+def deferred_modules_loaded(loaded: list[str]) -> list[str]:
+    """Return the DEFERRED_MODULES present in a list of loaded module names."""
+    return [name for name in DEFERRED_MODULES if name in loaded]
+
+
+def bench_imports(repeat: int, warmup: int) -> list[StageResult]:
+    """Time the cold import of every IMPORT_TARGETS module."""
+    stages = []
+    for module in IMPORT_TARGETS:
+        name = f"import.{module}"
+        samples = []
+        try:
+            for run in range(warmup + repeat):
+                seconds, _ = measure_import(module)
+                if run >= warmup:
+                    samples.append(seconds)
+        except Exception as e:
+            stages.append(StageResult.failed(name, e))
+            continue
+        stages.append(StageResult(name, samples))
+    return stages
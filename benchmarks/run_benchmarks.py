@@ -0,0 +1,362 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Benchmark runner with baseline regression gating.
+
+Usage:
+    # Record the corpus once (real API calls): every *.pdf in benchmarks/corpus
+    python -m benchmarks.run_benchmarks --record --record-provider openai --max-pages 10
+
+    # Save a baseline on the reference machine, then gate later runs against it
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json --update-baseline
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json --max-regression 15
+
+Exit codes:
+    0  All stages ran (or were skipped) and none regressed
+    1  A stage regressed beyond --max-regression or failed
+    2  Invalid arguments, corpus or baseline file
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from .harness import (
+    DEFAULT_MIN_DELTA_S,
+    STATUS_ERROR,
+    STATUS_OK,
+    StageComparison,
+    StageResult,
+    build_results,
+    compare_to_baseline,
+    load_results,
+    write_results,
+)
+from .import_time import bench_imports
+
+console = Console()
+
+BENCHMARKS_DIR = Path(__file__).parent
+DEFAULT_OUTPUT = BENCHMARKS_DIR / "results" / "latest.json"
+
+STAGE_GROUPS = (
+    "pipeline",
+    "dual_validation",
+    "schema_repair",
+    "latex",
+    "weasyprint",
+    "imports",
+)
+
+
+def _configure_replay(args: argparse.Namespace) -> None:
+    """Point the replay provider at the corpus; must run before src.config is imported."""
+    os.environ["LLM_REPLAY_DIR"] = str((args.corpus / "replay").resolve())
+    os.environ["LLM_REPLAY_MODE"] = "record" if args.record else "replay"
+    os.environ["LLM_REPLAY_LATENCY_SCALE"] = str(args.latency_scale)
+    if args.record:
+        os.environ["LLM_REPLAY_RECORD_PROVIDER"] = args.record_provider
+        # Recorded latencies must be real API latencies, not cache hits
+        os.environ["LLM_RESPONSE_CACHE"] = "false"
+
+
+def _record(args: argparse.Namespace) -> int:
+    """Run the corpus stages once against a real provider, saving every response."""
+    from .stages import MANIFEST_NAME, bench_dual_validation, bench_pipeline
+
+    pdf_paths = sorted(args.corpus.glob("*.pdf"))
+    if not pdf_paths:
+        console.print(f"[red]❌ No PDFs found in {args.corpus}[/red]")
+        return 2
+
+    console.print(
+        f"[bold]Recording {len(pdf_paths)} paper(s) with {args.record_provider}...[/bold]"
+    )
+    stages, results = bench_pipeline(
+        pdf_paths, args.max_pages, repeat=1, warmup=0, max_parallel_steps=args.parallel_steps
+    )
+    stages.append(bench_dual_validation(results, args.max_pages, repeat=1, warmup=0))
+    failed = [stage for stage in stages if stage.status == STATUS_ERROR]
+    for stage in failed:
+        console.print(f"[red]❌ {stage.name}: {stage.reason}[/red]")
+    if failed:
+        return 1
+
+    manifest = {
+        "papers": [path.name for path in pdf_paths],
+        "max_pages": args.max_pages,
+        "recorded_with": args.record_provider,
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    (args.corpus / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
+    console.print(f"[green]✅ Recorded corpus: {args.corpus / MANIFEST_NAME}[/green]")
+    return 0
+
+
+def _run_stages(args: argparse.Namespace) -> tuple[list[StageResult], dict[str, Any]]:
+    """Run the selected stage groups; returns stage results and the run config."""
+    from .stages import (
+        bench_dual_validation,
+        bench_latex,
+        bench_pipeline,
+        bench_schema_repair,
+        bench_weasyprint,
+        load_corpus,
+    )
+
+    groups = set(args.only or STAGE_GROUPS)
+    stages: list[StageResult] = []
+    config: dict[str, Any] = {
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "groups": sorted(groups),
+        "latency_scale": args.latency_scale,
+        "parallel_steps": args.parallel_steps,
+    }
+
+    if groups & {"pipeline", "dual_validation"}:
+        corpus = load_corpus(args.corpus)
+        if corpus is None:
+            reason = f"no recorded corpus in {args.corpus} (run with --record first)"
+            if "pipeline" in groups:
+                stages.append(StageResult.skipped("pipeline.total", reason))
+            if "dual_validation" in groups:
+                stages.append(StageResult.skipped("run_dual_validation", reason))
+        else:
+            pdf_paths, manifest = corpus
+            config["corpus"] = manifest
+            console.print(f"[dim]Replaying {len(pdf_paths)} corpus paper(s)...[/dim]")
+            pipeline_stages, pipeline_results = bench_pipeline(
+                pdf_paths,
+                manifest.get("max_pages"),
+                args.repeat,
+                args.warmup,
+                max_parallel_steps=args.parallel_steps,
+                verbose=args.verbose,
+            )
+            if "pipeline" in groups:
+                stages.extend(pipeline_stages)
+            if "dual_validation" in groups:
+                stages.append(
+                    bench_dual_validation(
+                        pipeline_results, manifest.get("max_pages"), args.repeat, args.warmup
+                    )
+                )
+
+    if "schema_repair" in groups:
+        stages.append(bench_schema_repair(args.repeat, args.warmup))
+    if "latex" in groups:
+        stages.append(bench_latex(args.repeat, args.warmup))
+    if "weasyprint" in groups:
+        stages.append(bench_weasyprint(args.repeat, args.warmup))
+    if "imports" in groups:
+        stages.extend(bench_imports(args.repeat, args.warmup))
+    return stages, config
+
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+
+def _print_summary(
+    results: dict[str, Any], comparisons: dict[str, StageComparison], metric: str
+) -> None:
+    table = Table(title="Benchmark results", show_lines=False)
+    table.add_column("Stage", style="cyan", no_wrap=True)
+    table.add_column("Status")
+    table.add_column("n", justify="right")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column(f"Baseline {metric[:-2]} ms", justify="right")
+    table.add_column("Change", justify="right")
+
+    for name, stage in results["stages"].items():
+        status = stage["status"]
+        if status == STATUS_OK:
+            status_text = "[green]ok[/green]"
+        elif status == STATUS_ERROR:
+            status_text = "[red]error[/red]"
+        else:
+            status_text = f"[yellow]{status}[/yellow]"
+
+        comparison = comparisons.get(name)
+        baseline_text, change_text = "-", "-"
+        if comparison is not None:
+            baseline_text = _ms(comparison.baseline_s)
+            if comparison.change_pct is not None:
+                color = "red" if comparison.regressed else "green"
+                change_text = f"[{color}]{comparison.change_pct:+.1f}%[/{color}]"
+            elif comparison.note:
+                change_text = f"[dim]{comparison.note}[/dim]"
+
+        table.add_row(
+            name,
+            status_text,
+            str(stage.get("n", "-")),
+            _ms(stage.get("p50_s")),
+            _ms(stage.get("p95_s")),
+            baseline_text,
+            change_text,
+        )
+    console.print(table)
+
+    for name, stage in results["stages"].items():
+        if stage["status"] != STATUS_OK and stage.get("reason"):
+            console.print(f"[dim]{name}: {stage['reason']}[/dim]")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entrypoint; returns the process exit code."""
+    parser = argparse.ArgumentParser(
+        description="Time pipeline stages on a recorded corpus and gate regressions "
+        "against a baseline.",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=BENCHMARKS_DIR / "corpus",
+        help="Corpus directory with PDFs, corpus.json and replay/ (default: benchmarks/corpus)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Measured runs per stage (default: 5)"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Unmeasured runs before measuring (default: 1)"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=STAGE_GROUPS,
+        default=None,
+        help="Run only these stage groups (default: all)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="Results JSON path (default: benchmarks/results/latest.json)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=None, help="Baseline results JSON to compare against"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write this run's results to --baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="Allowed slowdown per stage in percent before failing (default: 10)",
+    )
+    parser.add_argument(
+        "--metric",
+        choices=["p50", "p95", "mean"],
+        default="p50",
+        help="Statistic compared against the baseline (default: p50)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=DEFAULT_MIN_DELTA_S * 1000,
+        help="Slowdowns smaller than this never fail the gate (default: 5)",
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=0.0,
+        help="Replay recorded LLM latency scaled by this factor (default: 0 = instant)",
+    )
+    parser.add_argument(
+        "--parallel-steps",
+        type=int,
+        default=1,
+        help="max_parallel_steps for run_full_pipeline (default: 1, sequential step timings)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Record the corpus with a real provider instead of benchmarking",
+    )
+    parser.add_argument(
+        "--record-provider",
+        choices=["openai", "claude"],
+        default="openai",
+        help="Provider used by --record (default: openai)",
+    )
+    parser.add_argument(
+        "--max-pages", type=int, default=None, help="Page limit used by --record (default: all)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show pipeline console output")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be >= 1 and --warmup >= 0")
+    if args.update_baseline and args.baseline is None:
+        parser.error("--update-baseline requires --baseline")
+
+    _configure_replay(args)
+    if args.record:
+        return _record(args)
+
+    baseline = None
+    if args.baseline is not None and not args.update_baseline:
+        try:
+            baseline = load_results(args.baseline)
+        except (OSError, ValueError) as e:
+            console.print(f"[red]❌ Cannot read baseline: {e}[/red]")
+            return 2
+
+    try:
+        stages, config = _run_stages(args)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return 2
+
+    results = build_results(stages, config)
+    write_results(results, args.output)
+    if args.update_baseline:
+        write_results(results, args.baseline)
+        console.print(f"[green]✅ Baseline saved: {args.baseline}[/green]")
+
+    metric = f"{args.metric}_s"
+    comparisons: dict[str, StageComparison] = {}
+    if baseline is not None:
+        for comparison in compare_to_baseline(
+            results, baseline, args.max_regression, metric, args.min_delta_ms / 1000
+        ):
+            comparisons[comparison.stage] = comparison
+
+    _print_summary(results, comparisons, metric)
+    console.print(f"[dim]Results written to {args.output}[/dim]")
+
+    exit_code = 0
+    errors = [stage.name for stage in stages if stage.status == STATUS_ERROR]
+    if errors:
+        console.print(f"[red]❌ Stages failed: {', '.join(errors)}[/red]")
+        exit_code = 1
+    regressed = [c.stage for c in comparisons.values() if c.regressed]
+    if regressed:
+        console.print(
+            f"[red]❌ Regression above {args.max_regression:g}% ({args.metric}): "
+            f"{', '.join(regressed)}[/red]"
+        )
+        exit_code = 1
+    elif baseline is not None:
+        console.print(f"[green]✅ No stage regressed more than {args.max_regression:g}%[/green]")
+    return exit_code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Benchmark stages.
+
+Two kinds of stages are measured:
+
+    - Corpus stages replay a recorded corpus through the real pipeline with the
+      replay provider (LLM_PROVIDER=replay), so they time everything except the
+      LLM itself: prompt assembly, schema validation, repair, file writes and
+      rendering inside the steps.
+        pipeline.<step>      Each run_full_pipeline step, classification → podcast
+        pipeline.total       Whole run_full_pipeline call
+        run_dual_validation  Schema + (replayed) LLM validation of the raw extraction
+    - Fixture stages run on the committed inputs in benchmarks/fixtures and need
+      no corpus:
+        repair_schema_violations        Repair of a flawed interventional_trial extraction
+        render_report_to_pdf            LaTeX rendering with figures (compiled only if an
+                                        engine is installed; see the stage params)
+        render_report_with_weasyprint   HTML → PDF rendering
+
+Stages whose dependencies are missing (no corpus, WeasyPrint not importable)
+are reported as skipped rather than failing the run.
+
+The replay provider reads its settings at import time, so import this module
+only after LLM_REPLAY_* is set (benchmarks/run_benchmarks.py does this).
+"""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, redirect_stdout
+from copy import deepcopy
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from rich.console import Console
+
+from src.config import llm_settings
+from src.llm import get_llm_provider, get_replay_store
+from src.pipeline.orchestrator import ALL_PIPELINE_STEPS, run_full_pipeline
+from src.pipeline.schema_repair import repair_schema_violations
+from src.pipeline.validation_runner import run_dual_validation
+from src.rendering.latex_renderer import render_report_to_pdf
+from src.rendering.weasy_renderer import (
+    WeasyRendererError,
+    _import_weasyprint,
+    render_report_with_weasyprint,
+)
+from src.schemas_loader import load_schema
+
+from .harness import StageResult, time_call
+
+BENCHMARKS_DIR = Path(__file__).parent
+FIXTURES_DIR = BENCHMARKS_DIR / "fixtures"
+DEFAULT_CORPUS_DIR = BENCHMARKS_DIR / "corpus"
+
+# Corpus layout: <corpus>/corpus.json lists the papers; recordings live in <corpus>/replay
+MANIFEST_NAME = "corpus.json"
+REPLAY_DIR_NAME = "replay"
+
+# Publication type of benchmarks/fixtures/extraction.json
+FIXTURE_PUBLICATION_TYPE = "interventional_trial"
+
+LATEX_ENGINE = "xelatex"
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Load benchmarks/fixtures/<name>.json."""
+    return json.loads((FIXTURES_DIR / f"{name}.json").read_text(encoding="utf-8"))
+
+
+def load_corpus(corpus_dir: Path) -> tuple[list[Path], dict[str, Any]] | None:
+    """
+    Read a recorded corpus.
+
+    Returns:
+        (PDF paths, manifest), or None if corpus_dir has no manifest yet
+
+    Raises:
+        FileNotFoundError: If the manifest lists a PDF that is missing
+    """
+    manifest_path = corpus_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    pdf_paths = [corpus_dir / name for name in manifest.get("papers", [])]
+    missing = [str(path) for path in pdf_paths if not path.exists()]
+    if missing:
+        raise FileNotFoundError(f"Corpus PDFs listed in {manifest_path} are missing: {missing}")
+    return pdf_paths, manifest
+
+
+@contextmanager
+def _working_directory(path: Path) -> Iterator[None]:
+    # PipelineFileManager writes to ./tmp; keep benchmark artifacts out of the repo
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+@contextmanager
+def _quiet(verbose: bool) -> Iterator[None]:
+    """Swallow pipeline console output unless verbose (rich writes to sys.stdout)."""
+    if verbose:
+        yield
+        return
+    with redirect_stdout(io.StringIO()):
+        yield
+
+
+def _reset_replay() -> None:
+    """Serve every fingerprint from its first recorded response again."""
+    get_replay_store(llm_settings).reset()
+
+
+def _step_timer() -> tuple[Callable[[str, str, dict], None], dict[str, float]]:
+    """Progress callback recording each step's starting → completed duration."""
+    started: dict[str, float] = {}
+    durations: dict[str, float] = {}
+
+    def on_progress(step: str, status: str, data: dict) -> None:
+        if status == "starting":
+            started[step] = perf_counter()
+        elif status == "completed" and step in started:
+            durations[step] = perf_counter() - started[step]
+
+    return on_progress, durations
+
+
+def bench_pipeline(
+    pdf_paths: list[Path],
+    max_pages: int | None,
+    repeat: int,
+    warmup: int,
+    max_parallel_steps: int = 1,
+    verbose: bool = False,
+) -> tuple[list[StageResult], dict[Path, dict[str, Any]]]:
+    """
+    Time run_full_pipeline and each of its steps over the corpus.
+
+    Step durations are taken from the progress callback's "starting" and
+    "completed" events. Report PDFs are not compiled here (render_report_to_pdf
+    is measured as its own stage); figures and the .tex output still are.
+
+    Args:
+        pdf_paths: Corpus PDFs
+        max_pages: Page limit used when the corpus was recorded
+        repeat: Measured runs per paper
+        warmup: Unmeasured runs per paper
+        max_parallel_steps: Passed to run_full_pipeline (1 keeps step timings independent)
+        verbose: Show pipeline console output
+
+    Returns:
+        (stage results, pipeline results of the last run per paper)
+    """
+    samples: dict[str, list[float]] = {step: [] for step in ALL_PIPELINE_STEPS}
+    totals: list[float] = []
+    last_results: dict[Path, dict[str, Any]] = {}
+
+    try:
+        for pdf_path in pdf_paths:
+            for run in range(warmup + repeat):
+                on_progress, durations = _step_timer()
+                _reset_replay()
+                with tempfile.TemporaryDirectory() as workdir, _working_directory(Path(workdir)):
+                    with _quiet(verbose):
+                        start = perf_counter()
+                        results = run_full_pipeline(
+                            pdf_path=pdf_path.resolve(),
+                            max_pages=max_pages,
+                            llm_provider="replay",
+                            report_compile_pdf=False,
+                            progress_callback=on_progress,
+                            max_parallel_steps=max_parallel_steps,
+                        )
+                        total = perf_counter() - start
+
+                last_results[pdf_path] = results
+                if run < warmup:
+                    continue
+                totals.append(total)
+                for step, duration in durations.items():
+                    if step in samples:
+                        samples[step].append(duration)
+    except Exception as e:
+        return [StageResult.failed("pipeline.total", e)], last_results
+
+    stages = []
+    for step, step_samples in samples.items():
+        name = f"pipeline.{step}"
+        if step_samples:
+            stages.append(StageResult(name, step_samples))
+        else:
+            stages.append(StageResult.skipped(name, "step did not complete in the replayed runs"))
+    stages.append(StageResult("pipeline.total", totals))
+    return stages, last_results
+
+
+def bench_dual_validation(
+    pipeline_results: dict[Path, dict[str, Any]],
+    max_pages: int | None,
+    repeat: int,
+    warmup: int,
+) -> StageResult:
+    """
+    Time run_dual_validation on each paper's first extraction with the replay provider.
+
+    Args:
+        pipeline_results: Output of bench_pipeline(), per corpus PDF
+        max_pages: Page limit used when the corpus was recorded
+        repeat: Measured runs per paper
+        warmup: Unmeasured runs per paper
+    """
+    name = "run_dual_validation"
+    inputs = [
+        (pdf_path, results["extraction"], results["classification"]["publication_type"])
+        for pdf_path, results in pipeline_results.items()
+        if "extraction" in results and "classification" in results
+    ]
+    if not inputs:
+        return StageResult.skipped(name, "no replayed extraction available")
+
+    llm = get_llm_provider("replay")
+    console = Console(quiet=True)
+    samples = []
+    try:
+        for pdf_path, extraction, publication_type in inputs:
+            _reset_replay()
+            samples.extend(
+                time_call(
+                    lambda pdf=pdf_path, data=extraction, pub=publication_type: run_dual_validation(
+                        data, pdf, max_pages, pub, llm, console
+                    ),
+                    repeat,
+                    warmup,
+                )
+            )
+    except Exception as e:
+        return StageResult.failed(name, e)
+    return StageResult(name, samples)
+
+
+def bench_schema_repair(repeat: int, warmup: int) -> StageResult:
+    """Time repair_schema_violations on the flawed fixture extraction."""
+    name = "repair_schema_violations"
+    try:
+        data = load_fixture("extraction")
+        schema = load_schema(FIXTURE_PUBLICATION_TYPE)
+        samples = time_call(
+            lambda: repair_schema_violations(data, schema, original=data), repeat, warmup
+        )
+    except Exception as e:
+        return StageResult.failed(name, e)
+    return StageResult(name, samples, params={"publication_type": FIXTURE_PUBLICATION_TYPE})
+
+
+def _time_render(render: Any, report: dict[str, Any], repeat: int, warmup: int) -> list[float]:
+    """Time render(report, output_dir) with a fresh report copy and output dir per run."""
+    with tempfile.TemporaryDirectory() as workdir:
+        runs = iter(range(warmup + repeat))
+
+        def setup() -> tuple:
+            return deepcopy(report), Path(workdir) / f"run{next(runs)}"
+
+        return time_call(render, repeat, warmup, setup=setup)
+
+
+def bench_latex(repeat: int, warmup: int, engine: str = LATEX_ENGINE) -> StageResult:
+    """
+    Time render_report_to_pdf on the fixture report.
+
+    Without the LaTeX engine on PATH only .tex generation and figures are
+    measured; params["compile_pdf"] records which variant ran so baselines of
+    different variants are never compared.
+    """
+    name = "render_report_to_pdf"
+    compile_pdf = shutil.which(engine) is not None
+    params = {"engine": engine, "compile_pdf": compile_pdf}
+    try:
+        report = load_fixture("report")
+        samples = _time_render(
+            lambda data, out: render_report_to_pdf(
+                data, out, engine=engine, compile_pdf=compile_pdf
+            ),
+            report,
+            repeat,
+            warmup,
+        )
+    except Exception as e:
+        return StageResult.failed(name, e, **params)
+    return StageResult(name, samples, params=params)
+
+
+def bench_weasyprint(repeat: int, warmup: int) -> StageResult:
+    """Time render_report_with_weasyprint on the fixture report, if WeasyPrint imports."""
+    name = "render_report_with_weasyprint"
+    try:
+        _import_weasyprint()
+    except WeasyRendererError as e:
+        cause = f" ({e.__cause__})" if e.__cause__ else ""
+        return StageResult.skipped(name, f"{e}{cause}")
+    try:
+        samples = _time_render(
+            render_report_with_weasyprint, load_fixture("report"), repeat, warmup
+        )
+    except Exception as e:
+        return StageResult.failed(name, e)
+    return StageResult(name, samples)
@@ -67,8 +67,11 @@ from rich.table import Table
 
 # Import pipeline functionality
 try:
-    from src.pipeline import run_full_pipeline, run_single_step
+    from src.config import llm_settings
+    from src.llm import get_file_registry, get_response_cache
+    from src.pipeline import run_batch, run_full_pipeline, run_single_step, start_pipeline_trace
     from src.pipeline.file_manager import PipelineFileManager
+    from src.validation import start_validator_warmup
 
     HAVE_LLM_SUPPORT = True
 except ImportError as e:
@@ -84,6 +87,110 @@ console = Console()
 BREAKPOINT_AFTER_STEP = None  # Change this to move breakpoint
 
 
+def print_time_breakdown(trace_summary: dict, trace_path: Path | None = None) -> None:
+    """Print per-step time, LLM calls, tokens and cost from a run's tracer.summary()."""
+    table = Table(title="Where the time went", box=box.ROUNDED)
+    table.add_column("Step", style="cyan", no_wrap=True)
+    table.add_column("Time", justify="right")
+    table.add_column("LLM calls", justify="right")
+    table.add_column("LLM time", justify="right")
+    table.add_column("Tokens in/out", justify="right")
+    table.add_column("Cost", justify="right")
+
+    rows = [
+        (step["name"], step["duration_seconds"], step["llm"]) for step in trace_summary["steps"]
+    ]
+    rows.append(("Total", trace_summary["wall_seconds"], trace_summary["llm"]))
+    for name, seconds, llm in rows:
+        table.add_row(
+            name,
+            f"{seconds:.0f}s",
+            str(llm["calls"]),
+            f"{llm['seconds']:.0f}s",
+            f"{llm['input_tokens']:,} / {llm['output_tokens']:,}",
+            f"${llm['cost_usd']:.2f}",
+        )
+    console.print(table)
+
+    unpriced = trace_summary["llm"].get("unpriced_models")
+    if unpriced:
+        console.print(
+            f"[dim]No price for {', '.join(unpriced)}; set LLM_PRICING_FILE for cost estimates[/dim]"
+        )
+    if trace_path is not None:
+        console.print(f"[dim]Span trace: {trace_path}[/dim]")
+
+
+def run_batch_mode(args: argparse.Namespace) -> None:
+    """Run the full pipeline for a directory/manifest of PDFs and print an aggregated summary."""
+    if not HAVE_LLM_SUPPORT:
+        console.print("[red]❌ Batch mode requires the LLM modules[/red]")
+        raise SystemExit(1)
+
+    console.print(
+        Panel.fit(
+            f"[bold white]PDFtoPodcast batch[/bold white]\n[dim]{args.batch} · "
+            f"{args.workers} workers · {args.llm_provider.upper()}[/dim]",
+            border_style="magenta",
+        )
+    )
+
+    def _on_progress(pdf_path: Path, status: str, data: dict) -> None:
+        if status == "completed":
+            console.print(f"[green]✅ {pdf_path.name}[/green] ({data['duration_seconds']:.0f}s)")
+        elif status == "starting":
+            console.print(f"[dim]▶ {pdf_path.name}[/dim]")
+
+    try:
+        batch = run_batch(
+            args.batch,
+            workers=args.workers,
+            max_llm_concurrency=args.max_llm_concurrency,
+            progress_callback=_on_progress,
+            max_pages=args.max_pages,
+            llm_provider=args.llm_provider,
+            breakpoint_after_step=BREAKPOINT_AFTER_STEP,
+            report_language=args.report_language,
+            report_renderer=args.report_renderer,
+            report_compile_pdf=args.report_compile_pdf,
+            report_enable_figures=args.report_enable_figures,
+            skip_report=(args.output == "podcast"),
+            skip_podcast=(args.output == "report"),
+            verbose=args.verbose,
+            artifact_root=args.artifact_root,
+            isolated_run=args.isolated_run,
+            resume=args.resume,
+        )
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        raise SystemExit(1) from e
+
+    summary = Table(title="Batch Summary", box=box.ROUNDED)
+    summary.add_column("PDF", style="cyan", no_wrap=True)
+    summary.add_column("Status")
+    summary.add_column("Time", justify="right")
+    summary.add_column("Details")
+    for paper in batch.papers:
+        minutes, seconds = divmod(int(paper.duration_seconds), 60)
+        if paper.status == "completed":
+            publication_type = (
+                (paper.results or {}).get("classification", {}).get("publication_type", "—")
+            )
+            status, details = "[green]✅ completed[/green]", publication_type
+        else:
+            status, details = "[red]❌ failed[/red]", paper.error or ""
+        summary.add_row(paper.pdf_path.name, status, f"{minutes}m {seconds}s", details)
+    console.print(summary)
+
+    minutes, seconds = divmod(int(batch.duration_seconds), 60)
+    console.print(
+        f"[bold]{batch.succeeded}/{len(batch.papers)} papers completed[/bold] "
+        f"in {minutes}m {seconds}s"
+    )
+    if batch.failed:
+        raise SystemExit(1)
+
+
 def main():
     """CLI entrypoint for the six-step PDF-to-Podcast pipeline."""
     parser = argparse.ArgumentParser(
@@ -94,7 +201,8 @@ def main():
             "Single Step: python run_pipeline.py paper.pdf --step validation_correction --max-iterations 2\n"
             "Appraisal: python run_pipeline.py paper.pdf --step appraisal --appraisal-max-iter 3\n"
             "Report: python run_pipeline.py paper.pdf --step report_generation --report-language en\n"
-            "Podcast: python run_pipeline.py paper.pdf --step podcast_generation"
+            "Podcast: python run_pipeline.py paper.pdf --step podcast_generation\n"
+            "Batch: python run_pipeline.py --batch papers/ --workers 4"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -103,7 +211,26 @@ def main():
         action="store_true",
         help="Skip iterative correction for appraisal (single-pass mode).",
     )
-    parser.add_argument("pdf", help="Path to the PDF file")
+    parser.add_argument("pdf", nargs="?", help="Path to the PDF file")
+    parser.add_argument(
+        "--batch",
+        metavar="DIR|MANIFEST",
+        default=None,
+        help='Process every PDF in a directory or a .jsonl manifest (one {"pdf": ...} per line)',
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Papers processed concurrently in --batch mode (default: 4)",
+    )
+    parser.add_argument(
+        "--max-llm-concurrency",
+        type=int,
+        default=None,
+        help="Cap on in-flight LLM requests across all papers in --batch mode "
+        "(default: LLM_MAX_CONCURRENT_REQUESTS)",
+    )
     parser.add_argument(
         "--max-pages", type=int, default=None, help="Limit number of pages (for quick tests)"
     )
@@ -112,9 +239,9 @@ def main():
     )
     parser.add_argument(
         "--llm-provider",
-        choices=["openai", "claude"],
+        choices=["openai", "claude", "replay"],
         default="openai",
-        help="Choose LLM provider (default: openai)",
+        help="Choose LLM provider (default: openai; replay = recorded responses, see LLM_REPLAY_*)",
     )
     parser.add_argument(
         "--step",
@@ -229,6 +356,30 @@ def main():
         action="store_true",
         help="Show detailed validation/correction output (default: compact)",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reuse results of steps whose PDF, prompts, schemas, model and upstream "
+        "results are unchanged since the last run; rerun only invalidated steps",
+    )
+    parser.add_argument(
+        "--artifact-root",
+        metavar="DIR",
+        default=None,
+        help="Directory for intermediate files (default: PIPELINE_ARTIFACT_ROOT or tmp/)",
+    )
+    parser.add_argument(
+        "--isolated-run",
+        action="store_true",
+        default=None,
+        help="Write to a new run directory keyed by PDF content hash and run ID, so "
+        "concurrent runs on same-named PDFs cannot overwrite each other",
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="Use (or continue) the isolated run directory of this run ID",
+    )
     parser.add_argument(
         "--output",
         choices=["podcast", "report", "both"],
@@ -237,6 +388,18 @@ def main():
     )
     args = parser.parse_args()
 
+    if HAVE_LLM_SUPPORT:
+        # Compile schema validators while the first LLM request is in flight
+        start_validator_warmup()
+
+    if args.batch:
+        if args.pdf or args.step or args.run_id:
+            parser.error("--batch cannot be combined with a PDF argument, --step or --run-id")
+        run_batch_mode(args)
+        return
+    if not args.pdf:
+        parser.error("the following arguments are required: pdf (or use --batch)")
+
     pdf_path = Path(args.pdf)
     if not pdf_path.exists():
         console.print(f"[red]❌ PDF not found:[/red] {pdf_path}")
@@ -250,7 +413,13 @@ def main():
     )
 
     console.print(f"[green]✅ PDF found:[/green] {pdf_path}")
-    console.print("[blue]📁 Intermediate files saved to: tmp/ (DOI-based naming)[/blue]")
+    file_manager = PipelineFileManager(
+        pdf_path,
+        artifact_root=args.artifact_root,
+        run_id=args.run_id,
+        isolated=args.isolated_run,
+    )
+    console.print(f"[blue]📁 Intermediate files saved to: {file_manager.tmp_dir}/[/blue]")
     console.print(f"[blue]🤖 LLM Provider: {args.llm_provider.upper()}[/blue]")
 
     # Check if running single step or full pipeline
@@ -259,9 +428,6 @@ def main():
         # Single step execution
         console.print(f"[yellow]🎯 Running single step:[/yellow] {args.step}")
 
-        # Create file manager
-        file_manager = PipelineFileManager(pdf_path)
-
         # Build quality thresholds if validation_correction or appraisal step
         if args.step == "validation_correction":
             quality_thresholds = {
@@ -462,20 +628,26 @@ def main():
         # Run the six-step pipeline with selected LLM provider
         console.print("\n[bold cyan]Running six-step extraction pipeline...[/bold cyan]\n")
         pipeline_start_time = time.time()
-        results = run_full_pipeline(
-            pdf_path=pdf_path,
-            max_pages=args.max_pages,
-            llm_provider=args.llm_provider,
-            breakpoint_after_step=BREAKPOINT_AFTER_STEP,
-            have_llm_support=HAVE_LLM_SUPPORT,
-            report_language=args.report_language,
-            report_renderer=args.report_renderer,
-            report_compile_pdf=args.report_compile_pdf,
-            report_enable_figures=args.report_enable_figures,
-            skip_report=(args.output == "podcast"),
-            skip_podcast=(args.output == "report"),
-            verbose=args.verbose,
-        )
+        # Open the run's trace here so its summary can be printed after the run
+        with start_pipeline_trace(file_manager) as tracer:
+            results = run_full_pipeline(
+                pdf_path=pdf_path,
+                max_pages=args.max_pages,
+                llm_provider=args.llm_provider,
+                breakpoint_after_step=BREAKPOINT_AFTER_STEP,
+                have_llm_support=HAVE_LLM_SUPPORT,
+                report_language=args.report_language,
+                report_renderer=args.report_renderer,
+                report_compile_pdf=args.report_compile_pdf,
+                report_enable_figures=args.report_enable_figures,
+                skip_report=(args.output == "podcast"),
+                skip_podcast=(args.output == "report"),
+                verbose=args.verbose,
+                resume=args.resume,
+                artifact_root=file_manager.artifact_root,
+                run_id=file_manager.run_id,
+                isolated_run=file_manager.run_id is not None,
+            )
 
     # Calculate total pipeline time if available (only set in full pipeline mode)
     total_elapsed = None
@@ -604,6 +776,24 @@ def main():
         podcast_detail = f"{status} | {word_count} words | ~{duration} min{summary_info}"
         summary.add_row("Podcast", podcast_detail)
 
+    # --- Response cache ---
+    if HAVE_LLM_SUPPORT and llm_settings.response_cache_enabled:
+        cache_stats = get_response_cache(llm_settings).stats()
+        summary.add_row(
+            "Response cache",
+            f"{cache_stats.hits} hits | {cache_stats.misses} misses "
+            f"({cache_stats.hit_rate:.0%} hit rate)",
+        )
+
+    # --- Files API ---
+    if HAVE_LLM_SUPPORT and llm_settings.files_api_enabled:
+        file_stats = get_file_registry(llm_settings).stats()
+        if file_stats.uploads or file_stats.reuses:
+            summary.add_row(
+                "PDF uploads",
+                f"{file_stats.uploads} uploaded | {file_stats.reuses} reused by file ID",
+            )
+
     # --- Total time ---
     if total_elapsed:
         minutes = int(total_elapsed // 60)
@@ -612,8 +802,11 @@ def main():
 
     console.print(summary)
 
+    if pipeline_start_time is not None:
+        print_time_breakdown(tracer.summary(), tracer.trace_path)
+
     if args.keep_tmp:
-        console.print("[dim]Intermediate files kept in: tmp/[/dim]")
+        console.print(f"[dim]Intermediate files kept in: {file_manager.tmp_dir}/[/dim]")
     else:
         console.print("[dim]Use --keep-tmp to keep intermediate files[/dim]")
 
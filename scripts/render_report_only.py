@@ -3,6 +3,11 @@ Offline report renderer: convert an existing report JSON to PDF/HTML/Markdown wi
 
 Usage:
     python scripts/render_report_only.py tmp/<run>/report-best.json --renderer latex
+
+Several report JSONs render into one subdirectory of --output-dir each, with
+LaTeX compiles running concurrently (--workers, default LATEX_WORKERS) or
+WeasyPrint PDFs rendered by warmed worker processes (default WEASYPRINT_WORKERS):
+    python scripts/render_report_only.py tmp/*/*-report-best.json --workers 8
 """
 
 import argparse
@@ -16,24 +21,33 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.rendering.latex_renderer import LatexRenderError, render_report_to_pdf  # noqa: E402
+from src.config import llm_settings  # noqa: E402
+from src.pipeline.artifact_store import ArtifactStore, get_artifact_store  # noqa: E402
+from src.rendering.latex_renderer import (  # noqa: E402
+    LatexRenderError,
+    render_report_to_pdf,
+    render_reports_to_pdf,
+)
 from src.rendering.markdown_renderer import render_report_to_markdown  # noqa: E402
 from src.rendering.weasy_renderer import (  # noqa: E402
     WeasyRendererError,
     render_report_with_weasyprint,
+    render_reports_with_weasyprint,
 )
 
 console = Console()
 
 
-def _load_json_if_exists(path: Path) -> dict | None:
-    """Load JSON from path if present; return None on missing file or parse errors."""
-    if not path.exists():
-        return None
-    try:
-        return json.loads(path.read_text())
-    except Exception:
-        return None
+def _load_companion(store: ArtifactStore, prefix: str, step: str) -> dict | None:
+    """Load the best (else the plain, else the first) artifact of a step; None if absent."""
+    for iteration, status in ((None, "best"), (None, ""), (0, "")):
+        try:
+            data = store.load(prefix, step, iteration, status)
+        except Exception:
+            data = None
+        if data is not None:
+            return data
+    return None
 
 
 def _figure_data_from_extraction(extraction: dict | None) -> dict:
@@ -97,23 +111,11 @@ def _figure_data_from_appraisal(appraisal: dict | None) -> dict:
 
 def _hydrate_figure_blocks(report: dict, base_dir: Path, prefix: str) -> dict:
     """Resolve figure data for blocks that only declare data_ref."""
-    extraction = None
-    appraisal = None
-
-    def _first_existing(suffixes: list[str]) -> Path | None:
-        for suf in suffixes:
-            candidate = base_dir / f"{prefix}-{suf}.json"
-            if candidate.exists():
-                return candidate
-        return None
-
-    extraction_path = _first_existing(["extraction-best", "extraction", "extraction0"])
-    appraisal_path = _first_existing(["appraisal-best", "appraisal", "appraisal0"])
-
-    if extraction_path:
-        extraction = _load_json_if_exists(extraction_path)
-    if appraisal_path:
-        appraisal = _load_json_if_exists(appraisal_path)
+    # Companion artifacts are read through the configured store (ARTIFACT_STORE), so
+    # this also works with the sqlite backend where they are not files on disk
+    store = get_artifact_store(llm_settings, base_dir, Path(llm_settings.artifact_root))
+    extraction = _load_companion(store, prefix, "extraction")
+    appraisal = _load_companion(store, prefix, "appraisal")
 
     fig_data = {}
     fig_data.update(_figure_data_from_extraction(extraction))
@@ -136,17 +138,37 @@ def _hydrate_figure_blocks(report: dict, base_dir: Path, prefix: str) -> dict:
     return report
 
 
+def _load_report(report_path: Path) -> dict:
+    """Load report JSON and attach figure data from its run's extraction/appraisal artifacts."""
+    report = json.loads(report_path.read_text())
+    prefix = report_path.stem.split("-report", 1)[0]
+    return _hydrate_figure_blocks(report, report_path.parent, prefix)
+
+
+def _write_markdown(
+    report: dict, report_path: Path, output_dir: Path, render_dirs: dict[str, Path]
+) -> None:
+    """Write the Markdown rendering plus a root-level copy next to the JSON."""
+    try:
+        md_path = render_report_to_markdown(report, output_dir)
+        render_dirs["markdown"] = md_path
+        # Also write a root-level copy next to the JSON for convenience
+        root_md = report_path.parent / f"{report_path.stem}.md"
+        root_md.write_text(md_path.read_text(encoding="utf-8"), encoding="utf-8")
+        render_dirs["markdown_root"] = root_md
+        console.print(f"[green]✓ Markdown written: {md_path}[/green]")
+        console.print(f"[green]✓ Markdown copy: {root_md}[/green]")
+    except Exception as e:  # pragma: no cover - defensive
+        console.print(f"[yellow]⚠️ Failed to write markdown: {e}[/yellow]")
+
+
 def render_report(
     report_path: Path, output_dir: Path, renderer: str, compile_pdf: bool, enable_figures: bool
 ) -> None:
     """Render report JSON to PDF/HTML/Markdown, hydrating figure data when available."""
-    report = json.loads(report_path.read_text())
+    report = _load_report(report_path)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Attach figure data from companion extraction/appraisal files if present
-    prefix = report_path.stem.split("-report", 1)[0]
-    report = _hydrate_figure_blocks(report, report_path.parent, prefix)
-
     render_dirs: dict[str, Path] = {}
     try:
         if renderer == "weasyprint":
@@ -164,17 +186,61 @@ def render_report(
     except Exception as e:  # pragma: no cover - defensive
         console.print(f"[red]Unexpected render error: {e}[/red]")
 
-    try:
-        md_path = render_report_to_markdown(report, output_dir)
-        render_dirs["markdown"] = md_path
-        # Also write a root-level copy next to the JSON for convenience
-        root_md = report_path.parent / f"{report_path.stem}.md"
-        root_md.write_text(md_path.read_text(encoding="utf-8"), encoding="utf-8")
-        render_dirs["markdown_root"] = root_md
-        console.print(f"[green]✓ Markdown written: {md_path}[/green]")
-        console.print(f"[green]✓ Markdown copy: {root_md}[/green]")
-    except Exception as e:  # pragma: no cover - defensive
-        console.print(f"[yellow]⚠️ Failed to write markdown: {e}[/yellow]")
+    _write_markdown(report, report_path, output_dir, render_dirs)
+
+
+def _report_dirs(report_paths: list[Path], output_dir: Path) -> list[Path]:
+    """
+    One output directory per report: report.tex/report.pdf would collide otherwise.
+
+    Reports are named by their stem. Reports of different runs share a stem
+    (tmp/runs/<paper>/<run>/<paper>-report-best.json), so repeated stems are
+    prefixed with their parent directory, and with the position in the list if
+    that is still ambiguous.
+    """
+    stems = [path.stem for path in report_paths]
+    names = [
+        stem if stems.count(stem) == 1 else f"{path.parent.name}-{stem}"
+        for path, stem in zip(report_paths, stems, strict=True)
+    ]
+    names = [
+        name if names.count(name) == 1 else f"{index}-{name}" for index, name in enumerate(names)
+    ]
+    return [output_dir / name for name in names]
+
+
+def render_reports(
+    report_paths: list[Path],
+    output_dir: Path,
+    renderer: str,
+    compile_pdf: bool,
+    enable_figures: bool,
+    workers: int | None = None,
+) -> None:
+    """Render several report JSONs, sharing warmed renderer workers across them."""
+    reports = [_load_report(path) for path in report_paths]
+    report_dirs = _report_dirs(report_paths, output_dir)
+    jobs = list(zip(reports, report_dirs, strict=True))
+
+    if renderer == "weasyprint":
+        results = render_reports_with_weasyprint(jobs, workers=workers)
+    else:
+        results = render_reports_to_pdf(
+            jobs,
+            compile_pdf=compile_pdf,
+            enable_figures=enable_figures,
+            workers=workers,
+        )
+    for report_path, report, report_dir, result in zip(
+        report_paths, reports, report_dirs, results, strict=True
+    ):
+        if isinstance(result, (LatexRenderError, WeasyRendererError)):
+            console.print(f"[yellow]⚠️ Render error for {report_path.name}: {result}[/yellow]")
+            render_dirs: dict[str, Path] = {}
+        else:
+            render_dirs = result
+            console.print(f"[green]✓ Rendered {report_path.name}: {render_dirs}[/green]")
+        _write_markdown(report, report_path, report_dir, render_dirs)
 
 
 def main() -> None:
@@ -182,7 +248,12 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Render an existing report JSON to PDF/HTML/Markdown without LLM calls.",
     )
-    parser.add_argument("report_json", type=Path, help="Path to report-best.json (or iteration)")
+    parser.add_argument(
+        "report_json",
+        type=Path,
+        nargs="+",
+        help="Path(s) to report-best.json (or iteration)",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -209,15 +280,35 @@ def main() -> None:
         help="Skip figure generation (drops figure blocks)",
     )
     parser.set_defaults(enable_figures=True)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help=(
+            "Renderer workers for several reports (default: LATEX_WORKERS or WEASYPRINT_WORKERS)"
+        ),
+    )
 
     args = parser.parse_args()
 
-    if not args.report_json.exists():
-        console.print(f"[red]Report JSON not found: {args.report_json}[/red]")
+    missing = [path for path in args.report_json if not path.exists()]
+    if missing:
+        console.print(f"[red]Report JSON not found: {', '.join(map(str, missing))}[/red]")
         raise SystemExit(1)
 
+    if len(args.report_json) > 1:
+        render_reports(
+            report_paths=args.report_json,
+            output_dir=args.output_dir,
+            renderer=args.renderer,
+            compile_pdf=args.compile_pdf,
+            enable_figures=args.enable_figures,
+            workers=args.workers,
+        )
+        return
+
     render_report(
-        report_path=args.report_json,
+        report_path=args.report_json[0],
         output_dir=args.output_dir,
         renderer=args.renderer,
         compile_pdf=args.compile_pdf,
@@ -27,11 +27,50 @@ Environment Variables:
     # General Settings
     LLM_TEMPERATURE: Temperature for generation (default: 0.0 for deterministic)
     LLM_TIMEOUT: Request timeout in seconds (default: 120)
+    LLM_MAX_CONCURRENT_REQUESTS: Max in-flight requests per provider (default: 8)
+
+    # Rate Limiting
+    LLM_RATE_LIMIT: Pace requests against RPM/TPM limits before sending (default: true)
+    LLM_RATE_LIMIT_DB: SQLite file shared by all processes (default: .cache/llm_rate_limits.sqlite3)
+    LLM_RATE_LIMIT_RPM: Requests per minute until headers report the real limit (default: 0 = unknown)
+    LLM_RATE_LIMIT_TPM: Tokens per minute until headers report the real limit (default: 0 = unknown)
 
     # PDF Processing Limits (API Constraints)
     MAX_PDF_PAGES: Maximum pages to process from PDF (default: 100, API limit)
     MAX_PDF_SIZE_MB: Maximum PDF file size in MB (default: 32, API limit)
 
+    # Files API
+    LLM_FILES_API: Upload each PDF once and reference it by file ID; uploads stay on the
+        provider's servers, so this is opt-in (default: false)
+    LLM_FILES_API_TTL_HOURS: Re-upload files older than this (default: 24)
+    ANTHROPIC_PROMPT_CACHING: Mark Claude instructions, schema and PDF as cacheable (default: true)
+
+    # Response Cache
+    LLM_RESPONSE_CACHE: Serve repeated LLM requests from disk (default: false)
+    LLM_RESPONSE_CACHE_DIR: Cache directory (default: .cache/llm_responses)
+    LLM_RESPONSE_CACHE_MAX_SIZE_MB: Evict oldest entries above this size (default: 512)
+    LLM_RESPONSE_CACHE_MAX_AGE_HOURS: Entry time-to-live in hours (default: 168)
+
+    # Record/Replay Provider (LLM_PROVIDER=replay)
+    LLM_REPLAY_MODE: "replay" serves recordings, "record" calls a real provider and saves them
+    LLM_REPLAY_DIR: Recording directory (default: .cache/llm_replay)
+    LLM_REPLAY_RECORD_PROVIDER: Real provider used in record mode (default: openai)
+    LLM_REPLAY_LATENCY_SCALE: Multiplier on recorded latency during replay (default: 0 = instant)
+    LLM_REPLAY_LATENCY_MS: Fixed extra latency per replayed call (default: 0)
+
+    # Correction Loops
+    CORRECTION_MODE: "full" regenerates the whole document, "patch" asks for RFC 6902
+        JSON Patch operations and applies them locally (default: full)
+    CORRECTION_CANDIDATES: Corrections run in parallel per loop iteration; the best
+        validated one is kept (default: 1)
+    VALIDATION_MODE: "full" re-validates the whole extraction every iteration,
+        "incremental" only the top-level sections a correction changed (default: full)
+
+    # Tracing (see src/tracing.py)
+    LLM_PRICING_FILE: JSON file with per-model USD prices per million tokens, merged over
+        the built-in table for cost estimates (default: none)
+    PIPELINE_TRACE_FILE: Also stream every span to tmp/<paper>-trace.jsonl (default: false)
+
 Example .env file:
     OPENAI_API_KEY=sk-...
     OPENAI_MODEL=gpt-5.5
@@ -63,10 +102,13 @@ class LLMProvider(Enum):
     Providers:
         OPENAI: OpenAI GPT models (supports native structured outputs)
         CLAUDE: Anthropic Claude models (uses prompt-based structured outputs)
+        REPLAY: Recorded responses served from disk (offline benchmarking, see
+            src/llm/replay_provider.py)
     """
 
     OPENAI = "openai"
     CLAUDE = "claude"
+    REPLAY = "replay"
 
 
 @dataclass(frozen=True)
@@ -95,8 +137,48 @@ class LLMSettings:
         anthropic_max_tokens: Max output tokens for Claude (default: 4096)
         temperature: Sampling temperature, 0.0 = deterministic (default: 0.0)
         timeout: Request timeout in seconds (default: 1800 = 30 minutes for long extractions)
+        max_concurrent_requests: Cap on in-flight requests per provider (default: 8)
+        rate_limit_enabled: Wait for RPM/TPM budget before each request (default: True)
+        rate_limit_db: SQLite file holding the shared token buckets
+        rate_limit_rpm: Seed requests-per-minute limit per model (default: 0 = learn from headers)
+        rate_limit_tpm: Seed tokens-per-minute limit per model (default: 0 = learn from headers)
         max_pdf_pages: Maximum pages to process from PDF (default: 100, API limit)
         max_pdf_size_mb: Maximum PDF file size in MB (default: 10, provider max: 32)
+        files_api_enabled: Send PDFs by uploaded file ID instead of inline base64 (default: False)
+        pdf_slicing: Send only the max_pages page range of a PDF (default: True)
+        pdf_slice_dir: Cache directory of sliced PDFs (default: .cache/pdf_slices)
+        pdf_slice_strip: Also drop thumbnails and embedded fonts from slices (default: False)
+        extraction_chunk_pages: Extract PDFs longer than this in parallel page windows
+            (default: 0 = single call)
+        extraction_chunk_overlap: Pages shared by consecutive extraction windows (default: 1)
+        figure_cache_dir: Cache of rendered report figures ("" disables; default: .cache/figures)
+        figure_workers: Processes rendering report figures in parallel (default: 4)
+        latex_build_dir: LaTeX preamble formats and aux files ("" disables; default: .cache/latex)
+        latex_workers: Concurrent LaTeX compiles in batch rendering (default: 4)
+        weasyprint_workers: WeasyPrint processes in batch rendering (default: 2)
+        files_api_ttl_hours: Lifetime of an uploaded file handle before re-upload (default: 24)
+        anthropic_prompt_caching: Send cache_control breakpoints on Claude PDF requests (default: True)
+        response_cache_enabled: Wrap providers with the on-disk response cache (default: False)
+        response_cache_dir: Directory for cached responses (default: .cache/llm_responses)
+        response_cache_max_size_mb: Maximum cache size before eviction (default: 512)
+        response_cache_max_age_hours: Cache entry time-to-live (default: 168 = 7 days)
+        replay_mode: "replay" (serve recordings) or "record" (default: replay)
+        replay_dir: Directory holding recorded responses (default: .cache/llm_replay)
+        replay_record_provider: Real provider wrapped in record mode (default: openai)
+        replay_latency_scale: Multiplier on recorded latency when replaying (default: 0.0)
+        replay_latency_ms: Fixed synthetic latency per replayed call (default: 0)
+        pricing_file: JSON price table merged over tracing.DEFAULT_MODEL_PRICES (default: none)
+        trace_file: Write the span-level JSONL trace of each run (default: False)
+        correction_mode: "full" or "patch" correction output (default: full)
+        correction_candidates: Parallel correction candidates per loop iteration (default: 1)
+        validation_mode: "full" or "incremental" extraction re-validation (default: full)
+        artifact_root: Directory holding pipeline artifacts (default: tmp)
+        isolated_runs: Give every run its own artifact directory (default: False)
+        artifact_store: "files" or "sqlite" storage of JSON artifacts (default: files)
+        artifact_store_db: Database of the sqlite store (default: <root>/artifacts.sqlite3)
+        pretty_json_artifacts: Indent JSON artifacts for debugging (default: False)
+        prompt_context_max_tokens: Token budget of upstream JSON in prompts (default: 0 = none)
+        prompt_key_aliases: Abbreviate long repeated keys in prompt context (default: False)
     """
 
     # Default provider
@@ -130,6 +212,14 @@ class LLMSettings:
     # General settings
     temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.0"))  # 0.0 = deterministic
     timeout: int = int(os.getenv("LLM_TIMEOUT", "1800"))  # 30 minutes for long extractions
+    # Shared per-provider semaphores (see BaseLLMProvider.request_slot / request_slot_sync)
+    max_concurrent_requests: int = int(os.getenv("LLM_MAX_CONCURRENT_REQUESTS", "8"))
+
+    # Token-bucket RPM/TPM limiter shared across processes (see src/llm/rate_limiter.py)
+    rate_limit_enabled: bool = os.getenv("LLM_RATE_LIMIT", "true").lower() in ("1", "true", "yes")
+    rate_limit_db: str = os.getenv("LLM_RATE_LIMIT_DB", ".cache/llm_rate_limits.sqlite3")
+    rate_limit_rpm: float = float(os.getenv("LLM_RATE_LIMIT_RPM", "0"))
+    rate_limit_tpm: float = float(os.getenv("LLM_RATE_LIMIT_TPM", "0"))
 
     # PDF processing limits (API constraints for direct PDF upload)
     max_pdf_pages: int = int(os.getenv("MAX_PDF_PAGES", "100"))  # 100 page limit (OpenAI + Claude)
@@ -137,6 +227,93 @@ class LLMSettings:
         os.getenv("MAX_PDF_SIZE_MB", "10")
     )  # Default 10 MB, max 32 MB (provider limit)
 
+    # Files API upload registry (see src/llm/file_registry.py)
+    files_api_enabled: bool = os.getenv("LLM_FILES_API", "false").lower() in ("1", "true", "yes")
+    files_api_ttl_hours: float = float(os.getenv("LLM_FILES_API_TTL_HOURS", "24"))
+
+    # Local page slicing for max_pages (see src/llm/pdf_slicer.py; needs pypdf)
+    pdf_slicing: bool = os.getenv("PDF_PAGE_SLICING", "true").lower() in ("1", "true", "yes")
+    pdf_slice_dir: str = os.getenv("PDF_SLICE_CACHE_DIR", ".cache/pdf_slices")
+    pdf_slice_strip: bool = os.getenv("PDF_SLICE_STRIP", "false").lower() in ("1", "true", "yes")
+
+    # Page-chunked parallel extraction (see src/pipeline/chunked_extraction.py)
+    extraction_chunk_pages: int = int(os.getenv("EXTRACTION_CHUNK_PAGES", "0"))
+    extraction_chunk_overlap: int = int(os.getenv("EXTRACTION_CHUNK_OVERLAP", "1"))
+
+    # Report figures (see src/rendering/figure_generator.py)
+    figure_cache_dir: str = os.getenv("FIGURE_CACHE_DIR", ".cache/figures")
+    figure_workers: int = int(os.getenv("FIGURE_WORKERS", "4"))
+
+    # LaTeX build cache and batch compilation (see src/rendering/latex_build.py)
+    latex_build_dir: str = os.getenv("LATEX_BUILD_CACHE_DIR", ".cache/latex")
+    latex_workers: int = int(os.getenv("LATEX_WORKERS", "4"))
+
+    # Warmed WeasyPrint render workers (see WeasyRenderService)
+    weasyprint_workers: int = int(os.getenv("WEASYPRINT_WORKERS", "2"))
+
+    # Anthropic prompt caching for the stable instructions + schema + PDF prefix
+    anthropic_prompt_caching: bool = os.getenv("ANTHROPIC_PROMPT_CACHING", "true").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Content-addressed response cache (opt-in, see src/llm/response_cache.py)
+    response_cache_enabled: bool = os.getenv("LLM_RESPONSE_CACHE", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    response_cache_dir: str = os.getenv("LLM_RESPONSE_CACHE_DIR", ".cache/llm_responses")
+    response_cache_max_size_mb: float = float(os.getenv("LLM_RESPONSE_CACHE_MAX_SIZE_MB", "512"))
+    response_cache_max_age_hours: float = float(
+        os.getenv("LLM_RESPONSE_CACHE_MAX_AGE_HOURS", "168")
+    )
+
+    # Record/replay provider for offline benchmarking (see src/llm/replay_provider.py)
+    replay_mode: str = os.getenv("LLM_REPLAY_MODE", "replay").lower()
+    replay_dir: str = os.getenv("LLM_REPLAY_DIR", ".cache/llm_replay")
+    replay_record_provider: str = os.getenv("LLM_REPLAY_RECORD_PROVIDER", "openai").lower()
+    replay_latency_scale: float = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", "0"))
+    replay_latency_ms: float = float(os.getenv("LLM_REPLAY_LATENCY_MS", "0"))
+
+    # Model prices for trace cost estimates (see src/tracing.py)
+    pricing_file: str = os.getenv("LLM_PRICING_FILE", "")
+    # Span-level JSONL trace next to the artifacts; the per-step summary is always saved
+    trace_file: bool = os.getenv("PIPELINE_TRACE_FILE", "false").lower() in ("1", "true", "yes")
+
+    # Correction output format (see src/pipeline/json_patch.py)
+    correction_mode: str = os.getenv("CORRECTION_MODE", "full").lower()
+    # Speculative parallel corrections per iteration (see IterativeLoopConfig.candidates)
+    correction_candidates: int = max(1, int(os.getenv("CORRECTION_CANDIDATES", "1")))
+    # Section-scoped LLM re-validation in the extraction loop (see incremental_validation.py)
+    validation_mode: str = os.getenv("VALIDATION_MODE", "full").lower()
+
+    # Pipeline artifact location (see src/pipeline/file_manager.py)
+    artifact_root: str = os.getenv("PIPELINE_ARTIFACT_ROOT", "tmp")
+    isolated_runs: bool = os.getenv("PIPELINE_ISOLATED_RUNS", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+    # JSON artifact backend (see src/pipeline/artifact_store.py)
+    artifact_store: str = os.getenv("ARTIFACT_STORE", "files").lower()
+    artifact_store_db: str = os.getenv("ARTIFACT_STORE_DB", "")
+    # Indented JSON artifacts (see src/serialization.py); compact when off
+    pretty_json_artifacts: bool = os.getenv("PIPELINE_PRETTY_JSON", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Upstream JSON in report/appraisal/podcast prompts (see src/pipeline/prompt_context.py)
+    prompt_context_max_tokens: int = int(os.getenv("PROMPT_CONTEXT_MAX_TOKENS", "0"))
+    prompt_key_aliases: bool = os.getenv("PROMPT_KEY_ALIASES", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
 
 @dataclass(frozen=True)
 class Settings:
@@ -0,0 +1,93 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Deferred imports for heavy dependencies.
+
+The provider SDKs (openai, anthropic) and jsonschema take several seconds to
+import together, while run_pipeline.py --help, a classification-only run or a
+Streamlit page never touch most of them. Modules bind them with lazy_import()
+instead of a top-level import:
+
+    openai = lazy_import("openai")
+
+    def make_client():
+        return openai.OpenAI()  # openai is imported here, on first attribute access
+
+The proxy is a module object: attribute reads, writes (e.g. mock.patch) and
+deletes go to the real module once it is loaded. Code that must not trigger the
+import at definition time (decorator arguments, annotations, except clauses of
+module-level code) has to reference the proxy lazily, e.g. in a predicate
+function or a string annotation.
+
+matplotlib and weasyprint are already imported inside the functions that use
+them (src/rendering), which has the same effect.
+"""
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+
+_load_lock = threading.Lock()
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports the named module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> ModuleType:
+        module: ModuleType | None = self.__dict__["_lazy_target"]
+        if module is None:
+            with _load_lock:
+                module = self.__dict__["_lazy_target"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes the proxy itself does not have
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if is_loaded(self) else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a proxy for module `name` that imports it on first use.
+
+    Raises:
+        ImportError: On first attribute access, if the module is not installed
+    """
+    return LazyModule(name)
+
+
+def is_loaded(module: ModuleType) -> bool:
+    """True if module is a regular module or a LazyModule whose target was imported."""
+    if isinstance(module, LazyModule):
+        return module.__dict__["_lazy_target"] is not None
+    return True
+
+
+def is_available(name: str) -> bool:
+    """Check whether a module is installed without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
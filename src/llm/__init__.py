@@ -68,7 +68,11 @@ from typing import Any
 from ..config import LLMProvider, LLMSettings, llm_settings
 from .base import BaseLLMProvider, LLMError, LLMProviderError
 from .claude_provider import ClaudeProvider
+from .file_registry import FileHandleRegistry, get_file_registry
 from .openai_provider import OpenAIProvider
+from .rate_limiter import RateLimiter, get_rate_limiter
+from .replay_provider import REPLAY_MODES, ReplayProvider, ReplayStore, get_replay_store
+from .response_cache import CachedLLMProvider, CacheStats, ResponseCache, get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +85,21 @@ __all__ = [
     # Provider implementations
     "OpenAIProvider",
     "ClaudeProvider",
+    "ReplayProvider",
+    # Files API upload registry
+    "FileHandleRegistry",
+    "get_file_registry",
+    # RPM/TPM rate limiter
+    "RateLimiter",
+    "get_rate_limiter",
+    # Record/replay storage
+    "ReplayStore",
+    "get_replay_store",
+    # Response cache
+    "CachedLLMProvider",
+    "CacheStats",
+    "ResponseCache",
+    "get_response_cache",
     # Factory function
     "get_llm_provider",
     # Convenience functions
@@ -99,11 +118,14 @@ def get_llm_provider(
     or enum. Automatically loads settings from global configuration if not provided.
 
     Args:
-        provider: Provider name ("openai" or "claude") or LLMProvider enum
+        provider: Provider name ("openai", "claude" or "replay") or LLMProvider enum
         settings: Optional custom LLM settings (uses global llm_settings if None)
 
     Returns:
-        Provider instance (OpenAIProvider or ClaudeProvider)
+        Provider instance (OpenAIProvider, ClaudeProvider or ReplayProvider), wrapped
+        in CachedLLMProvider when settings.response_cache_enabled is set. "replay"
+        records through settings.replay_record_provider when settings.replay_mode
+        is "record" and is never wrapped in the response cache.
 
     Raises:
         LLMError: If provider is unsupported
@@ -129,13 +151,28 @@ def get_llm_provider(
                 f"Unsupported provider: {provider}. Supported: {[p.value for p in LLMProvider]}"
             ) from e
 
+    instance: BaseLLMProvider
     if provider == LLMProvider.OPENAI:
-        return OpenAIProvider(settings)
+        instance = OpenAIProvider(settings)
     elif provider == LLMProvider.CLAUDE:
-        return ClaudeProvider(settings)
+        instance = ClaudeProvider(settings)
+    elif provider == LLMProvider.REPLAY:
+        if settings.replay_mode not in REPLAY_MODES:
+            raise LLMError(
+                f"Unsupported replay mode: {settings.replay_mode}. Supported: {list(REPLAY_MODES)}"
+            )
+        if settings.replay_mode == "replay":
+            return ReplayProvider(settings)
+        if settings.replay_record_provider == LLMProvider.REPLAY.value:
+            raise LLMError("Replay record provider must be a real provider, not 'replay'")
+        return ReplayProvider(settings, get_llm_provider(settings.replay_record_provider, settings))
     else:
         raise LLMError(f"Unsupported provider: {provider}")
 
+    if settings.response_cache_enabled:
+        instance = CachedLLMProvider(instance, get_response_cache(settings))
+    return instance
+
 
 # Convenience functions for backward compatibility and easy usage
 def generate_text(
@@ -5,14 +5,167 @@
 """
 Base classes and exceptions for LLM provider abstraction layer.
 
-This module defines the abstract base class and exceptions used by all LLM providers.
+This module defines the abstract base class and exceptions used by all LLM providers,
+plus the shared per-provider semaphore that bounds concurrent async requests and the
+traced_llm_call decorator that records provider calls as tracing spans.
 """
 
+import asyncio
+import functools
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, TypeVar, Union
 
 from ..config import LLMSettings
+from ..tracing import KIND_LLM, current_span, record_llm_usage, span
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# asyncio.Semaphore binds to the loop it is first used on, so keep one set per loop
+_PROVIDER_SEMAPHORES: (
+    "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]"
+) = weakref.WeakKeyDictionary()
+_PROVIDER_SEMAPHORES_LOCK = threading.Lock()
+
+# Blocking (sync) requests share one threading semaphore per provider key
+_PROVIDER_THREAD_SEMAPHORES: dict[str, threading.BoundedSemaphore] = {}
+
+# Process-wide override of settings.max_concurrent_requests (see set_request_limit)
+_REQUEST_LIMIT_OVERRIDE: int | None = None
+
+
+def set_request_limit(limit: int | None) -> None:
+    """
+    Override the per-provider in-flight request cap for the whole process.
+
+    Used by the batch runner to enforce one global LLM concurrency budget no
+    matter how many papers run in parallel. Requests already in flight keep
+    their slot; new requests use semaphores sized to the new limit.
+
+    Args:
+        limit: Maximum concurrent requests per provider, or None to fall back
+            to settings.max_concurrent_requests
+    """
+    global _REQUEST_LIMIT_OVERRIDE
+    with _PROVIDER_SEMAPHORES_LOCK:
+        _REQUEST_LIMIT_OVERRIDE = limit
+        _PROVIDER_THREAD_SEMAPHORES.clear()
+        _PROVIDER_SEMAPHORES.clear()
+
+
+def get_provider_thread_semaphore(provider_key: str, limit: int) -> threading.BoundedSemaphore:
+    """
+    Return the threading semaphore shared by all blocking requests to one provider.
+
+    Sync counterpart of get_provider_semaphore(); the same limit rules apply.
+
+    Args:
+        provider_key: Provider identifier (e.g. "openai", "claude")
+        limit: Maximum concurrent in-flight requests (ignored if an override is set)
+
+    Returns:
+        threading.BoundedSemaphore shared across threads
+    """
+    with _PROVIDER_SEMAPHORES_LOCK:
+        semaphore = _PROVIDER_THREAD_SEMAPHORES.get(provider_key)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, _REQUEST_LIMIT_OVERRIDE or limit))
+            _PROVIDER_THREAD_SEMAPHORES[provider_key] = semaphore
+        return semaphore
+
+
+def get_provider_semaphore(provider_key: str, limit: int) -> asyncio.Semaphore:
+    """
+    Return the semaphore shared by all async requests to one provider.
+
+    Every provider instance with the same key (e.g. all OpenAIProvider objects
+    created by different pipeline steps) shares one semaphore per event loop,
+    so the cap applies to the whole process rather than to each instance.
+    The limit of the first caller wins for the lifetime of the loop unless
+    set_request_limit() overrides it.
+
+    Args:
+        provider_key: Provider identifier (e.g. "openai", "claude")
+        limit: Maximum concurrent in-flight requests
+
+    Returns:
+        asyncio.Semaphore bound to the running event loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    with _PROVIDER_SEMAPHORES_LOCK:
+        per_loop = _PROVIDER_SEMAPHORES.setdefault(loop, {})
+        semaphore = per_loop.get(provider_key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, _REQUEST_LIMIT_OVERRIDE or limit))
+            per_loop[provider_key] = semaphore
+        return semaphore
+
+
+def _record_result_usage(call_span: Any, result: Any) -> None:
+    """Fall back to the usage dict embedded in a JSON result (e.g. replayed responses)."""
+    if not isinstance(result, dict) or call_span.attributes.get("usage_recorded"):
+        return
+    model = (result.get("_metadata") or {}).get("model")
+    if call_span.attributes.get("response_cache") == "hit":
+        # Served from disk: nothing was billed for this call
+        if model:
+            call_span.set(model=model)
+        return
+    record_llm_usage(result.get("usage"), model)
+
+
+def traced_llm_call(func: F) -> F:
+    """
+    Record each call of a provider generate_* method as an llm tracing span.
+
+    The span carries the provider, schema name and reasoning effort, and the
+    token usage and cost the provider reports via record_llm_usage() (or the
+    ``usage`` of the returned JSON). Only the outermost provider records a span:
+    wrappers such as CachedLLMProvider or a recording ReplayProvider delegate to
+    a decorated provider without producing a second span for the same call.
+    """
+    name = func.__name__.removesuffix("_async")
+
+    def _attributes(provider: "BaseLLMProvider", kwargs: dict[str, Any]) -> dict[str, Any]:
+        attributes = {"provider": provider.trace_name}
+        for key in ("schema_name", "reasoning_effort"):
+            if kwargs.get(key):
+                attributes[key] = kwargs[key]
+        return attributes
+
+    def _nested() -> bool:
+        parent = current_span()
+        return parent is not None and parent.kind == KIND_LLM
+
+    if asyncio.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(self: "BaseLLMProvider", *args: Any, **kwargs: Any) -> Any:
+            if _nested():
+                return await func(self, *args, **kwargs)
+            with span(name, KIND_LLM, **_attributes(self, kwargs)) as call_span:
+                result = await func(self, *args, **kwargs)
+                _record_result_usage(call_span, result)
+                return result
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(func)
+    def wrapper(self: "BaseLLMProvider", *args: Any, **kwargs: Any) -> Any:
+        if _nested():
+            return func(self, *args, **kwargs)
+        with span(name, KIND_LLM, **_attributes(self, kwargs)) as call_span:
+            result = func(self, *args, **kwargs)
+            _record_result_usage(call_span, result)
+            return result
+
+    return wrapper  # type: ignore[return-value]
 
 
 class LLMError(Exception):
@@ -39,11 +192,21 @@ class BaseLLMProvider(ABC):
     2. Initialize provider-specific client (openai.OpenAI, anthropic.Anthropic, etc.)
     3. Implement all three abstract methods with retry logic
     4. Raise LLMProviderError for provider-specific errors
+    5. Optionally override the *_async methods with a native async client
+    6. Decorate each implemented generate_* method with @traced_llm_call
+
+    The async methods default to running the sync implementation in a worker
+    thread. Every request holds a slot of the provider's shared semaphore
+    (settings.max_concurrent_requests) while it is in flight: request_slot()
+    for async requests, request_slot_sync() for blocking ones.
 
     Attributes:
         settings: LLM configuration (API keys, models, timeouts, etc.)
+        concurrency_key: Key of the shared semaphore (defaults to class name)
     """
 
+    concurrency_key: str = ""
+
     def __init__(self, settings: LLMSettings):
         """
         Initialize provider with settings.
@@ -53,6 +216,11 @@ class BaseLLMProvider(ABC):
         """
         self.settings = settings
 
+    @property
+    def trace_name(self) -> str:
+        """Provider name recorded on llm tracing spans."""
+        return self.concurrency_key or type(self).__name__
+
     @abstractmethod
     def generate_text(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
         """
@@ -116,6 +284,7 @@ class BaseLLMProvider(ABC):
         max_pages: int | None = None,
         schema_name: str | None = None,
         reasoning_effort: str | None = None,
+        context: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
@@ -136,6 +305,8 @@ class BaseLLMProvider(ABC):
             max_pages: Optional limit on pages to process (max 100 per API limits)
             schema_name: Optional name for schema (used by some providers)
             reasoning_effort: Optional reasoning effort level ("low", "medium", "high") for GPT-5.1+ (ignored by Claude)
+            context: Optional per-call input (e.g. a validation report) that changes
+                between calls; kept out of the cacheable instructions/schema/PDF prefix
             **kwargs: Additional provider-specific arguments
 
         Returns:
@@ -163,3 +334,89 @@ class BaseLLMProvider(ABC):
             >>> # data includes tables, figures, complete extraction
         """
         pass
+
+    def request_slot(self) -> asyncio.Semaphore:
+        """
+        Return the shared semaphore bounding in-flight async requests for this provider.
+
+        Use as ``async with self.request_slot(): ...`` around each API request.
+        """
+        key = self.concurrency_key or type(self).__name__
+        return get_provider_semaphore(key, self.settings.max_concurrent_requests)
+
+    def request_slot_sync(self) -> threading.BoundedSemaphore:
+        """
+        Return the shared semaphore bounding in-flight blocking requests for this provider.
+
+        Use as ``with self.request_slot_sync(): ...`` around each blocking API request.
+        """
+        key = self.concurrency_key or type(self).__name__
+        return get_provider_thread_semaphore(key, self.settings.max_concurrent_requests)
+
+    async def generate_text_async(
+        self, prompt: str, system_prompt: str | None = None, **kwargs
+    ) -> str:
+        """
+        Async version of generate_text().
+
+        Default implementation runs generate_text() in a worker thread while
+        holding a request slot. Providers with native async clients override this.
+        """
+        async with self.request_slot():
+            return await asyncio.to_thread(self.generate_text, prompt, system_prompt, **kwargs)
+
+    async def generate_json_with_schema_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Async version of generate_json_with_schema().
+
+        Default implementation runs the sync method in a worker thread while
+        holding a request slot. Providers with native async clients override this.
+        """
+        async with self.request_slot():
+            return await asyncio.to_thread(
+                self.generate_json_with_schema,
+                prompt,
+                schema,
+                system_prompt=system_prompt,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                **kwargs,
+            )
+
+    async def generate_json_with_pdf_async(
+        self,
+        pdf_path: Union["Path", str],
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Async version of generate_json_with_pdf().
+
+        Default implementation runs the sync method in a worker thread while
+        holding a request slot. Providers with native async clients override this.
+        """
+        async with self.request_slot():
+            return await asyncio.to_thread(
+                self.generate_json_with_pdf,
+                pdf_path,
+                schema,
+                system_prompt=system_prompt,
+                max_pages=max_pages,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                context=context,
+                **kwargs,
+            )
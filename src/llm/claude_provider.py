@@ -28,38 +28,61 @@ Note:
     Requires jsonschema library for schema validation.
 """
 
+import asyncio
 import base64
 import json
 import logging
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import anthropic
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
 
 from ..config import LLMSettings
-from .base import BaseLLMProvider, LLMProviderError
+from ..lazy_import import is_available, lazy_import
+from ..serialization import dumps_prompt
+from ..tracing import record_llm_usage
+from ..validation import validate_instance
+from .base import BaseLLMProvider, LLMProviderError, traced_llm_call
+from .file_registry import get_file_registry, is_missing_file_error
+from .pdf_slicer import slice_pdf
+from .rate_limiter import rate_limited_http_client
 
 logger = logging.getLogger(__name__)
 
-# Check jsonschema availability
-try:
+# Beta flag required on requests that reference Files API uploads
+FILES_API_BETA = "files-api-2025-04-14"
+
+if TYPE_CHECKING:
+    import anthropic
     import jsonschema
+    from anthropic.types import CacheControlEphemeralParam, TextBlockParam
+else:
+    # Imported on first use (see src/lazy_import.py)
+    anthropic = lazy_import("anthropic")
+    jsonschema = lazy_import("jsonschema")
+
+# Prompt caching breakpoint: everything up to and including a marked block is cached
+_CACHE_CONTROL: "CacheControlEphemeralParam" = {"type": "ephemeral"}
 
-    HAVE_JSONSCHEMA = True
-except ImportError:
-    HAVE_JSONSCHEMA = False
+# Check jsonschema availability
+HAVE_JSONSCHEMA = is_available("jsonschema")
+if not HAVE_JSONSCHEMA:
     logger.warning(
         "jsonschema library not available. Schema validation will be disabled. "
         "Install with: pip install jsonschema"
     )
 
 
+def _is_transient_error(error: BaseException) -> bool:
+    """Rate-limit and timeout errors are retried."""
+    return isinstance(error, (anthropic.RateLimitError, anthropic.APITimeoutError))
+
+
 def _extract_json_from_markdown(content: str) -> str:
     """
     Extract JSON content from markdown code blocks.
@@ -106,6 +129,40 @@ def _extract_json_from_markdown(content: str) -> str:
     return content
 
 
+def _usage_to_dict(usage: Any) -> dict[str, Any]:
+    """
+    Normalise Claude usage to the OpenAI-style dict used across the pipeline.
+
+    Claude reports uncached input, cache writes and cache reads separately;
+    ``input_tokens`` here is their sum (all prompt tokens, as with OpenAI) and
+    ``cached_tokens`` mirrors OpenAI's cache-hit field. The raw cache counters
+    are kept as ``cache_read_input_tokens`` / ``cache_creation_input_tokens``.
+    """
+    uncached = getattr(usage, "input_tokens", None)
+    output_tokens = getattr(usage, "output_tokens", None)
+    cache_read = getattr(usage, "cache_read_input_tokens", None)
+    cache_write = getattr(usage, "cache_creation_input_tokens", None)
+    cache_read = cache_read if isinstance(cache_read, int) else 0
+    cache_write = cache_write if isinstance(cache_write, int) else 0
+
+    input_tokens = uncached + cache_read + cache_write if isinstance(uncached, int) else uncached
+    usage_dict: dict[str, Any] = {"input_tokens": input_tokens, "output_tokens": output_tokens}
+    # Calculate total tokens
+    if input_tokens and output_tokens:
+        usage_dict["total_tokens"] = input_tokens + output_tokens
+    if cache_read or cache_write:
+        usage_dict["cached_tokens"] = cache_read
+        usage_dict["cache_read_input_tokens"] = cache_read
+        usage_dict["cache_creation_input_tokens"] = cache_write
+    return usage_dict
+
+
+def _record_response_usage(response: Any) -> None:
+    """Attach the response's token usage to the current llm tracing span."""
+    if hasattr(response, "usage"):
+        record_llm_usage(_usage_to_dict(response.usage), getattr(response, "model", None))
+
+
 class ClaudeProvider(BaseLLMProvider):
     """
     Anthropic Claude API provider implementation with prompt-based schema guidance.
@@ -123,6 +180,7 @@ class ClaudeProvider(BaseLLMProvider):
 
     Attributes:
         client: Anthropic client instance
+        async_client: AsyncAnthropic client used by the *_async methods (created lazily)
         settings: LLM configuration
 
     Note:
@@ -130,6 +188,8 @@ class ClaudeProvider(BaseLLMProvider):
         Requires jsonschema library for schema validation.
     """
 
+    concurrency_key = "claude"
+
     def __init__(self, settings: LLMSettings):
         """
         Initialize Claude provider.
@@ -151,19 +211,289 @@ class ClaudeProvider(BaseLLMProvider):
             )
 
         self.client = anthropic.Anthropic(
-            api_key=settings.anthropic_api_key, timeout=settings.timeout
+            api_key=settings.anthropic_api_key,
+            timeout=settings.timeout,
+            http_client=rate_limited_http_client(
+                settings, self.concurrency_key, anthropic.DefaultHttpxClient
+            ),
         )
         logger.info(f"Initialized Claude provider with model: {settings.anthropic_model}")
 
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """Lazily created AsyncAnthropic client sharing the sync client's settings."""
+        if getattr(self, "_async_client", None) is None:
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.settings.anthropic_api_key,
+                timeout=self.settings.timeout,
+                http_client=rate_limited_http_client(
+                    self.settings, self.concurrency_key, anthropic.DefaultAsyncHttpxClient
+                ),
+            )
+        return self._async_client
+
+    def _schema_system_prompt(
+        self, schema: dict[str, Any], system_prompt: str | None, max_pages: int | None = None
+    ) -> "str | list[TextBlockParam]":
+        """
+        Build the system prompt: instructions followed by the schema (and optional page limit).
+
+        With settings.anthropic_prompt_caching the instructions and the schema are
+        separate text blocks marked with cache_control, so every call that repeats
+        them (each iteration of a correction loop) reads the ~100 KB prefix from the
+        prompt cache. Otherwise a single string is returned.
+        """
+        # Include schema information in system prompt
+        schema_instruction = (
+            f"You must return a JSON object that conforms to this JSON schema:\n"
+            f"{dumps_prompt(schema)}\n\n"
+            f"CRITICAL: Follow the schema exactly. Include all required fields. "
+            f"Return ONLY valid JSON, no markdown or explanations."
+        )
+
+        # Add page limit instruction if specified
+        if max_pages:
+            schema_instruction += f"\n\nProcess only the first {max_pages} pages of the PDF."
+
+        if not self.settings.anthropic_prompt_caching:
+            return (system_prompt or "") + "\n\n" + schema_instruction
+
+        blocks: list[TextBlockParam] = []
+        if system_prompt:
+            blocks.append({"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL})
+        blocks.append({"type": "text", "text": schema_instruction, "cache_control": _CACHE_CONTROL})
+        return blocks
+
+    def _files_api_available(self) -> bool:
+        """Files API is enabled in settings and supported by the installed SDK."""
+        if not self.settings.files_api_enabled:
+            return False
+        if getattr(getattr(self.client, "beta", None), "files", None) is None:
+            logger.warning("anthropic SDK has no Files API support; sending PDFs inline")
+            return False
+        return True
+
+    def _upload_pdf(self, pdf_path: Path) -> tuple[str, float | None]:
+        """Upload a PDF through the beta Files API (uploader for the file registry)."""
+        with self.request_slot_sync():
+            metadata = self.client.beta.files.upload(
+                file=(pdf_path.name, pdf_path.read_bytes(), "application/pdf")
+            )
+        return metadata.id, None
+
+    def _build_pdf_messages(
+        self, pdf_path: Path, context: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Size-check a PDF and wrap it into a Claude user message.
+
+        With the Files API available the PDF is uploaded once per content hash
+        (see file_registry) and referenced by file ID; otherwise it is sent inline
+        as base64. The document block is a prompt caching breakpoint when
+        settings.anthropic_prompt_caching is on; per-call context (e.g. a
+        validation report) follows it so it never invalidates the cached prefix.
+
+        Raises:
+            LLMProviderError: If the PDF is missing or exceeds the 32 MB limit
+        """
+        if not pdf_path.exists():
+            raise LLMProviderError(f"PDF file not found: {pdf_path}")
+
+        # Check file size (32 MB limit)
+        file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
+        if file_size_mb > 32:
+            raise LLMProviderError(f"PDF file too large: {file_size_mb:.1f} MB (max 32 MB)")
+
+        source: dict[str, Any]
+        if self._files_api_available():
+            handle = get_file_registry(self.settings).get_or_upload(
+                self.concurrency_key, pdf_path, self._upload_pdf
+            )
+            source = {"type": "file", "file_id": handle.file_id}
+            logger.info(f"Sending PDF to Claude by file ID: {pdf_path.name} ({handle.file_id})")
+        else:
+            # Read and encode PDF as base64
+            with open(pdf_path, "rb") as pdf_file:
+                pdf_data = base64.b64encode(pdf_file.read()).decode("utf-8")
+            source = {"type": "base64", "media_type": "application/pdf", "data": pdf_data}
+            logger.info(f"Uploading PDF to Claude: {pdf_path.name} ({file_size_mb:.1f} MB)")
+
+        document: dict[str, Any] = {"type": "document", "source": source}
+        if self.settings.anthropic_prompt_caching:
+            document["cache_control"] = _CACHE_CONTROL
+
+        content: list[dict[str, Any]] = [document]
+        if context:
+            content.append({"type": "text", "text": context})
+        content.append(
+            {
+                "type": "text",
+                "text": "Extract structured data from this PDF document according to the schema.",
+            }
+        )
+        return [{"role": "user", "content": content}]
+
+    def _pdf_request(
+        self, pdf_path: Path, context: str | None = None, **request: Any
+    ) -> dict[str, Any]:
+        """Build messages.create() arguments for a PDF request."""
+        if context and not self.settings.anthropic_prompt_caching:
+            # Without caching keep the original layout: context appended to the system prompt
+            request["system"] = f"{request.get('system') or ''}\n\n{context}"
+            context = None
+        messages = self._build_pdf_messages(pdf_path, context)
+        if messages[0]["content"][0]["source"]["type"] == "file":
+            headers = dict(request.get("extra_headers") or {})
+            betas = [b for b in headers.get("anthropic-beta", "").split(",") if b]
+            headers["anthropic-beta"] = ",".join([*betas, FILES_API_BETA])
+            request["extra_headers"] = headers
+        return {**request, "messages": messages}
+
+    def _invalidate_missing_file(
+        self, error: "anthropic.APIStatusError", request: dict[str, Any]
+    ) -> bool:
+        """Drop the registry handle if error says the referenced file is gone."""
+        file_id = request["messages"][0]["content"][0]["source"].get("file_id")
+        if file_id is None or not is_missing_file_error(error):
+            return False
+        logger.warning(f"Claude rejected file {file_id} ({error}); re-uploading PDF")
+        return get_file_registry(self.settings).invalidate(self.concurrency_key, file_id)
+
+    def _create_pdf_message(
+        self, pdf_path: Path, context: str | None = None, **request: Any
+    ) -> Any:
+        """Send a PDF request, re-uploading once if the cached file ID has expired."""
+        full_request = self._pdf_request(pdf_path, context, **request)
+        try:
+            with self.request_slot_sync():
+                return self.client.messages.create(**full_request)
+        except anthropic.APIStatusError as e:
+            if not self._invalidate_missing_file(e, full_request):
+                raise
+        full_request = self._pdf_request(pdf_path, context, **request)
+        with self.request_slot_sync():
+            return self.client.messages.create(**full_request)
+
+    async def _create_pdf_message_async(
+        self, pdf_path: Path, context: str | None = None, **request: Any
+    ) -> Any:
+        """Async version of _create_pdf_message(); uploads run in a worker thread."""
+        full_request = await asyncio.to_thread(self._pdf_request, pdf_path, context, **request)
+        try:
+            return await self._create_message_async(**full_request)
+        except anthropic.APIStatusError as e:
+            if not self._invalidate_missing_file(e, full_request):
+                raise
+        full_request = await asyncio.to_thread(self._pdf_request, pdf_path, context, **request)
+        return await self._create_message_async(**full_request)
+
+    def _parse_json_response(
+        self, response: Any, schema: dict[str, Any], success_message: str
+    ) -> dict[str, Any]:
+        """
+        Parse, schema-validate and annotate a Claude JSON response.
+
+        Adds ``usage`` and ``_metadata`` to the returned dictionary.
+
+        Raises:
+            LLMProviderError: If the response is not valid JSON or violates the schema
+        """
+        _record_response_usage(response)
+        content = response.content[0].text.strip()
+
+        # Extract JSON from markdown code blocks if present
+        content = _extract_json_from_markdown(content)
+
+        try:
+            result = cast(dict[str, Any], json.loads(content))
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            # Truncate long responses to avoid logging sensitive data
+            content_preview = content[:200] + "..." if len(content) > 200 else content
+            logger.error(f"Raw response preview: {content_preview}")
+            raise LLMProviderError(f"Invalid JSON response: {e}") from e
+
+        # Validate against schema using jsonschema library
+        if HAVE_JSONSCHEMA:
+            try:
+                validate_instance(result, schema)
+                logger.info(success_message)
+            except jsonschema.ValidationError as e:
+                logger.error(f"Schema validation failed: {e.message}")
+                raise LLMProviderError(
+                    f"Generated JSON does not conform to schema: {e.message}"
+                ) from e
+        else:
+            logger.warning(
+                "jsonschema library not available - skipping schema validation. "
+                "Schema guidance was provided to LLM but compliance is not guaranteed."
+            )
+
+        # Add usage information to result if available
+        if hasattr(response, "usage"):
+            result["usage"] = _usage_to_dict(response.usage)
+
+        # Add enhanced metadata to result
+        metadata = {}
+
+        # Response tracking
+        if hasattr(response, "id"):
+            metadata["response_id"] = response.id
+        if hasattr(response, "model"):
+            metadata["model"] = response.model
+        if hasattr(response, "stop_reason"):
+            metadata["stop_reason"] = response.stop_reason
+
+        if metadata:
+            result["_metadata"] = metadata
+
+        return result
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception(_is_transient_error),
+    )
+    async def _create_message_async(self, **request: Any) -> Any:
+        """Issue one async Messages API call while holding a provider request slot."""
+        async with self.request_slot():
+            return await self.async_client.messages.create(**request)
+
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_text(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
         """Generate text using Claude API"""
         try:
-            response = self.client.messages.create(
+            with self.request_slot_sync():
+                response = self.client.messages.create(
+                    model=self.settings.anthropic_model,
+                    max_tokens=self.settings.anthropic_max_tokens,
+                    temperature=self.settings.temperature,
+                    system=system_prompt or "",
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
+                )
+
+            _record_response_usage(response)
+            result = str(response.content[0].text).strip()
+            logger.info("Successfully generated text with Claude")
+            return result
+
+        except anthropic.AnthropicError as e:
+            logger.error(f"Claude API error: {e}")
+            raise LLMProviderError(f"Claude API error: {e}") from e
+
+    @traced_llm_call
+    async def generate_text_async(
+        self, prompt: str, system_prompt: str | None = None, **kwargs
+    ) -> str:
+        """Async version of generate_text() using AsyncAnthropic."""
+        try:
+            response = await self._create_message_async(
                 model=self.settings.anthropic_model,
                 max_tokens=self.settings.anthropic_max_tokens,
                 temperature=self.settings.temperature,
@@ -172,18 +502,20 @@ class ClaudeProvider(BaseLLMProvider):
                 **kwargs,
             )
 
+            _record_response_usage(response)
             result = str(response.content[0].text).strip()
-            logger.info("Successfully generated text with Claude")
+            logger.info("Successfully generated text with Claude (async)")
             return result
 
         except anthropic.AnthropicError as e:
             logger.error(f"Claude API error: {e}")
             raise LLMProviderError(f"Claude API error: {e}") from e
 
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_json_with_schema(
         self,
@@ -203,93 +535,62 @@ class ClaudeProvider(BaseLLMProvider):
         as Claude doesn't support explicit reasoning effort levels.
         """
         try:
-            # Include schema information in system prompt
-            schema_instruction = (
-                f"\n\nYou must return a JSON object that conforms to this JSON schema:\n"
-                f"{json.dumps(schema, indent=2)}\n\n"
-                f"CRITICAL: Follow the schema exactly. Include all required fields. "
-                f"Return ONLY valid JSON, no markdown or explanations."
+            with self.request_slot_sync():
+                response = self.client.messages.create(
+                    model=self.settings.anthropic_model,
+                    max_tokens=self.settings.anthropic_max_tokens,
+                    temperature=self.settings.temperature,
+                    system=self._schema_system_prompt(schema, system_prompt),
+                    messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
+                )
+
+            return self._parse_json_response(
+                response,
+                schema,
+                "Successfully generated and validated schema-conforming JSON with Claude",
             )
-            full_system_prompt = (system_prompt or "") + schema_instruction
 
-            response = self.client.messages.create(
+        except anthropic.AnthropicError as e:
+            logger.error(f"Claude API error with schema-based generation: {e}")
+            raise LLMProviderError(f"Claude schema-based generation failed: {e}") from e
+
+    @traced_llm_call
+    async def generate_json_with_schema_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Async version of generate_json_with_schema() using AsyncAnthropic."""
+        try:
+            response = await self._create_message_async(
                 model=self.settings.anthropic_model,
                 max_tokens=self.settings.anthropic_max_tokens,
                 temperature=self.settings.temperature,
-                system=full_system_prompt,
+                system=self._schema_system_prompt(schema, system_prompt),
                 messages=[{"role": "user", "content": prompt}],
                 **kwargs,
             )
 
-            content = response.content[0].text.strip()
-
-            # Extract JSON from markdown code blocks if present
-            content = _extract_json_from_markdown(content)
-
-            result = cast(dict[str, Any], json.loads(content))
-
-            # Validate against schema using jsonschema library
-            if HAVE_JSONSCHEMA:
-                try:
-                    jsonschema.validate(result, schema)
-                    logger.info(
-                        "Successfully generated and validated schema-conforming JSON with Claude"
-                    )
-                except jsonschema.ValidationError as e:
-                    logger.error(f"Schema validation failed: {e.message}")
-                    raise LLMProviderError(
-                        f"Generated JSON does not conform to schema: {e.message}"
-                    ) from e
-            else:
-                logger.warning(
-                    "jsonschema library not available - skipping schema validation. "
-                    "Schema guidance was provided to LLM but compliance is not guaranteed."
-                )
-
-            # Add usage information to result if available
-            if hasattr(response, "usage"):
-                usage = response.usage
-                usage_dict = {
-                    "input_tokens": getattr(usage, "input_tokens", None),
-                    "output_tokens": getattr(usage, "output_tokens", None),
-                }
-                # Calculate total tokens
-                if usage_dict["input_tokens"] and usage_dict["output_tokens"]:
-                    usage_dict["total_tokens"] = (
-                        usage_dict["input_tokens"] + usage_dict["output_tokens"]
-                    )
-                result["usage"] = usage_dict
-
-            # Add enhanced metadata to result
-            metadata = {}
-
-            # Response tracking
-            if hasattr(response, "id"):
-                metadata["response_id"] = response.id
-            if hasattr(response, "model"):
-                metadata["model"] = response.model
-            if hasattr(response, "stop_reason"):
-                metadata["stop_reason"] = response.stop_reason
-
-            if metadata:
-                result["_metadata"] = metadata
-
-            return result
+            return self._parse_json_response(
+                response,
+                schema,
+                "Successfully generated and validated schema-conforming JSON with Claude",
+            )
 
         except anthropic.AnthropicError as e:
             logger.error(f"Claude API error with schema-based generation: {e}")
             raise LLMProviderError(f"Claude schema-based generation failed: {e}") from e
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            # Truncate long responses to avoid logging sensitive data
-            content_preview = content[:200] + "..." if len(content) > 200 else content
-            logger.error(f"Raw response preview: {content_preview}")
-            raise LLMProviderError(f"Invalid JSON response: {e}") from e
 
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((anthropic.RateLimitError, anthropic.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_json_with_pdf(
         self,
@@ -299,129 +600,86 @@ class ClaudeProvider(BaseLLMProvider):
         max_pages: int | None = None,
         schema_name: str | None = None,
         reasoning_effort: str | None = None,
+        context: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
         Generate structured JSON from PDF using Claude API with vision capabilities.
 
         Uses Claude's PDF processing to analyze documents including tables, images,
-        and charts. PDF is base64-encoded and sent directly in the message.
+        and charts. With max_pages only that page range is sent (see pdf_slicer). When
+        LLM_FILES_API is enabled, the PDF is uploaded once and referenced by file ID;
+        otherwise it is sent inline as base64.
         The reasoning_effort parameter is accepted for API compatibility but ignored
         as Claude doesn't support explicit reasoning effort levels.
+
+        Instructions, schema and PDF are prompt caching breakpoints; ``context``
+        (per-iteration input such as a validation report) is sent after them.
         """
         try:
-            # Normalize to Path object
-            pdf_path = Path(pdf_path)
-
-            if not pdf_path.exists():
-                raise LLMProviderError(f"PDF file not found: {pdf_path}")
-
-            # Check file size (32 MB limit)
-            file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > 32:
-                raise LLMProviderError(f"PDF file too large: {file_size_mb:.1f} MB (max 32 MB)")
-
-            # Read and encode PDF as base64
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_data = base64.b64encode(pdf_file.read()).decode("utf-8")
-
-            logger.info(f"Uploading PDF to Claude: {pdf_path.name} ({file_size_mb:.1f} MB)")
-
-            # Include schema information in system prompt
-            schema_instruction = (
-                f"\n\nYou must return a JSON object that conforms to this JSON schema:\n"
-                f"{json.dumps(schema, indent=2)}\n\n"
-                f"CRITICAL: Follow the schema exactly. Include all required fields. "
-                f"Return ONLY valid JSON, no markdown or explanations."
-            )
-            full_system_prompt = (system_prompt or "") + schema_instruction
-
-            # Add page limit instruction if specified
-            if max_pages:
-                full_system_prompt += f"\n\nProcess only the first {max_pages} pages of the PDF."
+            # Normalize to Path object and keep only the requested pages
+            source_path = Path(pdf_path)
+            pdf_path = slice_pdf(source_path, max_pages, self.settings)
+            # The page limit instruction is only needed when the full PDF is sent
+            page_limit = max_pages if pdf_path == source_path else None
 
             # Create message with PDF document
-            response = self.client.messages.create(
+            response = self._create_pdf_message(
+                pdf_path,
+                context,
                 model=self.settings.anthropic_model,
                 max_tokens=self.settings.anthropic_max_tokens,
                 temperature=self.settings.temperature,
-                system=full_system_prompt,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "document",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "application/pdf",
-                                    "data": pdf_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": "Extract structured data from this PDF document according to the schema.",
-                            },
-                        ],
-                    }
-                ],
+                system=self._schema_system_prompt(schema, system_prompt, page_limit),
                 **kwargs,
             )
 
-            content = response.content[0].text.strip()
-
-            # Extract JSON from markdown code blocks if present
-            content = _extract_json_from_markdown(content)
+            return self._parse_json_response(
+                response,
+                schema,
+                "Successfully extracted and validated schema-conforming JSON from PDF with Claude",
+            )
 
-            result = cast(dict[str, Any], json.loads(content))
+        except FileNotFoundError as e:
+            logger.error(f"PDF file not found: {pdf_path}")
+            raise LLMProviderError(f"PDF file not found: {e}") from e
+        except anthropic.AnthropicError as e:
+            logger.error(f"Claude API error with PDF upload: {e}")
+            raise LLMProviderError(f"Claude PDF processing failed: {e}") from e
 
-            # Validate against schema using jsonschema library
-            if HAVE_JSONSCHEMA:
-                try:
-                    jsonschema.validate(result, schema)
-                    logger.info(
-                        "Successfully extracted and validated schema-conforming JSON from PDF with Claude"
-                    )
-                except jsonschema.ValidationError as e:
-                    logger.error(f"Schema validation failed: {e.message}")
-                    raise LLMProviderError(
-                        f"Generated JSON does not conform to schema: {e.message}"
-                    ) from e
-            else:
-                logger.warning(
-                    "jsonschema library not available - skipping schema validation. "
-                    "Schema guidance was provided to LLM but compliance is not guaranteed."
-                )
+    @traced_llm_call
+    async def generate_json_with_pdf_async(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Async version of generate_json_with_pdf() using AsyncAnthropic."""
+        try:
+            source_path = Path(pdf_path)
+            pdf_path = await asyncio.to_thread(slice_pdf, source_path, max_pages, self.settings)
+            page_limit = max_pages if pdf_path == source_path else None
 
-            # Add usage information to result if available
-            if hasattr(response, "usage"):
-                usage = response.usage
-                usage_dict = {
-                    "input_tokens": getattr(usage, "input_tokens", None),
-                    "output_tokens": getattr(usage, "output_tokens", None),
-                }
-                # Calculate total tokens
-                if usage_dict["input_tokens"] and usage_dict["output_tokens"]:
-                    usage_dict["total_tokens"] = (
-                        usage_dict["input_tokens"] + usage_dict["output_tokens"]
-                    )
-                result["usage"] = usage_dict
-
-            # Add enhanced metadata to result
-            metadata = {}
-
-            # Response tracking
-            if hasattr(response, "id"):
-                metadata["response_id"] = response.id
-            if hasattr(response, "model"):
-                metadata["model"] = response.model
-            if hasattr(response, "stop_reason"):
-                metadata["stop_reason"] = response.stop_reason
-
-            if metadata:
-                result["_metadata"] = metadata
+            response = await self._create_pdf_message_async(
+                pdf_path,
+                context,
+                model=self.settings.anthropic_model,
+                max_tokens=self.settings.anthropic_max_tokens,
+                temperature=self.settings.temperature,
+                system=self._schema_system_prompt(schema, system_prompt, page_limit),
+                **kwargs,
+            )
 
-            return result
+            return self._parse_json_response(
+                response,
+                schema,
+                "Successfully extracted and validated schema-conforming JSON from PDF with Claude",
+            )
 
         except FileNotFoundError as e:
             logger.error(f"PDF file not found: {pdf_path}")
@@ -429,9 +687,3 @@ class ClaudeProvider(BaseLLMProvider):
         except anthropic.AnthropicError as e:
             logger.error(f"Claude API error with PDF upload: {e}")
             raise LLMProviderError(f"Claude PDF processing failed: {e}") from e
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            # Truncate long responses to avoid logging sensitive data
-            content_preview = content[:200] + "..." if len(content) > 200 else content
-            logger.error(f"Raw response preview: {content_preview}")
-            raise LLMProviderError(f"Invalid JSON response: {e}") from e
@@ -0,0 +1,233 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Registry of PDFs uploaded through the providers' Files APIs.
+
+Every PDF step (classification, extraction, each validation and correction
+iteration) used to base64-encode and re-send the whole PDF, so one paper went
+up 6-12 times per run. With the registry, each provider uploads a PDF once per
+content hash and later calls reference the returned file ID instead.
+
+Lifecycle of a handle:
+    - Keyed by (provider, SHA-256 of the PDF bytes), so renamed copies share one upload
+    - Expires after settings.files_api_ttl_hours or the provider-reported expiry,
+      whichever comes first; expired handles are re-uploaded on next use
+    - Providers call invalidate() when a request is rejected because the file is
+      gone (deleted or expired server-side) and retry once with a fresh upload
+
+Concurrent callers asking for the same PDF block on a per-key lock, so parallel
+pipeline steps never upload the same file twice.
+
+Example:
+    >>> registry = get_file_registry(settings)
+    >>> handle = registry.get_or_upload("openai", pdf_path, provider._upload_pdf)
+    >>> handle.file_id
+    'file-abc123'
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from ..config import LLMSettings
+from .response_cache import hash_file
+
+logger = logging.getLogger(__name__)
+
+# Uploader signature: pdf_path -> (file_id, provider-reported expiry timestamp or None)
+Uploader = Callable[[Path], tuple[str, float | None]]
+
+
+@dataclass(frozen=True)
+class FileHandle:
+    """
+    An uploaded PDF that can be referenced by file ID.
+
+    Attributes:
+        provider: Provider key the file was uploaded to ("openai", "claude")
+        file_id: Provider file ID
+        sha256: Hex digest of the uploaded bytes
+        uploaded_at: Upload time (epoch seconds)
+        expires_at: Time after which the handle must not be used (None = never)
+    """
+
+    provider: str
+    file_id: str
+    sha256: str
+    uploaded_at: float
+    expires_at: float | None = None
+
+    def is_expired(self, now: float | None = None, margin_seconds: float = 0.0) -> bool:
+        """Return True if the handle expires within margin_seconds of now."""
+        if self.expires_at is None:
+            return False
+        return (now if now is not None else time.time()) + margin_seconds >= self.expires_at
+
+
+@dataclass
+class FileRegistryStats:
+    """
+    Upload/reuse counters for a file registry.
+
+    Attributes:
+        uploads: Files uploaded to a provider
+        reuses: Requests served with an existing file ID
+        expired: Handles dropped because they reached their expiry
+        invalidated: Handles dropped after the provider rejected the file ID
+    """
+
+    uploads: int = 0
+    reuses: int = 0
+    expired: int = 0
+    invalidated: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class FileHandleRegistry:
+    """
+    Thread-safe map from (provider, PDF hash) to uploaded file handles.
+
+    Args:
+        ttl_seconds: Maximum handle lifetime (0 = only provider-reported expiry)
+        refresh_margin_seconds: Re-upload this long before a handle expires, so a
+            request never starts with a file that expires mid-flight
+    """
+
+    def __init__(self, ttl_seconds: float = 0.0, refresh_margin_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._handles: dict[tuple[str, str], FileHandle] = {}
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stats = FileRegistryStats()
+
+    def _key_lock(self, key: tuple[str, str]) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def get_or_upload(self, provider: str, pdf_path: Path | str, upload: Uploader) -> FileHandle:
+        """
+        Return a valid handle for pdf_path, uploading it if needed.
+
+        Args:
+            provider: Provider key the handle belongs to
+            pdf_path: PDF to upload
+            upload: Callable performing the upload, returning (file_id, expires_at)
+
+        Returns:
+            FileHandle with a file ID usable in provider requests
+        """
+        pdf_path = Path(pdf_path)
+        key = (provider, hash_file(pdf_path))
+
+        with self._key_lock(key):
+            with self._lock:
+                handle = self._handles.get(key)
+                if handle is not None:
+                    if not handle.is_expired(margin_seconds=self.refresh_margin_seconds):
+                        self._stats.reuses += 1
+                        return handle
+                    self._stats.expired += 1
+                    del self._handles[key]
+                    logger.info(f"File handle {handle.file_id} expired, re-uploading")
+
+            uploaded_at = time.time()
+            file_id, provider_expiry = upload(pdf_path)
+            expiries = [t for t in (provider_expiry,) if t]
+            if self.ttl_seconds > 0:
+                expiries.append(uploaded_at + self.ttl_seconds)
+            handle = FileHandle(
+                provider=provider,
+                file_id=file_id,
+                sha256=key[1],
+                uploaded_at=uploaded_at,
+                expires_at=min(expiries) if expiries else None,
+            )
+            logger.info(f"Uploaded {pdf_path.name} to {provider} Files API as {file_id}")
+
+            with self._lock:
+                self._handles[key] = handle
+                self._stats.uploads += 1
+            return handle
+
+    def invalidate(self, provider: str, file_id: str) -> bool:
+        """
+        Drop the handle for a file ID the provider no longer accepts.
+
+        Returns:
+            True if a handle was removed
+        """
+        with self._lock:
+            for key, handle in list(self._handles.items()):
+                if key[0] == provider and handle.file_id == file_id:
+                    del self._handles[key]
+                    self._stats.invalidated += 1
+                    logger.info(f"Invalidated file handle {file_id} ({provider})")
+                    return True
+        return False
+
+    def handles(self) -> list[FileHandle]:
+        """Return a snapshot of all registered handles."""
+        with self._lock:
+            return list(self._handles.values())
+
+    def clear(self) -> None:
+        """Forget all handles (uploaded files are left on the provider)."""
+        with self._lock:
+            self._handles.clear()
+
+    def stats(self) -> FileRegistryStats:
+        """Return a snapshot of the upload/reuse counters."""
+        with self._lock:
+            return FileRegistryStats(**asdict(self._stats))
+
+
+def is_missing_file_error(error: Exception) -> bool:
+    """
+    Return True if a provider error means a referenced file ID is gone.
+
+    Both SDKs raise a 404 NotFoundError (or a 400 mentioning the file) when a
+    request references a deleted or expired file.
+    """
+    status_code = getattr(error, "status_code", None)
+    message = str(error).lower()
+    if status_code == 404:
+        return True
+    return (
+        status_code == 400
+        and "file" in message
+        and any(
+            marker in message for marker in ("not found", "expired", "does not exist", "deleted")
+        )
+    )
+
+
+_SHARED_REGISTRY: FileHandleRegistry | None = None
+_SHARED_REGISTRY_LOCK = threading.Lock()
+
+
+def get_file_registry(settings: LLMSettings) -> FileHandleRegistry:
+    """
+    Return the process-wide FileHandleRegistry.
+
+    Pipeline steps create a fresh provider per step; a shared registry is what
+    lets extraction reuse the file uploaded during classification.
+
+    Args:
+        settings: LLM settings with files_api_* fields (used on first call)
+
+    Returns:
+        Shared FileHandleRegistry
+    """
+    global _SHARED_REGISTRY
+    with _SHARED_REGISTRY_LOCK:
+        if _SHARED_REGISTRY is None:
+            _SHARED_REGISTRY = FileHandleRegistry(ttl_seconds=settings.files_api_ttl_hours * 3600)
+        return _SHARED_REGISTRY
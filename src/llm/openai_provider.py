@@ -8,26 +8,42 @@ OpenAI provider implementation with Structured Outputs support.
 This module provides the OpenAI-specific implementation of the LLM provider interface.
 """
 
+import asyncio
 import base64
 import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import openai
 from tenacity import (
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
 )
 
 from ..config import LLMSettings
-from .base import BaseLLMProvider, LLMProviderError
+from ..lazy_import import lazy_import
+from ..tracing import record_llm_usage
+from .base import BaseLLMProvider, LLMProviderError, traced_llm_call
+from .file_registry import get_file_registry, is_missing_file_error
+from .pdf_slicer import slice_pdf
+from .rate_limiter import rate_limited_http_client
 
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    import openai
+else:
+    # Imported on first use (see src/lazy_import.py)
+    openai = lazy_import("openai")
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Rate-limit and timeout errors are retried."""
+    return isinstance(error, (openai.RateLimitError, openai.APITimeoutError))
+
 
 def _repair_json_quotes(json_str: str) -> str:
     """
@@ -95,6 +111,45 @@ def _repair_json_quotes(json_str: str) -> str:
         return json_str
 
 
+def _usage_to_dict(usage: Any) -> dict[str, Any]:
+    """
+    Convert Responses API usage to the usage dict used across the pipeline.
+
+    ``cached_tokens`` and ``reasoning_tokens`` are only included when non-zero.
+    """
+    usage_dict: dict[str, Any] = {
+        "input_tokens": getattr(usage, "input_tokens", None),
+        "output_tokens": getattr(usage, "output_tokens", None),
+        "total_tokens": getattr(usage, "total_tokens", None),
+    }
+
+    # Add cached tokens if available (cost optimization metric)
+    input_details = getattr(usage, "input_tokens_details", None)
+    cached_tokens = getattr(input_details, "cached_tokens", None)
+    if cached_tokens:
+        usage_dict["cached_tokens"] = cached_tokens
+
+    # Add output token details if available (reasoning tokens for GPT-5/o-series)
+    output_details = getattr(usage, "output_tokens_details", None)
+    reasoning_tokens = getattr(output_details, "reasoning_tokens", None)
+    if reasoning_tokens:
+        usage_dict["reasoning_tokens"] = reasoning_tokens
+    return usage_dict
+
+
+def _record_response_usage(response: Any) -> None:
+    """Attach the response's token usage to the current llm tracing span."""
+    if hasattr(response, "usage"):
+        record_llm_usage(_usage_to_dict(response.usage), getattr(response, "model", None))
+
+
+def _with_context(system_prompt: str | None, context: str | None) -> str | None:
+    """Append per-call context to the system prompt (OpenAI caches prefixes automatically)."""
+    if not context:
+        return system_prompt
+    return f"{system_prompt}\n\n{context}" if system_prompt else context
+
+
 class OpenAIProvider(BaseLLMProvider):
     """
     OpenAI API provider implementation with native Structured Outputs support.
@@ -111,12 +166,15 @@ class OpenAIProvider(BaseLLMProvider):
 
     Attributes:
         client: OpenAI client instance
+        async_client: AsyncOpenAI client used by the *_async methods (created lazily)
         settings: LLM configuration
 
     Note:
         Requires OPENAI_API_KEY environment variable to be set.
     """
 
+    concurrency_key = "openai"
+
     def __init__(self, settings: LLMSettings):
         """
         Initialize OpenAI provider.
@@ -131,7 +189,13 @@ class OpenAIProvider(BaseLLMProvider):
         if not settings.openai_api_key:
             raise LLMProviderError("OpenAI API key not found in environment variables")
 
-        self.client = openai.OpenAI(api_key=settings.openai_api_key, timeout=settings.timeout)
+        self.client = openai.OpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.timeout,
+            http_client=rate_limited_http_client(
+                settings, self.concurrency_key, openai.DefaultHttpxClient
+            ),
+        )
         logger.info(f"Initialized OpenAI provider with model: {settings.openai_model}")
 
     def _parse_response_output(self, response) -> dict[str, Any]:
@@ -200,6 +264,7 @@ class OpenAIProvider(BaseLLMProvider):
                     f"  Accepted prediction tokens: {getattr(details, 'accepted_prediction_tokens', 'N/A')}"
                 )
             logger.info("===================")
+            record_llm_usage(_usage_to_dict(usage), getattr(response, "model", None))
         else:
             logger.warning("No usage information available in response")
 
@@ -319,27 +384,7 @@ class OpenAIProvider(BaseLLMProvider):
 
             # Add usage information to result if available
             if hasattr(response, "usage"):
-                usage = response.usage
-                usage_dict = {
-                    "input_tokens": getattr(usage, "input_tokens", None),
-                    "output_tokens": getattr(usage, "output_tokens", None),
-                    "total_tokens": getattr(usage, "total_tokens", None),
-                }
-
-                # Add cached tokens if available (cost optimization metric)
-                if hasattr(usage, "input_tokens_details"):
-                    input_details = usage.input_tokens_details
-                    if hasattr(input_details, "cached_tokens") and input_details.cached_tokens:
-                        usage_dict["cached_tokens"] = input_details.cached_tokens
-
-                # Add output token details if available (reasoning tokens for GPT-5/o-series)
-                if hasattr(usage, "output_tokens_details"):
-                    details = usage.output_tokens_details
-                    if hasattr(details, "reasoning_tokens") and details.reasoning_tokens:
-                        usage_dict["reasoning_tokens"] = details.reasoning_tokens
-
-                # Add to result dictionary
-                result["usage"] = usage_dict
+                result["usage"] = _usage_to_dict(response.usage)
 
             # Add enhanced metadata to result
             metadata = {}
@@ -399,26 +444,7 @@ class OpenAIProvider(BaseLLMProvider):
 
                 # Add usage information to result if available
                 if hasattr(response, "usage"):
-                    usage = response.usage
-                    usage_dict = {
-                        "input_tokens": getattr(usage, "input_tokens", None),
-                        "output_tokens": getattr(usage, "output_tokens", None),
-                        "total_tokens": getattr(usage, "total_tokens", None),
-                    }
-
-                    # Add cached tokens if available (cost optimization metric)
-                    if hasattr(usage, "input_tokens_details"):
-                        input_details = usage.input_tokens_details
-                        if hasattr(input_details, "cached_tokens") and input_details.cached_tokens:
-                            usage_dict["cached_tokens"] = input_details.cached_tokens
-
-                    # Add output token details if available
-                    if hasattr(usage, "output_tokens_details"):
-                        details = usage.output_tokens_details
-                        if hasattr(details, "reasoning_tokens") and details.reasoning_tokens:
-                            usage_dict["reasoning_tokens"] = details.reasoning_tokens
-
-                    result["usage"] = usage_dict
+                    result["usage"] = _usage_to_dict(response.usage)
 
                 # Add enhanced metadata to result
                 metadata = {}
@@ -454,10 +480,169 @@ class OpenAIProvider(BaseLLMProvider):
                     f"Repair attempt also failed. This may be an OpenAI API bug with strict mode."
                 ) from repair_error
 
+    @property
+    def async_client(self) -> "openai.AsyncOpenAI":
+        """Lazily created AsyncOpenAI client sharing the sync client's settings."""
+        if getattr(self, "_async_client", None) is None:
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self.settings.openai_api_key,
+                timeout=self.settings.timeout,
+                http_client=rate_limited_http_client(
+                    self.settings, self.concurrency_key, openai.DefaultAsyncHttpxClient
+                ),
+            )
+        return self._async_client
+
+    def _structured_output_params(
+        self,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        schema_name: str | None,
+        reasoning_effort: str | None,
+    ) -> tuple[dict[str, Any], str]:
+        """
+        Build the Responses API parameters shared by all schema-based requests.
+
+        Returns:
+            Tuple of (request parameters without ``input``, resolved schema name)
+        """
+        if schema_name is None:
+            schema_name = schema.get("title", "extraction_schema").replace(" ", "_")
+
+        # strict=False allows flexible schema guidance while maintaining prompt control
+        # Validation happens post-generation via dual-validation strategy
+        params = {
+            "model": self.settings.openai_model,
+            "instructions": system_prompt,
+            "max_output_tokens": self.settings.openai_max_tokens,
+            # temperature not supported for reasoning models (GPT-5, o-series)
+            "reasoning": {"effort": reasoning_effort} if reasoning_effort else None,
+            "text": {
+                "format": {
+                    "type": "json_schema",
+                    "name": schema_name,
+                    "schema": schema,
+                    "strict": False,
+                }
+            },
+        }
+        return params, schema_name
+
+    def _upload_pdf(self, pdf_path: Path) -> tuple[str, float | None]:
+        """Upload a PDF through the Files API (uploader for the file registry)."""
+        with self.request_slot_sync():
+            file_object = self.client.files.create(
+                file=(pdf_path.name, pdf_path.read_bytes(), "application/pdf"),
+                purpose="user_data",
+            )
+        return file_object.id, getattr(file_object, "expires_at", None)
+
+    def _build_pdf_input(self, pdf_path: Path, max_pages: int | None) -> list[dict[str, Any]]:
+        """
+        Slice a PDF to max_pages, size-check it and wrap it into Responses API input items.
+
+        With settings.files_api_enabled the PDF is uploaded once per content hash
+        (see file_registry) and referenced by file ID; otherwise it is sent inline
+        as base64.
+
+        Raises:
+            LLMProviderError: If the PDF is missing or exceeds the 32 MB limit
+        """
+        if not pdf_path.exists():
+            raise LLMProviderError(f"PDF file not found: {pdf_path}")
+
+        # Send only the requested pages; the size limit applies to what is uploaded
+        source_path = pdf_path
+        pdf_path = slice_pdf(pdf_path, max_pages, self.settings)
+
+        # Check file size (32 MB limit)
+        file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
+        if file_size_mb > 32:
+            raise LLMProviderError(f"PDF file too large: {file_size_mb:.1f} MB (max 32 MB)")
+
+        file_item: dict[str, Any]
+        if self.settings.files_api_enabled:
+            handle = get_file_registry(self.settings).get_or_upload(
+                self.concurrency_key, pdf_path, self._upload_pdf
+            )
+            file_item = {"type": "input_file", "file_id": handle.file_id}
+            logger.info(f"Sending PDF to OpenAI by file ID: {pdf_path.name} ({handle.file_id})")
+        else:
+            # Read and encode PDF as base64
+            with open(pdf_path, "rb") as pdf_file:
+                pdf_data = base64.b64encode(pdf_file.read()).decode("utf-8")
+            file_item = {
+                "type": "input_file",
+                "filename": pdf_path.name,
+                "file_data": f"data:application/pdf;base64,{pdf_data}",
+            }
+            logger.info(f"Uploading PDF to OpenAI: {pdf_path.name} ({file_size_mb:.1f} MB)")
+
+        # Build input with PDF content (Responses API format)
+        content_items = [file_item]
+
+        # The page limit instruction is only needed when the full PDF is sent
+        if max_pages and pdf_path == source_path:
+            content_items.append(
+                {
+                    "type": "input_text",
+                    "text": f"Process only the first {max_pages} pages of this PDF.",
+                }
+            )
+
+        return [{"role": "user", "content": content_items}]
+
+    def _invalidate_missing_file(
+        self, error: "openai.APIStatusError", input_content: list[dict[str, Any]]
+    ) -> bool:
+        """Drop the registry handle if error says the referenced file is gone."""
+        file_id = input_content[0]["content"][0].get("file_id")
+        if file_id is None or not is_missing_file_error(error):
+            return False
+        logger.warning(f"OpenAI rejected file {file_id} ({error}); re-uploading PDF")
+        return get_file_registry(self.settings).invalidate(self.concurrency_key, file_id)
+
+    def _create_pdf_response(self, pdf_path: Path, max_pages: int | None, **request: Any) -> Any:
+        """Send a PDF request, re-uploading once if the cached file ID has expired."""
+        input_content = self._build_pdf_input(pdf_path, max_pages)
+        try:
+            with self.request_slot_sync():
+                return self.client.responses.create(input=cast(Any, input_content), **request)
+        except openai.APIStatusError as e:
+            if not self._invalidate_missing_file(e, input_content):
+                raise
+        input_content = self._build_pdf_input(pdf_path, max_pages)
+        with self.request_slot_sync():
+            return self.client.responses.create(input=cast(Any, input_content), **request)
+
+    async def _create_pdf_response_async(
+        self, pdf_path: Path, max_pages: int | None, **request: Any
+    ) -> Any:
+        """Async version of _create_pdf_response(); uploads run in a worker thread."""
+        input_content = await asyncio.to_thread(self._build_pdf_input, pdf_path, max_pages)
+        try:
+            return await self._create_response_async(input=input_content, **request)
+        except openai.APIStatusError as e:
+            if not self._invalidate_missing_file(e, input_content):
+                raise
+        input_content = await asyncio.to_thread(self._build_pdf_input, pdf_path, max_pages)
+        return await self._create_response_async(input=input_content, **request)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        retry=retry_if_exception(_is_transient_error),
+    )
+    async def _create_response_async(self, **request: Any) -> Any:
+        """Issue one async Responses API call while holding a provider request slot."""
+        async with self.request_slot():
+            return await self.async_client.responses.create(**request)
+
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_text(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
         """
@@ -494,28 +679,54 @@ class OpenAIProvider(BaseLLMProvider):
             - Result is aggregated from response.output_text convenience property
         """
         try:
-            response = self.client.responses.create(
+            with self.request_slot_sync():
+                response = self.client.responses.create(
+                    model=self.settings.openai_model,
+                    input=prompt,
+                    instructions=system_prompt,
+                    max_output_tokens=self.settings.openai_max_tokens,
+                    # temperature not supported for reasoning models (GPT-5, o-series)
+                    **kwargs,
+                )
+
+            _record_response_usage(response)
+
+            # Use SDK convenience property for aggregated text output
+            result = str(response.output_text).strip()
+            logger.info("Successfully generated text with OpenAI Responses API")
+            return result
+
+        except openai.OpenAIError as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise LLMProviderError(f"OpenAI API error: {e}") from e
+
+    @traced_llm_call
+    async def generate_text_async(
+        self, prompt: str, system_prompt: str | None = None, **kwargs
+    ) -> str:
+        """Async version of generate_text() using AsyncOpenAI."""
+        try:
+            response = await self._create_response_async(
                 model=self.settings.openai_model,
                 input=prompt,
                 instructions=system_prompt,
                 max_output_tokens=self.settings.openai_max_tokens,
-                # temperature not supported for reasoning models (GPT-5, o-series)
                 **kwargs,
             )
-
-            # Use SDK convenience property for aggregated text output
+            _record_response_usage(response)
             result = str(response.output_text).strip()
-            logger.info("Successfully generated text with OpenAI Responses API")
+            logger.info("Successfully generated text with OpenAI Responses API (async)")
             return result
 
         except openai.OpenAIError as e:
             logger.error(f"OpenAI API error: {e}")
             raise LLMProviderError(f"OpenAI API error: {e}") from e
 
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_json_with_schema(
         self,
@@ -574,30 +785,13 @@ class OpenAIProvider(BaseLLMProvider):
             - Response parsing includes automatic JSON repair for unescaped quotes
         """
         try:
-            # Prepare schema name
-            if schema_name is None:
-                schema_name = schema.get("title", "extraction_schema").replace(" ", "_")
+            params, schema_name = self._structured_output_params(
+                schema, system_prompt, schema_name, reasoning_effort
+            )
 
             # Use OpenAI Responses API with structured outputs
-            # strict=False allows flexible schema guidance while maintaining prompt control
-            # Validation happens post-generation via dual-validation strategy
-            response = self.client.responses.create(
-                model=self.settings.openai_model,
-                input=prompt,
-                instructions=system_prompt,
-                max_output_tokens=self.settings.openai_max_tokens,
-                # temperature not supported for reasoning models (GPT-5, o-series)
-                reasoning={"effort": reasoning_effort} if reasoning_effort else None,
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": schema_name,
-                        "schema": schema,
-                        "strict": False,
-                    }
-                },
-                **kwargs,
-            )
+            with self.request_slot_sync():
+                response = self.client.responses.create(input=prompt, **params, **kwargs)
 
             # Parse JSON response
             result = self._parse_response_output(response)
@@ -611,10 +805,38 @@ class OpenAIProvider(BaseLLMProvider):
             logger.error(f"Schema size: {schema_size} bytes (~{schema_size//4} tokens)")
             raise LLMProviderError(f"OpenAI schema-based generation failed: {e}") from e
 
+    @traced_llm_call
+    async def generate_json_with_schema_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Async version of generate_json_with_schema() using AsyncOpenAI."""
+        try:
+            params, schema_name = self._structured_output_params(
+                schema, system_prompt, schema_name, reasoning_effort
+            )
+            response = await self._create_response_async(input=prompt, **params, **kwargs)
+
+            result = self._parse_response_output(response)
+            logger.info(f"Successfully generated schema-conforming JSON using {schema_name}")
+            return result
+
+        except openai.OpenAIError as e:
+            logger.error(f"OpenAI API error with schema-based generation: {e}")
+            schema_size = len(json.dumps(schema))
+            logger.error(f"Schema size: {schema_size} bytes (~{schema_size//4} tokens)")
+            raise LLMProviderError(f"OpenAI schema-based generation failed: {e}") from e
+
+    @traced_llm_call
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((openai.RateLimitError, openai.APITimeoutError)),
+        retry=retry_if_exception(_is_transient_error),
     )
     def generate_json_with_pdf(
         self,
@@ -624,15 +846,17 @@ class OpenAIProvider(BaseLLMProvider):
         max_pages: int | None = None,
         schema_name: str | None = None,
         reasoning_effort: str | None = None,
+        context: str | None = None,
         **kwargs,
     ) -> dict[str, Any]:
         """
         Generate structured JSON from PDF using OpenAI Responses API with vision capabilities.
 
         Uses GPT-5 multimodal capabilities to analyze PDF documents including text,
-        tables, images, charts, and diagrams. The PDF is base64-encoded and sent
-        directly to the API for processing. Supports schema-guided extraction with
-        optional page limits for cost control.
+        tables, images, charts, and diagrams. When LLM_FILES_API is enabled, the PDF
+        is uploaded once and referenced by file ID; otherwise it is sent inline as
+        base64. Supports schema-guided extraction with optional page limits for
+        cost control.
 
         Args:
             pdf_path: Path to PDF file (string or Path object)
@@ -641,6 +865,8 @@ class OpenAIProvider(BaseLLMProvider):
             max_pages: Optional limit on number of pages to process (for cost control)
             schema_name: Optional name for the schema (defaults to schema["title"] or "extraction_schema")
             reasoning_effort: Optional reasoning effort level ("low", "medium", "high") for GPT-5.1+
+            context: Optional per-call context (e.g. a validation report), appended
+                to the instructions after system_prompt
             **kwargs: Additional OpenAI API parameters
 
         Returns:
@@ -672,78 +898,62 @@ class OpenAIProvider(BaseLLMProvider):
         Note:
             - Supports multimodal content: text, tables, images, charts, diagrams
             - PDF size limit: 32 MB (enforced by OpenAI API)
-            - Base64 encoding increases upload size by ~33%
+            - With LLM_FILES_API, uploads are reused across calls for the same PDF bytes
+            - Inline base64 (the default) increases upload size by ~33%
             - Uses strict=False mode for flexible schema guidance
             - Validation via dual-validation strategy recommended post-generation
             - Automatically retries up to 3 times for rate limits and timeouts
             - Temperature not supported for reasoning models (GPT-5, o-series)
             - File size is logged before upload for debugging
-            - max_pages parameter adds instruction to process only first N pages
+            - max_pages sends only the first N pages (see pdf_slicer); the instruction to
+              process only those pages is added when the PDF could not be sliced
         """
         try:
             # Normalize to Path object
             pdf_path = Path(pdf_path)
+            params, schema_name = self._structured_output_params(
+                schema, _with_context(system_prompt, context), schema_name, reasoning_effort
+            )
 
-            if not pdf_path.exists():
-                raise LLMProviderError(f"PDF file not found: {pdf_path}")
-
-            # Check file size (32 MB limit)
-            file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
-            if file_size_mb > 32:
-                raise LLMProviderError(f"PDF file too large: {file_size_mb:.1f} MB (max 32 MB)")
-
-            # Read and encode PDF as base64
-            with open(pdf_path, "rb") as pdf_file:
-                pdf_data = base64.b64encode(pdf_file.read()).decode("utf-8")
-
-            logger.info(f"Uploading PDF to OpenAI: {pdf_path.name} ({file_size_mb:.1f} MB)")
-
-            # Prepare schema name
-            if schema_name is None:
-                schema_name = schema.get("title", "extraction_schema").replace(" ", "_")
+            # Use OpenAI Responses API with structured outputs
+            response = self._create_pdf_response(pdf_path, max_pages, **params, **kwargs)
 
-            # Build input with PDF content (Responses API format)
-            content_items = [
-                {
-                    "type": "input_file",
-                    "filename": pdf_path.name,
-                    "file_data": f"data:application/pdf;base64,{pdf_data}",
-                }
-            ]
-
-            # Add page limit instruction if specified
-            if max_pages:
-                content_items.append(
-                    {
-                        "type": "input_text",
-                        "text": f"Process only the first {max_pages} pages of this PDF.",
-                    }
-                )
+            # Parse JSON response
+            result = self._parse_response_output(response)
+            logger.info(
+                f"Successfully extracted schema-conforming JSON from PDF using {schema_name}"
+            )
+            return result
 
-            input_content = [{"role": "user", "content": content_items}]
+        except FileNotFoundError as e:
+            logger.error(f"PDF file not found: {pdf_path}")
+            raise LLMProviderError(f"PDF file not found: {e}") from e
+        except openai.OpenAIError as e:
+            logger.error(f"OpenAI API error with PDF upload: {e}")
+            raise LLMProviderError(f"OpenAI PDF processing failed: {e}") from e
 
-            # Use OpenAI Responses API with structured outputs
-            # strict=False allows flexible schema guidance while maintaining prompt control
-            # Validation happens post-generation via dual-validation strategy
-            response = self.client.responses.create(  # type: ignore[call-overload]
-                model=self.settings.openai_model,
-                input=input_content,
-                instructions=system_prompt,
-                max_output_tokens=self.settings.openai_max_tokens,
-                # temperature not supported for reasoning models (GPT-5, o-series)
-                reasoning={"effort": reasoning_effort} if reasoning_effort else None,
-                text={
-                    "format": {
-                        "type": "json_schema",
-                        "name": schema_name,
-                        "schema": schema,
-                        "strict": False,
-                    }
-                },
-                **kwargs,
+    @traced_llm_call
+    async def generate_json_with_pdf_async(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Async version of generate_json_with_pdf() using AsyncOpenAI."""
+        try:
+            pdf_path = Path(pdf_path)
+            params, schema_name = self._structured_output_params(
+                schema, _with_context(system_prompt, context), schema_name, reasoning_effort
+            )
+            response = await self._create_pdf_response_async(
+                pdf_path, max_pages, **params, **kwargs
             )
 
-            # Parse JSON response
             result = self._parse_response_output(response)
             logger.info(
                 f"Successfully extracted schema-conforming JSON from PDF using {schema_name}"
@@ -0,0 +1,177 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Local page slicing of PDFs before upload.
+
+max_pages used to be only a prompt instruction ("Process only the first N
+pages"): the whole PDF was still read, uploaded and billed. Providers now send
+slice_pdf(pdf_path, max_pages, settings) instead, a copy holding just that page
+range. Optionally (PDF_SLICE_STRIP) page thumbnails and embedded font programs
+are dropped as well; fonts fall back to standard substitutes when rendered.
+
+Slices are cached on disk by (SHA-256 of the source PDF, page range, strip
+flag), so every step and iteration of a run reuses one slice. The file
+registry keys uploads by content hash, so a slice is uploaded once as well.
+
+Slicing needs pypdf (optional). Without it, or when a PDF cannot be parsed
+(e.g. encrypted), the original PDF is sent and the page instruction remains
+the only limit.
+
+Example:
+    >>> path = slice_pdf(Path("paper.pdf"), 5, settings)
+    >>> path.name
+    '3f2a...-p1-5.pdf'
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from ..config import LLMSettings
+from ..lazy_import import is_available, lazy_import
+from .response_cache import hash_file
+
+logger = logging.getLogger(__name__)
+
+# Imported on first use (see src/lazy_import.py)
+pypdf = lazy_import("pypdf")
+HAVE_PYPDF = is_available("pypdf")
+
+# Embedded font programs in a font descriptor (Type 1, TrueType, CFF/OpenType)
+_FONT_FILE_KEYS = ("/FontFile", "/FontFile2", "/FontFile3")
+
+_warned_missing_pypdf = False
+
+
+def _warn_missing_pypdf() -> None:
+    global _warned_missing_pypdf
+    if not _warned_missing_pypdf:
+        _warned_missing_pypdf = True
+        logger.warning(
+            "pypdf not installed; max_pages is sent as an instruction only and the full "
+            "PDF is uploaded. Install with: pip install pypdf"
+        )
+
+
+def count_pages(pdf_path: Path | str) -> int | None:
+    """Return the number of pages of a PDF, or None if it cannot be determined."""
+    if not HAVE_PYPDF:
+        return None
+    try:
+        return len(pypdf.PdfReader(str(pdf_path)).pages)
+    except Exception as e:
+        logger.warning(f"Could not read page count of {pdf_path}: {e}")
+        return None
+
+
+def _font_descriptors(page) -> list:
+    resources = page.get("/Resources")
+    fonts = resources.get_object().get("/Font") if resources else None
+    if not fonts:
+        return []
+    descriptors = []
+    for font_ref in fonts.get_object().values():
+        font = font_ref.get_object()
+        # Type0 (composite) fonts keep the descriptor on their descendant font
+        for candidate in [font, *[f.get_object() for f in font.get("/DescendantFonts", [])]]:
+            descriptor = candidate.get("/FontDescriptor")
+            if descriptor is not None:
+                descriptors.append(descriptor.get_object())
+    return descriptors
+
+
+def _strip_page(page) -> None:
+    if "/Thumb" in page:
+        del page[pypdf.generic.NameObject("/Thumb")]
+    for descriptor in _font_descriptors(page):
+        for key in _FONT_FILE_KEYS:
+            if key in descriptor:
+                del descriptor[pypdf.generic.NameObject(key)]
+
+
+def _write_slice(pdf_path: Path, first_page: int, last_page: int, strip: bool, target: Path):
+    reader = pypdf.PdfReader(str(pdf_path))
+    writer = pypdf.PdfWriter()
+    for page in reader.pages[first_page - 1 : last_page]:
+        writer.add_page(page)
+    if strip:
+        for page in writer.pages:
+            _strip_page(page)
+    # Pages share fonts and images; drop duplicates and objects of the removed pages
+    writer.compress_identical_objects()
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-", suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer.write(f)
+        os.replace(tmp_name, target)
+    except Exception:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def slice_pdf_pages(
+    pdf_path: Path | str,
+    first_page: int,
+    last_page: int,
+    settings: LLMSettings,
+) -> Path:
+    """
+    Return a PDF holding pages first_page..last_page (1-based, inclusive).
+
+    The original path is returned when slicing is disabled or unavailable, when
+    the range covers the whole document (and nothing is stripped), or when the
+    PDF cannot be parsed.
+
+    Args:
+        pdf_path: Source PDF
+        first_page: First page to keep (1-based)
+        last_page: Last page to keep; clipped to the page count
+        settings: settings.pdf_slicing, pdf_slice_dir and pdf_slice_strip apply
+
+    Returns:
+        Path of the sliced (cached) PDF or of the original PDF
+
+    Raises:
+        FileNotFoundError: If pdf_path does not exist
+    """
+    pdf_path = Path(pdf_path)
+    if not settings.pdf_slicing:
+        return pdf_path
+
+    if not HAVE_PYPDF:
+        _warn_missing_pypdf()
+        return pdf_path
+
+    digest = hash_file(pdf_path)
+    strip = settings.pdf_slice_strip
+    suffix = "-stripped" if strip else ""
+    target = Path(settings.pdf_slice_dir) / f"{digest}-p{first_page}-{last_page}{suffix}.pdf"
+    if target.exists():
+        return target
+
+    try:
+        total = len(pypdf.PdfReader(str(pdf_path)).pages)
+        if first_page <= 1 and last_page >= total and not strip:
+            return pdf_path
+        _write_slice(pdf_path, first_page, min(last_page, total), strip, target)
+    except Exception as e:
+        logger.warning(f"Could not slice {pdf_path.name} (pages {first_page}-{last_page}): {e}")
+        return pdf_path
+
+    logger.info(
+        f"Sliced {pdf_path.name} to pages {first_page}-{min(last_page, total)} of {total} "
+        f"({pdf_path.stat().st_size / 1024:.0f} KB -> {target.stat().st_size / 1024:.0f} KB)"
+    )
+    return target
+
+
+def slice_pdf(pdf_path: Path | str, max_pages: int | None, settings: LLMSettings) -> Path:
+    """Return a PDF holding only the first max_pages pages (the original if max_pages is unset)."""
+    if not max_pages:
+        return Path(pdf_path)
+    return slice_pdf_pages(pdf_path, 1, max_pages, settings)
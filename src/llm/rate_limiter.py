@@ -0,0 +1,451 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Proactive requests-per-minute / tokens-per-minute limiter for LLM providers.
+
+tenacity's retry only reacts after a 429, and parallel workers that back off
+together hit the limit again together. This module paces requests before they
+are sent instead, using two token buckets (requests and tokens) per
+(provider, model):
+
+    - Capacity is the per-minute limit; buckets refill continuously at limit/60 per second
+    - Limits are seeded from settings.rate_limit_rpm / rate_limit_tpm and replaced by the
+      x-ratelimit-* / anthropic-ratelimit-* response headers once a response arrives
+    - Bucket levels are resynchronised with the remaining-* headers after every response,
+      so estimates that were too low (e.g. PDFs referenced by file ID) self-correct
+    - A 429 with retry-after blocks the whole key until the server's deadline
+
+State lives in a small SQLite database (WAL mode, one BEGIN IMMEDIATE transaction
+per reservation), so every thread, pipeline step and CLI process on the machine
+draws from one budget. Keys without known limits are never delayed.
+
+Providers install the limiter as httpx event hooks on their SDK clients (see
+rate_limited_http_client), which covers every request including SDK retries.
+
+Example:
+    >>> limiter = get_rate_limiter(settings)
+    >>> limiter.acquire("openai", "gpt-5.1", tokens=12_000)  # blocks until budget is free
+    0.0
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import LLMSettings
+
+logger = logging.getLogger(__name__)
+
+# Longest single sleep between reservation attempts; limits may change meanwhile
+MAX_WAIT_SLICE_SECONDS = 5.0
+
+# Rough prompt size estimate: request body characters per token
+CHARS_PER_TOKEN = 4
+
+# Flat charge for an inline base64 file (file_data / source.data) instead of its size;
+# providers bill PDFs per page, and the remaining-tokens header corrects the level after
+INLINE_FILE_TOKENS = 2_000
+
+# Refill rounding tolerance; without it a bucket can stay a hair below full forever
+_EPSILON = 1e-6
+
+# (limit, remaining) header names per provider, requests then tokens
+_HEADER_NAMES = {
+    "openai": (
+        ("x-ratelimit-limit-requests", "x-ratelimit-remaining-requests"),
+        ("x-ratelimit-limit-tokens", "x-ratelimit-remaining-tokens"),
+    ),
+    "claude": (
+        ("anthropic-ratelimit-requests-limit", "anthropic-ratelimit-requests-remaining"),
+        ("anthropic-ratelimit-tokens-limit", "anthropic-ratelimit-tokens-remaining"),
+    ),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    rpm REAL,
+    tpm REAL,
+    requests REAL NOT NULL,
+    tokens REAL NOT NULL,
+    blocked_until REAL NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+@dataclass(frozen=True)
+class BucketState:
+    """
+    Snapshot of one (provider, model) bucket pair.
+
+    Attributes:
+        rpm: Requests-per-minute limit (None = unknown)
+        tpm: Tokens-per-minute limit (None = unknown)
+        requests: Requests currently available
+        tokens: Tokens currently available
+        blocked_until: Epoch time before which no request may start
+    """
+
+    rpm: float | None
+    tpm: float | None
+    requests: float
+    tokens: float
+    blocked_until: float = 0.0
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def estimate_request_tokens(body: dict[str, Any], body_size: int) -> int:
+    """
+    Estimate the tokens a request counts against TPM before it is sent.
+
+    Providers charge the prompt plus the requested output budget, so this is
+    the body size in tokens plus max_tokens / max_output_tokens. Inline base64
+    files are not billed by their encoded size and count INLINE_FILE_TOKENS each.
+    """
+    file_chars, file_count = _inline_files(body)
+    max_output = body.get("max_tokens") or body.get("max_output_tokens") or 0
+    prompt_chars = max(0, body_size - file_chars)
+    return prompt_chars // CHARS_PER_TOKEN + file_count * INLINE_FILE_TOKENS + int(max_output)
+
+
+def _inline_files(value: Any) -> tuple[int, int]:
+    """Return (total characters, count) of the inline base64 files in a request body."""
+    if isinstance(value, list):
+        totals = [_inline_files(item) for item in value]
+        return sum(chars for chars, _ in totals), sum(count for _, count in totals)
+    if not isinstance(value, dict):
+        return 0, 0
+    # OpenAI input_file parts carry a data URL, Anthropic document sources raw base64
+    if isinstance(value.get("file_data"), str):
+        return len(value["file_data"]), 1
+    if value.get("type") == "base64" and isinstance(value.get("data"), str):
+        return len(value["data"]), 1
+    return _inline_files(list(value.values()))
+
+
+class RateLimiter:
+    """
+    SQLite-backed token buckets keyed by (provider, model).
+
+    Args:
+        db_path: SQLite file shared by all processes using the same budget
+        default_rpm: Requests-per-minute seed for keys without header data (0 = unknown)
+        default_tpm: Tokens-per-minute seed for keys without header data (0 = unknown)
+        clock: Time source (injectable for tests)
+        sleep: Blocking sleep used by acquire() (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        default_rpm: float = 0.0,
+        default_tpm: float = 0.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.db_path = Path(db_path)
+        self.default_rpm = default_rpm or None
+        self.default_tpm = default_tpm or None
+        self._clock = clock
+        self._sleep = sleep
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: sqlite3 connections are not
+        # shareable across threads, and the file lock handles cross-process access
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction holding the database lock for its whole read-modify-write."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _key(provider: str, model: str | None) -> str:
+        return f"{provider}:{model or '*'}"
+
+    def _load(self, conn: sqlite3.Connection, key: str, now: float) -> BucketState | None:
+        """Read a bucket pair and refill it to `now`; None if the key has no known limits."""
+        row = conn.execute("SELECT * FROM buckets WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            if self.default_rpm is None and self.default_tpm is None:
+                return None
+            return BucketState(
+                rpm=self.default_rpm,
+                tpm=self.default_tpm,
+                requests=self.default_rpm or 0.0,
+                tokens=self.default_tpm or 0.0,
+            )
+
+        elapsed = max(0.0, now - row["updated_at"])
+        requests, tokens = row["requests"], row["tokens"]
+        if row["rpm"]:
+            requests = min(row["rpm"], requests + elapsed * row["rpm"] / 60.0)
+        if row["tpm"]:
+            tokens = min(row["tpm"], tokens + elapsed * row["tpm"] / 60.0)
+        return BucketState(row["rpm"], row["tpm"], requests, tokens, row["blocked_until"])
+
+    def _store(self, conn: sqlite3.Connection, key: str, state: BucketState, now: float) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets "
+            "(key, rpm, tpm, requests, tokens, blocked_until, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                state.rpm,
+                state.tpm,
+                state.requests,
+                state.tokens,
+                state.blocked_until,
+                now,
+            ),
+        )
+
+    def try_acquire(self, provider: str, model: str | None, tokens: int = 0) -> float:
+        """
+        Reserve one request and `tokens` tokens if both buckets allow it.
+
+        Args:
+            provider: Provider key ("openai", "claude")
+            model: Model name the request is for
+            tokens: Estimated tokens the request counts against TPM
+
+        Returns:
+            0.0 if the reservation was made, otherwise seconds to wait before retrying
+        """
+        key = self._key(provider, model)
+        with self._transaction() as conn:
+            now = self._clock()
+            state = self._load(conn, key, now)
+            if state is None:
+                return 0.0
+
+            wait = max(0.0, state.blocked_until - now)
+            if state.rpm and state.requests + _EPSILON < 1:
+                wait = max(wait, (1 - state.requests) * 60.0 / state.rpm)
+            # A request larger than the whole bucket only needs a full bucket
+            needed = min(tokens, state.tpm) if state.tpm else 0
+            if state.tpm and state.tokens + _EPSILON < needed:
+                wait = max(wait, (needed - state.tokens) * 60.0 / state.tpm)
+
+            if wait == 0.0:
+                state = BucketState(
+                    state.rpm,
+                    state.tpm,
+                    state.requests - 1 if state.rpm else state.requests,
+                    state.tokens - needed,
+                    state.blocked_until,
+                )
+            self._store(conn, key, state, now)
+            return wait
+
+    def acquire(self, provider: str, model: str | None, tokens: int = 0) -> float:
+        """
+        Block until a request of `tokens` tokens fits the RPM/TPM budget.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while (wait := self.try_acquire(provider, model, tokens)) > 0:
+            wait = min(wait, MAX_WAIT_SLICE_SECONDS)
+            if waited == 0.0:
+                logger.info(f"Rate limit reached for {provider}:{model}, waiting {wait:.1f}s")
+            self._sleep(wait)
+            waited += wait
+        return waited
+
+    async def acquire_async(self, provider: str, model: str | None, tokens: int = 0) -> float:
+        """Async version of acquire(); waits with asyncio.sleep instead of blocking."""
+        waited = 0.0
+        while (wait := await asyncio.to_thread(self.try_acquire, provider, model, tokens)) > 0:
+            wait = min(wait, MAX_WAIT_SLICE_SECONDS)
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def update_from_headers(
+        self,
+        provider: str,
+        model: str | None,
+        headers: Mapping[str, str],
+        status_code: int = 200,
+    ) -> None:
+        """
+        Learn limits and remaining budget from a provider response.
+
+        Args:
+            provider: Provider key ("openai", "claude")
+            model: Model the request was for
+            headers: Response headers (case-insensitive mapping)
+            status_code: HTTP status; a 429 with retry-after blocks the key until then
+        """
+        (rpm_name, req_left_name), (tpm_name, tok_left_name) = _HEADER_NAMES.get(
+            provider, _HEADER_NAMES["openai"]
+        )
+        rpm = _header_float(headers, rpm_name)
+        tpm = _header_float(headers, tpm_name)
+        requests_left = _header_float(headers, req_left_name)
+        tokens_left = _header_float(headers, tok_left_name)
+        retry_after = _header_float(headers, "retry-after") if status_code == 429 else None
+        if rpm is tpm is requests_left is tokens_left is retry_after is None:
+            return
+
+        key = self._key(provider, model)
+        with self._transaction() as conn:
+            now = self._clock()
+            state = self._load(conn, key, now) or BucketState(None, None, 0.0, 0.0)
+            rpm = rpm or state.rpm
+            tpm = tpm or state.tpm
+            requests = state.requests if state.rpm else (rpm or 0.0)
+            tokens = state.tokens if state.tpm else (tpm or 0.0)
+            # Other clients share the org budget: trust the server when it reports less
+            if requests_left is not None:
+                requests = min(requests, requests_left)
+            if tokens_left is not None:
+                tokens = min(tokens, tokens_left)
+            blocked_until = state.blocked_until
+            if retry_after is not None:
+                blocked_until = max(blocked_until, now + retry_after)
+                logger.warning(f"{key} rate limited by server, pausing {retry_after:.1f}s")
+            self._store(conn, key, BucketState(rpm, tpm, requests, tokens, blocked_until), now)
+
+    def state(self, provider: str, model: str | None) -> BucketState | None:
+        """Return the current (refilled) bucket state for a key, or None if unknown."""
+        with closing(self._connect()) as conn:
+            return self._load(conn, self._key(provider, model), self._clock())
+
+    # --- httpx integration ------------------------------------------------
+
+    # Hooks only rely on the Request/Response interface shared by httpx and the
+    # httpx forks some SDK releases bundle, so no http library is imported here
+
+    def _request_info(self, request: Any) -> tuple[str | None, int] | None:
+        """Return (model, estimated tokens) for a JSON model request, else None."""
+        # Uploads are multipart and not model requests; SDK JSON bodies are in memory
+        if "json" not in request.headers.get("content-type", ""):
+            return None
+        try:
+            content = request.content
+            body = json.loads(content)
+        except ValueError:
+            return None
+        if not isinstance(body, dict) or "model" not in body:
+            return None
+        return body["model"], estimate_request_tokens(body, len(content))
+
+    def event_hooks(self, provider: str) -> dict[str, list[Callable[..., Any]]]:
+        """Sync http client event hooks that pace requests and learn from responses."""
+
+        def on_request(request: Any) -> None:
+            info = self._request_info(request)
+            if info is not None:
+                request.extensions["rate_limit_model"] = info[0]
+                self.acquire(provider, *info)
+
+        def on_response(response: Any) -> None:
+            if "rate_limit_model" in response.request.extensions:
+                model = response.request.extensions["rate_limit_model"]
+                self.update_from_headers(provider, model, response.headers, response.status_code)
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def async_event_hooks(self, provider: str) -> dict[str, list[Callable[..., Any]]]:
+        """Async http client event hooks; same behaviour as event_hooks()."""
+
+        async def on_request(request: Any) -> None:
+            info = self._request_info(request)
+            if info is not None:
+                request.extensions["rate_limit_model"] = info[0]
+                await self.acquire_async(provider, *info)
+
+        async def on_response(response: Any) -> None:
+            if "rate_limit_model" in response.request.extensions:
+                model = response.request.extensions["rate_limit_model"]
+                await asyncio.to_thread(
+                    self.update_from_headers,
+                    provider,
+                    model,
+                    response.headers,
+                    response.status_code,
+                )
+
+        return {"request": [on_request], "response": [on_response]}
+
+
+_SHARED_LIMITERS: dict[str, RateLimiter] = {}
+_SHARED_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(settings: LLMSettings) -> RateLimiter | None:
+    """
+    Return the process-wide RateLimiter for settings.rate_limit_db.
+
+    Args:
+        settings: LLM settings with rate_limit_* fields
+
+    Returns:
+        Shared RateLimiter, or None if rate limiting is disabled
+    """
+    if not settings.rate_limit_enabled:
+        return None
+    path = str(Path(settings.rate_limit_db).resolve())
+    with _SHARED_LIMITERS_LOCK:
+        limiter = _SHARED_LIMITERS.get(path)
+        if limiter is None:
+            limiter = RateLimiter(path, settings.rate_limit_rpm, settings.rate_limit_tpm)
+            _SHARED_LIMITERS[path] = limiter
+        return limiter
+
+
+def rate_limited_http_client(settings: LLMSettings, provider: str, client_class: type) -> Any:
+    """
+    Build an SDK http client with the shared limiter installed as event hooks.
+
+    Args:
+        settings: LLM settings
+        provider: Provider key used for the buckets ("openai", "claude")
+        client_class: SDK default client class, e.g. openai.DefaultHttpxClient or
+            openai.DefaultAsyncHttpxClient
+
+    Returns:
+        Configured http client, or None (SDK default) when rate limiting is disabled
+    """
+    limiter = get_rate_limiter(settings)
+    if limiter is None:
+        return None
+    if hasattr(client_class, "aclose"):
+        return client_class(event_hooks=limiter.async_event_hooks(provider))
+    return client_class(event_hooks=limiter.event_hooks(provider))
@@ -0,0 +1,449 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Deterministic record/replay LLM provider for offline benchmarking.
+
+Registered in get_llm_provider() as "replay". Two modes (settings.replay_mode):
+
+    record: Wraps a real provider (settings.replay_record_provider), passes every
+            call through and saves the response plus its wall-clock latency
+    replay: Serves the recorded responses without any network access, optionally
+            sleeping for a synthetic latency to reproduce production timings
+
+This makes the whole run_full_pipeline path (IterativeLoopRunner, rendering,
+file I/O) benchmarkable and profilable offline, and lets a slow production run
+be recorded once and replayed locally.
+
+Requests are fingerprinted with the response cache's key derivation (prompts,
+schema, schema name, reasoning effort, PDF bytes hash, max_pages, extra kwargs),
+but without provider and model, so a recording can be replayed under any
+configuration. A fingerprint can occur several times in one run (a correction
+loop re-issuing an identical request); its responses are stored in order and
+replayed in the same order, repeating the last one if the replay asks for more.
+
+Storage layout:
+    <replay_dir>/<key[:2]>/<key>.json   # {"kind": str, "responses": [{"value", "latency_s", ...}]}
+
+Synthetic latency per replayed call:
+    recorded latency * settings.replay_latency_scale + settings.replay_latency_ms / 1000
+
+Example:
+    >>> # Record one real run, then benchmark it offline
+    >>> # LLM_REPLAY_MODE=record python run_pipeline.py paper.pdf --llm-provider replay
+    >>> # LLM_REPLAY_LATENCY_SCALE=1 python run_pipeline.py paper.pdf --llm-provider replay
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from ..config import LLMSettings
+from ..tracing import current_span
+from .base import BaseLLMProvider, LLMProviderError, traced_llm_call
+from .response_cache import hash_file, make_cache_key
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODES = ("record", "replay")
+
+
+class ReplayStore:
+    """
+    Directory of recorded responses shared by all ReplayProvider instances.
+
+    Pipeline steps create a fresh provider per step, so occurrence counters
+    (which recorded response to serve next) live here rather than on the provider.
+
+    Attributes:
+        replay_dir: Root directory of the recording
+    """
+
+    def __init__(self, replay_dir: Path | str):
+        self.replay_dir = Path(replay_dir)
+        self._lock = threading.Lock()
+        self._served: dict[str, int] = {}
+        self._recorded: set[str] = set()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.replay_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        try:
+            entry: dict[str, Any] = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+            return entry
+        except FileNotFoundError:
+            return None
+
+    def next_response(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the next recorded response for a fingerprint.
+
+        Returns:
+            Response record ({"value", "latency_s", ...}), or None if never recorded
+        """
+        entry = self._read(key)
+        if not entry or not entry.get("responses"):
+            return None
+        responses = entry["responses"]
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        if index >= len(responses):
+            logger.debug(f"Replay {key[:12]}: occurrence {index + 1} not recorded, reusing last")
+        response: dict[str, Any] = responses[min(index, len(responses) - 1)]
+        return response
+
+    def record(self, key: str, kind: str, response: dict[str, Any]) -> None:
+        """
+        Append a response to a fingerprint's recording.
+
+        The first write to a key in this process replaces what an earlier
+        recording stored, so re-recording a run does not mix old and new responses.
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entry = self._read(key) if key in self._recorded else None
+            if entry is None:
+                entry = {"kind": kind, "responses": []}
+            entry["responses"].append(response)
+            self._recorded.add(key)
+
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, ensure_ascii=False, default=str)
+                os.replace(tmp_name, path)
+            except Exception:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+    def reset(self) -> None:
+        """Restart every fingerprint at its first recorded response."""
+        with self._lock:
+            self._served.clear()
+
+
+_SHARED_STORES: dict[str, ReplayStore] = {}
+_SHARED_STORES_LOCK = threading.Lock()
+
+
+def get_replay_store(settings: LLMSettings) -> ReplayStore:
+    """
+    Return the process-wide ReplayStore for settings.replay_dir.
+
+    Args:
+        settings: LLM settings with replay_* fields
+
+    Returns:
+        Shared ReplayStore instance
+    """
+    replay_dir = str(Path(settings.replay_dir).resolve())
+    with _SHARED_STORES_LOCK:
+        store = _SHARED_STORES.get(replay_dir)
+        if store is None:
+            store = ReplayStore(replay_dir)
+            _SHARED_STORES[replay_dir] = store
+        return store
+
+
+class ReplayProvider(BaseLLMProvider):
+    """
+    Provider that records real responses or replays them from disk.
+
+    Record mode is selected by passing the real provider as `wrapped`; without
+    it the provider replays and raises LLMProviderError for unrecorded requests.
+
+    Attributes:
+        wrapped: Real provider being recorded (None in replay mode)
+        store: ReplayStore holding the recording
+        mode: "record" or "replay"
+        settings: LLM configuration (replay_latency_* used when replaying)
+    """
+
+    concurrency_key = "replay"
+
+    def __init__(
+        self,
+        settings: LLMSettings,
+        wrapped: BaseLLMProvider | None = None,
+        store: ReplayStore | None = None,
+    ):
+        super().__init__(settings)
+        self.wrapped = wrapped
+        self.store = store or get_replay_store(settings)
+        self.mode = "record" if wrapped is not None else "replay"
+        logger.info(f"Initialized replay provider ({self.mode}) at {self.store.replay_dir}")
+
+    def _latency(self, response: dict[str, Any]) -> float:
+        recorded = float(response.get("latency_s") or 0.0)
+        return recorded * self.settings.replay_latency_scale + (
+            self.settings.replay_latency_ms / 1000.0
+        )
+
+    def _record(self, key: str, kind: str, value: Any, started: float) -> None:
+        self.store.record(
+            key,
+            kind,
+            {
+                "value": value,
+                "latency_s": round(time.perf_counter() - started, 4),
+                "provider": type(self.wrapped).__name__,
+                "recorded_at": time.time(),
+            },
+        )
+
+    def _replayed(self, key: str, kind: str) -> dict[str, Any]:
+        response = self.store.next_response(key)
+        if response is None:
+            raise LLMProviderError(
+                f"No recorded {kind} response for request {key[:12]} in {self.store.replay_dir}. "
+                f"Record it first with LLM_REPLAY_MODE=record."
+            )
+        return response
+
+    @staticmethod
+    def _mark_replayed() -> None:
+        # Usage in the recorded value is kept: it is what the live call would cost
+        call_span = current_span()
+        if call_span is not None:
+            call_span.set(replayed=True)
+
+    def _call(self, kind: str, key: str, call: Callable[[BaseLLMProvider], T]) -> T:
+        """Record call(wrapped) in record mode; replay the recorded value otherwise."""
+        if self.wrapped is not None:
+            started = time.perf_counter()
+            value = call(self.wrapped)
+            self._record(key, kind, value, started)
+            return value
+
+        response = self._replayed(key, kind)
+        self._mark_replayed()
+        with self.request_slot_sync():
+            time.sleep(self._latency(response))
+        return cast(T, copy.deepcopy(response["value"]))
+
+    async def _call_async(
+        self, kind: str, key: str, call: Callable[[BaseLLMProvider], Awaitable[T]]
+    ) -> T:
+        if self.wrapped is not None:
+            started = time.perf_counter()
+            value = await call(self.wrapped)
+            self._record(key, kind, value, started)
+            return value
+
+        response = self._replayed(key, kind)
+        self._mark_replayed()
+        async with self.request_slot():
+            await asyncio.sleep(self._latency(response))
+        return cast(T, copy.deepcopy(response["value"]))
+
+    # --- fingerprints -----------------------------------------------------
+
+    @staticmethod
+    def _text_key(prompt: str, system_prompt: str | None, kwargs: dict[str, Any]) -> str:
+        return make_cache_key(
+            kind="text", prompt=prompt, system_prompt=system_prompt, kwargs=kwargs
+        )
+
+    @staticmethod
+    def _schema_key(
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        schema_name: str | None,
+        reasoning_effort: str | None,
+        kwargs: dict[str, Any],
+    ) -> str:
+        return make_cache_key(
+            kind="json_with_schema",
+            prompt=prompt,
+            schema=schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            kwargs=kwargs,
+        )
+
+    @staticmethod
+    def _pdf_key(
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        max_pages: int | None,
+        schema_name: str | None,
+        reasoning_effort: str | None,
+        context: str | None,
+        kwargs: dict[str, Any],
+    ) -> str:
+        try:
+            pdf_hash = hash_file(pdf_path)
+        except OSError as e:
+            raise LLMProviderError(f"PDF file not found: {e}") from e
+        if context is not None:
+            # Keyed like any other per-call argument
+            kwargs = {**kwargs, "context": context}
+        return make_cache_key(
+            kind="json_with_pdf",
+            pdf_sha256=pdf_hash,
+            max_pages=max_pages,
+            schema=schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            kwargs=kwargs,
+        )
+
+    # --- provider interface -----------------------------------------------
+
+    @traced_llm_call
+    def generate_text(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
+        key = self._text_key(prompt, system_prompt, kwargs)
+        return self._call(
+            "text", key, lambda wrapped: wrapped.generate_text(prompt, system_prompt, **kwargs)
+        )
+
+    @traced_llm_call
+    async def generate_text_async(
+        self, prompt: str, system_prompt: str | None = None, **kwargs
+    ) -> str:
+        key = self._text_key(prompt, system_prompt, kwargs)
+        return await self._call_async(
+            "text",
+            key,
+            lambda wrapped: wrapped.generate_text_async(prompt, system_prompt, **kwargs),
+        )
+
+    @traced_llm_call
+    def generate_json_with_schema(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._schema_key(prompt, schema, system_prompt, schema_name, reasoning_effort, kwargs)
+        return self._call(
+            "json_with_schema",
+            key,
+            lambda wrapped: wrapped.generate_json_with_schema(
+                prompt,
+                schema,
+                system_prompt=system_prompt,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                **kwargs,
+            ),
+        )
+
+    @traced_llm_call
+    async def generate_json_with_schema_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._schema_key(prompt, schema, system_prompt, schema_name, reasoning_effort, kwargs)
+        return await self._call_async(
+            "json_with_schema",
+            key,
+            lambda wrapped: wrapped.generate_json_with_schema_async(
+                prompt,
+                schema,
+                system_prompt=system_prompt,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                **kwargs,
+            ),
+        )
+
+    @traced_llm_call
+    def generate_json_with_pdf(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._pdf_key(
+            pdf_path,
+            schema,
+            system_prompt,
+            max_pages,
+            schema_name,
+            reasoning_effort,
+            context,
+            kwargs,
+        )
+        return self._call(
+            "json_with_pdf",
+            key,
+            lambda wrapped: wrapped.generate_json_with_pdf(
+                pdf_path,
+                schema,
+                system_prompt=system_prompt,
+                max_pages=max_pages,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                context=context,
+                **kwargs,
+            ),
+        )
+
+    @traced_llm_call
+    async def generate_json_with_pdf_async(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._pdf_key(
+            pdf_path,
+            schema,
+            system_prompt,
+            max_pages,
+            schema_name,
+            reasoning_effort,
+            context,
+            kwargs,
+        )
+        return await self._call_async(
+            "json_with_pdf",
+            key,
+            lambda wrapped: wrapped.generate_json_with_pdf_async(
+                pdf_path,
+                schema,
+                system_prompt=system_prompt,
+                max_pages=max_pages,
+                schema_name=schema_name,
+                reasoning_effort=reasoning_effort,
+                context=context,
+                **kwargs,
+            ),
+        )
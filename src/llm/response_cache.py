@@ -0,0 +1,597 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Content-addressed response cache for LLM provider calls.
+
+Re-running the pipeline on a paper that was already processed (for example after
+a crash during report rendering) would otherwise re-pay every classification,
+extraction and validation call. This module stores successful provider responses
+on disk, keyed by a SHA-256 digest of everything that determines the response:
+
+    - Provider and model name
+    - Temperature and reasoning effort
+    - System prompt and user prompt
+    - JSON schema (canonicalised) and schema name
+    - PDF bytes hash and max_pages (for PDF calls)
+    - Any extra provider kwargs
+
+Storage layout:
+    <cache_dir>/<key[:2]>/<key>.json   # {"created_at": float, "kind": str, "value": ...}
+
+Limits:
+    - max_age_seconds: entries older than this are treated as misses and deleted
+    - max_size_bytes: after each write the oldest entries (by last access) are
+      evicted until the cache fits
+
+Failed calls are never cached. The cache is opt-in (LLM_RESPONSE_CACHE=true)
+because some loop steps intentionally re-issue identical requests to get a
+different answer (e.g. regenerating a failed initial extraction).
+
+Example:
+    >>> from src.llm import get_llm_provider
+    >>> llm = get_llm_provider("openai")  # wrapped when LLM_RESPONSE_CACHE=true
+    >>> llm.generate_json_with_pdf(pdf_path, schema, system_prompt=prompt)
+    >>> llm.cache_stats().hits
+    0
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import LLMSettings
+from ..tracing import current_span, increment
+from .base import BaseLLMProvider, traced_llm_call
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or entry layout changes to invalidate old entries
+CACHE_FORMAT_VERSION = 1
+
+_PDF_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for a response cache.
+
+    Attributes:
+        hits: Lookups served from the cache
+        misses: Lookups that fell through to the provider
+        writes: Responses stored in the cache
+        expired: Entries discarded because they exceeded max age
+        evictions: Entries removed to stay under the size limit
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    expired: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when no lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return counters plus hit rate as a plain dict."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+def hash_file(path: Path | str) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's bytes.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_PDF_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_cache_key(**components: Any) -> str:
+    """
+    Build a deterministic cache key from request components.
+
+    Components are serialised as canonical JSON (sorted keys, no whitespace) so
+    that semantically identical schemas and kwargs produce the same key.
+
+    Args:
+        **components: Everything that influences the response
+
+    Returns:
+        SHA-256 hex digest
+
+    Example:
+        >>> make_cache_key(model="gpt-5", prompt="hi") == make_cache_key(prompt="hi", model="gpt-5")
+        True
+    """
+    payload = json.dumps(
+        {"version": CACHE_FORMAT_VERSION, **components},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Disk-backed, content-addressed store for LLM responses.
+
+    Safe to share between providers and threads within one process; writes use
+    a temp file + atomic rename so concurrent processes never see partial entries.
+
+    Attributes:
+        cache_dir: Root directory for cache entries
+        max_size_bytes: Upper bound on total entry size (0 = unlimited)
+        max_age_seconds: Entry time-to-live (0 = no expiry)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        max_size_bytes: int = 0,
+        max_age_seconds: float = 0,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        self.max_age_seconds = max_age_seconds
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            Deep copy of the cached value, or None on miss/expiry/corruption
+        """
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            self._record("misses")
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self._record("misses")
+            return None
+
+        created_at = entry.get("created_at", 0)
+        if self.max_age_seconds and time.time() - created_at > self.max_age_seconds:
+            path.unlink(missing_ok=True)
+            self._record("expired")
+            self._record("misses")
+            return None
+
+        # Touch for LRU eviction ordering
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self._record("hits")
+        return copy.deepcopy(entry.get("value"))
+
+    def put(self, key: str, value: Any, kind: str = "") -> None:
+        """
+        Store a response under key, then enforce the size limit.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: JSON-serialisable response
+            kind: Optional label for the entry (e.g. "json_with_pdf")
+        """
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"created_at": time.time(), "kind": kind, "value": value}
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, default=str)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        self._record("writes")
+        if self.max_size_bytes:
+            self._enforce_size_limit()
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries.
+
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for path in self._iter_entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return CacheStats(**asdict(self._stats))
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters."""
+        with self._lock:
+            self._stats = CacheStats()
+
+    def size_bytes(self) -> int:
+        """Total size of all cache entries on disk."""
+        total = 0
+        for path in self._iter_entries():
+            try:
+                total += path.stat().st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def _iter_entries(self):
+        if not self.cache_dir.exists():
+            return iter(())
+        # Skip the in-flight temp files of put(); they are renamed into place when complete
+        return (
+            path for path in self.cache_dir.glob("??/*.json") if not path.name.startswith(".tmp-")
+        )
+
+    def _enforce_size_limit(self) -> None:
+        entries = []
+        total = 0
+        for path in self._iter_entries():
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self.max_size_bytes:
+            return
+
+        # Oldest access first
+        entries.sort(key=lambda e: e[0])
+        for _, size, path in entries:
+            if total <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self._record("evictions")
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            setattr(self._stats, counter, getattr(self._stats, counter) + 1)
+
+
+# One shared cache per directory so stats aggregate across provider instances
+_SHARED_CACHES: dict[str, ResponseCache] = {}
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def get_response_cache(settings: LLMSettings) -> ResponseCache:
+    """
+    Return the process-wide ResponseCache configured by settings.
+
+    Pipeline steps create a fresh provider per step; sharing the cache instance
+    keeps the hit/miss statistics for a whole run in one place.
+
+    Args:
+        settings: LLM settings with response_cache_* fields
+
+    Returns:
+        Shared ResponseCache instance for settings.response_cache_dir
+    """
+    cache_dir = str(Path(settings.response_cache_dir).resolve())
+    with _SHARED_CACHES_LOCK:
+        cache = _SHARED_CACHES.get(cache_dir)
+        if cache is None:
+            cache = ResponseCache(
+                cache_dir,
+                max_size_bytes=int(settings.response_cache_max_size_mb * 1024 * 1024),
+                max_age_seconds=settings.response_cache_max_age_hours * 3600,
+            )
+            _SHARED_CACHES[cache_dir] = cache
+        return cache
+
+
+class CachedLLMProvider(BaseLLMProvider):
+    """
+    Provider wrapper that serves repeated requests from a ResponseCache.
+
+    Delegates to the wrapped provider on a miss and stores successful responses.
+    Exceptions propagate unchanged and are never cached.
+
+    Attributes:
+        wrapped: The underlying provider (OpenAIProvider, ClaudeProvider, ...)
+        cache: ResponseCache used for lookups
+        settings: Settings of the wrapped provider
+    """
+
+    def __init__(self, wrapped: BaseLLMProvider, cache: ResponseCache):
+        super().__init__(wrapped.settings)
+        self.wrapped = wrapped
+        self.cache = cache
+
+    @property
+    def trace_name(self) -> str:
+        return self.wrapped.trace_name
+
+    def cache_stats(self) -> CacheStats:
+        """Return hit/miss statistics for the underlying cache."""
+        return self.cache.stats()
+
+    def _model_components(self) -> dict[str, Any]:
+        """Identify the provider/model/temperature the wrapped provider will use."""
+        name = type(self.wrapped).__name__
+        if "Claude" in name:
+            model = self.settings.anthropic_model
+        else:
+            model = self.settings.openai_model
+        return {
+            "provider": name,
+            "model": model,
+            "temperature": self.settings.temperature,
+        }
+
+    def _text_key(self, prompt: str, system_prompt: str | None, kwargs: dict[str, Any]) -> str:
+        return make_cache_key(
+            kind="text",
+            **self._model_components(),
+            prompt=prompt,
+            system_prompt=system_prompt,
+            kwargs=kwargs,
+        )
+
+    def _schema_key(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        schema_name: str | None,
+        reasoning_effort: str | None,
+        kwargs: dict[str, Any],
+    ) -> str:
+        return make_cache_key(
+            kind="json_with_schema",
+            **self._model_components(),
+            prompt=prompt,
+            schema=schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            kwargs=kwargs,
+        )
+
+    def _pdf_key(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        max_pages: int | None,
+        schema_name: str | None,
+        reasoning_effort: str | None,
+        context: str | None,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """Return the cache key, or None if the PDF cannot be read (provider raises)."""
+        try:
+            pdf_hash = hash_file(pdf_path)
+        except OSError:
+            return None
+        if context is not None:
+            # Keyed like any other per-call argument
+            kwargs = {**kwargs, "context": context}
+        return make_cache_key(
+            kind="json_with_pdf",
+            **self._model_components(),
+            pdf_sha256=pdf_hash,
+            max_pages=max_pages,
+            schema=schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            kwargs=kwargs,
+        )
+
+    def _lookup(self, key: str | None, kind: str) -> Any | None:
+        if key is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info(f"Response cache hit ({kind}) {key[:12]}")
+            call_span = current_span()
+            if call_span is not None:
+                call_span.set(response_cache="hit")
+        increment("llm.response_cache.misses" if cached is None else "llm.response_cache.hits")
+        return cached
+
+    def _store(self, key: str | None, value: Any, kind: str) -> None:
+        if key is not None:
+            self.cache.put(key, value, kind=kind)
+
+    @traced_llm_call
+    def generate_text(self, prompt: str, system_prompt: str | None = None, **kwargs) -> str:
+        key = self._text_key(prompt, system_prompt, kwargs)
+        cached = self._lookup(key, "text")
+        if cached is not None:
+            return str(cached["text"])
+
+        result = self.wrapped.generate_text(prompt, system_prompt, **kwargs)
+        self._store(key, {"text": result}, "text")
+        return result
+
+    @traced_llm_call
+    async def generate_text_async(
+        self, prompt: str, system_prompt: str | None = None, **kwargs
+    ) -> str:
+        key = self._text_key(prompt, system_prompt, kwargs)
+        cached = self._lookup(key, "text")
+        if cached is not None:
+            return str(cached["text"])
+
+        result = await self.wrapped.generate_text_async(prompt, system_prompt, **kwargs)
+        self._store(key, {"text": result}, "text")
+        return result
+
+    @traced_llm_call
+    def generate_json_with_schema(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._schema_key(prompt, schema, system_prompt, schema_name, reasoning_effort, kwargs)
+        cached: dict[str, Any] | None = self._lookup(key, "json_with_schema")
+        if cached is not None:
+            return cached
+
+        result = self.wrapped.generate_json_with_schema(
+            prompt,
+            schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            **kwargs,
+        )
+        self._store(key, result, "json_with_schema")
+        return result
+
+    @traced_llm_call
+    async def generate_json_with_schema_async(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._schema_key(prompt, schema, system_prompt, schema_name, reasoning_effort, kwargs)
+        cached: dict[str, Any] | None = self._lookup(key, "json_with_schema")
+        if cached is not None:
+            return cached
+
+        result = await self.wrapped.generate_json_with_schema_async(
+            prompt,
+            schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            **kwargs,
+        )
+        self._store(key, result, "json_with_schema")
+        return result
+
+    @traced_llm_call
+    def generate_json_with_pdf(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._pdf_key(
+            pdf_path,
+            schema,
+            system_prompt,
+            max_pages,
+            schema_name,
+            reasoning_effort,
+            context,
+            kwargs,
+        )
+        cached: dict[str, Any] | None = self._lookup(key, "json_with_pdf")
+        if cached is not None:
+            return cached
+
+        result = self.wrapped.generate_json_with_pdf(
+            pdf_path,
+            schema,
+            system_prompt=system_prompt,
+            max_pages=max_pages,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            context=context,
+            **kwargs,
+        )
+        self._store(key, result, "json_with_pdf")
+        return result
+
+    @traced_llm_call
+    async def generate_json_with_pdf_async(
+        self,
+        pdf_path: Path | str,
+        schema: dict[str, Any],
+        system_prompt: str | None = None,
+        max_pages: int | None = None,
+        schema_name: str | None = None,
+        reasoning_effort: str | None = None,
+        context: str | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        key = self._pdf_key(
+            pdf_path,
+            schema,
+            system_prompt,
+            max_pages,
+            schema_name,
+            reasoning_effort,
+            context,
+            kwargs,
+        )
+        cached: dict[str, Any] | None = self._lookup(key, "json_with_pdf")
+        if cached is not None:
+            return cached
+
+        result = await self.wrapped.generate_json_with_pdf_async(
+            pdf_path,
+            schema,
+            system_prompt=system_prompt,
+            max_pages=max_pages,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            context=context,
+            **kwargs,
+        )
+        self._store(key, result, "json_with_pdf")
+        return result
@@ -15,7 +15,9 @@ This package provides the core pipeline that coordinates:
 
 Main Components:
     - orchestrator: Main pipeline coordination (run_full_pipeline, run_single_step)
+    - batch: Multi-PDF batch runner with a global LLM concurrency cap (run_batch)
     - file_manager: File naming and storage management
+    - artifact_store: JSON artifact backends (file tree or SQLite)
     - validation_runner: Dual validation strategy implementation
     - utils: Helper functions (DOI handling, breakpoints, etc.)
 
@@ -33,29 +35,73 @@ Usage:
 Public API:
     - run_full_pipeline: Main pipeline entry point (steps 1-6)
     - run_single_step: Execute individual steps including report_generation
+    - run_batch: Run the full pipeline for many PDFs concurrently
+    - start_pipeline_trace: Trace a run to read tracer.summary() afterwards
     - PipelineFileManager: File management class
     - run_dual_validation: Dual validation function
     - Utility functions: doi_to_safe_filename, get_file_identifier, etc.
 """
 
-from .file_manager import PipelineFileManager
-from .orchestrator import run_full_pipeline, run_single_step, run_validation_with_correction
-from .utils import check_breakpoint, doi_to_safe_filename, get_file_identifier, get_next_step
-from .validation_runner import SCHEMA_QUALITY_THRESHOLD, run_dual_validation
+from typing import TYPE_CHECKING
 
-__all__ = [
+# Public API -> defining submodule. Submodules are imported on first attribute
+# access (PEP 562), so "from src.pipeline.file_manager import ..." does not load
+# the orchestrator, every step and both provider SDKs.
+_EXPORTS = {
     # Main pipeline orchestration
-    "run_full_pipeline",
-    "run_single_step",
-    "run_validation_with_correction",
+    "run_full_pipeline": "orchestrator",
+    "run_single_step": "orchestrator",
+    "run_validation_with_correction": "orchestrator",
+    "start_pipeline_trace": "orchestrator",
+    # Batch processing
+    "run_batch": "batch",
+    "BatchResult": "batch",
     # File management
-    "PipelineFileManager",
+    "PipelineFileManager": "file_manager",
+    "ArtifactStore": "artifact_store",
+    "FileArtifactStore": "artifact_store",
+    "SQLiteArtifactStore": "artifact_store",
+    "get_artifact_store": "artifact_store",
     # Validation
-    "run_dual_validation",
-    "SCHEMA_QUALITY_THRESHOLD",
+    "run_dual_validation": "validation_runner",
+    "SCHEMA_QUALITY_THRESHOLD": "validation_runner",
     # Utilities
-    "doi_to_safe_filename",
-    "get_file_identifier",
-    "get_next_step",
-    "check_breakpoint",
-]
+    "doi_to_safe_filename": "utils",
+    "get_file_identifier": "utils",
+    "get_next_step": "utils",
+    "check_breakpoint": "utils",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .artifact_store import (
+        ArtifactStore,
+        FileArtifactStore,
+        SQLiteArtifactStore,
+        get_artifact_store,
+    )
+    from .batch import BatchResult, run_batch
+    from .file_manager import PipelineFileManager
+    from .orchestrator import (
+        run_full_pipeline,
+        run_single_step,
+        run_validation_with_correction,
+        start_pipeline_trace,
+    )
+    from .utils import check_breakpoint, doi_to_safe_filename, get_file_identifier, get_next_step
+    from .validation_runner import SCHEMA_QUALITY_THRESHOLD, run_dual_validation
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
@@ -0,0 +1,449 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Storage backends for the pipeline's JSON artifacts.
+
+PipelineFileManager saves and loads every JSON artifact (step results, iteration
+files, best/failed selections, manifests) through an ArtifactStore. An artifact
+is addressed by (identifier, step, iteration, status), the same parts that make
+up its filename, e.g. ("paper", "appraisal", 2, "") for tmp/paper-appraisal2.json.
+
+Backends (ARTIFACT_STORE):
+    - files (default): one JSON file per artifact in the run directory, named as
+      before ({identifier}-{step}{iteration}-{status}.json)
+    - sqlite: one row per artifact in a SQLite database (WAL mode) with a primary
+      key on (namespace, identifier, step, iteration, status) and an index on
+      (step, status). Iteration listings and existence checks become indexed
+      lookups instead of directory globs and stats, which stay fast with tens of
+      thousands of artifacts, and find() queries one step across all papers.
+
+Only JSON artifacts go through the store. Traces, rendered reports, figures and
+Markdown files are always written to the run directory. With the sqlite backend
+the paths returned by PipelineFileManager.save_json() are logical names that do
+not exist on disk.
+
+Example:
+    >>> store = SQLiteArtifactStore("tmp/artifacts.sqlite3")
+    >>> store.save("paper", "appraisal", {"risk_of_bias": {}}, iteration=0)
+    >>> [info.iteration for info in store.iterations("paper", "appraisal")]
+    [0]
+    >>> store.save("paper", "appraisal", {"risk_of_bias": {}}, status="best")
+    >>> store.save("other_paper", "appraisal", {"risk_of_bias": {}}, status="best")
+    >>> [info.identifier for info in store.find("appraisal", status="best")]
+    ['other_paper', 'paper']
+"""
+
+import glob
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from ..config import LLMSettings
+from ..serialization import dumps, dumps_artifact, loads
+
+ARTIFACT_STORE_FILES = "files"
+ARTIFACT_STORE_SQLITE = "sqlite"
+
+# Default database filename inside the artifact root
+DEFAULT_DB_NAME = "artifacts.sqlite3"
+
+# SQLite primary keys treat NULLs as distinct, so "no iteration" is stored as -1
+_NO_ITERATION = -1
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS artifacts (
+        namespace TEXT NOT NULL,
+        identifier TEXT NOT NULL,
+        step TEXT NOT NULL,
+        iteration INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        data TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (namespace, identifier, step, iteration, status)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS artifacts_step_status ON artifacts (step, status)",
+)
+
+
+def artifact_filename(
+    identifier: str, step: str, iteration_number: int | None = None, status: str = ""
+) -> str:
+    """
+    Return the filename of an artifact in the file layout.
+
+    Examples:
+        >>> artifact_filename("paper", "extraction", 0)
+        'paper-extraction0.json'
+        >>> artifact_filename("paper", "appraisal", status="best")
+        'paper-appraisal-best.json'
+    """
+    # Build filename parts
+    parts = [identifier, step]
+
+    # Add iteration number if provided (extraction0, validation1, etc.)
+    if iteration_number is not None:
+        parts[-1] = f"{step}{iteration_number}"
+
+    # Add status if provided (for failed cases)
+    if status:
+        parts.append(status)
+
+    return "-".join(parts) + ".json"
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """
+    Write text to path atomically.
+
+    The text goes to a hidden temp file in the same directory, which then replaces
+    path with os.replace(). Concurrent readers see either the old or the new file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(frozen=True)
+class ArtifactInfo:
+    """
+    Metadata of one stored artifact.
+
+    Attributes:
+        identifier: File identifier (PDF stem)
+        step: Step name as used in filenames ("extraction", "appraisal_validation", ...)
+        iteration: Iteration number, or None for non-iteration artifacts
+        status: Status suffix ("", "best", "failed", ...)
+        size_bytes: Size of the serialized JSON
+        updated_at: Time of the last write (epoch seconds)
+        path: File holding the artifact (None for the sqlite backend)
+    """
+
+    identifier: str
+    step: str
+    iteration: int | None
+    status: str
+    size_bytes: int
+    updated_at: float
+    path: Path | None = None
+
+
+class ArtifactStore(ABC):
+    """Storage for JSON artifacts addressed by (identifier, step, iteration, status)."""
+
+    @abstractmethod
+    def save(
+        self,
+        identifier: str,
+        step: str,
+        data: Any,
+        iteration: int | None = None,
+        status: str = "",
+    ) -> None:
+        """Store an artifact, replacing any previous version."""
+
+    @abstractmethod
+    def load(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> Any | None:
+        """Return a stored artifact, or None if it does not exist."""
+
+    @abstractmethod
+    def info(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> ArtifactInfo | None:
+        """Return an artifact's metadata, or None if it does not exist."""
+
+    @abstractmethod
+    def delete(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> bool:
+        """Delete an artifact; returns False if it did not exist."""
+
+    @abstractmethod
+    def iterations(self, identifier: str, step: str, status: str = "") -> list[ArtifactInfo]:
+        """Return the numbered iterations of a step, sorted by iteration number."""
+
+    @abstractmethod
+    def find(self, step: str, status: str = "", iteration: int | None = None) -> list[ArtifactInfo]:
+        """Return one artifact kind across all identifiers, sorted by identifier."""
+
+    def exists(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> bool:
+        """True if the artifact exists."""
+        return self.info(identifier, step, iteration, status) is not None
+
+
+class FileArtifactStore(ArtifactStore):
+    """
+    One JSON file per artifact in a directory (the original tmp/ layout).
+
+    Args:
+        directory: Run directory holding the files
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+
+    def path(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> Path:
+        """Return the file of an artifact."""
+        return self.directory / artifact_filename(identifier, step, iteration, status)
+
+    def save(
+        self,
+        identifier: str,
+        step: str,
+        data: Any,
+        iteration: int | None = None,
+        status: str = "",
+    ) -> None:
+        path = self.path(identifier, step, iteration, status)
+        atomic_write_text(path, dumps_artifact(data))
+
+    def load(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> Any | None:
+        path = self.path(identifier, step, iteration, status)
+        if not path.exists():
+            return None
+        return loads(path.read_bytes())
+
+    def _info(
+        self, path: Path, identifier: str, step: str, iteration: int | None, status: str
+    ) -> ArtifactInfo | None:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return ArtifactInfo(identifier, step, iteration, status, stat.st_size, stat.st_mtime, path)
+
+    def info(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> ArtifactInfo | None:
+        path = self.path(identifier, step, iteration, status)
+        return self._info(path, identifier, step, iteration, status)
+
+    def delete(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> bool:
+        path = self.path(identifier, step, iteration, status)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
+
+    def iterations(self, identifier: str, step: str, status: str = "") -> list[ArtifactInfo]:
+        suffix = f"-{status}" if status else ""
+        pattern = re.compile(
+            rf"^{re.escape(identifier)}-{re.escape(step)}(\d+){re.escape(suffix)}\.json$"
+        )
+        found = []
+        prefix = glob.escape(f"{identifier}-{step}")
+        for path in self.directory.glob(f"{prefix}[0-9]*{glob.escape(suffix)}.json"):
+            match = pattern.match(path.name)
+            if match:
+                info = self._info(path, identifier, step, int(match.group(1)), status)
+                if info is not None:
+                    found.append(info)
+        return sorted(found, key=lambda info: info.iteration or 0)
+
+    def find(self, step: str, status: str = "", iteration: int | None = None) -> list[ArtifactInfo]:
+        tail = artifact_filename("", step, iteration, status)
+        found = []
+        for path in self.directory.glob(f"*{glob.escape(tail)}"):
+            identifier = path.name[: -len(tail)]
+            if not identifier:
+                continue
+            info = self._info(path, identifier, step, iteration, status)
+            if info is not None:
+                found.append(info)
+        return sorted(found, key=lambda info: info.identifier)
+
+
+class SQLiteArtifactStore(ArtifactStore):
+    """
+    JSON artifacts as rows of a SQLite database.
+
+    Args:
+        db_path: SQLite file; may be shared by many runs, threads and processes
+        namespace: Separates runs that share the database (the isolated run
+            directory relative to the artifact root; "" for the shared layout)
+    """
+
+    def __init__(self, db_path: Path | str, namespace: str = ""):
+        self.db_path = Path(db_path)
+        self.namespace = namespace
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: sqlite3 connections are not
+        # shareable across threads, and the file lock handles cross-process access
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _row_info(row: sqlite3.Row) -> ArtifactInfo:
+        iteration = None if row["iteration"] == _NO_ITERATION else row["iteration"]
+        return ArtifactInfo(
+            row["identifier"],
+            row["step"],
+            iteration,
+            row["status"],
+            row["size_bytes"],
+            row["updated_at"],
+        )
+
+    def _key(
+        self, identifier: str, step: str, iteration: int | None, status: str
+    ) -> tuple[str, str, str, int, str]:
+        iteration = _NO_ITERATION if iteration is None else iteration
+        return (self.namespace, identifier, step, iteration, status)
+
+    def save(
+        self,
+        identifier: str,
+        step: str,
+        data: Any,
+        iteration: int | None = None,
+        status: str = "",
+    ) -> None:
+        payload = dumps(data)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO artifacts "
+                "(namespace, identifier, step, iteration, status, data, size_bytes, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *self._key(identifier, step, iteration, status),
+                    payload,
+                    len(payload.encode("utf-8")),
+                    time.time(),
+                ),
+            )
+
+    def load(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> Any | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT data FROM artifacts WHERE namespace = ? AND identifier = ? "
+                "AND step = ? AND iteration = ? AND status = ?",
+                self._key(identifier, step, iteration, status),
+            ).fetchone()
+        return None if row is None else loads(row["data"])
+
+    def info(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> ArtifactInfo | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT identifier, step, iteration, status, size_bytes, updated_at "
+                "FROM artifacts WHERE namespace = ? AND identifier = ? "
+                "AND step = ? AND iteration = ? AND status = ?",
+                self._key(identifier, step, iteration, status),
+            ).fetchone()
+        return None if row is None else self._row_info(row)
+
+    def delete(
+        self, identifier: str, step: str, iteration: int | None = None, status: str = ""
+    ) -> bool:
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "DELETE FROM artifacts WHERE namespace = ? AND identifier = ? "
+                "AND step = ? AND iteration = ? AND status = ?",
+                self._key(identifier, step, iteration, status),
+            )
+        return cursor.rowcount > 0
+
+    def iterations(self, identifier: str, step: str, status: str = "") -> list[ArtifactInfo]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT identifier, step, iteration, status, size_bytes, updated_at "
+                "FROM artifacts WHERE namespace = ? AND identifier = ? AND step = ? "
+                "AND status = ? AND iteration >= 0 ORDER BY iteration",
+                (self.namespace, identifier, step, status),
+            ).fetchall()
+        return [self._row_info(row) for row in rows]
+
+    def find(self, step: str, status: str = "", iteration: int | None = None) -> list[ArtifactInfo]:
+        iteration = _NO_ITERATION if iteration is None else iteration
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT identifier, step, iteration, status, size_bytes, updated_at "
+                "FROM artifacts WHERE step = ? AND status = ? AND iteration = ? "
+                "AND namespace = ? ORDER BY identifier",
+                (step, status, iteration, self.namespace),
+            ).fetchall()
+        return [self._row_info(row) for row in rows]
+
+
+_SHARED_SQLITE_STORES: dict[tuple[str, str], SQLiteArtifactStore] = {}
+_SHARED_SQLITE_STORES_LOCK = threading.Lock()
+
+
+def get_artifact_store(
+    settings: LLMSettings, directory: Path, artifact_root: Path | None = None
+) -> ArtifactStore:
+    """
+    Return the artifact store configured by settings.artifact_store.
+
+    Args:
+        settings: Settings with artifact_store / artifact_store_db
+        directory: Run directory (holds the files of the files backend)
+        artifact_root: Root of all runs; the sqlite database lives here unless
+            settings.artifact_store_db is set (default: directory)
+
+    Returns:
+        FileArtifactStore for "files", a shared SQLiteArtifactStore for "sqlite"
+
+    Raises:
+        ValueError: If settings.artifact_store names an unknown backend
+    """
+    if settings.artifact_store == ARTIFACT_STORE_FILES:
+        return FileArtifactStore(directory)
+    if settings.artifact_store != ARTIFACT_STORE_SQLITE:
+        raise ValueError(
+            f"Unknown ARTIFACT_STORE '{settings.artifact_store}' "
+            f"(expected '{ARTIFACT_STORE_FILES}' or '{ARTIFACT_STORE_SQLITE}')"
+        )
+
+    root = artifact_root if artifact_root is not None else directory
+    db_path = Path(settings.artifact_store_db or root / DEFAULT_DB_NAME).resolve()
+    try:
+        namespace = directory.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        namespace = directory.resolve().as_posix()
+    namespace = "" if namespace == "." else namespace
+
+    key = (str(db_path), namespace)
+    with _SHARED_SQLITE_STORES_LOCK:
+        store = _SHARED_SQLITE_STORES.get(key)
+        if store is None:
+            store = SQLiteArtifactStore(db_path, namespace)
+            _SHARED_SQLITE_STORES[key] = store
+        return store
@@ -0,0 +1,331 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Multi-PDF batch runner for the six-step pipeline.
+
+Runs run_full_pipeline() for many papers concurrently. Pipeline wall time is
+dominated by waiting on LLM responses, so papers run on a thread pool while a
+process-wide semaphore (src.llm.base.set_request_limit) caps the number of LLM
+requests in flight across all papers.
+
+Isolation guarantees:
+    - Each paper gets its own PipelineFileManager and results dict
+    - An exception in one paper is recorded on that paper and never aborts the batch
+    - Papers whose file identifier would collide (same PDF stem) are rejected up
+      front instead of overwriting each other's tmp/ files, unless they run with
+      isolated_run=True, which gives every paper its own run directory
+
+Batch sources:
+    - Directory: every *.pdf directly inside it (sorted by name)
+    - Manifest (.jsonl): one JSON object per line with a "pdf" path plus optional
+      run_full_pipeline overrides, e.g. {"pdf": "a.pdf", "max_pages": 10}.
+      Relative paths resolve against the manifest's directory.
+
+Example:
+    >>> from src.pipeline.batch import run_batch
+    >>> batch = run_batch(Path("papers/"), workers=8, max_llm_concurrency=16)
+    >>> batch.succeeded, batch.failed
+    (42, 1)
+"""
+
+import inspect
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+
+from ..config import llm_settings
+from ..llm.base import set_request_limit
+from . import orchestrator
+
+console = Console()
+
+BatchProgressCallback = Callable[[Path, str, dict[str, Any]], None]
+
+
+@dataclass
+class BatchItem:
+    """
+    One paper in a batch.
+
+    Attributes:
+        pdf_path: PDF to process
+        options: Per-paper run_full_pipeline keyword overrides
+    """
+
+    pdf_path: Path
+    options: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchPaperResult:
+    """
+    Outcome of one paper in a batch.
+
+    Attributes:
+        pdf_path: PDF that was processed
+        status: "completed" or "failed"
+        duration_seconds: Wall time spent on this paper
+        results: run_full_pipeline() return value (None on failure)
+        error: Error message (None on success)
+    """
+
+    pdf_path: Path
+    status: str
+    duration_seconds: float = 0.0
+    results: dict[str, Any] | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary without the full step results (for JSON reports)."""
+        return {
+            "pdf": str(self.pdf_path),
+            "status": self.status,
+            "duration_seconds": round(self.duration_seconds, 2),
+            "steps": sorted(self.results) if self.results else [],
+            "error": self.error,
+        }
+
+
+@dataclass
+class BatchResult:
+    """
+    Aggregated outcome of a batch run.
+
+    Attributes:
+        papers: Per-paper results in input order
+        duration_seconds: Wall time of the whole batch
+    """
+
+    papers: list[BatchPaperResult]
+    duration_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for p in self.papers if p.status == "completed")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for p in self.papers if p.status != "completed")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": len(self.papers),
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "duration_seconds": round(self.duration_seconds, 2),
+            "papers": [p.to_dict() for p in self.papers],
+        }
+
+
+# run_full_pipeline keyword arguments that may be set per batch or per paper
+PIPELINE_OPTIONS = frozenset(inspect.signature(orchestrator.run_full_pipeline).parameters) - {
+    "pdf_path",
+    "progress_callback",
+    "have_llm_support",
+}
+
+
+def load_batch_items(source: Path | str) -> list[BatchItem]:
+    """
+    Expand a batch source (directory or .jsonl manifest) into BatchItems.
+
+    Args:
+        source: Directory of PDFs or path to a JSONL manifest
+
+    Returns:
+        List of BatchItem in deterministic order
+
+    Raises:
+        FileNotFoundError: If source does not exist
+        ValueError: If a manifest line is malformed or has unknown options
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Batch source not found: {source}")
+
+    if source.is_dir():
+        return [BatchItem(pdf_path=p) for p in sorted(source.glob("*.pdf"))]
+
+    items: list[BatchItem] = []
+    for line_number, line in enumerate(source.read_text(encoding="utf-8").splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            entry = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON ({e})") from e
+        if not isinstance(entry, dict) or "pdf" not in entry:
+            raise ValueError(f"{source}:{line_number}: each line needs a 'pdf' field")
+
+        pdf_path = Path(entry.pop("pdf"))
+        if not pdf_path.is_absolute():
+            pdf_path = source.parent / pdf_path
+
+        unknown = set(entry) - PIPELINE_OPTIONS
+        if unknown:
+            raise ValueError(
+                f"{source}:{line_number}: unknown option(s) {sorted(unknown)}. "
+                f"Allowed: {sorted(PIPELINE_OPTIONS)}"
+            )
+        items.append(BatchItem(pdf_path=pdf_path, options=entry))
+
+    return items
+
+
+def _normalize_items(items: Any) -> list[BatchItem]:
+    if isinstance(items, str | Path):
+        return load_batch_items(items)
+    normalized = []
+    for item in items:
+        if isinstance(item, BatchItem):
+            normalized.append(item)
+        else:
+            normalized.append(BatchItem(pdf_path=Path(item)))
+    return normalized
+
+
+def _has_own_run_directory(options: dict[str, Any]) -> bool:
+    """True if a paper run with these options writes to a new isolated run directory."""
+    isolated = options.get("isolated_run")
+    if isolated is None:
+        isolated = llm_settings.isolated_runs
+    return bool(isolated) and options.get("run_id") is None
+
+
+def _run_one(
+    item: BatchItem,
+    pipeline_kwargs: dict[str, Any],
+    progress_callback: BatchProgressCallback | None,
+) -> BatchPaperResult:
+    """Run the full pipeline for one paper, capturing any exception."""
+    start = time.time()
+    kwargs = {**pipeline_kwargs, **item.options}
+
+    step_callback = None
+    if progress_callback is not None:
+
+        def step_callback(step_name: str, status: str, data: dict) -> None:
+            progress_callback(item.pdf_path, f"{step_name}:{status}", data)
+
+    try:
+        if not item.pdf_path.exists():
+            raise FileNotFoundError(f"PDF not found: {item.pdf_path}")
+        results = orchestrator.run_full_pipeline(
+            pdf_path=item.pdf_path, progress_callback=step_callback, **kwargs
+        )
+        return BatchPaperResult(
+            pdf_path=item.pdf_path,
+            status="completed",
+            duration_seconds=time.time() - start,
+            results=results,
+        )
+    except Exception as e:  # noqa: BLE001 - one paper must never abort the batch
+        console.print(f"[red]❌ {item.pdf_path.name}: {type(e).__name__}: {e}[/red]")
+        return BatchPaperResult(
+            pdf_path=item.pdf_path,
+            status="failed",
+            duration_seconds=time.time() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def run_batch(
+    items: list[BatchItem | Path | str] | Path | str,
+    workers: int = 4,
+    max_llm_concurrency: int | None = None,
+    progress_callback: BatchProgressCallback | None = None,
+    **pipeline_kwargs: Any,
+) -> BatchResult:
+    """
+    Run the full pipeline for many PDFs concurrently.
+
+    Args:
+        items: Batch source (directory or .jsonl manifest) or explicit list of
+            PDF paths / BatchItems
+        workers: Number of papers processed at the same time
+        max_llm_concurrency: Process-wide cap on in-flight LLM requests across
+            all papers (None = settings.max_concurrent_requests per provider)
+        progress_callback: Optional callback(pdf_path, status, data). Status is
+            "starting", "completed" or "failed" for the paper itself and
+            "<step>:<status>" for forwarded step events.
+        **pipeline_kwargs: Defaults passed to run_full_pipeline() for every
+            paper (e.g. llm_provider, max_pages, skip_podcast)
+
+    Returns:
+        BatchResult with one BatchPaperResult per input item, in input order
+
+    Raises:
+        ValueError: If workers < 1 or pipeline_kwargs contains unknown options
+
+    Example:
+        >>> batch = run_batch(["a.pdf", "b.pdf"], workers=2, llm_provider="openai")
+        >>> [p.status for p in batch.papers]
+        ['completed', 'completed']
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    unknown = set(pipeline_kwargs) - PIPELINE_OPTIONS
+    if unknown:
+        raise ValueError(f"Unknown run_full_pipeline option(s): {sorted(unknown)}")
+
+    batch_items = _normalize_items(items)
+    start = time.time()
+    results: list[BatchPaperResult | None] = [None] * len(batch_items)
+
+    # Papers share tmp/<stem>-*.json naming, so duplicate stems would clobber each other
+    # (isolated runs get their own directory and are exempt)
+    seen: dict[str, int] = {}
+    runnable: list[int] = []
+    for index, item in enumerate(batch_items):
+        stem = item.pdf_path.stem
+        if _has_own_run_directory({**pipeline_kwargs, **item.options}):
+            runnable.append(index)
+            continue
+        if stem in seen:
+            results[index] = BatchPaperResult(
+                pdf_path=item.pdf_path,
+                status="failed",
+                error=(
+                    f"Duplicate file identifier '{stem}' "
+                    f"(also used by {batch_items[seen[stem]].pdf_path})"
+                ),
+            )
+            continue
+        seen[stem] = index
+        runnable.append(index)
+
+    if max_llm_concurrency is not None:
+        set_request_limit(max_llm_concurrency)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool:
+            futures = {}
+            for index in runnable:
+                item = batch_items[index]
+                if progress_callback is not None:
+                    progress_callback(item.pdf_path, "starting", {})
+                futures[pool.submit(_run_one, item, pipeline_kwargs, progress_callback)] = index
+
+            for future in as_completed(futures):
+                index = futures[future]
+                paper = future.result()
+                results[index] = paper
+                if progress_callback is not None:
+                    progress_callback(paper.pdf_path, paper.status, paper.to_dict())
+    finally:
+        if max_llm_concurrency is not None:
+            set_request_limit(None)
+
+    return BatchResult(
+        papers=[r for r in results if r is not None],
+        duration_seconds=time.time() - start,
+    )
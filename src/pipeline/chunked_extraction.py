@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Page-chunked parallel extraction for long PDFs.
+
+With EXTRACTION_CHUNK_PAGES=N, a PDF longer than N pages is split into page
+windows of N pages that overlap by EXTRACTION_CHUNK_OVERLAP pages (so tables and
+paragraphs crossing a window boundary are seen whole at least once). Every
+window is extracted against the same publication-type schema, concurrently,
+and the partial extractions are merged deterministically:
+
+- Objects: merged key by key
+- Arrays of objects with an ID field (outcome_id, arm_id, ... as chosen by
+  schema_repair._get_id_field_for_array): one item per ID, items with the same
+  ID merged; items without an ID are de-duplicated by content
+- Arrays of scalars: union in order of first appearance
+- Scalars: the value of the earliest window that has one (front matter such as
+  title and authors comes from the first pages)
+
+Windows are processed in page order and the merge never depends on completion
+order, so the same partial results always produce the same extraction.
+Windows are sliced with src/llm/pdf_slicer.py; without pypdf the extraction
+falls back to a single call.
+"""
+
+import contextvars
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..config import llm_settings
+from ..llm.pdf_slicer import count_pages, slice_pdf_pages
+from .schema_repair import _get_id_field_for_array, _get_item_schema, _resolve_ref
+
+logger = logging.getLogger(__name__)
+
+CHUNK_INSTRUCTIONS = (
+    "PAGE WINDOW: this PDF holds pages {first}-{last} of a {total}-page article; the other "
+    "pages are extracted separately and merged with your output. Page 1 of this PDF is page "
+    "{first} of the article: report article page numbers. Extract only information found on "
+    "these pages and omit optional fields whose information is not here. Use the identifiers "
+    "the article itself uses for arms, outcomes, groups and other entities, so entries from "
+    "different windows can be matched."
+)
+
+
+def page_windows(total_pages: int, chunk_pages: int, overlap: int = 0) -> list[tuple[int, int]]:
+    """
+    Split pages 1..total_pages into windows of chunk_pages overlapping by overlap pages.
+
+    Example:
+        >>> page_windows(30, 12, 2)
+        [(1, 12), (11, 22), (21, 30)]
+    """
+    if total_pages <= 0:
+        return []
+    if chunk_pages <= 0 or total_pages <= chunk_pages:
+        return [(1, total_pages)]
+    step = max(1, chunk_pages - max(0, overlap))
+    windows = []
+    first = 1
+    while True:
+        last = min(first + chunk_pages - 1, total_pages)
+        windows.append((first, last))
+        if last == total_pages:
+            return windows
+        first += step
+
+
+def plan_chunks(pdf_path: Path, max_pages: int | None) -> list[tuple[int, int]]:
+    """
+    Return the page windows to extract, or [] when a single call should be used.
+
+    A single call is used when chunking is disabled (EXTRACTION_CHUNK_PAGES=0),
+    the document fits in one window, or the page count cannot be read.
+    """
+    chunk_pages = llm_settings.extraction_chunk_pages
+    if chunk_pages <= 0:
+        return []
+    total = count_pages(pdf_path)
+    if total is None:
+        logger.warning("Page count unavailable; extracting %s in a single call", pdf_path.name)
+        return []
+    if max_pages:
+        total = min(total, max_pages)
+    windows = page_windows(total, chunk_pages, llm_settings.extraction_chunk_overlap)
+    return windows if len(windows) > 1 else []
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def _resolve(schema: dict[str, Any], schema_defs: dict[str, Any]) -> dict[str, Any]:
+    if "$ref" in schema:
+        return _resolve_ref(schema["$ref"], schema_defs)
+    return schema
+
+
+def _merge_values(
+    first: Any, second: Any, schema: dict[str, Any], schema_defs: dict[str, Any]
+) -> Any:
+    schema = _resolve(schema or {}, schema_defs)
+    if first is None:
+        return second
+    if second is None:
+        return first
+    if isinstance(first, dict) and isinstance(second, dict):
+        return _merge_objects(first, second, schema, schema_defs)
+    if isinstance(first, list) and isinstance(second, list):
+        return _merge_arrays(first, second, schema, schema_defs)
+    # Scalars (or mismatched types): the earlier window wins
+    return first
+
+
+def _merge_objects(
+    first: dict[str, Any],
+    second: dict[str, Any],
+    schema: dict[str, Any],
+    schema_defs: dict[str, Any],
+) -> dict[str, Any]:
+    properties = schema.get("properties", {})
+    merged = dict(first)
+    for key, value in second.items():
+        if key in merged:
+            merged[key] = _merge_values(merged[key], value, properties.get(key, {}), schema_defs)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _merge_arrays(
+    first: list[Any],
+    second: list[Any],
+    schema: dict[str, Any],
+    schema_defs: dict[str, Any],
+) -> list[Any]:
+    item_schema = _get_item_schema(schema, schema_defs) if schema else {}
+    id_field = _get_id_field_for_array(item_schema) if item_schema else None
+
+    merged = list(first)
+    by_id = {
+        str(item[id_field]): index
+        for index, item in enumerate(merged)
+        if id_field and isinstance(item, dict) and id_field in item
+    }
+    seen = {_canonical(item) for item in merged}
+    for item in second:
+        if id_field and isinstance(item, dict) and id_field in item:
+            key = str(item[id_field])
+            if key in by_id:
+                index = by_id[key]
+                merged[index] = _merge_values(merged[index], item, item_schema, schema_defs)
+                continue
+            by_id[key] = len(merged)
+        elif _canonical(item) in seen:
+            continue
+        seen.add(_canonical(item))
+        merged.append(item)
+    return merged
+
+
+def merge_extractions(parts: list[dict[str, Any]], schema: dict[str, Any]) -> dict[str, Any]:
+    """
+    Merge partial extractions of consecutive page windows into one extraction.
+
+    Args:
+        parts: Extractions in page order (provider "usage"/"_metadata" are combined,
+            not merged as data)
+        schema: Bundled publication-type schema (used to find array ID fields)
+
+    Returns:
+        Merged extraction; "usage" holds the summed token counts and "_metadata"
+        the first window's metadata plus the number of windows
+    """
+    schema_defs = schema.get("$defs", {})
+    merged: dict[str, Any] = {}
+    usage: dict[str, int] = {}
+    for part in parts:
+        data = {key: value for key, value in part.items() if key not in ("usage", "_metadata")}
+        merged = _merge_objects(merged, data, schema, schema_defs)
+        for name, count in (part.get("usage") or {}).items():
+            if isinstance(count, int):
+                usage[name] = usage.get(name, 0) + count
+
+    if usage:
+        merged["usage"] = usage
+    metadata = next((part["_metadata"] for part in parts if part.get("_metadata")), None)
+    if metadata is not None:
+        merged["_metadata"] = {**metadata, "chunks": len(parts)}
+    return merged
+
+
+def run_chunked_extraction(
+    llm: Any,
+    pdf_path: Path,
+    windows: list[tuple[int, int]],
+    schema: dict[str, Any],
+    system_prompt: str,
+    schema_name: str,
+    reasoning_effort: str | None,
+) -> dict[str, Any]:
+    """
+    Extract every page window concurrently and merge the results.
+
+    Args:
+        llm: LLM provider instance
+        pdf_path: Source PDF
+        windows: Page windows from plan_chunks()
+        schema: Publication-type extraction schema
+        system_prompt: Extraction prompt
+        schema_name: Schema name passed to the provider
+        reasoning_effort: Reasoning effort passed to the provider
+
+    Returns:
+        Merged extraction (see merge_extractions())
+
+    Raises:
+        LLMError: If any window fails (a partial extraction is never returned)
+    """
+    total = windows[-1][1]
+
+    def extract(window: tuple[int, int]) -> dict[str, Any]:
+        first, last = window
+        part: dict[str, Any] = llm.generate_json_with_pdf(
+            pdf_path=slice_pdf_pages(pdf_path, first, last, llm_settings),
+            schema=schema,
+            system_prompt=system_prompt,
+            schema_name=schema_name,
+            reasoning_effort=reasoning_effort,
+            context=CHUNK_INSTRUCTIONS.format(first=first, last=last, total=total),
+        )
+        return part
+
+    workers = max(1, min(len(windows), llm_settings.max_concurrent_requests))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract-chunk") as pool:
+        # Each window runs in a copy of this context, so its LLM span nests under the
+        # current step; results are collected in window order
+        futures = [
+            pool.submit(contextvars.copy_context().run, extract, window) for window in windows
+        ]
+        parts = [future.result() for future in futures]
+    return merge_extractions(parts, schema)
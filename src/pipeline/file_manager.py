@@ -7,16 +7,76 @@ File management for pipeline intermediate and final outputs.
 
 This module provides the PipelineFileManager class for consistent
 filename-based file naming and storage throughout the extraction pipeline.
+
+Artifacts live under the artifact root (PIPELINE_ARTIFACT_ROOT, default tmp/).
+By default every run of a PDF shares the root and files are named by PDF stem.
+Isolated runs (PIPELINE_ISOLATED_RUNS=true, or an explicit run ID) write to
+{root}/runs/{stem}-{content hash}/{run_id}/ instead, so concurrent runs on
+same-named PDFs, Streamlit sessions or workers sharing one volume never touch
+each other's files. All writes go through a temp file plus rename, so readers
+never see a partially written artifact.
+
+JSON artifacts are stored through an ArtifactStore (ARTIFACT_STORE, see
+artifact_store.py): one file each in the run directory (default) or rows in a
+SQLite database.
 """
 
-import json
+import functools
+import hashlib
+import uuid
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 
+from ..config import llm_settings
+from ..tracing import KIND_FILE_WRITE, span
+from .artifact_store import (
+    ArtifactStore,
+    FileArtifactStore,
+    artifact_filename,
+    atomic_write_text,
+    get_artifact_store,
+)
+
 console = Console()
 
+# Length of the PDF content hash in isolated run directory names
+RUN_HASH_LENGTH = 12
+
+
+@functools.lru_cache(maxsize=32)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def pdf_digest(pdf_path: Path) -> str:
+    """Return the SHA-256 of a PDF (memoized per path, mtime and size)."""
+    stat = pdf_path.stat()
+    return _file_digest(str(pdf_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def new_run_id() -> str:
+    """Return a new run ID: UTC timestamp (sortable) plus a random suffix."""
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+
+
+def run_directory(pdf_path: Path, artifact_root: Path | str, run_id: str) -> Path:
+    """
+    Return the artifact directory of an isolated run.
+
+    Example:
+        >>> run_directory(Path("paper.pdf"), "tmp", "20250101T120000Z-1a2b3c4d")
+        PosixPath('tmp/runs/paper-3f2a9c1d0b7e/20250101T120000Z-1a2b3c4d')
+    """
+    content_hash = pdf_digest(pdf_path)[:RUN_HASH_LENGTH]
+    return Path(artifact_root) / "runs" / f"{pdf_path.stem}-{content_hash}" / run_id
+
 
 class PipelineFileManager:
     """
@@ -28,7 +88,10 @@ class PipelineFileManager:
     Attributes:
         pdf_path: Path to source PDF file
         pdf_stem: PDF filename without extension
+        artifact_root: Root directory of all pipeline artifacts
+        run_id: Run ID of an isolated run (None when runs share the artifact root)
         tmp_dir: Directory for temporary/intermediate files
+        store: Storage backend of the JSON artifacts
         identifier: File identifier used in all output filenames
 
     Example:
@@ -41,28 +104,67 @@ class PipelineFileManager:
         tmp/research_paper-classification.json
     """
 
-    def __init__(self, pdf_path: Path):
+    def __init__(
+        self,
+        pdf_path: Path,
+        artifact_root: Path | str | None = None,
+        run_id: str | None = None,
+        isolated: bool | None = None,
+        store: ArtifactStore | None = None,
+    ):
         """
         Initialize file manager for a PDF.
 
         Args:
             pdf_path: Path to the PDF file being processed
+            artifact_root: Root directory for artifacts (default: PIPELINE_ARTIFACT_ROOT)
+            run_id: Run ID of an isolated run; implies isolated=True. Pass the ID of
+                an earlier run to continue writing to its directory.
+            isolated: Write to a run-scoped directory keyed by PDF content hash and
+                run ID (default: PIPELINE_ISOLATED_RUNS). A new run ID is generated
+                when none is given.
+            store: JSON artifact store (default: the ARTIFACT_STORE backend)
 
         Note:
-            Creates tmp/ directory if it doesn't exist.
+            Creates the artifact directory if it doesn't exist.
             Prints the file identifier to console for tracking.
         """
         self.pdf_path = pdf_path
         self.pdf_stem = pdf_path.stem
-
-        # Create tmp directory
-        self.tmp_dir = Path("tmp")
-        self.tmp_dir.mkdir(exist_ok=True)
+        self.artifact_root = Path(
+            artifact_root if artifact_root is not None else llm_settings.artifact_root
+        )
+        if isolated is None:
+            isolated = run_id is not None or llm_settings.isolated_runs
+
+        # Create artifact directory
+        if isolated:
+            self.run_id: str | None = run_id or new_run_id()
+            self.tmp_dir = run_directory(pdf_path, self.artifact_root, self.run_id)
+        else:
+            self.run_id = None
+            self.tmp_dir = self.artifact_root
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.store = store or get_artifact_store(llm_settings, self.tmp_dir, self.artifact_root)
 
         # Use PDF filename as permanent identifier (no DOI renaming)
         # This creates consistent naming: {pdf_filename}-{step}.json
         self.identifier = pdf_path.stem
         console.print(f"[blue]📁 File identifier: {self.identifier}[/blue]")
+        if self.run_id is not None:
+            console.print(f"[blue]📁 Run directory: {self.tmp_dir}[/blue]")
+
+    @property
+    def tmp_dir(self) -> Path:
+        """Directory holding this run's artifacts."""
+        return self._tmp_dir
+
+    @tmp_dir.setter
+    def tmp_dir(self, directory: Path) -> None:
+        self._tmp_dir = Path(directory)
+        # The file store keeps its JSON files in the run directory, so it moves along
+        if isinstance(getattr(self, "store", None), FileArtifactStore):
+            self.store = FileArtifactStore(self._tmp_dir)
 
     def get_filename(
         self, step: str, iteration_number: int | None = None, status: str = ""
@@ -89,19 +191,7 @@ class PipelineFileManager:
             >>> manager.get_filename("extraction", status="failed")
             PosixPath('tmp/paper-extraction-failed.json')
         """
-        # Build filename parts
-        parts = [self.identifier, step]
-
-        # Add iteration number if provided (extraction0, validation1, etc.)
-        if iteration_number is not None:
-            parts[-1] = f"{step}{iteration_number}"
-
-        # Add status if provided (for failed cases)
-        if status:
-            parts.append(status)
-
-        filename = "-".join(parts) + ".json"
-        return self.tmp_dir / filename
+        return self.tmp_dir / artifact_filename(self.identifier, step, iteration_number, status)
 
     def save_json(
         self, data: dict[Any, Any], step: str, iteration_number: int | None = None, status: str = ""
@@ -116,7 +206,7 @@ class PipelineFileManager:
             status: Optional status suffix
 
         Returns:
-            Path to saved JSON file
+            Path to saved JSON file (a logical name with the sqlite artifact store)
 
         Examples:
             >>> manager = PipelineFileManager(Path("paper.pdf"))
@@ -130,8 +220,8 @@ class PipelineFileManager:
             'paper-extraction0.json'
         """
         filepath = self.get_filename(step, iteration_number, status)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with span("save_json", KIND_FILE_WRITE, file=filepath.name):
+            self.store.save(self.identifier, step, data, iteration_number, status)
         return filepath
 
     def load_json(
@@ -167,12 +257,11 @@ class PipelineFileManager:
             >>> manager.load_json("nonexistent")
             None
         """
-        filepath = self.get_filename(step, iteration_number, status)
-        if not filepath.exists():
-            return None
+        return self.store.load(self.identifier, step, iteration_number, status)
 
-        with open(filepath, encoding="utf-8") as f:
-            return json.load(f)
+    def exists(self, step: str, iteration_number: int | None = None, status: str = "") -> bool:
+        """Return True if the JSON artifact exists (without loading it)."""
+        return self.store.exists(self.identifier, step, iteration_number, status)
 
     def save_appraisal_iteration(
         self,
@@ -300,7 +389,7 @@ class PipelineFileManager:
                 - validation_file: Path | None
                 - appraisal_exists: bool
                 - validation_exists: bool
-                - created_time: datetime (from file mtime)
+                - created_time: datetime (time of the last write)
 
         Sorted by iteration number.
 
@@ -323,39 +412,7 @@ class PipelineFileManager:
             >>> iterations[0]["validation_exists"]
             True
         """
-        import re
-        from datetime import datetime
-
-        # Find all appraisal iteration files
-        pattern = f"{self.identifier}-appraisal[0-9]*.json"
-        appraisal_files = sorted(self.tmp_dir.glob(pattern))
-
-        iterations = []
-        for appraisal_file in appraisal_files:
-            # Extract iteration number from filename
-            match = re.search(r"appraisal(\d+)\.json$", appraisal_file.name)
-            if not match:
-                continue
-
-            iteration_num = int(match.group(1))
-
-            # Check for validation file
-            validation_file = self.get_filename(
-                "appraisal_validation", iteration_number=iteration_num
-            )
-
-            iterations.append(
-                {
-                    "iteration_num": iteration_num,
-                    "appraisal_file": appraisal_file,
-                    "validation_file": validation_file if validation_file.exists() else None,
-                    "appraisal_exists": appraisal_file.exists(),
-                    "validation_exists": validation_file.exists(),
-                    "created_time": datetime.fromtimestamp(appraisal_file.stat().st_mtime),
-                }
-            )
-
-        return sorted(iterations, key=lambda x: x["iteration_num"])
+        return self._get_iterations("appraisal", "appraisal_validation")
 
     def save_report_iteration(
         self,
@@ -416,7 +473,8 @@ class PipelineFileManager:
         """
         filename = f"{self.identifier}-report-{status}.tex"
         tex_path = self.tmp_dir / filename
-        tex_path.write_text(tex_content, encoding="utf-8")
+        with span("save_report_render", KIND_FILE_WRITE, file=filename):
+            atomic_write_text(tex_path, tex_content)
         return tex_path
 
     def load_report_iteration(
@@ -500,7 +558,7 @@ class PipelineFileManager:
                 - validation_file: Path | None
                 - report_exists: bool
                 - validation_exists: bool
-                - created_time: datetime (from file mtime)
+                - created_time: datetime (time of the last write)
 
         Sorted by iteration number.
 
@@ -523,34 +581,25 @@ class PipelineFileManager:
             >>> iterations[0]["validation_exists"]
             True
         """
-        import re
-        from datetime import datetime
-
-        # Find all report iteration files
-        pattern = f"{self.identifier}-report[0-9]*.json"
-        report_files = sorted(self.tmp_dir.glob(pattern))
+        return self._get_iterations("report", "report_validation")
 
+    def _get_iterations(self, step: str, validation_step: str) -> list[dict[str, Any]]:
+        """Iteration listing shared by get_appraisal_iterations and get_report_iterations."""
+        validated = {
+            info.iteration for info in self.store.iterations(self.identifier, validation_step)
+        }
         iterations = []
-        for report_file in report_files:
-            # Extract iteration number from filename
-            match = re.search(r"report(\d+)\.json$", report_file.name)
-            if not match:
-                continue
-
-            iteration_num = int(match.group(1))
-
-            # Check for validation file
-            validation_file = self.get_filename("report_validation", iteration_number=iteration_num)
-
+        for info in self.store.iterations(self.identifier, step):
+            validation_file = self.get_filename(validation_step, iteration_number=info.iteration)
+            validation_exists = info.iteration in validated
             iterations.append(
                 {
-                    "iteration_num": iteration_num,
-                    "report_file": report_file,
-                    "validation_file": validation_file if validation_file.exists() else None,
-                    "report_exists": report_file.exists(),
-                    "validation_exists": validation_file.exists(),
-                    "created_time": datetime.fromtimestamp(report_file.stat().st_mtime),
+                    "iteration_num": info.iteration,
+                    f"{step}_file": self.get_filename(step, iteration_number=info.iteration),
+                    "validation_file": validation_file if validation_exists else None,
+                    f"{step}_exists": True,
+                    "validation_exists": validation_exists,
+                    "created_time": datetime.fromtimestamp(info.updated_at),
                 }
             )
-
-        return sorted(iterations, key=lambda x: x["iteration_num"])
+        return iterations
@@ -0,0 +1,247 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Section-scoped incremental LLM validation for the extraction correction loop.
+
+With VALIDATION_MODE=incremental, run_dual_validation remembers the LLM verdicts
+of every extraction it validated in the loop. When a correction only touched some
+top-level sections, the validator receives just those sections. Its verdict is
+then merged with the remembered verdicts for the unchanged sections:
+
+- Issues: cached issues for unchanged sections plus the new issues, renumbered
+- Scores: cached and new completeness/accuracy blended by the size of the sections
+- Counts and overall_status: recomputed from the merged issues
+
+Schema validation is always run on the whole extraction; only the LLM call is
+scoped. A full validation is used when there is no usable baseline, when more
+than half of the sections changed, or when a cached issue cannot be attributed
+to a section (it might have been fixed without the validator seeing it).
+"""
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any
+
+# Incremental validation is skipped when more than this fraction of sections changed
+MAX_CHANGED_FRACTION = 0.5
+
+# Baselines kept per loop (current best, rollbacks and parallel candidates)
+MAX_CACHED_VALIDATIONS = 8
+
+# Keys added by the pipeline or providers; never compared or sent to the validator
+_IGNORED_KEYS = ("_metadata", "_pipeline_metadata", "usage", "correction_notes")
+
+_SECTION_RE = re.compile(r"^[$/.\s]*([A-Za-z_][\w-]*)")
+
+_STATUS_ORDER = {"passed": 0, "warning": 1, "failed": 2}
+
+
+def _sections(extraction: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in extraction.items() if key not in _IGNORED_KEYS}
+
+
+def _fingerprint(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def changed_sections(previous: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """
+    List the top-level sections that differ between two extractions.
+
+    Added, removed and modified sections all count as changed. Pipeline
+    metadata keys are ignored.
+
+    Args:
+        previous: Extraction that was validated before
+        current: Extraction to validate now
+
+    Returns:
+        Sorted list of changed top-level keys
+    """
+    old, new = _sections(previous), _sections(current)
+    return sorted(
+        key
+        for key in old.keys() | new.keys()
+        if key not in old or key not in new or _fingerprint(old[key]) != _fingerprint(new[key])
+    )
+
+
+def issue_section(issue: dict[str, Any]) -> str | None:
+    """
+    Return the top-level section an issue's field_path points into.
+
+    Accepts dotted ("outcomes[0].name"), JSON Pointer ("/outcomes/0") and
+    JSONPath ("$.outcomes") styles. Returns None when there is no field_path.
+    """
+    match = _SECTION_RE.match(str(issue.get("field_path") or ""))
+    return match.group(1) if match else None
+
+
+class ValidationCache:
+    """
+    LLM validation verdicts of recently validated extractions.
+
+    One cache is shared by all validations of a correction loop, including
+    parallel candidates, so access is locked. Stored values are deep copies;
+    callers can mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_VALIDATIONS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[dict, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def store(self, extraction: dict[str, Any], llm_validation: dict[str, Any]) -> None:
+        """Remember the LLM verdict (without schema_validation) for an extraction."""
+        sections = _sections(extraction)
+        verdict = {k: v for k, v in llm_validation.items() if k != "schema_validation"}
+        key = _fingerprint(sections)
+        with self._lock:
+            self._entries[key] = (deepcopy(sections), deepcopy(verdict))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def closest(self, extraction: dict[str, Any]) -> tuple[dict, dict, list[str]] | None:
+        """
+        Find the cached extraction with the fewest changed sections.
+
+        Returns:
+            (cached_extraction, cached_verdict, changed_sections), or None when empty.
+            Ties go to the most recently stored entry.
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+        best = None
+        for cached_extraction, verdict in reversed(entries):
+            changed = changed_sections(cached_extraction, extraction)
+            if best is None or len(changed) < len(best[2]):
+                best = (cached_extraction, verdict, changed)
+        if best is None:
+            return None
+        return deepcopy(best[0]), deepcopy(best[1]), best[2]
+
+
+def plan_incremental(
+    cache: ValidationCache | None, extraction: dict[str, Any]
+) -> tuple[dict, list[str]] | None:
+    """
+    Decide whether an extraction can be validated incrementally.
+
+    Args:
+        cache: The loop's validation cache (None disables incremental validation)
+        extraction: Extraction about to be validated
+
+    Returns:
+        (cached_verdict, changed_sections) when incremental validation applies;
+        changed_sections is empty when the content is identical. None means a full
+        validation is needed.
+    """
+    if cache is None:
+        return None
+    closest = cache.closest(extraction)
+    if closest is None:
+        return None
+    _, verdict, changed = closest
+
+    sections = _sections(extraction)
+    if len(changed) > MAX_CHANGED_FRACTION * max(len(sections), 1):
+        return None
+    issues = verdict.get("issues")
+    if not isinstance(issues, list) or "verification_summary" not in verdict:
+        return None
+    if any(issue_section(issue) not in sections for issue in issues):
+        return None
+    return verdict, changed
+
+
+def merge_section_validation(
+    cached: dict[str, Any],
+    partial: dict[str, Any],
+    extraction: dict[str, Any],
+    changed: list[str],
+) -> dict[str, Any]:
+    """
+    Combine a cached full verdict with a verdict for the changed sections only.
+
+    Args:
+        cached: LLM verdict for the baseline extraction
+        partial: LLM verdict covering only the changed sections
+        extraction: The extraction being validated
+        changed: Sections that were sent to the validator
+
+    Returns:
+        Merged LLM verdict in the validation schema shape, with the partial call's
+        _metadata/usage and an "incremental" entry in verification_metadata
+    """
+    sections = _sections(extraction)
+    changed_set = set(changed)
+    kept = [issue for issue in cached.get("issues", []) if issue_section(issue) not in changed_set]
+    issues = [{**issue} for issue in kept + list(partial.get("issues", []))]
+    for number, issue in enumerate(issues, start=1):
+        issue["issue_id"] = f"I{number:03d}"
+
+    sizes = {key: len(json.dumps(value, default=str)) for key, value in sections.items()}
+    total_size = sum(sizes.values()) or 1
+    weight = sum(sizes.get(key, 0) for key in changed) / total_size
+
+    cached_summary = cached.get("verification_summary", {})
+    partial_summary = partial.get("verification_summary", {})
+    summary = {**cached_summary}
+    for score in ("completeness_score", "accuracy_score"):
+        old = cached_summary.get(score)
+        new = partial_summary.get(score)
+        if old is not None and new is not None:
+            summary[score] = (1 - weight) * old + weight * new
+        elif new is not None:
+            summary[score] = new
+
+    critical = sum(1 for issue in issues if issue.get("severity") == "critical")
+    if critical:
+        status = "failed"
+    elif issues:
+        status = "warning"
+    else:
+        status = "passed"
+    partial_status = partial_summary.get("overall_status", "passed")
+    if _STATUS_ORDER.get(partial_status, 0) > _STATUS_ORDER[status]:
+        status = partial_status
+    summary.update(total_issues=len(issues), critical_issues=critical, overall_status=status)
+
+    completeness = {**cached.get("completeness_analysis", {})}
+    completeness.update(partial.get("completeness_analysis", {}))
+    recommendations = list(
+        dict.fromkeys(partial.get("recommendations", []) + cached.get("recommendations", []))
+    )
+    metadata = {**cached.get("verification_metadata", {})}
+    metadata.update(partial.get("verification_metadata", {}))
+    metadata["incremental"] = {
+        "validated_sections": sorted(changed_set),
+        "reused_sections": sorted(set(sections) - changed_set),
+        "changed_weight": round(weight, 4),
+    }
+
+    merged = {
+        **cached,
+        "verification_summary": summary,
+        "issues": issues,
+        "field_validation": partial.get("field_validation", cached.get("field_validation", {})),
+        "completeness_analysis": completeness,
+        "recommendations": recommendations,
+        "verification_metadata": metadata,
+    }
+    for key in ("_metadata", "usage"):
+        merged.pop(key, None)
+        if key in partial:
+            merged[key] = partial[key]
+    return merged
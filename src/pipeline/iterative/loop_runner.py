@@ -11,15 +11,18 @@ The runner uses callback functions to customize behavior for each loop type
 while sharing the common iteration logic.
 """
 
+import contextvars
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Protocol
 
 from rich.console import Console
 
+from ...tracing import KIND_ITERATION, KIND_LOOP, Span, get_tracer, span
 from ..quality.metrics import MetricType, QualityMetrics, extract_metrics
-from ..quality.scoring import select_best_iteration
+from ..quality.scoring import quality_rank, select_best_iteration
 from ..quality.thresholds import (
     QualityThresholds,
     get_thresholds_for_type,
@@ -42,6 +45,17 @@ FINAL_STATUS_FAILED_SCHEMA = "failed_schema_validation"
 # Maximum consecutive rollbacks before early exit (stuck loop detection)
 MAX_CONSECUTIVE_ROLLBACKS = 2
 
+# Extra correction hints that make parallel candidates (candidates > 1) differ.
+# Candidate 0 always runs the plain correction; the others cycle through these.
+DEFAULT_CANDIDATE_HINTS: tuple[str, ...] = (
+    "CANDIDATE FOCUS: Fix schema errors and critical issues first. Leave everything "
+    "the validation report does not flag unchanged.",
+    "CANDIDATE FOCUS: Completeness. Re-check the source for every missing or incomplete "
+    "field in the validation report and fill it with verified values.",
+    "CANDIDATE FOCUS: Accuracy. Verify every flagged value against the source and correct "
+    "numbers, units and labels exactly as reported.",
+)
+
 
 class ValidateFunc(Protocol):
     """Protocol for validation function."""
@@ -113,6 +127,10 @@ class IterativeLoopConfig:
         quality_score_key: Key for quality score display (e.g., "overall_quality")
         max_correction_retries: Max retries when correction fails schema validation
         max_initial_retries: Max retries when initial result fails schema validation
+        candidates: Corrections run concurrently per iteration; the best validated
+            candidate (by quality_rank) is kept (default: 1 = one serial correction)
+        candidate_hints: Extra _correction_hints given to candidates 2..k in turn, so
+            parallel candidates explore different fixes
     """
 
     metric_type: MetricType
@@ -127,6 +145,8 @@ class IterativeLoopConfig:
     max_correction_retries: int = 2  # Max retries per correction when schema fails
     max_initial_retries: int = 2  # Max retries for initial result schema failure
     verbose: bool = False  # Show detailed validation/correction output (debugging)
+    candidates: int = 1  # Parallel correction candidates per iteration
+    candidate_hints: tuple[str, ...] = DEFAULT_CANDIDATE_HINTS
 
 
 @dataclass
@@ -253,6 +273,8 @@ class IterativeLoopRunner:
         # Get thresholds
         self.thresholds = config.quality_thresholds or get_thresholds_for_type(config.metric_type)
 
+        self._iteration_span: Span | None = None
+
         # Initialize tracker
         self.tracker = IterationTracker(
             metric_type=config.metric_type,
@@ -263,9 +285,47 @@ class IterativeLoopRunner:
         """
         Execute the iterative correction loop.
 
+        The loop and each pass through it are recorded as tracing spans
+        ("<metric>_loop" and "iteration") when a trace is active.
+
         Returns:
             IterativeLoopResult with best result, validation, and history
         """
+        self._iteration_span = None
+        with span(
+            f"{self.config.metric_type.value}_loop",
+            KIND_LOOP,
+            max_iterations=self.config.max_iterations,
+        ) as loop_span:
+            try:
+                result = self._run_loop()
+            except BaseException as e:
+                self._end_iteration_span(e)
+                raise
+            self._end_iteration_span()
+            loop_span.set(
+                final_status=result.final_status,
+                iterations=result.iteration_count,
+                best_iteration=result.best_iteration_num,
+            )
+            return result
+
+    def _start_iteration_span(self, iteration_num: int) -> None:
+        """End the previous iteration span and open one for this pass."""
+        self._end_iteration_span()
+        tracer = get_tracer()
+        if tracer is not None:
+            self._iteration_span = tracer.start_span(
+                "iteration", KIND_ITERATION, iteration=iteration_num
+            )
+
+    def _end_iteration_span(self, error: BaseException | None = None) -> None:
+        tracer = get_tracer()
+        if self._iteration_span is not None and tracer is not None:
+            tracer.end_span(self._iteration_span, error=error)
+        self._iteration_span = None
+
+    def _run_loop(self) -> IterativeLoopResult:
         current_result = self.initial_result
         current_validation = None
         iteration_num = 0
@@ -282,6 +342,8 @@ class IterativeLoopRunner:
             self._display_header()
 
         while iteration_num <= self.config.max_iterations:
+            self._start_iteration_span(iteration_num)
+
             # Display iteration header
             if self.config.verbose:
                 self.console.print(f"\n[bold cyan]─── Iteration {iteration_num} ───[/bold cyan]")
@@ -436,16 +498,14 @@ class IterativeLoopRunner:
                         "_correction_hints": previous_failure_hints,
                     }
 
-                correction_output = self.correct_fn(current_result, correction_validation)
-
-                # Support both return styles: dict or (dict, dict) tuple
-                if isinstance(correction_output, tuple):
-                    corrected_result, corrected_validation = correction_output
-                    if corrected_validation is None:
-                        corrected_validation = self.validate_fn(corrected_result)
+                if self.config.candidates > 1:
+                    corrected_result, corrected_validation = self._run_candidates(
+                        current_result, correction_validation
+                    )
                 else:
-                    corrected_result = correction_output
-                    corrected_validation = self.validate_fn(corrected_result)
+                    corrected_result, corrected_validation = self._correct_and_validate(
+                        current_result, correction_validation
+                    )
 
                 # Check schema quality of correction
                 if self.check_schema_quality:
@@ -588,6 +648,96 @@ class IterativeLoopRunner:
         # Should not reach here, but handle gracefully
         return self._create_max_iterations_result()
 
+    def _correct_and_validate(self, result: dict, validation: dict) -> tuple[dict, dict]:
+        """Run one correction and return it with its validation."""
+        correction_output = self.correct_fn(result, validation)
+
+        # Support both return styles: dict or (dict, dict) tuple
+        if isinstance(correction_output, tuple):
+            corrected_result, corrected_validation = correction_output
+            if corrected_validation is None:
+                corrected_validation = self.validate_fn(corrected_result)
+        else:
+            corrected_result = correction_output
+            corrected_validation = self.validate_fn(corrected_result)
+        return corrected_result, corrected_validation
+
+    def _candidate_validation(self, validation: dict, index: int) -> dict:
+        """Add the focus hint for candidate index to the correction hints."""
+        hints = [hint for hint in self.config.candidate_hints if hint]
+        if index == 0 or not hints:
+            return validation
+        hint = hints[(index - 1) % len(hints)]
+        previous = validation.get("_correction_hints")
+        return {
+            **validation,
+            "_correction_hints": f"{previous}\n\n{hint}" if previous else hint,
+        }
+
+    def _run_candidates(self, result: dict, validation: dict) -> tuple[dict, dict]:
+        """
+        Run config.candidates corrections concurrently and keep the best one.
+
+        Each candidate is corrected and validated in its own worker thread.
+        Candidates that pass the schema quality check are preferred; among those
+        the winner is picked with quality_rank, ties going to the lower index.
+        Failed candidates are skipped unless all of them fail, in which case the
+        first error is raised.
+        """
+        count = self.config.candidates
+        with ThreadPoolExecutor(max_workers=count) as pool:
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._correct_and_validate,
+                    result,
+                    self._candidate_validation(validation, index),
+                )
+                for index in range(count)
+            ]
+            outcomes: list[tuple[int, dict, dict]] = []
+            errors: list[Exception] = []
+            for index, future in enumerate(futures):
+                try:
+                    outcomes.append((index, *future.result()))
+                except Exception as e:
+                    errors.append(e)
+                    self.console.print(f"  [red]✗ Candidate {index + 1} failed: {e}[/red]")
+
+        if not outcomes:
+            raise errors[0]
+
+        def rank(outcome: tuple[int, dict, dict]) -> tuple:
+            index, _, candidate_validation = outcome
+            schema_ok = (
+                not self.check_schema_quality
+                or self._get_schema_quality(candidate_validation) >= self.schema_quality_threshold
+            )
+            metrics = extract_metrics(candidate_validation, self.config.metric_type)
+            entry = {"iteration_num": index, "metrics": metrics}
+            return (schema_ok, *quality_rank(entry, self.config.metric_type))
+
+        best_index, best_result, best_validation = max(outcomes, key=rank)
+        scores = {
+            index: extract_metrics(v, self.config.metric_type).quality_score
+            for index, _, v in outcomes
+        }
+        if self._iteration_span is not None:
+            self._iteration_span.set(
+                candidates=count,
+                candidate_failures=len(errors),
+                selected_candidate=best_index,
+            )
+        if self.config.verbose:
+            summary = ", ".join(f"#{i + 1}: {q:.1%}" for i, q in scores.items())
+            self.console.print(f"[dim]Candidates {summary} — keeping #{best_index + 1}[/dim]")
+        else:
+            self.console.print(
+                f"  [dim]Best of {len(outcomes)} candidates: "
+                f"#{best_index + 1} ({scores[best_index]:.1%})[/dim]"
+            )
+        return best_result, best_validation
+
     def _display_header(self) -> None:
         """Display loop header with configuration."""
         self.console.print(
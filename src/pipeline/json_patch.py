@@ -0,0 +1,336 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+JSON Patch (RFC 6902) corrections for the validation/correction loops.
+
+In patch correction mode (CORRECTION_MODE=patch) the correction LLM call returns
+a list of patch operations instead of re-emitting the whole document. The
+operations are applied locally, one at a time, and each one is checked against
+the target schema:
+
+1. An operation that cannot be applied (bad pointer, failed "test") is rejected
+2. An operation that introduces a schema error the document did not have is rejected
+3. Everything else is kept, so one bad operation does not discard the whole patch
+
+When the response is unusable or no operation survives, the caller falls back to
+full-document regeneration.
+"""
+
+import logging
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..tracing import KIND_REPAIR, span
+from ..validation import get_validator
+
+logger = logging.getLogger(__name__)
+
+CORRECTION_MODE_FULL = "full"
+CORRECTION_MODE_PATCH = "patch"
+CORRECTION_MODES = (CORRECTION_MODE_FULL, CORRECTION_MODE_PATCH)
+
+PATCH_OPS = ("add", "remove", "replace", "move", "copy", "test")
+
+# Response schema for patch correction calls. "value" is deliberately untyped:
+# it carries whatever fragment of the target document the operation writes.
+PATCH_RESPONSE_SCHEMA: dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "title": "JSON Patch correction",
+    "type": "object",
+    "properties": {
+        "operations": {
+            "type": "array",
+            "description": "RFC 6902 operations, applied in order to the original document",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "op": {"type": "string", "enum": list(PATCH_OPS)},
+                    "path": {"type": "string", "description": "RFC 6901 JSON Pointer"},
+                    "from": {"type": "string", "description": "Source pointer (move/copy)"},
+                    "value": {"description": "New value (add/replace/test)"},
+                },
+                "required": ["op", "path"],
+                "additionalProperties": False,
+            },
+        },
+        "correction_notes": {
+            "type": "string",
+            "description": "Summary of the corrections made",
+        },
+    },
+    "required": ["operations", "correction_notes"],
+    "additionalProperties": False,
+}
+
+
+class JsonPatchError(ValueError):
+    """Raised when a patch operation is malformed or cannot be applied."""
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """
+    Split an RFC 6901 JSON Pointer into unescaped reference tokens.
+
+    Args:
+        pointer: JSON Pointer such as "/outcomes/0/name" ("" is the whole document)
+
+    Returns:
+        List of reference tokens ("~1" decoded to "/", "~0" to "~")
+
+    Raises:
+        JsonPatchError: If the pointer is not empty and does not start with "/"
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid JSON Pointer {pointer!r}: must start with '/'")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def _array_index(token: str, array: list, pointer: str, allow_end: bool = False) -> int:
+    if allow_end and token == "-":
+        return len(array)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise JsonPatchError(f"Invalid array index {token!r} in {pointer!r}")
+    index = int(token)
+    upper = len(array) if allow_end else len(array) - 1
+    if index > upper:
+        raise JsonPatchError(f"Array index {index} out of range in {pointer!r}")
+    return index
+
+
+def _resolve(document: Any, tokens: list[str], pointer: str) -> Any:
+    target = document
+    for token in tokens:
+        if isinstance(target, dict):
+            if token not in target:
+                raise JsonPatchError(f"Path {pointer!r} does not exist")
+            target = target[token]
+        elif isinstance(target, list):
+            target = target[_array_index(token, target, pointer)]
+        else:
+            raise JsonPatchError(f"Path {pointer!r} traverses a scalar value")
+    return target
+
+
+def _get(document: Any, pointer: str) -> Any:
+    return _resolve(document, parse_pointer(pointer), pointer)
+
+
+def _add(document: Any, pointer: str, value: Any) -> Any:
+    tokens = parse_pointer(pointer)
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1], pointer)
+    key = tokens[-1]
+    if isinstance(parent, dict):
+        parent[key] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(key, parent, pointer, allow_end=True), value)
+    else:
+        raise JsonPatchError(f"Cannot add to scalar parent of {pointer!r}")
+    return document
+
+
+def _remove(document: Any, pointer: str) -> tuple[Any, Any]:
+    tokens = parse_pointer(pointer)
+    if not tokens:
+        raise JsonPatchError("Cannot remove the whole document")
+    parent = _resolve(document, tokens[:-1], pointer)
+    key = tokens[-1]
+    if isinstance(parent, dict):
+        if key not in parent:
+            raise JsonPatchError(f"Path {pointer!r} does not exist")
+        return document, parent.pop(key)
+    if isinstance(parent, list):
+        return document, parent.pop(_array_index(key, parent, pointer))
+    raise JsonPatchError(f"Cannot remove from scalar parent of {pointer!r}")
+
+
+def _apply_operation(document: Any, operation: dict[str, Any]) -> Any:
+    if not isinstance(operation, dict):
+        raise JsonPatchError(f"Patch operation must be an object, got {type(operation).__name__}")
+    op = operation.get("op")
+    path = operation.get("path")
+    if op not in PATCH_OPS:
+        raise JsonPatchError(f"Unknown patch operation {op!r}")
+    if not isinstance(path, str):
+        raise JsonPatchError(f"Patch operation {op!r} is missing a string 'path'")
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise JsonPatchError(f"Patch operation {op!r} at {path!r} is missing 'value'")
+    if op in ("move", "copy") and not isinstance(operation.get("from"), str):
+        raise JsonPatchError(f"Patch operation {op!r} at {path!r} is missing 'from'")
+
+    if op == "add":
+        return _add(document, path, deepcopy(operation["value"]))
+    if op == "remove":
+        return _remove(document, path)[0]
+    if op == "replace":
+        _get(document, path)
+        if not parse_pointer(path):
+            return deepcopy(operation["value"])
+        document, _ = _remove(document, path)
+        return _add(document, path, deepcopy(operation["value"]))
+    if op == "move":
+        source = operation["from"]
+        if path != source and path.startswith(source + "/"):
+            raise JsonPatchError(f"Cannot move {source!r} into its own child {path!r}")
+        document, value = _remove(document, source)
+        return _add(document, path, value)
+    if op == "copy":
+        return _add(document, path, deepcopy(_get(document, operation["from"])))
+    # test
+    if _get(document, path) != operation["value"]:
+        raise JsonPatchError(f"Test failed at {path!r}")
+    return document
+
+
+def apply_json_patch(document: Any, operations: list[dict[str, Any]]) -> Any:
+    """
+    Apply RFC 6902 operations to a copy of a document.
+
+    The patch is atomic: if any operation fails, JsonPatchError is raised and
+    the input document is left untouched.
+
+    Args:
+        document: JSON document to patch (not modified)
+        operations: Patch operations, applied in order
+
+    Returns:
+        The patched copy of the document
+
+    Raises:
+        JsonPatchError: If an operation is malformed or cannot be applied
+    """
+    result = deepcopy(document)
+    for operation in operations:
+        result = _apply_operation(result, operation)
+    return result
+
+
+def _error_signatures(document: Any, schema: dict[str, Any]) -> set[tuple[str, str]]:
+    return {
+        (error.json_path, error.message) for error in get_validator(schema).iter_errors(document)
+    }
+
+
+@dataclass
+class PatchResult:
+    """
+    Outcome of a schema-guarded patch.
+
+    Attributes:
+        document: Patched copy of the document (only accepted operations applied)
+        applied: Operations that were applied
+        rejected: (operation, reason) pairs for operations that were skipped
+    """
+
+    document: Any
+    applied: list[dict[str, Any]] = field(default_factory=list)
+    rejected: list[tuple[Any, str]] = field(default_factory=list)
+
+    def summary(self) -> dict[str, Any]:
+        """Return counts and rejection reasons for _pipeline_metadata."""
+        return {
+            "correction_mode": CORRECTION_MODE_PATCH,
+            "patch_operations_applied": len(self.applied),
+            "patch_operations_rejected": len(self.rejected),
+            "patch_rejections": [reason for _, reason in self.rejected],
+        }
+
+
+def apply_patch_with_schema_guard(
+    document: dict[str, Any],
+    operations: list[dict[str, Any]],
+    schema: dict[str, Any],
+) -> PatchResult:
+    """
+    Apply patch operations one at a time, keeping only those the schema accepts.
+
+    An operation is rejected when it cannot be applied or when it introduces a
+    schema error that was not present before it. Errors the original document
+    already had do not block unrelated operations, so a patch can fix them
+    incrementally.
+
+    Args:
+        document: Document to patch (not modified)
+        operations: Patch operations from the LLM, in order
+        schema: JSON schema the document must satisfy
+
+    Returns:
+        PatchResult with the patched document and the applied/rejected operations
+    """
+    result = PatchResult(document=deepcopy(document))
+    errors = _error_signatures(result.document, schema)
+
+    for operation in operations:
+        try:
+            candidate = _apply_operation(deepcopy(result.document), operation)
+        except JsonPatchError as e:
+            result.rejected.append((operation, str(e)))
+            continue
+
+        candidate_errors = _error_signatures(candidate, schema)
+        introduced = candidate_errors - errors
+        if introduced:
+            path, message = sorted(introduced)[0]
+            result.rejected.append(
+                (operation, f"{operation.get('op')} {operation.get('path')!r}: {path}: {message}")
+            )
+            continue
+
+        result.document = candidate
+        result.applied.append(operation)
+        errors = candidate_errors
+
+    for operation, reason in result.rejected:
+        logger.debug(f"Rejected patch operation {operation!r}: {reason}")
+    return result
+
+
+def correct_with_patch(
+    document: dict[str, Any],
+    schema: dict[str, Any],
+    generate: Callable[[dict[str, Any]], dict[str, Any]],
+) -> tuple[dict[str, Any], PatchResult] | None:
+    """
+    Run one patch correction: ask the LLM for operations and apply them safely.
+
+    Args:
+        document: Metadata-free document to correct
+        schema: Schema of the document
+        generate: Calls the LLM with the given response schema and returns its JSON
+
+    Returns:
+        (corrected_document, patch_result), or None when the response holds no usable
+        operations and the caller should regenerate the full document instead. The
+        corrected document carries the response's correction_notes, _metadata and usage.
+    """
+    response = generate(PATCH_RESPONSE_SCHEMA)
+    operations = response.get("operations") if isinstance(response, dict) else None
+    if not isinstance(operations, list) or not operations:
+        logger.warning("Patch correction returned no operations; falling back to full output")
+        return None
+
+    with span("apply_json_patch", KIND_REPAIR, operations=len(operations)) as patch_span:
+        result = apply_patch_with_schema_guard(document, operations, schema)
+        patch_span.set(applied=len(result.applied), rejected=len(result.rejected))
+
+    if not result.applied or not isinstance(result.document, dict):
+        logger.warning(
+            f"All {len(operations)} patch operations were rejected; falling back to full output"
+        )
+        return None
+
+    corrected = result.document
+    notes = response.get("correction_notes")
+    if isinstance(notes, str) and notes.strip():
+        corrected["correction_notes"] = notes
+    for key in ("_metadata", "usage"):
+        if key in response:
+            corrected[key] = response[key]
+    return corrected, result
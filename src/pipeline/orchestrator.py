@@ -21,8 +21,9 @@ Public APIs:
     - run_single_step(): Execute individual pipeline steps with dependency validation
       Enables step-by-step execution with UI updates between steps.
 
-    - run_full_pipeline(): Execute all steps sequentially
-      Runs the complete pipeline in one call without intermediate updates.
+    - run_full_pipeline(): Execute all steps in dependency order
+      Runs the complete pipeline in one call; independent steps (report and
+      podcast generation) run concurrently.
 
 Step-by-Step Execution Example:
     >>> from pathlib import Path
@@ -58,22 +59,39 @@ PDF Upload Strategy:
     Benefit: Complete data fidelity - no loss of tables, images, or formatting
 """
 
+import contextvars
+import dataclasses
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from rich.console import Console
 
+from ..config import llm_settings
+from ..tracing import KIND_STEP, Span, Tracer, get_tracer, load_model_prices, span, start_trace
 from .file_manager import PipelineFileManager
 from .iterative import detect_quality_degradation as _detect_quality_degradation_new
 from .iterative import select_best_iteration as _select_best_iteration_new
 from .podcast_logic import run_podcast_generation
 from .quality import (
+    APPRAISAL_THRESHOLDS,
+    EXTRACTION_THRESHOLDS,
+    REPORT_THRESHOLDS,
     MetricType,
     extract_appraisal_metrics_as_dict,
     extract_extraction_metrics_as_dict,
     extract_report_metrics_as_dict,
 )
+from .run_manifest import (
+    RESUMABLE_STEPS,
+    build_step_inputs,
+    load_resumable_result,
+    output_digest,
+    save_step_manifest,
+)
 from .steps.appraisal import (
     UnsupportedPublicationType,  # noqa: F401 - re-export for backward compat
     run_appraisal_single_pass,
@@ -138,6 +156,31 @@ STEP_DISPLAY_NAMES = {
     STEP_PODCAST_GENERATION: "Step 6 - Podcast Generation",
 }
 
+# Hard prerequisites: a step in steps_to_run requires these steps in steps_to_run too
+STEP_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    STEP_VALIDATION: (STEP_EXTRACTION,),
+    STEP_CORRECTION: (STEP_VALIDATION,),
+    STEP_EXTRACTION: (STEP_CLASSIFICATION,),
+    STEP_APPRAISAL: (STEP_CLASSIFICATION, STEP_EXTRACTION),
+    STEP_PODCAST_GENERATION: (STEP_APPRAISAL, STEP_CLASSIFICATION, STEP_EXTRACTION),
+    STEP_REPORT_GENERATION: (STEP_APPRAISAL, STEP_CLASSIFICATION, STEP_EXTRACTION),
+}
+
+# Ordering-only edges: wait for these steps when they are scheduled, because their
+# output (best extraction, final status) is consumed when present
+STEP_ORDERING_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    STEP_VALIDATION_CORRECTION: (STEP_CLASSIFICATION, STEP_EXTRACTION),
+    STEP_APPRAISAL: (STEP_VALIDATION_CORRECTION,),
+}
+
+# Scheduling graph used by run_full_pipeline(). Report and podcast generation only
+# depend on classification, the best extraction and the best appraisal, so they run
+# concurrently once appraisal is done.
+PIPELINE_STEP_GRAPH: dict[str, tuple[str, ...]] = {
+    step: STEP_DEPENDENCIES.get(step, ()) + STEP_ORDERING_DEPENDENCIES.get(step, ())
+    for step in ALL_PIPELINE_STEPS
+}
+
 
 # Final status codes for iterative loop results
 FINAL_STATUS_CODES = {
@@ -206,11 +249,12 @@ def _print_iteration_summary(
     for it_data in iterations:
         it_num = it_data["iteration_num"]
         extraction_file = file_manager.get_filename("extraction", iteration_number=it_num)
-        status_symbol = "✅" if extraction_file.exists() else "⚠️"
+        exists = file_manager.exists("extraction", iteration_number=it_num)
+        status_symbol = "✅" if exists else "⚠️"
         console.print(f"  {status_symbol} Iteration {it_num}: {extraction_file.name}")
 
     best_file = file_manager.get_filename("extraction", status="best")
-    if best_file.exists():
+    if file_manager.exists("extraction", status="best"):
         console.print(f"  🏆 Best: {best_file.name} (iteration {best_iteration})")
 
 
@@ -264,36 +308,13 @@ def _validate_step_dependencies(steps_to_run: list[str]) -> None:
         ...
         ValueError: Validation step requires extraction step
     """
-    if STEP_VALIDATION in steps_to_run and STEP_EXTRACTION not in steps_to_run:
-        raise ValueError("Validation step requires extraction step")
-
-    if STEP_CORRECTION in steps_to_run and STEP_VALIDATION not in steps_to_run:
-        raise ValueError("Correction step requires validation step")
-
-    if STEP_EXTRACTION in steps_to_run and STEP_CLASSIFICATION not in steps_to_run:
-        raise ValueError("Extraction step requires classification step")
-
-    if STEP_APPRAISAL in steps_to_run:
-        if STEP_CLASSIFICATION not in steps_to_run:
-            raise ValueError("Appraisal step requires classification step")
-        if STEP_EXTRACTION not in steps_to_run:
-            raise ValueError("Appraisal step requires extraction step")
-
-    if STEP_PODCAST_GENERATION in steps_to_run:
-        if STEP_APPRAISAL not in steps_to_run:
-            raise ValueError("Podcast generation step requires appraisal step")
-        if STEP_CLASSIFICATION not in steps_to_run:
-            raise ValueError("Podcast generation step requires classification step")
-        if STEP_EXTRACTION not in steps_to_run:
-            raise ValueError("Podcast generation step requires extraction step")
-
-    if STEP_REPORT_GENERATION in steps_to_run:
-        if STEP_APPRAISAL not in steps_to_run:
-            raise ValueError("Report generation step requires appraisal step")
-        if STEP_CLASSIFICATION not in steps_to_run:
-            raise ValueError("Report generation step requires classification step")
-        if STEP_EXTRACTION not in steps_to_run:
-            raise ValueError("Report generation step requires extraction step")
+    for step_name, dependencies in STEP_DEPENDENCIES.items():
+        if step_name not in steps_to_run:
+            continue
+        label = step_name.replace("_", " ").capitalize()
+        for dependency in dependencies:
+            if dependency not in steps_to_run:
+                raise ValueError(f"{label} step requires {dependency} step")
 
 
 def _get_next_scheduled_step(current_step: str, steps_to_run: list[str] | None) -> str | None:
@@ -327,28 +348,29 @@ def _resolve_primary_output_path(file_manager: PipelineFileManager, step_name: s
     """
     Try to resolve the most relevant output file for a step.
     """
-    candidates: list[Path] = []
+    # (step, iteration_number, status) of each candidate artifact
+    candidates: list[tuple[str, int | None, str]] = []
     if step_name == STEP_CLASSIFICATION:
-        candidates.append(file_manager.get_filename(STEP_CLASSIFICATION))
+        candidates.append((STEP_CLASSIFICATION, None, ""))
     elif step_name == STEP_EXTRACTION:
-        candidates.append(file_manager.get_filename("extraction", status="best"))
-        candidates.append(file_manager.get_filename("extraction", iteration_number=0))
+        candidates.append(("extraction", None, "best"))
+        candidates.append(("extraction", 0, ""))
     elif step_name == STEP_VALIDATION_CORRECTION:
-        candidates.append(file_manager.get_filename("validation", status="best"))
-        candidates.append(file_manager.get_filename("validation", iteration_number=0))
+        candidates.append(("validation", None, "best"))
+        candidates.append(("validation", 0, ""))
     elif step_name == STEP_APPRAISAL:
-        candidates.append(file_manager.get_filename("appraisal", status="best"))
-        candidates.append(file_manager.get_filename("appraisal", iteration_number=0))
-        candidates.append(file_manager.get_filename("appraisal"))
+        candidates.append(("appraisal", None, "best"))
+        candidates.append(("appraisal", 0, ""))
+        candidates.append(("appraisal", None, ""))
     elif step_name == STEP_REPORT_GENERATION:
-        candidates.append(file_manager.get_filename("report", status="best"))
-        candidates.append(file_manager.get_filename("report", iteration_number=0))
+        candidates.append(("report", None, "best"))
+        candidates.append(("report", 0, ""))
     else:
-        candidates.append(file_manager.get_filename(step_name))
+        candidates.append((step_name, None, ""))
 
-    for path in candidates:
-        if path.exists():
-            return path
+    for step, iteration_number, status in candidates:
+        if file_manager.exists(step, iteration_number, status):
+            return file_manager.get_filename(step, iteration_number, status)
     return None
 
 
@@ -406,6 +428,123 @@ def _finalize_pipeline_results(
 _run_classification_step = _run_classification_step_impl
 
 
+def start_pipeline_trace(
+    file_manager: PipelineFileManager, append: bool = False
+) -> AbstractContextManager[Tracer]:
+    """
+    Start the trace of a pipeline run, or reuse the trace already active (see src/tracing.py).
+
+    Callers that want the run's tracer (e.g. run_pipeline.py for tracer.summary())
+    open it around run_full_pipeline(); the pipeline then records into it. Spans
+    are streamed to tmp/{identifier}-trace.jsonl only when PIPELINE_TRACE_FILE is
+    set; otherwise they are kept in memory for the trace_summary artifact.
+    """
+    tracer = get_tracer()
+    if tracer is not None:
+        return nullcontext(tracer)
+    try:
+        prices = load_model_prices(llm_settings.pricing_file)
+    except (OSError, ValueError) as e:
+        console.print(f"[yellow]⚠️ Ignoring LLM_PRICING_FILE: {e}[/yellow]")
+        prices = load_model_prices()
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    trace_path = None
+    if llm_settings.trace_file:
+        trace_path = file_manager.tmp_dir / f"{file_manager.identifier}-trace.jsonl"
+    return start_trace(
+        run_id=f"{file_manager.identifier}-{timestamp}",
+        trace_path=trace_path,
+        prices=prices,
+        append=append,
+    )
+
+
+def _attach_step_usage(result: Any, step_span: Span) -> None:
+    """Add the step's duration and LLM usage to the result's _pipeline_metadata."""
+    tracer = get_tracer()
+    metadata = result.get("_pipeline_metadata") if isinstance(result, dict) else None
+    if tracer is None or not isinstance(metadata, dict):
+        return
+    metadata.setdefault("duration_seconds", step_span.duration_seconds)
+    metadata["llm_usage"] = tracer.llm_usage(step_span)
+
+
+def _step_inputs(
+    step_name: str,
+    pdf_path: Path,
+    llm_provider: str,
+    file_manager: PipelineFileManager,
+    previous_results: dict[str, Any],
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Build the run-manifest inputs of a step (see src/pipeline/run_manifest.py).
+
+    Upstream outputs are taken from the manifests of the dependencies present in
+    previous_results, i.e. the upstream results the step actually consumed.
+    """
+    classification = previous_results.get(STEP_CLASSIFICATION)
+    publication_type = (
+        classification.get("publication_type")
+        if step_name != STEP_CLASSIFICATION and isinstance(classification, dict)
+        else None
+    )
+    upstream = {
+        dep: output_digest(file_manager, dep)
+        for dep in PIPELINE_STEP_GRAPH[step_name]
+        if dep in previous_results
+    }
+    return build_step_inputs(step_name, pdf_path, llm_provider, publication_type, upstream, options)
+
+
+# Thresholds the iterative loop of a step uses when none are passed
+_DEFAULT_LOOP_THRESHOLDS = {
+    STEP_VALIDATION_CORRECTION: EXTRACTION_THRESHOLDS,
+    STEP_APPRAISAL: APPRAISAL_THRESHOLDS,
+    STEP_REPORT_GENERATION: REPORT_THRESHOLDS,
+}
+
+
+def _step_options(
+    step_name: str,
+    max_pages: int | None,
+    max_correction_iterations: int | None = None,
+    quality_thresholds: dict[str, Any] | None = None,
+    enable_iterative_correction: bool = True,
+    report_language: str = "en",
+    report_compile_pdf: bool = True,
+    report_enable_figures: bool = True,
+    report_renderer: str = "latex",
+) -> dict[str, Any]:
+    """
+    Return the step arguments that influence a step's result.
+
+    Iterative-loop options are recorded as the loop applies them (default
+    iteration count and thresholds filled in), so changing a default also
+    invalidates resumed results.
+    """
+    options: dict[str, Any] = {"max_pages": max_pages}
+    if step_name in _DEFAULT_LOOP_THRESHOLDS:
+        thresholds: Any = quality_thresholds or _DEFAULT_LOOP_THRESHOLDS[step_name]
+        if dataclasses.is_dataclass(thresholds) and not isinstance(thresholds, type):
+            thresholds = dataclasses.asdict(thresholds)
+        options["quality_thresholds"] = thresholds
+        iterative = step_name == STEP_VALIDATION_CORRECTION or enable_iterative_correction
+        options["iterative_correction"] = iterative
+        # Same fallback as _run_single_step()
+        options["max_correction_iterations"] = (
+            (max_correction_iterations or 3) if iterative else None
+        )
+    if step_name == STEP_REPORT_GENERATION:
+        options.update(
+            language=report_language,
+            renderer=report_renderer,
+            compile_pdf=report_compile_pdf,
+            enable_figures=report_enable_figures,
+        )
+    return options
+
+
 def run_single_step(
     step_name: str,
     pdf_path: Path,
@@ -430,6 +569,16 @@ def run_single_step(
     running individual steps independently with UI updates between steps,
     supporting iterative workflows and better user feedback.
 
+    The step is recorded as a tracing span. Outside run_full_pipeline() a trace
+    is started for the step (appended to tmp/{identifier}-trace.jsonl with
+    PIPELINE_TRACE_FILE). When
+    the step result carries _pipeline_metadata, its LLM calls, tokens and cost
+    are added there as llm_usage.
+
+    After a pipeline step succeeds, its input manifest and a snapshot of its
+    result are written to tmp/ so a later run_full_pipeline(resume=True) can
+    reuse the result while the inputs are unchanged.
+
     Args:
         step_name: Step to execute:
             - "classification": Classify document type
@@ -487,6 +636,71 @@ def run_single_step(
         ...     previous_results={"classification": result1},
         ... )
     """
+    if previous_results is None:
+        previous_results = {}
+
+    with start_pipeline_trace(file_manager, append=True):
+        with span(step_name, KIND_STEP) as step_span:
+            result = _run_single_step(
+                step_name=step_name,
+                pdf_path=pdf_path,
+                max_pages=max_pages,
+                llm_provider=llm_provider,
+                file_manager=file_manager,
+                progress_callback=progress_callback,
+                previous_results=previous_results,
+                max_correction_iterations=max_correction_iterations,
+                quality_thresholds=quality_thresholds,
+                enable_iterative_correction=enable_iterative_correction,
+                report_language=report_language,
+                report_compile_pdf=report_compile_pdf,
+                report_enable_figures=report_enable_figures,
+                report_renderer=report_renderer,
+                verbose=verbose,
+            )
+        _attach_step_usage(result, step_span)
+        # Failed loop results are not resumable: a later resume should retry them
+        if (
+            step_name in RESUMABLE_STEPS
+            and isinstance(result, dict)
+            and not str(result.get("final_status", "")).startswith("failed")
+        ):
+            options = _step_options(
+                step_name,
+                max_pages,
+                max_correction_iterations,
+                quality_thresholds,
+                enable_iterative_correction,
+                report_language,
+                report_compile_pdf,
+                report_enable_figures,
+                report_renderer,
+            )
+            inputs = _step_inputs(
+                step_name, pdf_path, llm_provider, file_manager, previous_results, options
+            )
+            save_step_manifest(file_manager, step_name, inputs, result)
+        return result
+
+
+def _run_single_step(
+    step_name: str,
+    pdf_path: Path,
+    max_pages: int | None,
+    llm_provider: str,
+    file_manager: PipelineFileManager,
+    progress_callback: Callable[[str, str, dict], None] | None = None,
+    previous_results: dict[str, Any] | None = None,
+    max_correction_iterations: int | None = None,
+    quality_thresholds: dict[str, Any] | None = None,
+    enable_iterative_correction: bool = True,
+    report_language: str = "en",
+    report_compile_pdf: bool = True,
+    report_enable_figures: bool = True,
+    report_renderer: str = "latex",
+    verbose: bool = False,
+) -> dict[str, Any]:
+    """Run one step without tracing; see run_single_step()."""
     # Validate step name (allow both new and legacy steps)
     valid_steps = ALL_PIPELINE_STEPS + [STEP_VALIDATION, STEP_CORRECTION]
     if step_name not in valid_steps:
@@ -630,6 +844,12 @@ def run_single_step(
         classification_result = _get_or_load_result("classification")
         extraction_result = _get_or_load_result("extraction")
         appraisal_result = _get_or_load_result("appraisal")
+
+        # Use best_appraisal like report generation; the full loop result embeds
+        # per-iteration timestamps that would make the podcast prompt differ every run
+        if isinstance(appraisal_result, dict) and appraisal_result.get("best_appraisal"):
+            appraisal_result = appraisal_result["best_appraisal"]
+
         previous_results[STEP_CLASSIFICATION] = classification_result
         previous_results[STEP_EXTRACTION] = extraction_result
         previous_results[STEP_APPRAISAL] = appraisal_result
@@ -857,6 +1077,199 @@ def run_single_step(
         raise ValueError(f"Unknown step: {step_name}")
 
 
+def _should_skip_pipeline_step(
+    step_name: str,
+    results: dict[str, Any],
+    steps_to_run: list[str] | None,
+    skip_report: bool,
+    skip_podcast: bool,
+    progress_callback: Callable[[str, str, dict], None] | None,
+) -> bool:
+    """
+    Decide whether run_full_pipeline() skips a step whose dependencies have finished.
+
+    Emits the "skipped" progress event and console message for skipped steps.
+
+    Raises:
+        RuntimeError: If classification is excluded via steps_to_run
+    """
+    # Check if step should run
+    if not _should_run_step(step_name, steps_to_run):
+        _call_progress_callback(progress_callback, step_name, "skipped", {})
+        console.print(f"[yellow]⏭️  {step_name.title()} skipped (not in steps_to_run)[/yellow]")
+
+        # Classification cannot be skipped - it's required for all other steps
+        if step_name == STEP_CLASSIFICATION:
+            raise RuntimeError("Classification cannot be skipped - required for all other steps")
+
+        return True
+
+    # Skip report generation if skip_report is True
+    if step_name == STEP_REPORT_GENERATION and skip_report:
+        _call_progress_callback(
+            progress_callback, step_name, "skipped", {"reason": "skip_report flag"}
+        )
+        console.print("[yellow]⏭️  Report generation skipped (--output podcast)[/yellow]")
+        return True
+
+    # Skip podcast generation if skip_podcast is True
+    if step_name == STEP_PODCAST_GENERATION and skip_podcast:
+        _call_progress_callback(
+            progress_callback, step_name, "skipped", {"reason": "skip_podcast flag"}
+        )
+        console.print("[yellow]⏭️  Podcast generation skipped (--output report)[/yellow]")
+        return True
+
+    # Special handling for correction - skip if validation passed
+    if step_name == STEP_CORRECTION:
+        validation_result = results.get(STEP_VALIDATION)
+        if validation_result:
+            validation_status = validation_result.get("verification_summary", {}).get(
+                "overall_status"
+            )
+            if validation_status == "passed":
+                _call_progress_callback(
+                    progress_callback,
+                    STEP_CORRECTION,
+                    "skipped",
+                    {"reason": "validation_passed", "validation_status": validation_status},
+                )
+                console.print("[green]✅ Correction not needed - validation passed[/green]")
+                return True
+
+    # Special handling for appraisal - skip if validation_correction failed
+    if step_name == STEP_APPRAISAL:
+        validation_correction_result = results.get(STEP_VALIDATION_CORRECTION)
+        if validation_correction_result:
+            final_status = validation_correction_result.get("final_status", "")
+            if final_status.startswith("failed"):
+                error_msg = validation_correction_result.get("error", "Schema validation failed")
+                _call_progress_callback(
+                    progress_callback,
+                    STEP_APPRAISAL,
+                    "skipped",
+                    {
+                        "reason": "extraction_validation_failed",
+                        "final_status": final_status,
+                        "error": error_msg,
+                    },
+                )
+                console.print(
+                    f"[red]⏭️  Appraisal skipped - extraction validation failed: {error_msg}[/red]"
+                )
+                return True
+
+    # Skip report_generation if appraisal not available
+    if step_name == STEP_REPORT_GENERATION and not skip_report:
+        if STEP_APPRAISAL not in results:
+            _call_progress_callback(
+                progress_callback,
+                step_name,
+                "skipped",
+                {"reason": "appraisal_not_available"},
+            )
+            console.print("[red]⏭️  Report generation skipped - appraisal not available[/red]")
+            return True
+
+    # Skip podcast_generation if appraisal not available
+    if step_name == STEP_PODCAST_GENERATION and not skip_podcast:
+        if STEP_APPRAISAL not in results:
+            _call_progress_callback(
+                progress_callback,
+                step_name,
+                "skipped",
+                {"reason": "appraisal_not_available"},
+            )
+            console.print("[red]⏭️  Podcast generation skipped - appraisal not available[/red]")
+            return True
+
+    return False
+
+
+def _store_step_result(
+    step_name: str,
+    step_result: dict[str, Any],
+    results: dict[str, Any],
+    file_manager: PipelineFileManager,
+    breakpoint_after_step: str | None,
+) -> bool:
+    """
+    Store a finished step's result for run_full_pipeline().
+
+    Returns:
+        True if the pipeline should stop scheduling new steps (breakpoint reached
+        or publication type "overig")
+    """
+    if step_name == STEP_CORRECTION:
+        # Correction returns dict with extraction_corrected and validation_corrected
+        # Strip metadata (including correction_notes) from corrected extraction
+        results["extraction_corrected"] = _strip_metadata_for_pipeline(
+            step_result["extraction_corrected"]
+        )
+        results["validation_corrected"] = step_result["validation_corrected"]
+    else:
+        results[step_name] = step_result
+
+    stop = False
+    # Check for breakpoint after this step
+    if check_breakpoint(step_name, results, file_manager, breakpoint_after_step):
+        stop = True
+
+    # Check for publication_type == "overig" after classification
+    if step_name == STEP_CLASSIFICATION:
+        if step_result.get("publication_type") == "overig":
+            console.print(
+                "[yellow]⚠️ Publication type 'overig' - no specialized extraction available[/yellow]"
+            )
+            stop = True
+    return stop
+
+
+def _load_resumed_step(
+    step_name: str,
+    pdf_path: Path,
+    max_pages: int | None,
+    llm_provider: str,
+    file_manager: PipelineFileManager,
+    results: dict[str, Any],
+    report_language: str,
+    report_renderer: str,
+    report_compile_pdf: bool,
+    report_enable_figures: bool,
+    progress_callback: Callable[[str, str, dict], None] | None,
+    max_correction_iterations: int | None = None,
+    quality_thresholds: dict[str, Any] | None = None,
+    enable_iterative_correction: bool = True,
+) -> dict[str, Any] | None:
+    """
+    Return the stored result of a step whose inputs are unchanged, or None to run it.
+
+    The loop arguments must be the ones the step would run with (run_full_pipeline()
+    uses run_single_step()'s defaults). Emits a "skipped" progress event with reason
+    "resumed" for reused steps.
+    """
+    options = _step_options(
+        step_name,
+        max_pages,
+        max_correction_iterations,
+        quality_thresholds,
+        enable_iterative_correction,
+        report_language,
+        report_compile_pdf,
+        report_enable_figures,
+        report_renderer,
+    )
+    inputs = _step_inputs(step_name, pdf_path, llm_provider, file_manager, results, options)
+    result, reason = load_resumable_result(file_manager, step_name, inputs)
+    if result is None:
+        console.print(f"[cyan]🔁 {step_name.title()} will run ({reason})[/cyan]")
+        return None
+
+    _call_progress_callback(progress_callback, step_name, "skipped", {"reason": "resumed"})
+    console.print(f"[green]⏩ {step_name.title()} unchanged - reusing previous result[/green]")
+    return result
+
+
 def run_full_pipeline(
     pdf_path: Path,
     max_pages: int | None = None,
@@ -872,10 +1285,19 @@ def run_full_pipeline(
     skip_report: bool = False,
     skip_podcast: bool = False,
     verbose: bool = False,
+    max_parallel_steps: int = 2,
+    resume: bool = False,
+    artifact_root: Path | str | None = None,
+    run_id: str | None = None,
+    isolated_run: bool | None = None,
 ) -> dict[str, Any]:
     """
     Full extraction-and-appraisal pipeline with optional step filtering.
 
+    Steps are scheduled from PIPELINE_STEP_GRAPH rather than run as a fixed list:
+    a step starts as soon as every scheduled step it depends on has finished, so
+    report and podcast generation run concurrently after appraisal.
+
     Coordinates the full pipeline from PDF to validated evidence outputs:
     1. Classification - Identify publication type + extract metadata
     2. Extraction - Detailed data extraction based on classified type
@@ -899,11 +1321,26 @@ def run_full_pipeline(
         report_enable_figures: Enable/disable figure generation in reports
         skip_report: Skip report generation step (default: False)
         skip_podcast: Skip podcast generation step (default: False)
+        max_parallel_steps: Maximum number of independent steps run at the same time
+            (default: 2; 1 = strictly sequential)
+        resume: Reuse the stored result of every step whose inputs (PDF, prompts,
+            schemas, model settings, options and upstream outputs) match its manifest
+            from an earlier run. Steps with changed inputs rerun; a rerun that changes
+            a step's result in turn invalidates the steps that depend on it. Reused
+            steps emit a "skipped" progress event with reason "resumed".
+        artifact_root: Directory for intermediate files (default: PIPELINE_ARTIFACT_ROOT)
+        run_id: Write to the isolated run directory of this run ID (see
+            PipelineFileManager); pass an earlier run's ID to resume that run
+        isolated_run: Use a new run-scoped artifact directory so concurrent runs on
+            same-named PDFs cannot overwrite each other (default: PIPELINE_ISOLATED_RUNS)
         progress_callback: Optional callback for progress updates.
             Signature: callback(step_name: str, status: str, data: dict)
             - step_name: "classification" | "extraction" | "validation_correction" | "appraisal"
+              | "report_generation" | "podcast_generation"
             - status: "starting" | "completed" | "failed" | "skipped"
             - data: dict with step-specific info (results, errors, timing, file_path)
+            Events are streamed as steps finish and may arrive from worker threads;
+            events of concurrently running steps interleave.
 
     Returns:
         Dictionary with results from each completed step:
@@ -919,6 +1356,7 @@ def run_full_pipeline(
     Raises:
         RuntimeError: If LLM support not available
         ValueError: If step dependencies are violated in steps_to_run
+            or max_parallel_steps < 1
         LLMError: If LLM API calls fail
         SchemaLoadError: If schemas cannot be loaded
         PromptLoadError: If prompts cannot be loaded
@@ -948,155 +1386,125 @@ def run_full_pipeline(
         ...     progress_callback=my_callback
         ... )
     """
-    file_manager = PipelineFileManager(pdf_path)
+    if max_parallel_steps < 1:
+        raise ValueError("max_parallel_steps must be >= 1")
+
+    file_manager = PipelineFileManager(
+        pdf_path, artifact_root=artifact_root, run_id=run_id, isolated=isolated_run
+    )
     results = {}
 
     # Validate step dependencies if step filtering is enabled
     if steps_to_run is not None:
         _validate_step_dependencies(steps_to_run)
 
-    # Define all steps in order
-    all_steps = ALL_PIPELINE_STEPS
-
-    # Execute each step using run_single_step()
-    for step_name in all_steps:
-        # Check if step should run
-        if not _should_run_step(step_name, steps_to_run):
-            _call_progress_callback(progress_callback, step_name, "skipped", {})
-            console.print(f"[yellow]⏭️  {step_name.title()} skipped (not in steps_to_run)[/yellow]")
-
-            # Classification cannot be skipped - it's required for all other steps
-            if step_name == STEP_CLASSIFICATION:
-                raise RuntimeError(
-                    "Classification cannot be skipped - required for all other steps"
-                )
-
-            continue
-
-        # Skip report generation if skip_report is True
-        if step_name == STEP_REPORT_GENERATION and skip_report:
-            _call_progress_callback(
-                progress_callback, step_name, "skipped", {"reason": "skip_report flag"}
-            )
-            console.print("[yellow]⏭️  Report generation skipped (--output podcast)[/yellow]")
-            continue
-
-        # Skip podcast generation if skip_podcast is True
-        if step_name == STEP_PODCAST_GENERATION and skip_podcast:
-            _call_progress_callback(
-                progress_callback, step_name, "skipped", {"reason": "skip_podcast flag"}
-            )
-            console.print("[yellow]⏭️  Podcast generation skipped (--output report)[/yellow]")
-            continue
-
-        # Special handling for correction - skip if validation passed
-        if step_name == STEP_CORRECTION:
-            validation_result = results.get(STEP_VALIDATION)
-            if validation_result:
-                validation_status = validation_result.get("verification_summary", {}).get(
-                    "overall_status"
-                )
-                if validation_status == "passed":
-                    _call_progress_callback(
-                        progress_callback,
-                        STEP_CORRECTION,
-                        "skipped",
-                        {"reason": "validation_passed", "validation_status": validation_status},
-                    )
-                    console.print("[green]✅ Correction not needed - validation passed[/green]")
-                    continue
-
-        # Special handling for appraisal - skip if validation_correction failed
-        if step_name == STEP_APPRAISAL:
-            validation_correction_result = results.get(STEP_VALIDATION_CORRECTION)
-            if validation_correction_result:
-                final_status = validation_correction_result.get("final_status", "")
-                if final_status.startswith("failed"):
-                    error_msg = validation_correction_result.get(
-                        "error", "Schema validation failed"
-                    )
-                    _call_progress_callback(
-                        progress_callback,
-                        STEP_APPRAISAL,
-                        "skipped",
-                        {
-                            "reason": "extraction_validation_failed",
-                            "final_status": final_status,
-                            "error": error_msg,
-                        },
-                    )
-                    console.print(
-                        f"[red]⏭️  Appraisal skipped - extraction validation failed: {error_msg}[/red]"
-                    )
-                    continue
-
-        # Skip report_generation if appraisal not available
-        if step_name == STEP_REPORT_GENERATION and not skip_report:
-            if STEP_APPRAISAL not in results:
-                _call_progress_callback(
-                    progress_callback,
-                    step_name,
-                    "skipped",
-                    {"reason": "appraisal_not_available"},
-                )
-                console.print("[red]⏭️  Report generation skipped - appraisal not available[/red]")
-                continue
-
-        # Skip podcast_generation if appraisal not available
-        if step_name == STEP_PODCAST_GENERATION and not skip_podcast:
-            if STEP_APPRAISAL not in results:
-                _call_progress_callback(
-                    progress_callback,
-                    step_name,
-                    "skipped",
-                    {"reason": "appraisal_not_available"},
-                )
-                console.print("[red]⏭️  Podcast generation skipped - appraisal not available[/red]")
-                continue
-
-        try:
-            # Run single step with previous results
-            step_result = run_single_step(
-                step_name=step_name,
-                pdf_path=pdf_path,
-                max_pages=max_pages,
-                llm_provider=llm_provider,
-                file_manager=file_manager,
-                progress_callback=progress_callback,
-                previous_results=results,
-                report_language=report_language,
-                report_renderer=report_renderer,
-                report_compile_pdf=report_compile_pdf,
-                report_enable_figures=report_enable_figures,
-                verbose=verbose,
-            )
-
-            # Store result
-            if step_name == STEP_CORRECTION:
-                # Correction returns dict with extraction_corrected and validation_corrected
-                # Strip metadata (including correction_notes) from corrected extraction
-                results["extraction_corrected"] = _strip_metadata_for_pipeline(
-                    step_result["extraction_corrected"]
-                )
-                results["validation_corrected"] = step_result["validation_corrected"]
-            else:
-                results[step_name] = step_result
-
-        except Exception:
-            # Error already handled in run_single_step() via progress callback
-            raise
-
-        # Check for breakpoint after this step
-        if check_breakpoint(step_name, results, file_manager, breakpoint_after_step):
-            return _finalize_pipeline_results(results, file_manager, steps_to_run)
+    def _run_step(step_name: str, previous_results: dict[str, Any]) -> dict[str, Any]:
+        return run_single_step(
+            step_name=step_name,
+            pdf_path=pdf_path,
+            max_pages=max_pages,
+            llm_provider=llm_provider,
+            file_manager=file_manager,
+            progress_callback=progress_callback,
+            previous_results=previous_results,
+            report_language=report_language,
+            report_renderer=report_renderer,
+            report_compile_pdf=report_compile_pdf,
+            report_enable_figures=report_enable_figures,
+            verbose=verbose,
+        )
 
-        # Check for publication_type == "overig" after classification
-        if step_name == STEP_CLASSIFICATION:
-            if step_result.get("publication_type") == "overig":
-                console.print(
-                    "[yellow]⚠️ Publication type 'overig' - "
-                    "no specialized extraction available[/yellow]"
-                )
-                return _finalize_pipeline_results(results, file_manager, steps_to_run)
+    # Every step, LLM call, loop iteration, validation, render and file write is
+    # traced and summarized per step at the end (saved as the trace_summary artifact)
+    with start_pipeline_trace(file_manager) as tracer:
+        # Dependency-graph scheduling: a step starts once every scheduled step it depends on
+        # has finished (completed or skipped); independent steps run concurrently.
+        pending = list(ALL_PIPELINE_STEPS)
+        if breakpoint_after_step in pending:
+            # Steps after the breakpoint never start, not even concurrent siblings of it
+            del pending[pending.index(breakpoint_after_step) + 1 :]
+        running: dict[Future, str] = {}
+        stop = False
+        error: BaseException | None = None
+
+        with ThreadPoolExecutor(max_workers=max_parallel_steps) as pool:
+            while True:
+                # Schedule every ready step. Skipping a step can unblock others, so repeat
+                # until nothing changes.
+                scheduled = True
+                while scheduled and not stop and error is None:
+                    scheduled = False
+                    blocked = set(pending) | set(running.values())
+                    for step_name in list(pending):
+                        if any(dep in blocked for dep in PIPELINE_STEP_GRAPH[step_name]):
+                            continue
+                        pending.remove(step_name)
+                        scheduled = True
+                        if _should_skip_pipeline_step(
+                            step_name,
+                            results,
+                            steps_to_run,
+                            skip_report,
+                            skip_podcast,
+                            progress_callback,
+                        ):
+                            break
+                        if resume:
+                            resumed = _load_resumed_step(
+                                step_name,
+                                pdf_path,
+                                max_pages,
+                                llm_provider,
+                                file_manager,
+                                results,
+                                report_language,
+                                report_renderer,
+                                report_compile_pdf,
+                                report_enable_figures,
+                                progress_callback,
+                            )
+                            if resumed is not None:
+                                stop = _store_step_result(
+                                    step_name,
+                                    resumed,
+                                    results,
+                                    file_manager,
+                                    breakpoint_after_step,
+                                )
+                                break
+                        # Snapshot: concurrent steps must not see each other's results mid-run
+                        future = pool.submit(
+                            contextvars.copy_context().run,
+                            _run_step,
+                            step_name,
+                            dict(results),
+                        )
+                        running[future] = step_name
+                        break
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step_name = running.pop(future)
+                    try:
+                        step_result = future.result()
+                    except Exception as e:
+                        # Error already reported by run_single_step() via progress callback;
+                        # let concurrently running steps finish, then re-raise
+                        if error is None:
+                            error = e
+                        continue
+
+                    if _store_step_result(
+                        step_name, step_result, results, file_manager, breakpoint_after_step
+                    ):
+                        stop = True
+
+        file_manager.save_json(tracer.summary(), "trace_summary")
+
+    if error is not None:
+        raise error
 
     return _finalize_pipeline_results(results, file_manager, steps_to_run)
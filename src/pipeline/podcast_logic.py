@@ -1,17 +1,18 @@
-import json
 import re
 from collections.abc import Callable
 from typing import Any
 
-from jsonschema import ValidationError as JsonSchemaValidationError
-from jsonschema import validate as jsonschema_validate
 from rich.console import Console
 
+from ..lazy_import import lazy_import
 from ..llm import get_llm_provider
 from ..prompts import load_podcast_generation_prompt, load_podcast_summary_prompt
 from ..rendering.podcast_renderer import render_podcast_to_markdown
 from ..schemas_loader import load_schema
+from ..serialization import dumps_prompt
+from ..validation import validate_instance
 from .file_manager import PipelineFileManager
+from .prompt_context import encode_prompt_context
 from .utils import _call_progress_callback, _strip_metadata_for_pipeline
 
 # Constants
@@ -25,6 +26,9 @@ MAX_NUMERICAL_STATEMENTS = 3  # Maximum recommended numerical values in transcri
 
 console = Console()
 
+# Imported on first use (see src/lazy_import.py)
+jsonschema = lazy_import("jsonschema")
+
 
 def run_podcast_generation(
     extraction_result: dict[str, Any],
@@ -67,20 +71,31 @@ def run_podcast_generation(
         # Strip metadata to reduce token usage and focus on content
         extraction_clean = _strip_metadata_for_pipeline(extraction_result)
         appraisal_clean = _strip_metadata_for_pipeline(appraisal_result)
+        classification_clean = _strip_metadata_for_pipeline(classification_result)
 
         # Build prompt context with input data (matches report generation pattern)
         # System prompt contains instructions, user prompt contains data
+        # Encoded once, reused by the show summary call below
+        encoded = encode_prompt_context(
+            {
+                "extraction": extraction_clean,
+                "appraisal": appraisal_clean,
+                "classification": classification_clean,
+            },
+            fixed={"podcast_schema": schema},
+            llm_provider=llm_provider,
+        )
         prompt_context = f"""EXTRACTION_JSON:
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
 APPRAISAL_JSON:
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
 CLASSIFICATION_JSON:
-{json.dumps(classification_result, indent=2)}
+{encoded["classification"]}
 
-PODCAST_SCHEMA:
-{json.dumps(schema, indent=2)}
+{encoded.legend}PODCAST_SCHEMA:
+{encoded["podcast_schema"]}
 """
 
         # Call LLM with correct parameter pattern
@@ -131,8 +146,8 @@ PODCAST_SCHEMA:
 
         # Check 0: Schema validation (hard requirement)
         try:
-            jsonschema_validate(podcast_clean, schema)
-        except JsonSchemaValidationError as e:
+            validate_instance(podcast_clean, schema)
+        except jsonschema.ValidationError as e:
             critical_issues.append(f"Schema validation failed: {e.message}")
 
         # Check 1: Length check (hard requirement)
@@ -277,19 +292,19 @@ PODCAST_SCHEMA:
             if not summary_schema:
                 raise ValueError("show_summary schema not found in podcast schema")
             summary_prompt_context = f"""EXTRACTION_JSON:
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
 APPRAISAL_JSON:
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
 CLASSIFICATION_JSON:
-{json.dumps(classification_result, indent=2)}
+{encoded["classification"]}
 
-TRANSCRIPT:
+{encoded.legend}TRANSCRIPT:
 {transcript}
 
 SHOW_SUMMARY_SCHEMA:
-{json.dumps(summary_schema, indent=2)}
+{dumps_prompt(summary_schema)}
 """
 
             summary_json = llm.generate_json_with_schema(
@@ -306,8 +321,8 @@ SHOW_SUMMARY_SCHEMA:
             # Validate show summary
             # Critical: schema compliance
             try:
-                jsonschema_validate(summary_json, summary_schema)
-            except JsonSchemaValidationError as e:
+                validate_instance(summary_json, summary_schema)
+            except jsonschema.ValidationError as e:
                 summary_critical_issues.append(f"Summary schema validation failed: {e.message}")
 
             # Critical: synopsis length
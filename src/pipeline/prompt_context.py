@@ -0,0 +1,274 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Compact encoding of upstream JSON embedded in LLM prompts.
+
+Report, appraisal and podcast prompts embed the full extraction and appraisal
+(often 60-80k tokens). encode_prompt_context() encodes them as:
+
+- Reference sections (upstream data the LLM reads): minified, empty fields
+  (None, "", [], {}) dropped, keys optionally aliased (PROMPT_KEY_ALIASES), and
+  low-value fields trimmed tier by tier (TRIM_TIERS) while the estimated size
+  exceeds PROMPT_CONTEXT_MAX_TOKENS
+- Fixed sections (the document being validated or corrected, validation
+  reports, schemas): minified only. The LLM echoes or cites their keys, so they
+  are never altered
+
+Token counts are estimated from the character count with a per-model ratio;
+they are meant for budgeting, not billing.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..config import llm_settings
+from ..serialization import dumps_prompt
+
+logger = logging.getLogger(__name__)
+
+# Characters per token of minified JSON, by model name prefix (first match wins)
+_CHARS_PER_TOKEN: tuple[tuple[str, float], ...] = (
+    ("claude", 3.5),
+    ("gpt-", 4.0),
+    ("o1", 4.0),
+    ("o3", 4.0),
+    ("o4", 4.0),
+)
+_DEFAULT_CHARS_PER_TOKEN = 3.5
+
+# Fields removed from reference sections, tier by tier, while over budget.
+# Earlier tiers hold bookkeeping the prompts never use; the last tier removes
+# evidence pointers (page/table anchors) but keeps every reported value.
+TRIM_TIERS: tuple[tuple[str, ...], ...] = (
+    (
+        "provenance",
+        "parsing_context",
+        "ai_processing",
+        "bbox",
+        "coding",
+        "fhir_coding",
+        "extraction_warnings",
+        "truncated",
+    ),
+    (
+        "ontology_term",
+        "ontology_terms",
+        "external_id",
+        "external_ids",
+        "passage",
+        "tables_parsed",
+        "figures_summary",
+    ),
+    ("source", "source_refs", "*_source"),
+)
+
+# Key aliasing: only keys at least this long that occur at least this often
+_ALIAS_MIN_KEY_LENGTH = 12
+_ALIAS_MIN_COUNT = 3
+
+_ALIAS_LEGEND = (
+    "KEY_ALIASES: long keys in {sections} are abbreviated to save space. "
+    "This maps each abbreviation to the full key name:\n{aliases}\n"
+)
+
+
+def estimate_tokens(text: str, model: str = "") -> int:
+    """Estimate the input tokens of a prompt text for a model."""
+    ratio = next(
+        (chars for prefix, chars in _CHARS_PER_TOKEN if model.startswith(prefix)),
+        _DEFAULT_CHARS_PER_TOKEN,
+    )
+    return int(len(text) / ratio) + 1 if text else 0
+
+
+def _provider_model(llm_provider: str) -> str:
+    if llm_provider == "openai":
+        return llm_settings.openai_model
+    if llm_provider == "claude":
+        return llm_settings.anthropic_model
+    return ""
+
+
+def drop_empty(value: Any) -> Any:
+    """Recursively remove None, "", [] and {} values (False and 0 are kept)."""
+    if isinstance(value, dict):
+        cleaned = {key: drop_empty(item) for key, item in value.items()}
+        return {key: item for key, item in cleaned.items() if item not in (None, "", [], {})}
+    if isinstance(value, list):
+        cleaned_items = [drop_empty(item) for item in value]
+        return [item for item in cleaned_items if item not in (None, "", [], {})]
+    return value
+
+
+def _matches(key: str, names: tuple[str, ...]) -> bool:
+    return any(key.endswith(name[1:]) if name[0] == "*" else key == name for name in names)
+
+
+def _drop_keys(value: Any, names: tuple[str, ...], removed: set[str]) -> Any:
+    if isinstance(value, dict):
+        kept = {}
+        for key, item in value.items():
+            if _matches(key, names):
+                removed.add(key)
+            else:
+                kept[key] = _drop_keys(item, names, removed)
+        return kept
+    if isinstance(value, list):
+        return [_drop_keys(item, names, removed) for item in value]
+    return value
+
+
+def _count_keys(value: Any, counts: Counter) -> None:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            counts[key] += 1
+            _count_keys(item, counts)
+    elif isinstance(value, list):
+        for item in value:
+            _count_keys(item, counts)
+
+
+def build_key_aliases(sections: dict[str, Any]) -> dict[str, str]:
+    """
+    Choose short aliases for long, frequently repeated keys.
+
+    Returns:
+        {key: alias}; aliases are "k0", "k1", ... and never collide with a real key
+    """
+    counts: Counter = Counter()
+    for data in sections.values():
+        _count_keys(data, counts)
+
+    candidates = [
+        key
+        for key, count in counts.items()
+        if len(key) >= _ALIAS_MIN_KEY_LENGTH and count >= _ALIAS_MIN_COUNT
+    ]
+    # Largest savings first, so they get the shortest aliases
+    candidates.sort(key=lambda key: (-counts[key] * len(key), key))
+
+    aliases: dict[str, str] = {}
+    index = 0
+    for key in candidates:
+        alias = f"k{index}"
+        while alias in counts:
+            index += 1
+            alias = f"k{index}"
+        aliases[key] = alias
+        index += 1
+    return aliases
+
+
+def _apply_aliases(value: Any, aliases: dict[str, str]) -> Any:
+    if isinstance(value, dict):
+        return {aliases.get(key, key): _apply_aliases(item, aliases) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_apply_aliases(item, aliases) for item in value]
+    return value
+
+
+@dataclass
+class PromptContext:
+    """
+    Encoded prompt sections.
+
+    Attributes:
+        texts: Minified JSON per section name (index the context directly: context["extraction"])
+        aliases: {key: alias} applied to the reference sections (empty without aliasing)
+        aliased_sections: Names of the aliased sections, listed in the legend
+        trimmed: Field names removed from the reference sections to meet the budget
+        estimated_tokens: Estimated tokens of all sections plus the alias legend
+    """
+
+    texts: dict[str, str]
+    aliases: dict[str, str] = field(default_factory=dict)
+    aliased_sections: tuple[str, ...] = ()
+    trimmed: tuple[str, ...] = ()
+    estimated_tokens: int = 0
+
+    def __getitem__(self, name: str) -> str:
+        return self.texts[name]
+
+    @property
+    def legend(self) -> str:
+        """Alias legend to include in the prompt ("" without aliasing)."""
+        if not self.aliases:
+            return ""
+        mapping = {alias: key for key, alias in self.aliases.items()}
+        sections = ", ".join(f"{name.upper()}_JSON" for name in self.aliased_sections)
+        return _ALIAS_LEGEND.format(sections=sections, aliases=dumps_prompt(mapping))
+
+
+def encode_prompt_context(
+    references: dict[str, Any],
+    fixed: dict[str, Any] | None = None,
+    llm_provider: str = "",
+    max_tokens: int | None = None,
+    key_aliases: bool | None = None,
+) -> PromptContext:
+    """
+    Encode the JSON sections of a prompt within a token budget.
+
+    Args:
+        references: Upstream data the LLM only reads (may be compacted and trimmed)
+        fixed: Sections that must stay intact (document under validation/correction,
+            validation reports, schemas); they count toward the budget
+        llm_provider: "openai" or "claude", selects the token ratio of the configured model
+        max_tokens: Budget for all sections (default: settings.prompt_context_max_tokens,
+            0 = unlimited)
+        key_aliases: Alias long repeated keys in the references
+            (default: settings.prompt_key_aliases)
+
+    Returns:
+        PromptContext with one text per section. When the budget cannot be met after
+        all trim tiers, the smallest encoding is returned and a warning is logged.
+    """
+    fixed = fixed or {}
+    if max_tokens is None:
+        max_tokens = llm_settings.prompt_context_max_tokens
+    if key_aliases is None:
+        key_aliases = llm_settings.prompt_key_aliases
+    model = _provider_model(llm_provider)
+
+    fixed_texts = {name: dumps_prompt(data) for name, data in fixed.items()}
+    fixed_tokens = sum(estimate_tokens(text, model) for text in fixed_texts.values())
+    references = {name: drop_empty(data) for name, data in references.items()}
+
+    trimmed: list[str] = []
+    tiers = iter(TRIM_TIERS)
+    while True:
+        aliases = build_key_aliases(references) if key_aliases else {}
+        texts = {
+            name: dumps_prompt(_apply_aliases(data, aliases)) for name, data in references.items()
+        }
+        context = PromptContext(
+            texts={**texts, **fixed_texts},
+            aliases=aliases,
+            aliased_sections=tuple(references) if aliases else (),
+            trimmed=tuple(trimmed),
+        )
+        context.estimated_tokens = (
+            fixed_tokens
+            + sum(estimate_tokens(text, model) for text in texts.values())
+            + estimate_tokens(context.legend, model)
+        )
+        if not max_tokens or context.estimated_tokens <= max_tokens:
+            return context
+
+        tier = next(tiers, None)
+        if tier is None:
+            logger.warning(
+                "Prompt context of ~%d tokens exceeds the budget of %d after trimming",
+                context.estimated_tokens,
+                max_tokens,
+            )
+            return context
+        removed: set[str] = set()
+        references = {
+            name: drop_empty(_drop_keys(data, tier, removed)) for name, data in references.items()
+        }
+        trimmed.extend(sorted(removed))
@@ -0,0 +1,287 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Per-step input manifests for resumable pipeline runs.
+
+After a pipeline step succeeds, run_single_step() writes two artifacts next to
+the step's regular outputs (through the run's artifact store):
+
+- tmp/{identifier}-{step}-manifest.json: SHA-256 digests of everything the step
+  consumed (PDF, prompt files, schemas, model settings, options and the outputs
+  of upstream steps), plus the digest of the step's result
+- tmp/{identifier}-{step}-resume.json: the step result as returned to the pipeline
+
+run_full_pipeline(resume=True) recomputes the input digest before starting a
+step. When it matches the stored manifest and the stored result is intact, the
+step is skipped and the stored result is reused. Because upstream output digests
+are part of the inputs, a step whose rerun produces a different result invalidates
+every step that depends on it.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from ..config import llm_settings
+from ..prompts import (
+    PromptLoadError,
+    load_appraisal_correction_prompt,
+    load_appraisal_prompt,
+    load_appraisal_validation_prompt,
+    load_classification_prompt,
+    load_correction_prompt,
+    load_extraction_prompt,
+    load_patch_correction_prompt,
+    load_podcast_generation_prompt,
+    load_podcast_summary_prompt,
+    load_report_correction_prompt,
+    load_report_generation_prompt,
+    load_report_validation_prompt,
+    load_validation_prompt,
+)
+from ..schemas_loader import SchemaLoadError, load_schema
+from .file_manager import PipelineFileManager, pdf_digest
+from .version import get_pipeline_version
+
+MANIFEST_VERSION = 1
+
+MANIFEST_STATUS = "manifest"
+RESUME_STATUS = "resume"
+
+# Prompts each step loads; loaders take the publication type
+_STEP_PROMPTS: dict[str, dict[str, Callable[[str], str]]] = {
+    "classification": {"classification": lambda _: load_classification_prompt()},
+    "extraction": {"extraction": load_extraction_prompt},
+    "validation_correction": {
+        "extraction": load_extraction_prompt,
+        "validation": lambda _: load_validation_prompt(),
+        "correction": lambda _: load_correction_prompt(),
+        "correction_patch": lambda _: load_patch_correction_prompt(),
+    },
+    "appraisal": {
+        "appraisal": load_appraisal_prompt,
+        "appraisal_validation": lambda _: load_appraisal_validation_prompt(),
+        "appraisal_correction": lambda _: load_appraisal_correction_prompt(),
+        "correction_patch": lambda _: load_patch_correction_prompt(),
+    },
+    "report_generation": {
+        "report_generation": lambda _: load_report_generation_prompt(),
+        "report_validation": lambda _: load_report_validation_prompt(),
+        "report_correction": lambda _: load_report_correction_prompt(),
+        "correction_patch": lambda _: load_patch_correction_prompt(),
+    },
+    "podcast_generation": {
+        "podcast_generation": lambda _: load_podcast_generation_prompt(),
+        "podcast_summary": lambda _: load_podcast_summary_prompt(),
+    },
+}
+
+# Schemas each step loads; "{publication_type}" is the classified type's schema
+_STEP_SCHEMAS: dict[str, tuple[str, ...]] = {
+    "classification": ("classification",),
+    "extraction": ("{publication_type}",),
+    "validation_correction": ("{publication_type}", "validation"),
+    "appraisal": ("appraisal", "appraisal_validation"),
+    "report_generation": ("report", "report_validation"),
+    "podcast_generation": ("podcast",),
+}
+
+# Encoding of upstream JSON in prompts (see prompt_context.py)
+_PROMPT_CONTEXT_SETTINGS = ("prompt_context_max_tokens", "prompt_key_aliases")
+
+# LLMSettings fields that change a step's LLM requests or loop behaviour
+_STEP_SETTINGS: dict[str, tuple[str, ...]] = {
+    "classification": ("reasoning_effort_classification",),
+    "extraction": (
+        "reasoning_effort_extraction",
+        "extraction_chunk_pages",
+        "extraction_chunk_overlap",
+    ),
+    "validation_correction": (
+        "reasoning_effort_extraction",
+        "reasoning_effort_validation",
+        "reasoning_effort_correction",
+        "correction_mode",
+        "correction_candidates",
+        "validation_mode",
+    ),
+    "appraisal": (
+        "reasoning_effort_appraisal",
+        "correction_mode",
+        "correction_candidates",
+        *_PROMPT_CONTEXT_SETTINGS,
+    ),
+    "report_generation": (
+        "reasoning_effort_report",
+        "correction_mode",
+        "correction_candidates",
+        *_PROMPT_CONTEXT_SETTINGS,
+    ),
+    "podcast_generation": ("reasoning_effort_podcast", *_PROMPT_CONTEXT_SETTINGS),
+}
+
+RESUMABLE_STEPS = tuple(_STEP_PROMPTS)
+
+
+def _digest(value: Any) -> str:
+    if isinstance(value, bytes):
+        payload = value
+    elif isinstance(value, str):
+        payload = value.encode("utf-8")
+    else:
+        payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _snapshot_digest(snapshot: Any) -> str:
+    return _digest(json.dumps(snapshot, indent=2, ensure_ascii=False))
+
+
+def _model_settings(llm_provider: str) -> dict[str, Any]:
+    if llm_provider == "openai":
+        model, max_tokens = llm_settings.openai_model, llm_settings.openai_max_tokens
+    else:
+        model, max_tokens = llm_settings.anthropic_model, llm_settings.anthropic_max_tokens
+    return {
+        "provider": llm_provider,
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": llm_settings.temperature,
+    }
+
+
+def build_step_inputs(
+    step_name: str,
+    pdf_path: Path,
+    llm_provider: str,
+    publication_type: str | None,
+    upstream: dict[str, str | None],
+    options: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Collect digests of everything a pipeline step consumes.
+
+    A prompt or schema that cannot be loaded is recorded as None, so it still
+    takes part in the comparison.
+
+    Args:
+        step_name: One of RESUMABLE_STEPS
+        pdf_path: Source PDF
+        llm_provider: "openai" or "claude"
+        publication_type: Classified publication type (None for classification)
+        upstream: Output digests of the steps this step depends on
+        options: Step arguments that influence the result (max_pages, language, ...)
+
+    Returns:
+        JSON-serializable inputs dictionary (compare with input_digest())
+    """
+    publication_type = publication_type or ""
+    prompts: dict[str, str | None] = {}
+    for name, loader in _STEP_PROMPTS[step_name].items():
+        try:
+            prompts[name] = _digest(loader(publication_type))
+        except PromptLoadError:
+            prompts[name] = None
+
+    schemas: dict[str, str | None] = {}
+    for name in _STEP_SCHEMAS[step_name]:
+        name = name.format(publication_type=publication_type)
+        try:
+            schemas[name] = _digest(load_schema(name))
+        except SchemaLoadError:
+            schemas[name] = None
+
+    settings = {name: getattr(llm_settings, name) for name in _STEP_SETTINGS[step_name]}
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "pipeline_version": get_pipeline_version(),
+        "pdf": pdf_digest(pdf_path),
+        "publication_type": publication_type or None,
+        "prompts": prompts,
+        "schemas": schemas,
+        "model": {**_model_settings(llm_provider), **settings},
+        "options": options,
+        "upstream": dict(sorted(upstream.items())),
+    }
+
+
+def input_digest(inputs: dict[str, Any]) -> str:
+    """Return the digest that identifies a step's inputs."""
+    return _digest(inputs)
+
+
+def load_manifest(file_manager: PipelineFileManager, step_name: str) -> dict[str, Any] | None:
+    """Load tmp/{identifier}-{step}-manifest.json, or None if it does not exist."""
+    return file_manager.load_json(step_name, status=MANIFEST_STATUS)
+
+
+def output_digest(file_manager: PipelineFileManager, step_name: str) -> str | None:
+    """Return the recorded output digest of a step, or None if it has no manifest."""
+    manifest = load_manifest(file_manager, step_name)
+    return manifest.get("output_digest") if manifest else None
+
+
+def save_step_manifest(
+    file_manager: PipelineFileManager,
+    step_name: str,
+    inputs: dict[str, Any],
+    result: dict[str, Any],
+) -> Path:
+    """
+    Store a step's result snapshot and its manifest.
+
+    The snapshot is written first, so a manifest never points at a missing or
+    older result.
+
+    Returns:
+        Path to the manifest file
+    """
+    # Round-trip through JSON so the digest matches what load_resumable_result() reads back
+    snapshot = json.loads(json.dumps(result, ensure_ascii=False, default=str))
+    file_manager.save_json(snapshot, step_name, status=RESUME_STATUS)
+    manifest = {
+        "step": step_name,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "input_digest": input_digest(inputs),
+        "output_digest": _snapshot_digest(snapshot),
+        "inputs": inputs,
+    }
+    return file_manager.save_json(manifest, step_name, status=MANIFEST_STATUS)
+
+
+def load_resumable_result(
+    file_manager: PipelineFileManager, step_name: str, inputs: dict[str, Any]
+) -> tuple[dict[str, Any] | None, str]:
+    """
+    Return a stored step result if it was produced from the same inputs.
+
+    Args:
+        file_manager: File manager of the run
+        step_name: Step to check
+        inputs: Current inputs from build_step_inputs()
+
+    Returns:
+        (result, reason). result is None when the step must run; reason says why
+        ("no manifest", "changed: prompts, upstream", "result missing", ...) or is
+        "unchanged" when the stored result can be reused.
+    """
+    manifest = load_manifest(file_manager, step_name)
+    if manifest is None:
+        return None, "no manifest"
+
+    if manifest.get("input_digest") != input_digest(inputs):
+        stored = manifest.get("inputs", {})
+        changed = [key for key in inputs if stored.get(key) != inputs[key]]
+        return None, f"changed: {', '.join(changed) or 'manifest'}"
+
+    result = file_manager.load_json(step_name, status=RESUME_STATUS)
+    if result is None:
+        return None, "result missing"
+    if _snapshot_digest(result) != manifest.get("output_digest"):
+        return None, "result modified"
+    return result, "unchanged"
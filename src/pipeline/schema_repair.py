@@ -20,9 +20,12 @@ import re
 from copy import deepcopy
 from typing import Any
 
+from ..tracing import KIND_REPAIR, traced
+
 logger = logging.getLogger(__name__)
 
 
+@traced(KIND_REPAIR)
 def repair_schema_violations(
     data: dict[str, Any],
     schema: dict[str, Any],
@@ -8,7 +8,6 @@ Appraisal step module.
 Handles critical appraisal (RoB, GRADE, applicability) with iterative correction.
 """
 
-import json
 import time
 from collections.abc import Callable
 from datetime import datetime, timezone
@@ -22,12 +21,15 @@ from ...prompts import (
     load_appraisal_correction_prompt,
     load_appraisal_prompt,
     load_appraisal_validation_prompt,
+    load_patch_correction_prompt,
 )
 from ...schemas_loader import SchemaLoadError, load_schema
 from ..file_manager import PipelineFileManager
 from ..iterative import IterativeLoopConfig, IterativeLoopRunner
 from ..iterative import detect_quality_degradation as _detect_quality_degradation_new
 from ..iterative import select_best_iteration as _select_best_iteration_new
+from ..json_patch import CORRECTION_MODE_PATCH, correct_with_patch
+from ..prompt_context import encode_prompt_context
 from ..quality import MetricType, extract_appraisal_metrics_as_dict
 from ..quality.thresholds import APPRAISAL_THRESHOLDS, QualityThresholds
 from ..utils import _call_progress_callback, _get_provider_name, _strip_metadata_for_pipeline
@@ -172,10 +174,13 @@ def run_appraisal_step(
 
         from ...config import llm_settings
 
+        encoded = encode_prompt_context(
+            {"extraction": extraction_clean}, llm_provider=_get_provider_name(llm)
+        )
         appraisal_result = llm.generate_json_with_schema(
             schema=appraisal_schema,
             system_prompt=appraisal_prompt,
-            prompt=f"EXTRACTION_JSON:\n{json.dumps(extraction_clean, indent=2)}",
+            prompt=f"{encoded.legend}EXTRACTION_JSON:\n{encoded['extraction']}",
             schema_name=f"{publication_type}_appraisal",
             reasoning_effort=llm_settings.reasoning_effort_appraisal,
         )
@@ -266,14 +271,19 @@ def run_appraisal_validation_step(
         appraisal_schema = load_schema("appraisal")
         validation_report_schema = load_schema("appraisal_validation")
 
+        encoded = encode_prompt_context(
+            {"extraction": extraction_clean},
+            fixed={"appraisal": appraisal_clean, "appraisal_schema": appraisal_schema},
+            llm_provider=_get_provider_name(llm),
+        )
         context = f"""APPRAISAL_JSON:
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
 EXTRACTION_JSON (for evidence checking):
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
-APPRAISAL_SCHEMA:
-{json.dumps(appraisal_schema, indent=2)}"""
+{encoded.legend}APPRAISAL_SCHEMA:
+{encoded["appraisal_schema"]}"""
 
         console.print(
             "[dim]Validating appraisal for logical consistency, completeness, evidence support...[/dim]"
@@ -367,26 +377,54 @@ def run_appraisal_correction_step(
         correction_prompt = load_appraisal_correction_prompt()
         appraisal_schema = load_schema("appraisal")
 
+        encoded = encode_prompt_context(
+            {"extraction": extraction_clean},
+            fixed={
+                "validation": validation_clean,
+                "appraisal": appraisal_clean,
+                "appraisal_schema": appraisal_schema,
+            },
+            llm_provider=_get_provider_name(llm),
+        )
         context = f"""VALIDATION_REPORT:
-{json.dumps(validation_clean, indent=2)}
+{encoded["validation"]}
 
 ORIGINAL_APPRAISAL:
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
 EXTRACTION_JSON (for re-checking evidence):
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
-APPRAISAL_SCHEMA:
-{json.dumps(appraisal_schema, indent=2)}"""
+{encoded.legend}APPRAISAL_SCHEMA:
+{encoded["appraisal_schema"]}"""
 
-        console.print("[dim]Correcting appraisal based on validation issues...[/dim]")
+        from ...config import llm_settings
 
-        corrected_appraisal = llm.generate_json_with_schema(
-            schema=appraisal_schema,
-            system_prompt=correction_prompt,
-            prompt=context,
-            schema_name="appraisal_correction",
-        )
+        patched = None
+        if llm_settings.correction_mode == CORRECTION_MODE_PATCH:
+            console.print("[dim]Requesting JSON Patch for appraisal validation issues...[/dim]")
+            patched = correct_with_patch(
+                appraisal_clean,
+                appraisal_schema,
+                lambda patch_schema: llm.generate_json_with_schema(
+                    schema=patch_schema,
+                    system_prompt=f"{correction_prompt}\n\n{load_patch_correction_prompt()}",
+                    prompt=context,
+                    schema_name="appraisal_correction_patch",
+                ),
+            )
+
+        if patched is not None:
+            corrected_appraisal, patch_result = patched
+        else:
+            console.print("[dim]Correcting appraisal based on validation issues...[/dim]")
+            patch_result = None
+            corrected_appraisal = llm.generate_json_with_schema(
+                schema=appraisal_schema,
+                system_prompt=correction_prompt,
+                prompt=context,
+                schema_name="appraisal_correction",
+            )
 
         console.print("[green]+ Appraisal correction completed[/green]")
 
@@ -401,6 +439,8 @@ APPRAISAL_SCHEMA:
             "status": "success",
             "validation_status_before_correction": validation_status,
         }
+        if patch_result is not None:
+            corrected_appraisal["_pipeline_metadata"].update(patch_result.summary())
 
         _call_progress_callback(
             progress_callback,
@@ -545,6 +585,8 @@ def run_appraisal_with_correction(
         raise
 
     # Step 2: Configure and run iterative validation/correction loop
+    from ...config import llm_settings
+
     config = IterativeLoopConfig(
         metric_type=MetricType.APPRAISAL,
         max_iterations=max_iterations,
@@ -558,6 +600,7 @@ def run_appraisal_with_correction(
         step_number=4,
         show_banner=False,
         verbose=verbose,
+        candidates=llm_settings.correction_candidates,
     )
 
     # Define callbacks that capture the required context
@@ -19,6 +19,7 @@ from rich.console import Console
 from ...llm import LLMError
 from ...prompts import PromptLoadError, load_extraction_prompt
 from ...schemas_loader import SchemaLoadError, load_schema, validate_schema_compatibility
+from ..chunked_extraction import plan_chunks, run_chunked_extraction
 from ..file_manager import PipelineFileManager
 from ..utils import _call_progress_callback, _get_provider_name, _strip_metadata_for_pipeline
 
@@ -103,14 +104,30 @@ def run_extraction_step(
         # Run schema-based extraction with direct PDF upload
         from ...config import llm_settings
 
-        extraction_result = llm.generate_json_with_pdf(
-            pdf_path=pdf_path,
-            schema=extraction_schema,
-            system_prompt=extraction_prompt,
-            max_pages=max_pages,
-            schema_name=f"{publication_type}_extraction",
-            reasoning_effort=llm_settings.reasoning_effort_extraction,
-        )
+        windows = plan_chunks(pdf_path, max_pages)
+        if windows:
+            console.print(
+                f"[cyan]📑 Extracting {len(windows)} page windows in parallel: "
+                f"{', '.join(f'{first}-{last}' for first, last in windows)}[/cyan]"
+            )
+            extraction_result = run_chunked_extraction(
+                llm,
+                pdf_path,
+                windows,
+                schema=extraction_schema,
+                system_prompt=extraction_prompt,
+                schema_name=f"{publication_type}_extraction",
+                reasoning_effort=llm_settings.reasoning_effort_extraction,
+            )
+        else:
+            extraction_result = llm.generate_json_with_pdf(
+                pdf_path=pdf_path,
+                schema=extraction_schema,
+                system_prompt=extraction_prompt,
+                max_pages=max_pages,
+                schema_name=f"{publication_type}_extraction",
+                reasoning_effort=llm_settings.reasoning_effort_extraction,
+            )
 
         console.print("[green]✅ Schema-conforming extraction completed[/green]")
 
@@ -128,6 +145,8 @@ def run_extraction_step(
             "status": "success",
             "publication_type": publication_type,
         }
+        if windows:
+            extraction_result["_pipeline_metadata"]["page_windows"] = [list(w) for w in windows]
 
         # Display extraction summary
         model_used = extraction_result.get("_metadata", {}).get("model", _get_provider_name(llm))
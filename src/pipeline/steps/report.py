@@ -8,7 +8,6 @@ Report step module.
 Handles report generation with iterative correction and PDF/markdown rendering.
 """
 
-import json
 import time
 from collections.abc import Callable
 from datetime import datetime, timezone
@@ -19,6 +18,7 @@ from rich.console import Console
 from ...llm import LLMError, get_llm_provider
 from ...prompts import (
     PromptLoadError,
+    load_patch_correction_prompt,
     load_report_correction_prompt,
     load_report_generation_prompt,
     load_report_validation_prompt,
@@ -32,6 +32,8 @@ from ..file_manager import PipelineFileManager
 from ..iterative import IterativeLoopConfig, IterativeLoopRunner
 from ..iterative import detect_quality_degradation as _detect_quality_degradation_new
 from ..iterative import select_best_iteration as _select_best_iteration_new
+from ..json_patch import CORRECTION_MODE_PATCH, correct_with_patch
+from ..prompt_context import encode_prompt_context
 from ..quality import MetricType, extract_report_metrics_as_dict
 from ..quality.thresholds import REPORT_THRESHOLDS, QualityThresholds
 from ..utils import _call_progress_callback, _get_provider_name, _strip_metadata_for_pipeline
@@ -144,23 +146,31 @@ def run_report_generation(
 
     generation_timestamp = datetime.now(timezone.utc).isoformat()
     pipeline_version = _get_pipeline_version()
-    report_schema_str = json.dumps(report_schema, indent=2)
+    encoded = encode_prompt_context(
+        {
+            "classification": classification_clean,
+            "extraction": extraction_clean,
+            "appraisal": appraisal_clean,
+        },
+        fixed={"report_schema": report_schema},
+        llm_provider=llm_provider,
+    )
 
     prompt_context = f"""CLASSIFICATION_JSON:
-{json.dumps(classification_clean, indent=2)}
+{encoded["classification"]}
 
 EXTRACTION_JSON:
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
 APPRAISAL_JSON:
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
-LANGUAGE: {language}
+{encoded.legend}LANGUAGE: {language}
 GENERATION_TIMESTAMP: {generation_timestamp}
 PIPELINE_VERSION: {pipeline_version}
 
 REPORT_SCHEMA:
-{report_schema_str}
+{encoded["report_schema"]}
 """
 
     llm = get_llm_provider(llm_provider)
@@ -261,14 +271,20 @@ def run_report_validation_step(
         validation_prompt = load_report_validation_prompt()
         validation_schema = load_schema("report_validation")
 
+        encoded = encode_prompt_context(
+            {"extraction": extraction_clean, "appraisal": appraisal_clean},
+            fixed={"report": report_clean},
+            llm_provider=_get_provider_name(llm),
+        )
         context = f"""REPORT_JSON:
-{json.dumps(report_clean, indent=2)}
+{encoded["report"]}
 
 EXTRACTION_JSON (for data accuracy checking):
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
 APPRAISAL_JSON (for quality assessment cross-checking):
-{json.dumps(appraisal_clean, indent=2)}"""
+{encoded["appraisal"]}
+{encoded.legend}"""
 
         console.print("[dim]Validating report for completeness, accuracy, consistency...[/dim]")
 
@@ -362,29 +378,57 @@ def run_report_correction_step(
         correction_prompt = load_report_correction_prompt()
         report_schema = load_schema("report")
 
+        encoded = encode_prompt_context(
+            {"extraction": extraction_clean, "appraisal": appraisal_clean},
+            fixed={
+                "validation": validation_clean,
+                "report": report_clean,
+                "report_schema": report_schema,
+            },
+            llm_provider=_get_provider_name(llm),
+        )
         context = f"""VALIDATION_REPORT:
-{json.dumps(validation_clean, indent=2)}
+{encoded["validation"]}
 
 ORIGINAL_REPORT:
-{json.dumps(report_clean, indent=2)}
+{encoded["report"]}
 
 EXTRACTION_JSON (for re-checking data accuracy):
-{json.dumps(extraction_clean, indent=2)}
+{encoded["extraction"]}
 
 APPRAISAL_JSON (for re-checking quality assessments):
-{json.dumps(appraisal_clean, indent=2)}
+{encoded["appraisal"]}
 
-REPORT_SCHEMA:
-{json.dumps(report_schema, indent=2)}"""
+{encoded.legend}REPORT_SCHEMA:
+{encoded["report_schema"]}"""
 
-        console.print("[dim]Correcting report based on validation issues...[/dim]")
+        from ...config import llm_settings
 
-        corrected_report = llm.generate_json_with_schema(
-            schema=report_schema,
-            system_prompt=correction_prompt,
-            prompt=context,
-            schema_name="report_correction",
-        )
+        patched = None
+        if llm_settings.correction_mode == CORRECTION_MODE_PATCH:
+            console.print("[dim]Requesting JSON Patch for report validation issues...[/dim]")
+            patched = correct_with_patch(
+                report_clean,
+                report_schema,
+                lambda patch_schema: llm.generate_json_with_schema(
+                    schema=patch_schema,
+                    system_prompt=f"{correction_prompt}\n\n{load_patch_correction_prompt()}",
+                    prompt=context,
+                    schema_name="report_correction_patch",
+                ),
+            )
+
+        if patched is not None:
+            corrected_report, patch_result = patched
+        else:
+            console.print("[dim]Correcting report based on validation issues...[/dim]")
+            patch_result = None
+            corrected_report = llm.generate_json_with_schema(
+                schema=report_schema,
+                system_prompt=correction_prompt,
+                prompt=context,
+                schema_name="report_correction",
+            )
 
         console.print("[green]+ Report correction completed[/green]")
 
@@ -399,6 +443,8 @@ REPORT_SCHEMA:
             "status": "success",
             "validation_status_before_correction": validation_status,
         }
+        if patch_result is not None:
+            corrected_report["_pipeline_metadata"].update(patch_result.summary())
 
         _call_progress_callback(
             progress_callback,
@@ -524,6 +570,8 @@ def run_report_with_correction(
         raise
 
     # Step 2: Configure and run iterative validation/correction loop
+    from ...config import llm_settings
+
     config = IterativeLoopConfig(
         metric_type=MetricType.REPORT,
         max_iterations=max_iterations,
@@ -537,6 +585,7 @@ def run_report_with_correction(
         step_number=5,
         show_banner=False,  # We already printed our own banner
         verbose=verbose,
+        candidates=llm_settings.correction_candidates,
     )
 
     # Create quiet console to suppress step-level output in compact mode
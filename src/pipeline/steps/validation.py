@@ -9,7 +9,6 @@ Handles dual validation (schema + LLM semantic) and iterative correction
 of extracted data until quality thresholds are met.
 """
 
-import json
 import time
 from collections.abc import Callable
 from datetime import datetime, timezone
@@ -19,12 +18,15 @@ from typing import Any
 from rich.console import Console
 
 from ...llm import LLMError, get_llm_provider
-from ...prompts import PromptLoadError, load_correction_prompt
+from ...prompts import PromptLoadError, load_correction_prompt, load_patch_correction_prompt
 from ...schemas_loader import SchemaLoadError, load_schema
+from ...serialization import dumps_prompt
 from ..file_manager import PipelineFileManager
+from ..incremental_validation import ValidationCache
 from ..iterative import IterativeLoopConfig, IterativeLoopRunner
 from ..iterative import detect_quality_degradation as _detect_quality_degradation_new
 from ..iterative import select_best_iteration as _select_best_iteration_new
+from ..json_patch import CORRECTION_MODE_PATCH, correct_with_patch
 from ..quality import MetricType, extract_extraction_metrics_as_dict
 from ..quality.thresholds import EXTRACTION_THRESHOLDS, QualityThresholds
 from ..utils import _call_progress_callback, _get_provider_name, _strip_metadata_for_pipeline
@@ -102,11 +104,12 @@ def _print_iteration_summary(
     for it_data in iterations:
         it_num = it_data["iteration_num"]
         extraction_file = file_manager.get_filename("extraction", iteration_number=it_num)
-        status_symbol = "+" if extraction_file.exists() else "!"
+        exists = file_manager.exists("extraction", iteration_number=it_num)
+        status_symbol = "+" if exists else "!"
         _console.print(f"  {status_symbol} Iteration {it_num}: {extraction_file.name}")
 
     best_file = file_manager.get_filename("extraction", status="best")
-    if best_file.exists():
+    if file_manager.exists("extraction", status="best"):
         _console.print(f"  * Best: {best_file.name} (iteration {best_iteration})")
 
 
@@ -153,6 +156,7 @@ def run_validation_step(
     banner_label: str | None = None,
     save_to_disk: bool = True,
     console: Console | None = None,
+    validation_cache: ValidationCache | None = None,
 ) -> dict[str, Any]:
     """
     Run validation step of the pipeline.
@@ -172,6 +176,7 @@ def run_validation_step(
         save_to_disk: Whether to save validation results to disk (default True)
         console: Optional Rich Console for output. If None, uses module-level console.
             Pass Console(quiet=True) to suppress output in compact mode.
+        validation_cache: Optional cache enabling section-scoped incremental LLM validation
 
     Returns:
         Dictionary containing validation results with verification_summary
@@ -200,6 +205,7 @@ def run_validation_step(
         llm=llm,
         console=console,
         banner_label=label,
+        cache=validation_cache,
     )
 
     # Add pipeline metadata
@@ -254,6 +260,7 @@ def run_correction_step(
     progress_callback: Callable[[str, str, dict], None] | None,
     banner_label: str | None = None,
     console: Console | None = None,
+    validation_cache: ValidationCache | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """
     Run correction step of the pipeline.
@@ -273,6 +280,8 @@ def run_correction_step(
         banner_label: Optional custom label for console banner
         console: Optional Rich Console for output. If None, uses module-level console.
             Pass Console(quiet=True) to suppress output in compact mode.
+        validation_cache: Optional cache enabling section-scoped incremental LLM validation
+            of the corrected extraction
 
     Returns:
         Tuple of (corrected_extraction, final_validation)
@@ -329,32 +338,61 @@ def run_correction_step(
             "verification_summary": verification_summary,
         }
 
-        correction_context = f"""
-ORIGINAL_EXTRACTION: {json.dumps(extraction_clean)}
-
-VALIDATION_REPORT: {json.dumps(correction_issues)}
+        correction_inputs = f"""
+ORIGINAL_EXTRACTION: {dumps_prompt(extraction_clean)}
 
+VALIDATION_REPORT: {dumps_prompt(correction_issues)}
+"""
+        correction_context = correction_inputs + """
 Systematically address all identified issues and produce corrected, complete,\
  schema-compliant JSON extraction.
 """
 
         # Inject previous failure hints if available
         correction_hints = validation_clean.get("_correction_hints", "")
+        hints_context = ""
         if correction_hints:
-            correction_context += f"\n\nPREVIOUS_CORRECTION_FAILURES: {correction_hints}\n"
+            hints_context = f"\n\nPREVIOUS_CORRECTION_FAILURES: {correction_hints}\n"
+            correction_context += hints_context
 
         # Run correction with PDF upload for direct reference
-        console.print("[dim]Running correction with PDF upload...[/dim]")
         from ...config import llm_settings
 
-        corrected_extraction = llm.generate_json_with_pdf(
-            pdf_path=pdf_path,
-            schema=extraction_schema,
-            system_prompt=correction_prompt + "\n\n" + correction_context,
-            max_pages=max_pages,
-            schema_name=f"{publication_type}_extraction_corrected",
-            reasoning_effort=llm_settings.reasoning_effort_correction,
-        )
+        patched = None
+        if llm_settings.correction_mode == CORRECTION_MODE_PATCH:
+            console.print("[dim]Running patch correction with PDF upload...[/dim]")
+            patch_context = correction_inputs + """
+Systematically address all identified issues and return the JSON Patch operations\
+ that turn ORIGINAL_EXTRACTION into a corrected, complete, schema-compliant extraction.
+""" + hints_context
+            patched = correct_with_patch(
+                extraction_clean,
+                extraction_schema,
+                lambda patch_schema: llm.generate_json_with_pdf(
+                    pdf_path=pdf_path,
+                    schema=patch_schema,
+                    system_prompt=f"{correction_prompt}\n\n{load_patch_correction_prompt()}",
+                    context=patch_context,
+                    max_pages=max_pages,
+                    schema_name=f"{publication_type}_extraction_patch",
+                    reasoning_effort=llm_settings.reasoning_effort_correction,
+                ),
+            )
+
+        if patched is not None:
+            corrected_extraction, patch_result = patched
+        else:
+            console.print("[dim]Running correction with PDF upload...[/dim]")
+            patch_result = None
+            corrected_extraction = llm.generate_json_with_pdf(
+                pdf_path=pdf_path,
+                schema=extraction_schema,
+                system_prompt=correction_prompt,
+                context=correction_context,
+                max_pages=max_pages,
+                schema_name=f"{publication_type}_extraction_corrected",
+                reasoning_effort=llm_settings.reasoning_effort_correction,
+            )
 
         # Apply deterministic schema repairs before validation.
         # Fixes common LLM issues: array items as strings instead of objects,
@@ -387,6 +425,8 @@ Systematically address all identified issues and produce corrected, complete,\
             "execution_mode": "streamlit" if progress_callback else "cli",
             "status": "success",
         }
+        if patch_result is not None:
+            corrected_extraction["_pipeline_metadata"].update(patch_result.summary())
 
         # Final validation of corrected extraction
         console.print("[dim]Running final validation on corrected extraction...[/dim]")
@@ -402,6 +442,7 @@ Systematically address all identified issues and produce corrected, complete,\
             publication_type=publication_type,
             llm=llm,
             console=console,
+            cache=validation_cache,
         )
 
         # Add pipeline metadata to final validation
@@ -578,6 +619,11 @@ def run_validation_with_correction(
     # Create quiet console to suppress step-level output in compact mode
     quiet_console = None if verbose else Console(quiet=True)
 
+    # Section-scoped LLM re-validation after corrections (VALIDATION_MODE=incremental)
+    from ...config import llm_settings
+
+    validation_cache = ValidationCache() if llm_settings.validation_mode == "incremental" else None
+
     # Define callback functions for IterativeLoopRunner.
     # Note: _with_llm_retry is intentionally called without console_instance so that
     # LLM retry/failure messages always print to _console, even in compact mode.
@@ -596,6 +642,7 @@ def run_validation_with_correction(
                 banner_label="VALIDATION",
                 save_to_disk=False,
                 console=quiet_console,
+                validation_cache=validation_cache,
             ),
         )
 
@@ -613,6 +660,7 @@ def run_validation_with_correction(
                 progress_callback=progress_callback,
                 banner_label="CORRECTION",
                 console=quiet_console,
+                validation_cache=validation_cache,
             ),
         )
         return _strip_metadata_for_pipeline(corrected), post_validation
@@ -672,6 +720,7 @@ def run_validation_with_correction(
         step_number=3,
         show_banner=False,  # We already printed banner above
         verbose=verbose,
+        candidates=llm_settings.correction_candidates,
     )
 
     runner = IterativeLoopRunner(
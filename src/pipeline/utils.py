@@ -161,7 +161,7 @@ def _get_provider_name(llm: Any) -> str:
         llm: LLM provider instance (OpenAIProvider or ClaudeProvider)
 
     Returns:
-        Provider name: "openai", "claude", or "unknown"
+        Provider name: "openai", "claude", "replay" (replay mode only), or "unknown"
 
     Example:
         >>> from src.llm import get_llm_provider
@@ -169,11 +169,21 @@ def _get_provider_name(llm: Any) -> str:
         >>> _get_provider_name(llm)
         'openai'
     """
+    from ..llm.base import BaseLLMProvider
+
+    # Unwrap decorating providers (e.g. CachedLLMProvider) to the real backend
+    wrapped = getattr(llm, "wrapped", None)
+    while isinstance(wrapped, BaseLLMProvider):
+        llm = wrapped
+        wrapped = getattr(llm, "wrapped", None)
+
     class_name = llm.__class__.__name__
     if "OpenAI" in class_name:
         return "openai"
     elif "Claude" in class_name:
         return "claude"
+    elif "Replay" in class_name:
+        return "replay"
     return "unknown"
 
 
@@ -12,7 +12,6 @@ This module implements the two-tier validation strategy:
 See VALIDATION_STRATEGY.md for design rationale.
 """
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -21,7 +20,10 @@ from rich.console import Console
 from ..llm import LLMError
 from ..prompts import PromptLoadError, load_validation_prompt
 from ..schemas_loader import SchemaLoadError, load_schema
+from ..serialization import dumps_prompt
+from ..tracing import KIND_VALIDATION, traced
 from ..validation import ValidationError, validate_extraction_quality
+from .incremental_validation import ValidationCache, merge_section_validation, plan_incremental
 
 if TYPE_CHECKING:
     from ..llm import BaseLLMProvider
@@ -33,7 +35,58 @@ console = Console()
 # If schema validation quality < threshold, skip LLM validation and go directly to correction
 SCHEMA_QUALITY_THRESHOLD = 0.5  # 50% - extraction must have basic structure
 
+FULL_VALIDATION_INSTRUCTIONS = (
+    "Verify the extracted data against the original PDF document. Check for hallucinations, "
+    "missing data, accuracy errors, and completeness."
+)
+
+# Used by incremental validation (see incremental_validation.py)
+PARTIAL_VALIDATION_INSTRUCTIONS = (
+    "PARTIAL RE-VALIDATION: EXTRACTED_JSON contains only the top-level sections that changed "
+    "since the previous validation. The other sections ({unchanged}) were already verified and "
+    "are not shown. Sections removed by the correction: {removed}. Verify only the sections "
+    "shown against the original PDF document. Report issues only for these sections, with "
+    "field_path starting at the section name, and score completeness and accuracy for these "
+    "sections alone."
+)
+
+
+def _run_llm_validation(
+    extraction: dict[str, Any],
+    schema_validation: dict[str, Any],
+    pdf_path: Path,
+    max_pages: int | None,
+    llm: "BaseLLMProvider",
+    instructions: str = FULL_VALIDATION_INSTRUCTIONS,
+) -> dict[str, Any]:
+    """Run the LLM validator on (part of) an extraction with the PDF attached."""
+    from ..config import llm_settings
+
+    validation_prompt = load_validation_prompt()
+    validation_schema = load_schema("validation")
+
+    # Prepare validation context (extracted JSON + schema validation results)
+    validation_context = f"""
+EXTRACTED_JSON: {dumps_prompt(extraction)}
+
+SCHEMA_VALIDATION_RESULTS: {dumps_prompt(schema_validation)}
+
+{instructions}
+"""
+
+    # Run LLM validation with PDF upload for direct comparison
+    return llm.generate_json_with_pdf(
+        pdf_path=pdf_path,
+        schema=validation_schema,
+        system_prompt=validation_prompt,
+        context=validation_context,
+        max_pages=max_pages,
+        schema_name="validation_report",
+        reasoning_effort=llm_settings.reasoning_effort_validation,
+    )
 
+
+@traced(KIND_VALIDATION)
 def run_dual_validation(
     extraction_result: dict[str, Any],
     pdf_path: Path,
@@ -43,6 +96,7 @@ def run_dual_validation(
     console: Console,
     schema_quality_threshold: float = SCHEMA_QUALITY_THRESHOLD,
     banner_label: str | None = None,
+    cache: ValidationCache | None = None,
 ) -> dict[str, Any]:
     """
     Run dual validation: schema validation + conditional LLM validation.
@@ -60,6 +114,9 @@ def run_dual_validation(
         console: Rich console for output
         schema_quality_threshold: Minimum quality score to trigger LLM validation
         banner_label: Optional custom label for console output banner
+        cache: Optional ValidationCache shared by a correction loop. When given, the
+            LLM only re-validates top-level sections that changed since a cached
+            validation and reuses the cached verdicts for the rest
 
     Returns:
         Dictionary with combined validation results:
@@ -111,30 +168,44 @@ def run_dual_validation(
         # Step 2: LLM-based semantic validation (conditional on schema quality)
         # Only run expensive LLM validation if extraction has decent structure
         if schema_quality >= schema_quality_threshold:
-            console.print("[dim]LLM semantic validation with PDF upload...[/dim]")
-            validation_prompt = load_validation_prompt()
-            validation_schema = load_schema("validation")
-
-            # Prepare validation context (extracted JSON + schema validation results)
-            validation_context = f"""
-EXTRACTED_JSON: {json.dumps(extraction_result, indent=2)}
-
-SCHEMA_VALIDATION_RESULTS: {json.dumps(schema_validation, indent=2)}
-
-Verify the extracted data against the original PDF document. Check for hallucinations, missing data, accuracy errors, and completeness.
-"""
-
-            # Run LLM validation with PDF upload for direct comparison
-            from ..config import llm_settings
-
-            llm_validation = llm.generate_json_with_pdf(
-                pdf_path=pdf_path,
-                schema=validation_schema,
-                system_prompt=validation_prompt + "\n\n" + validation_context,
-                max_pages=max_pages,
-                schema_name="validation_report",
-                reasoning_effort=llm_settings.reasoning_effort_validation,
-            )
+            plan = plan_incremental(cache, extraction_result)
+            if plan is not None and not plan[1]:
+                console.print("[dim]Extraction unchanged — reusing cached LLM validation[/dim]")
+                llm_validation = {
+                    k: v for k, v in plan[0].items() if k not in ("_metadata", "usage")
+                }
+            elif plan is not None:
+                cached_verdict, changed = plan
+                console.print(
+                    f"[dim]LLM semantic validation of changed sections "
+                    f"({', '.join(changed)}) with PDF upload...[/dim]"
+                )
+                partial = _run_llm_validation(
+                    {
+                        key: extraction_result.get(key)
+                        for key in changed
+                        if key in extraction_result
+                    },
+                    schema_validation,
+                    pdf_path,
+                    max_pages,
+                    llm,
+                    instructions=PARTIAL_VALIDATION_INSTRUCTIONS.format(
+                        unchanged=", ".join(key for key in extraction_result if key not in changed),
+                        removed=", ".join(k for k in changed if k not in extraction_result)
+                        or "none",
+                    ),
+                )
+                llm_validation = merge_section_validation(
+                    cached_verdict, partial, extraction_result, changed
+                )
+            else:
+                console.print("[dim]LLM semantic validation with PDF upload...[/dim]")
+                llm_validation = _run_llm_validation(
+                    extraction_result, schema_validation, pdf_path, max_pages, llm
+                )
+            if cache is not None:
+                cache.store(extraction_result, llm_validation)
 
             # Combine schema and LLM validation results
             validation_result = {
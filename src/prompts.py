@@ -100,6 +100,31 @@ def load_correction_prompt() -> str:
         raise PromptLoadError(f"Error reading correction prompt: {e}") from e
 
 
+def load_patch_correction_prompt() -> str:
+    """
+    Load the JSON Patch output instructions from Correction-patch.txt.
+
+    Appended to the extraction, appraisal or report correction prompt when
+    CORRECTION_MODE=patch, so the LLM returns RFC 6902 operations instead of the
+    whole corrected document.
+
+    Returns:
+        Patch correction instructions
+
+    Raises:
+        PromptLoadError: If prompt file not found or cannot be read
+    """
+    prompt_file = PROMPTS_DIR / "Correction-patch.txt"
+
+    if not prompt_file.exists():
+        raise PromptLoadError(f"Patch correction prompt not found: {prompt_file}")
+
+    try:
+        return prompt_file.read_text(encoding="utf-8").strip()
+    except Exception as e:
+        raise PromptLoadError(f"Error reading patch correction prompt: {e}") from e
+
+
 def get_all_available_prompts() -> dict[str, str]:
     """
     Get a dictionary of all available prompts with their descriptions.
@@ -131,6 +156,13 @@ def get_all_available_prompts() -> dict[str, str]:
     except PromptLoadError:
         pass
 
+    # Check patch correction instructions
+    try:
+        load_patch_correction_prompt()
+        prompts["correction_patch"] = "JSON Patch output format for correction steps"
+    except PromptLoadError:
+        pass
+
     # Check extraction prompts for each publication type
     extraction_types = [
         "interventional_trial",
@@ -431,6 +463,7 @@ def validate_prompt_directory() -> dict[str, bool]:
         "Report-generation.txt",
         "Report-validation.txt",
         "Report-correction.txt",
+        "Correction-patch.txt",
         # Podcast prompts
         "Podcast-generation.txt",
         "Podcast-summary.txt",
@@ -7,14 +7,35 @@ Current support:
 - prisma: PRISMA 2020 flow diagram for systematic reviews
 - consort: CONSORT flow diagram for clinical trials
 
-Figures are saved as PNG (dpi=300) using matplotlib (Agg backend).
+Figures are saved as PNG (dpi=300) using matplotlib (Agg backend). Rendered
+PNGs are cached in FIGURE_CACHE_DIR by a hash of (figure_kind, data,
+FIGURE_STYLE_VERSION), so re-rendering a report after a text-only correction
+copies its figures instead of redrawing them. generate_figures() renders the
+cache misses of a report in a process pool.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
+from ..config import llm_settings
+from ..tracing import KIND_RENDER, span
+
+logger = logging.getLogger(__name__)
+
+# Bump when the drawing code changes, so cached PNGs of the old style are not reused
+FIGURE_STYLE_VERSION = 1
+
 
 class FigureGenerationError(RuntimeError):
     """Raised when a figure cannot be generated."""
@@ -86,7 +107,6 @@ def _generate_rob_traffic_light(data: dict[str, Any], path: Path) -> None:
     ax.set_xlim(0, 1)
     ax.set_xticks([])
     ax.set_title("Risk of Bias (RoB 2)", fontsize=10, pad=8)
-    ax.set_title("Risk of Bias (RoB 2)", fontsize=10, pad=8)
     fig.tight_layout()
     try:
         fig.savefig(path, dpi=300)
@@ -234,7 +254,6 @@ def _generate_prisma_flow(data: dict[str, Any], path: Path) -> None:
         5, 11.8, "PRISMA Flow Diagram", ha="center", va="center", fontsize=12, fontweight="bold"
     )
 
-    fig.tight_layout()
     fig.tight_layout()
     try:
         fig.savefig(path, dpi=300, bbox_inches="tight")
@@ -347,7 +366,6 @@ def _generate_consort_flow(data: dict[str, Any], path: Path) -> None:
         fontweight="bold",
     )
 
-    fig.tight_layout()
     fig.tight_layout()
     try:
         fig.savefig(path, dpi=300, bbox_inches="tight")
@@ -355,24 +373,184 @@ def _generate_consort_flow(data: dict[str, Any], path: Path) -> None:
         plt.close(fig)
 
 
+_RENDERERS = {
+    "rob_traffic_light": _generate_rob_traffic_light,
+    "forest": _generate_forest_basic,
+    "prisma": _generate_prisma_flow,
+    "consort": _generate_consort_flow,
+}
+
+
+def figure_cache_key(block: dict[str, Any]) -> str:
+    """SHA-256 of (figure_kind, data, FIGURE_STYLE_VERSION) identifying a rendered PNG."""
+    payload = json.dumps(
+        [block.get("figure_kind"), block.get("data", {}), FIGURE_STYLE_VERSION],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _render(figure_kind: str, data: dict[str, Any], path: Path) -> None:
+    """Render one figure to path (a temporary file first, so readers never see a partial PNG)."""
+    renderer = _RENDERERS.get(figure_kind)
+    if renderer is None:
+        raise FigureGenerationError(f"Unsupported figure_kind: {figure_kind}")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".png")
+    os.close(fd)
+    try:
+        renderer(data, Path(tmp_name))
+        os.replace(tmp_name, path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def _cache_dir() -> Path | None:
+    return Path(llm_settings.figure_cache_dir) if llm_settings.figure_cache_dir else None
+
+
+def _render_cached(block: dict[str, Any], cache_dir: Path | None) -> Path:
+    """Return the cached PNG for block, rendering it on a miss (runs in pool workers too)."""
+    if cache_dir is None:
+        fd, tmp_name = tempfile.mkstemp(prefix="figure-", suffix=".png")
+        os.close(fd)
+        target = Path(tmp_name)
+    else:
+        target = _ensure_dir(cache_dir) / f"{figure_cache_key(block)}.png"
+        if target.exists():
+            return target
+    try:
+        # Callers have checked figure_kind against _RENDERERS
+        _render(block["figure_kind"], block.get("data", {}), target)
+    except Exception:
+        if cache_dir is None:
+            target.unlink(missing_ok=True)
+        raise
+    return target
+
+
+def _place(rendered: Path, block: dict[str, Any], output_dir: Path, cache_dir: Path | None) -> Path:
+    """Copy (or move, without a cache) a rendered PNG to output_dir/<label>.png."""
+    fig_path = _ensure_dir(output_dir) / f"{block.get('label', 'figure')}.png"
+    if cache_dir is None:
+        shutil.move(rendered, fig_path)
+    else:
+        shutil.copyfile(rendered, fig_path)
+    return fig_path
+
+
 def generate_figure(block: dict[str, Any], output_dir: Path) -> Path:
     """
     Generate a figure for a figure block. Returns the path to the PNG.
+
+    The PNG is taken from the figure cache (FIGURE_CACHE_DIR) when the same
+    figure_kind and data were rendered before.
     """
     figure_kind = block.get("figure_kind")
-    _ensure_dir(output_dir)
-    filename = f"{block.get('label', 'figure')}.png"
-    fig_path = output_dir / filename
-
-    if figure_kind == "rob_traffic_light":
-        _generate_rob_traffic_light(block.get("data", {}), fig_path)
-    elif figure_kind == "forest":
-        _generate_forest_basic(block.get("data", {}), fig_path)
-    elif figure_kind == "prisma":
-        _generate_prisma_flow(block.get("data", {}), fig_path)
-    elif figure_kind == "consort":
-        _generate_consort_flow(block.get("data", {}), fig_path)
-    else:
+    if figure_kind not in _RENDERERS:
         raise FigureGenerationError(f"Unsupported figure_kind: {figure_kind}")
+    cache_dir = _cache_dir()
 
-    return fig_path
+    with span("generate_figure", KIND_RENDER, figure_kind=figure_kind):
+        rendered = _render_cached(block, cache_dir)
+        return _place(rendered, block, output_dir, cache_dir)
+
+
+def generate_figures(
+    blocks: list[dict[str, Any]], output_dir: Path
+) -> list[Path | FigureGenerationError]:
+    """
+    Generate the figures of several figure blocks, rendering cache misses in parallel.
+
+    matplotlib is not thread-safe, so misses are rendered in a process pool of up
+    to FIGURE_WORKERS spawned processes. A single miss (or FIGURE_WORKERS=1) is
+    rendered in this process, and so is everything if the pool cannot start.
+
+    Args:
+        blocks: Figure blocks (figure_kind, data, label)
+        output_dir: Directory receiving <label>.png per block
+
+    Returns:
+        Per block, in order: the PNG path or the FigureGenerationError that
+        prevented it (one failing figure does not stop the others)
+    """
+    cache_dir = _cache_dir()
+    results: list[Path | FigureGenerationError | None] = [None] * len(blocks)
+    jobs: dict[str, dict[str, Any]] = {}
+    job_of_block: dict[int, str] = {}
+    for index, block in enumerate(blocks):
+        figure_kind = block.get("figure_kind")
+        if figure_kind not in _RENDERERS:
+            results[index] = FigureGenerationError(f"Unsupported figure_kind: {figure_kind}")
+            continue
+        # With a cache identical figures render once; without, each block renders its own file
+        key = figure_cache_key(block) if cache_dir is not None else str(index)
+        job_of_block[index] = key
+        jobs.setdefault(key, block)
+
+    outcomes: dict[str, Path | FigureGenerationError] = {}
+    if cache_dir is not None:
+        for key in jobs:
+            if (cache_dir / f"{key}.png").exists():
+                outcomes[key] = cache_dir / f"{key}.png"
+    misses = {key: block for key, block in jobs.items() if key not in outcomes}
+
+    with span("generate_figures", KIND_RENDER, figures=len(jobs), cached=len(outcomes)):
+        outcomes.update(_render_misses(misses, cache_dir))
+
+    for index, key in job_of_block.items():
+        outcome = outcomes[key]
+        if isinstance(outcome, FigureGenerationError):
+            results[index] = outcome
+            continue
+        try:
+            results[index] = _place(outcome, blocks[index], output_dir, cache_dir)
+        except OSError as e:
+            results[index] = FigureGenerationError(f"Failed to write figure: {e}")
+    return results  # type: ignore[return-value]
+
+
+def _render_misses(
+    misses: dict[str, dict[str, Any]], cache_dir: Path | None
+) -> dict[str, Path | FigureGenerationError]:
+    workers = min(llm_settings.figure_workers, len(misses))
+    if workers > 1:
+        try:
+            return _render_in_pool(misses, cache_dir, workers)
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning(f"Figure process pool unavailable ({e}); rendering serially")
+
+    outcomes: dict[str, Path | FigureGenerationError] = {}
+    for key, block in misses.items():
+        try:
+            outcomes[key] = _render_cached(block, cache_dir)
+        except FigureGenerationError as e:
+            outcomes[key] = e
+        except Exception as e:
+            # Renderer bugs or malformed data must not take the other figures down
+            outcomes[key] = FigureGenerationError(f"Failed to render {block['figure_kind']}: {e}")
+    return outcomes
+
+
+def _render_in_pool(
+    misses: dict[str, dict[str, Any]], cache_dir: Path | None, workers: int
+) -> dict[str, Path | FigureGenerationError]:
+    # spawn: forking a process that runs pipeline threads can deadlock
+    context = multiprocessing.get_context("spawn")
+    outcomes: dict[str, Path | FigureGenerationError] = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            key: pool.submit(_render_cached, block, cache_dir) for key, block in misses.items()
+        }
+        for key, future in futures.items():
+            try:
+                outcomes[key] = future.result()
+            except FigureGenerationError as e:
+                outcomes[key] = e
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                figure_kind = misses[key]["figure_kind"]
+                outcomes[key] = FigureGenerationError(f"Failed to render {figure_kind}: {e}")
+    return outcomes
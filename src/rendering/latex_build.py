@@ -0,0 +1,223 @@
+"""
+Build cache for LaTeX compilation.
+
+Without it, render_report_to_pdf() compiles every report from scratch in a fresh
+directory: copy every template file, load all preamble packages, start without
+aux files. This module keeps the reusable parts under LATEX_BUILD_CACHE_DIR:
+
+- formats/<template>-<engine>-<hash>/preamble.fmt: the template's preamble.tex
+  precompiled into a format with mylatexformat. A report compiled with it skips
+  loading fontspec, tcolorbox, siunitx, ... on every run. The format is rebuilt
+  when preamble.tex or the engine binary changes. When it cannot be built (no
+  mylatexformat, or packages that cannot be dumped) a failure marker is kept and
+  reports compile without a format.
+- aux/<report key>/: the .aux/.toc/.out files of the last compile of a report
+  (same title and DOI), restored before the next compile so cross-references
+  and PDF outlines are right on the first pass.
+
+Template files are copied only when missing or changed (size and mtime).
+
+Example:
+    >>> fmt = ensure_format(template_dir, "xelatex")  # None if unavailable
+    >>> # report.tex then starts with FORMAT_PREAMBLE_MARKER instead of \\input{preamble.tex}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+from ..config import llm_settings
+
+logger = logging.getLogger(__name__)
+
+PREAMBLE_FILE = "preamble.tex"
+PREAMBLE_INPUT = "\\input{preamble.tex}"
+FORMAT_NAME = "preamble"
+
+# Ends the preamble skipped by a mylatexformat format; \relax if no format is loaded
+FORMAT_PREAMBLE_MARKER = "\\csname endofdump\\endcsname"
+
+# Engines whose formats mylatexformat can dump (LuaLaTeX needs luaotfload at run time)
+FORMAT_ENGINES = ("pdflatex", "xelatex")
+
+AUX_SUFFIXES = (".aux", ".toc", ".out")
+
+_FAILED_MARKER = "failed.log"
+_FORMAT_TIMEOUT_S = 300
+
+
+def _build_dir() -> Path | None:
+    return Path(llm_settings.latex_build_dir) if llm_settings.latex_build_dir else None
+
+
+def sync_template_files(template_dir: Path, output_dir: Path, skip: tuple[str, ...]) -> list[str]:
+    """
+    Copy template files to output_dir unless an identical copy is already there.
+
+    Copies keep the source mtime, so "unchanged" is size plus mtime (as rsync does).
+
+    Returns:
+        Names of the files that were copied
+    """
+    copied = []
+    for template_file in template_dir.iterdir():
+        if template_file.name in skip or not template_file.is_file():
+            continue
+        target = output_dir / template_file.name
+        source_stat = template_file.stat()
+        if target.exists():
+            target_stat = target.stat()
+            if (
+                target_stat.st_size == source_stat.st_size
+                and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+            ):
+                continue
+        shutil.copy2(template_file, target)
+        copied.append(template_file.name)
+    return copied
+
+
+def engine_fingerprint(engine: str) -> str:
+    """Identify the installed engine binary (path, size, mtime); "" if it is not found."""
+    path = shutil.which(engine)
+    if path is None:
+        return ""
+    try:
+        stat = Path(path).resolve().stat()
+    except OSError:
+        return ""
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _format_dir(template_dir: Path, engine: str, build_dir: Path) -> Path:
+    digest = hashlib.sha256()
+    digest.update((template_dir / PREAMBLE_FILE).read_bytes())
+    digest.update(engine_fingerprint(engine).encode("utf-8"))
+    return build_dir / "formats" / f"{template_dir.name}-{engine}-{digest.hexdigest()[:16]}"
+
+
+def ensure_format(template_dir: Path, engine: str) -> Path | None:
+    """
+    Return the precompiled preamble format of a template, building it if needed.
+
+    Returns:
+        Path of the .fmt file, or None when the build cache is disabled, the
+        engine cannot dump formats, the template has no preamble.tex, or the
+        format could not be built (remembered until preamble.tex changes)
+    """
+    build_dir = _build_dir()
+    if build_dir is None or engine not in FORMAT_ENGINES:
+        return None
+    if not (template_dir / PREAMBLE_FILE).is_file():
+        return None
+
+    format_dir = _format_dir(template_dir, engine, build_dir)
+    fmt_path = format_dir / f"{FORMAT_NAME}.fmt"
+    if fmt_path.exists():
+        return fmt_path
+    if (format_dir / _FAILED_MARKER).exists():
+        return None
+
+    format_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(template_dir / PREAMBLE_FILE, format_dir / PREAMBLE_FILE)
+    (format_dir / "format.tex").write_text(f"{PREAMBLE_INPUT}\n\\endofdump\n", encoding="utf-8")
+    # Unique job name: concurrent builds (batch workers) never write the same file
+    jobname = f"{FORMAT_NAME}-{os.getpid()}-{threading.get_ident()}"
+    cmd = [
+        engine,
+        "-ini",
+        "-interaction=nonstopmode",
+        f"-jobname={jobname}",
+        f"&{engine}",
+        "mylatexformat.ltx",
+        "format.tex",
+    ]
+    try:
+        completed = subprocess.run(
+            cmd, cwd=format_dir, capture_output=True, timeout=_FORMAT_TIMEOUT_S, check=False
+        )
+        built = format_dir / f"{jobname}.fmt"
+        if completed.returncode != 0 or not built.exists():
+            output = completed.stdout.decode("utf-8", "ignore")[-2000:]
+            raise RuntimeError(f"exit code {completed.returncode}\n{output}")
+        os.replace(built, fmt_path)
+    except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+        mark_format_failed(fmt_path, str(e))
+        return None
+
+    logger.info(f"Precompiled {template_dir.name}/{PREAMBLE_FILE} for {engine}: {fmt_path}")
+    return fmt_path
+
+
+def mark_format_failed(fmt_path: Path, reason: str) -> None:
+    """Stop using a format (e.g. it failed to load) until preamble.tex or the engine binary changes."""
+    logger.warning(
+        f"Preamble format {fmt_path.parent.name} unavailable, compiling without it: "
+        f"{reason.splitlines()[0] if reason else ''}"
+    )
+    fmt_path.parent.mkdir(parents=True, exist_ok=True)
+    (fmt_path.parent / _FAILED_MARKER).write_text(reason, encoding="utf-8")
+    fmt_path.unlink(missing_ok=True)
+
+
+def link_format(fmt_path: Path, output_dir: Path) -> str:
+    """
+    Make a format loadable from output_dir and return its -fmt name.
+
+    The format is hard-linked (copied across file systems) next to the .tex file;
+    kpathsea searches the working directory for formats.
+    """
+    target = output_dir / fmt_path.name
+    if target.exists() and target.stat().st_ino == fmt_path.stat().st_ino:
+        return fmt_path.stem
+    target.unlink(missing_ok=True)
+    try:
+        os.link(fmt_path, target)
+    except OSError:
+        shutil.copy2(fmt_path, target)
+    return fmt_path.stem
+
+
+def report_key(report: dict[str, Any], template: str, engine: str) -> str:
+    """Identify "the same report" across renders: template, engine, title and DOI."""
+    metadata = report.get("metadata", {}) or {}
+    identity = "\n".join(
+        [template, engine, str(metadata.get("title", "")), str(metadata.get("doi", ""))]
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()[:24]
+
+
+def restore_aux(key: str, output_dir: Path, stem: str) -> bool:
+    """Copy cached aux files of a report into output_dir (unless it has its own)."""
+    build_dir = _build_dir()
+    if build_dir is None:
+        return False
+    cache = build_dir / "aux" / key
+    restored = False
+    for suffix in AUX_SUFFIXES:
+        cached = cache / f"{stem}{suffix}"
+        target = output_dir / f"{stem}{suffix}"
+        if cached.exists() and not target.exists():
+            shutil.copy2(cached, target)
+            restored = True
+    return restored
+
+
+def save_aux(key: str, output_dir: Path, stem: str) -> None:
+    """Keep the aux files of a successful compile for the next render of the report."""
+    build_dir = _build_dir()
+    if build_dir is None:
+        return
+    cache = build_dir / "aux" / key
+    cache.mkdir(parents=True, exist_ok=True)
+    for suffix in AUX_SUFFIXES:
+        produced = output_dir / f"{stem}{suffix}"
+        if produced.exists():
+            shutil.copy2(produced, cache / produced.name)
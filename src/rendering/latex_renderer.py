@@ -16,10 +16,24 @@ from __future__ import annotations
 import copy
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from .figure_generator import FigureGenerationError, generate_figure
+from ..config import llm_settings
+from ..tracing import KIND_RENDER, span, traced
+from .figure_generator import FigureGenerationError, generate_figures
+from .latex_build import (
+    FORMAT_PREAMBLE_MARKER,
+    PREAMBLE_INPUT,
+    ensure_format,
+    link_format,
+    mark_format_failed,
+    report_key,
+    restore_aux,
+    save_aux,
+    sync_template_files,
+)
 
 
 class LatexRenderError(RuntimeError):
@@ -231,9 +245,7 @@ def _render_section(section: dict[str, Any], depth: int = 1) -> str:
 
 def render_report_to_tex(report: dict[str, Any], template: str = "vetrix") -> str:
     """Render report JSON to a LaTeX document string."""
-    # Use path relative to this file to find templates
-    template_dir = Path(__file__).parent.parent.parent / "templates" / "latex" / template
-    main_tex = template_dir / "main.tex"
+    main_tex = _template_dir(template) / "main.tex"
     if not main_tex.exists():
         raise LatexRenderError(f"Template not found: {main_tex}")
 
@@ -271,27 +283,31 @@ def render_report_to_tex(report: dict[str, Any], template: str = "vetrix") -> st
     return main_content.replace("{{SECTIONS}}", rendered_sections)
 
 
-def render_report_to_pdf(
-    report: dict[str, Any],
-    output_dir: Path,
-    template: str = "vetrix",
-    engine: str = "xelatex",
-    compile_pdf: bool = True,
-    enable_figures: bool = True,
-) -> dict[str, Path]:
-    """
-    Render report JSON to LaTeX, optionally compile to PDF.
+ALLOWED_ENGINES = {"pdflatex", "xelatex", "lualatex"}
 
-    Returns a dict with paths to .tex and (optionally) .pdf.
-    """
+TEX_STEM = "report"
+
+
+def _template_dir(template: str) -> Path:
+    # Use path relative to this file to find templates
+    return Path(__file__).parent.parent.parent / "templates" / "latex" / template
+
+
+def _check_engine(engine: str) -> None:
     # Security check for engine
-    allowed_engines = {"pdflatex", "xelatex", "lualatex"}
-    if engine not in allowed_engines:
-        raise ValueError(f"Invalid LaTeX engine: {engine}. Must be one of {allowed_engines}")
+    if engine not in ALLOWED_ENGINES:
+        raise ValueError(f"Invalid LaTeX engine: {engine}. Must be one of {ALLOWED_ENGINES}")
 
+
+def _prepare_report(
+    report: dict[str, Any],
+    output_dir: Path,
+    template: str,
+    enable_figures: bool,
+) -> Path:
+    """Generate figures, write report.tex and sync the template files; returns the .tex path."""
     output_dir.mkdir(parents=True, exist_ok=True)
-    # Use path relative to this file to find templates
-    template_dir = Path(__file__).parent.parent.parent / "templates" / "latex" / template
+    template_dir = _template_dir(template)
     report_copy = copy.deepcopy(report)
 
     from collections.abc import Iterator
@@ -308,15 +324,19 @@ def render_report_to_pdf(
     # Generate figures if enabled (walk subsections too)
     if enable_figures:
         fig_dir = output_dir / "figures"
-        for section in _walk_sections(report_copy.get("sections", [])):
-            for block in section.get("blocks", []) or []:
-                if block.get("type") == "figure" and not block.get("file"):
-                    try:
-                        fig_path = generate_figure(block, fig_dir)
-                        # Use relative path from tex location
-                        block["file"] = f"figures/{fig_path.name}"
-                    except FigureGenerationError as e:
-                        raise LatexRenderError(str(e)) from e
+        figure_blocks = [
+            block
+            for section in _walk_sections(report_copy.get("sections", []))
+            for block in section.get("blocks", []) or []
+            if block.get("type") == "figure" and not block.get("file")
+        ]
+        for block, fig_path in zip(
+            figure_blocks, generate_figures(figure_blocks, fig_dir), strict=True
+        ):
+            if isinstance(fig_path, FigureGenerationError):
+                raise LatexRenderError(str(fig_path)) from fig_path
+            # Use relative path from tex location
+            block["file"] = f"figures/{fig_path.name}"
     else:
         # Strip figures everywhere to avoid LaTeX errors
         for section in _walk_sections(report_copy.get("sections", [])):
@@ -325,30 +345,135 @@ def render_report_to_pdf(
 
     tex_str = render_report_to_tex(report_copy, template)
 
-    tex_path = output_dir / "report.tex"
+    tex_path = output_dir / f"{TEX_STEM}.tex"
     tex_path.write_text(tex_str, encoding="utf-8")
 
-    # Copy auxiliary template files (e.g., preamble.tex) so \input references resolve
-    for template_file in template_dir.iterdir():
-        if template_file.name == "main.tex":
-            continue
-        if template_file.is_file():
-            shutil.copy(template_file, output_dir / template_file.name)
+    # Copy auxiliary template files (e.g., preamble.tex) so \input references resolve;
+    # files already copied by an earlier render are left alone
+    sync_template_files(template_dir, output_dir, skip=("main.tex",))
+    return tex_path
 
-    result = {"tex": tex_path}
 
-    if compile_pdf:
-        if not shutil.which(engine):
-            raise LatexRenderError(f"LaTeX engine '{engine}' not found in PATH")
-        cmd = [engine, "-interaction=nonstopmode", tex_path.name]
-        try:
-            # Safe: using list args (shell=False) prevents command injection
-            # tex_path.name is also safe as it comes from pathlib
+def _run_engine(cmd: list[str], output_dir: Path, engine: str) -> None:
+    try:
+        # Safe: using list args (shell=False) prevents command injection
+        # tex_path.name is also safe as it comes from pathlib
+        with span("latex_compile", KIND_RENDER, engine=engine):
             subprocess.run(cmd, cwd=output_dir, check=True, capture_output=True)
-            result["pdf"] = output_dir / "report.pdf"
-        except subprocess.CalledProcessError as exc:
-            raise LatexRenderError(
-                f"LaTeX compilation failed: {exc.stderr.decode('utf-8', 'ignore')}"
-            ) from exc
+    except subprocess.CalledProcessError as exc:
+        raise LatexRenderError(
+            f"LaTeX compilation failed: {exc.stderr.decode('utf-8', 'ignore')}"
+        ) from exc
+
+
+def _compile(tex_path: Path, report: dict[str, Any], template: str, engine: str) -> Path:
+    """
+    Compile report.tex in its directory; returns the PDF path.
+
+    Uses the template's precompiled preamble format and the report's cached aux
+    files when available (see latex_build.py). If a compile with the format
+    fails but one without it succeeds, the format is marked unusable.
+    """
+    if not shutil.which(engine):
+        raise LatexRenderError(f"LaTeX engine '{engine}' not found in PATH")
+    output_dir = tex_path.parent
+    key = report_key(report, template, engine)
+    restore_aux(key, output_dir, tex_path.stem)
+    cmd = [engine, "-interaction=nonstopmode", tex_path.name]
+
+    tex_str = tex_path.read_text(encoding="utf-8")
+    fmt_path = ensure_format(_template_dir(template), engine)
+    if fmt_path is not None and PREAMBLE_INPUT in tex_str:
+        fmt_name = link_format(fmt_path, output_dir)
+        tex_path.write_text(tex_str.replace(PREAMBLE_INPUT, FORMAT_PREAMBLE_MARKER, 1), "utf-8")
+        try:
+            _run_engine([engine, f"-fmt={fmt_name}", *cmd[1:]], output_dir, engine)
+        except LatexRenderError as e:
+            tex_path.write_text(tex_str, encoding="utf-8")
+            _run_engine(cmd, output_dir, engine)
+            mark_format_failed(fmt_path, str(e))
+        else:
+            # Leave a .tex that compiles on its own
+            tex_path.write_text(tex_str, encoding="utf-8")
+    else:
+        _run_engine(cmd, output_dir, engine)
+
+    save_aux(key, output_dir, tex_path.stem)
+    return output_dir / f"{tex_path.stem}.pdf"
+
+
+@traced(KIND_RENDER)
+def render_report_to_pdf(
+    report: dict[str, Any],
+    output_dir: Path,
+    template: str = "vetrix",
+    engine: str = "xelatex",
+    compile_pdf: bool = True,
+    enable_figures: bool = True,
+) -> dict[str, Path]:
+    """
+    Render report JSON to LaTeX, optionally compile to PDF.
+
+    Returns a dict with paths to .tex and (optionally) .pdf.
+    """
+    _check_engine(engine)
+    tex_path = _prepare_report(report, output_dir, template, enable_figures)
 
+    result = {"tex": tex_path}
+    if compile_pdf:
+        result["pdf"] = _compile(tex_path, report, template, engine)
     return result
+
+
+@traced(KIND_RENDER)
+def render_reports_to_pdf(
+    jobs: list[tuple[dict[str, Any], Path]],
+    template: str = "vetrix",
+    engine: str = "xelatex",
+    compile_pdf: bool = True,
+    enable_figures: bool = True,
+    workers: int | None = None,
+) -> list[dict[str, Path] | LatexRenderError]:
+    """
+    Render many reports, compiling them concurrently.
+
+    The .tex files and figures are prepared one report at a time (figure
+    rendering has its own process pool), the preamble format is built once, and
+    the LaTeX runs go through a pool of `workers` threads (default:
+    LATEX_WORKERS), each driving one engine process.
+
+    Args:
+        jobs: (report JSON, output directory) pairs; use one directory per report
+        template, engine, compile_pdf, enable_figures: As for render_report_to_pdf()
+        workers: Concurrent engine processes
+
+    Returns:
+        Per job, in order: the render_report_to_pdf() result or the
+        LatexRenderError that stopped it (one failing report does not stop the rest)
+    """
+    _check_engine(engine)
+    results: list[dict[str, Path] | LatexRenderError] = []
+    for report, output_dir in jobs:
+        try:
+            results.append({"tex": _prepare_report(report, output_dir, template, enable_figures)})
+        except LatexRenderError as e:
+            results.append(e)
+    if not compile_pdf:
+        return results
+
+    if shutil.which(engine):
+        ensure_format(_template_dir(template), engine)
+
+    def compile_job(index: int) -> None:
+        result = results[index]
+        if isinstance(result, LatexRenderError):
+            return
+        try:
+            result["pdf"] = _compile(result["tex"], jobs[index][0], template, engine)
+        except LatexRenderError as e:
+            results[index] = e
+
+    workers = max(1, workers or llm_settings.latex_workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="latex") as pool:
+        list(pool.map(compile_job, range(len(jobs))))
+    return results
@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from ..tracing import KIND_RENDER, traced
+
 
 def _escape_md(text: str) -> str:
     """Minimal Markdown escaping for special characters."""
@@ -88,6 +90,7 @@ def _render_section(section: dict[str, Any], depth: int = 1) -> str:
     return "\n".join(parts)
 
 
+@traced(KIND_RENDER)
 def render_report_to_markdown(report: dict[str, Any], output_dir: Path) -> Path:
     """
     Render report JSON to Markdown and save as report.md in output_dir.
@@ -22,6 +22,8 @@ The renderer produces a simple structure:
 from pathlib import Path
 from typing import Any
 
+from ..tracing import KIND_RENDER, traced
+
 # Language code to full name mapping
 LANGUAGE_NAMES: dict[str, str] = {
     "en": "English",
@@ -69,6 +71,7 @@ def render_show_summary_plain_text(show_summary: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+@traced(KIND_RENDER)
 def render_podcast_to_markdown(podcast: dict[str, Any], output_path: Path) -> Path:
     """
     Render podcast JSON to human-readable markdown.
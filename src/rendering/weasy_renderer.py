@@ -3,14 +3,43 @@ HTML → PDF renderer using WeasyPrint (optional alternative to LaTeX).
 
 Scope: basic support for text, table, callout, and figure blocks.
 Figures must have 'file' set to an image path (PNG).
+
+Importing WeasyPrint, building its FontConfiguration (a fontconfig scan) and
+parsing the report stylesheet are done once per process and reused by every
+render. For many reports, WeasyRenderService keeps that warmed state in a pool
+of worker processes and turns render_report_to_html() output into PDF bytes;
+get_render_service() keeps one service per worker count alive until exit, so
+batch calls after the first skip the pool start-up and warm-up.
 """
 
 from __future__ import annotations
 
+import atexit
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+
+from ..config import llm_settings
+from ..tracing import KIND_RENDER, traced
+from .figure_generator import FigureGenerationError, generate_figures
+
+logger = logging.getLogger(__name__)
 
-from .figure_generator import FigureGenerationError, generate_figure
+REPORT_CSS = """
+body { font-family: sans-serif; margin: 32px; }
+h1,h2,h3 { color: #222; }
+table.report-table { border-collapse: collapse; width: 100%; margin: 12px 0; }
+table.report-table th, table.report-table td { border: 1px solid #ccc; padding: 6px; font-size: 12px; }
+table.report-table caption { font-weight: bold; margin-bottom: 4px; }
+.callout { border-left: 4px solid #999; padding: 8px 12px; margin: 8px 0; background: #f8f8f8; }
+.callout.warning { border-color: #d9534f; }
+.callout.note { border-color: #0275d8; }
+.callout.implication { border-color: #5cb85c; }
+"""  # noqa: E501
 
 
 class WeasyRendererError(RuntimeError):
@@ -18,14 +47,158 @@ class WeasyRendererError(RuntimeError):
 
 
 def _import_weasyprint():
-    """Import WeasyPrint HTML class or raise a friendly error."""
+    """Import the WeasyPrint module or raise a friendly error."""
     try:
-        from weasyprint import HTML  # type: ignore
+        import weasyprint
+        import weasyprint.text.fonts  # noqa: F401
     except Exception as e:
         raise WeasyRendererError(
             "WeasyPrint is not installed. Install with 'pip install weasyprint[lxml]'"
         ) from e
-    return HTML
+    return weasyprint
+
+
+# (weasyprint module, FontConfiguration, parsed REPORT_CSS) of this process
+_warm: tuple[Any, Any, Any] | None = None
+# WeasyPrint objects (the font configuration in particular) are not thread-safe
+_render_lock = threading.Lock()
+
+
+def _warm_state() -> tuple[Any, Any, Any]:
+    """Return the process-wide font configuration and stylesheet, building them once."""
+    global _warm
+    weasyprint = _import_weasyprint()
+    if _warm is None or _warm[0] is not weasyprint:
+        font_config = weasyprint.text.fonts.FontConfiguration()
+        stylesheet = weasyprint.CSS(string=REPORT_CSS, font_config=font_config)
+        _warm = (weasyprint, font_config, stylesheet)
+    return _warm
+
+
+def _write_pdf(html_str: str, base_url: str, target: str | None = None) -> bytes | None:
+    """Render HTML (without inline CSS) with the warmed state; PDF bytes if no target."""
+    with _render_lock:
+        try:
+            weasyprint, font_config, stylesheet = _warm_state()
+            pdf: bytes | None = weasyprint.HTML(string=html_str, base_url=base_url).write_pdf(
+                target, stylesheets=[stylesheet], font_config=font_config
+            )
+            return pdf
+        except WeasyRendererError:
+            raise
+        except Exception as e:
+            raise WeasyRendererError(f"WeasyPrint failed: {e}") from e
+
+
+def _warm_worker() -> None:
+    """Pool initializer: pay the import, font and CSS cost before the first report."""
+    try:
+        _warm_state()
+    except WeasyRendererError:
+        pass  # reported by the first render
+
+
+def _render_pdf_bytes(html_str: str, base_url: str) -> bytes:
+    # Without a target, write_pdf() returns the document
+    return cast(bytes, _write_pdf(html_str, base_url))
+
+
+class WeasyRenderService:
+    """
+    Long-lived WeasyPrint renderer: HTML in, PDF bytes out.
+
+    With more than one worker, reports are queued to a pool of spawned
+    processes, each keeping its own FontConfiguration and parsed stylesheet;
+    otherwise (or when processes cannot be started) they render in this process
+    with the process-wide warmed state.
+
+    Example:
+        >>> with WeasyRenderService(workers=4) as service:
+        ...     future = service.submit(render_report_to_html(report, inline_css=False), "out/")
+        ...     Path("out/report.pdf").write_bytes(future.result())
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = max(1, workers or llm_settings.weasyprint_workers)
+        self._pool: ProcessPoolExecutor | None = None
+        if self.workers > 1:
+            try:
+                # spawn: forking a process that runs pipeline threads can deadlock
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"WeasyPrint process pool unavailable ({e}); rendering in-process")
+
+    def submit(self, html_str: str, base_url: str) -> Future[bytes]:
+        """Queue one HTML document; the future resolves to PDF bytes or WeasyRendererError."""
+        if self._pool is not None:
+            try:
+                return self._pool.submit(_render_pdf_bytes, html_str, base_url)
+            except (RuntimeError, BrokenProcessPool) as e:
+                logger.warning(f"WeasyPrint process pool failed ({e}); rendering in-process")
+                self._pool = None
+        future: Future[bytes] = Future()
+        try:
+            future.set_result(_render_pdf_bytes(html_str, base_url))
+        except WeasyRendererError as e:
+            future.set_exception(e)
+        return future
+
+    def render(self, html_str: str, base_url: str) -> bytes:
+        """Render one HTML document to PDF bytes."""
+        future = self.submit(html_str, base_url)
+        try:
+            return future.result()
+        except BrokenProcessPool as e:
+            raise WeasyRendererError(f"WeasyPrint worker died: {e}") from e
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> WeasyRenderService:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_SHARED_SERVICES: dict[int, WeasyRenderService] = {}
+_SHARED_SERVICES_LOCK = threading.Lock()
+
+
+def get_render_service(workers: int | None = None) -> WeasyRenderService:
+    """
+    Return the process-wide WeasyRenderService for a worker count, starting it on first use.
+
+    Args:
+        workers: WeasyPrint worker processes (default: WEASYPRINT_WORKERS)
+
+    Returns:
+        Shared service; it is closed at interpreter exit (or by close_render_services())
+    """
+    workers = max(1, workers or llm_settings.weasyprint_workers)
+    with _SHARED_SERVICES_LOCK:
+        service = _SHARED_SERVICES.get(workers)
+        if service is None:
+            if not _SHARED_SERVICES:
+                atexit.register(close_render_services)
+            service = WeasyRenderService(workers)
+            _SHARED_SERVICES[workers] = service
+        return service
+
+
+def close_render_services() -> None:
+    """Shut down the worker pools of all shared render services."""
+    with _SHARED_SERVICES_LOCK:
+        services = list(_SHARED_SERVICES.values())
+        _SHARED_SERVICES.clear()
+    for service in services:
+        service.close()
 
 
 def _escape_html(text: str) -> str:
@@ -97,25 +270,21 @@ def _render_section(section: dict[str, Any]) -> str:
     return f"<section><h2>{title}</h2>{body}</section>"
 
 
-def render_report_to_html(report: dict[str, Any]) -> str:
-    """Render report JSON to a standalone HTML string (no PDF)."""
+def render_report_to_html(report: dict[str, Any], inline_css: bool = True) -> str:
+    """
+    Render report JSON to a standalone HTML string (no PDF).
+
+    With inline_css=False the <style> element is left out; the PDF renderers
+    apply REPORT_CSS as a pre-parsed stylesheet instead.
+    """
     sections_html = "".join(_render_section(s) for s in report.get("sections", []))
     language = report.get("layout", {}).get("language", "en")
+    style = f"<style>{REPORT_CSS}</style>" if inline_css else ""
     return f"""<!DOCTYPE html>
 <html lang="{language}">
 <head>
 <meta charset="utf-8"/>
-<style>
-body {{ font-family: sans-serif; margin: 32px; }}
-h1,h2,h3 {{ color: #222; }}
-table.report-table {{ border-collapse: collapse; width: 100%; margin: 12px 0; }}
-table.report-table th, table.report-table td {{ border: 1px solid #ccc; padding: 6px; font-size: 12px; }}
-table.report-table caption {{ font-weight: bold; margin-bottom: 4px; }}
-.callout {{ border-left: 4px solid #999; padding: 8px 12px; margin: 8px 0; background: #f8f8f8; }}
-.callout.warning {{ border-color: #d9534f; }}
-.callout.note {{ border-color: #0275d8; }}
-.callout.implication {{ border-color: #5cb85c; }}
-</style>
+{style}
 </head>
 <body>
 <h1>{_escape_html(report.get('metadata', {}).get('title', 'Report'))}</h1>
@@ -124,12 +293,8 @@ table.report-table caption {{ font-weight: bold; margin-bottom: 4px; }}
 </html>"""
 
 
-def render_report_with_weasyprint(report: dict[str, Any], output_dir: Path) -> dict[str, Path]:
-    """
-    Render report JSON to HTML and PDF using WeasyPrint.
-
-    Returns dict with 'html' and 'pdf' paths.
-    """
+def _prepare_report(report: dict[str, Any], output_dir: Path) -> Path:
+    """Generate missing figures and write report.html; returns the .html path."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate figures first
@@ -145,32 +310,90 @@ def render_report_with_weasyprint(report: dict[str, Any], output_dir: Path) -> d
             if "subsections" in section:
                 stack.extend(section["subsections"])
 
-    # Walk through all sections to find and generate figures
-    for section in _walk_sections(report.get("sections", [])):
-        for block in section.get("blocks", []):
-            if block.get("type") == "figure":
-                # If file path is missing, generate it
-                if not block.get("file"):
-                    try:
-                        # Generate figure using shared figure generator
-                        # This will create the file in output_dir/figures
-                        fig_path = generate_figure(block, output_dir)
-                        # Update block with absolute path to generated file
-                        block["file"] = str(fig_path)
-                    except FigureGenerationError as e:
-                        # Log error but continue (will likely fail rendering or show broken image)
-                        print(f"Failed to generate figure: {e}")
-                        # Don't raise here, let renderer handle missing file or skip
-
-    html_str = render_report_to_html(report)
+    # Walk through all sections to find figures whose file path is missing
+    figure_blocks = [
+        block
+        for section in _walk_sections(report.get("sections", []))
+        for block in section.get("blocks", [])
+        if block.get("type") == "figure" and not block.get("file")
+    ]
+    # Generate them with the shared figure generator (cached, cache misses in parallel)
+    for block, fig_path in zip(
+        figure_blocks, generate_figures(figure_blocks, output_dir), strict=True
+    ):
+        if isinstance(fig_path, FigureGenerationError):
+            # Log error but continue (will likely fail rendering or show broken image)
+            print(f"Failed to generate figure: {fig_path}")
+            # Don't raise here, let renderer handle missing file or skip
+            continue
+        # Update block with absolute path to generated file
+        block["file"] = str(fig_path)
+
     html_path = output_dir / "report.html"
-    html_path.write_text(html_str, encoding="utf-8")
+    html_path.write_text(render_report_to_html(report), encoding="utf-8")
+    return html_path
 
-    HTML = _import_weasyprint()
-    try:
-        pdf_path = output_dir / "report.pdf"
-        HTML(string=html_str, base_url=str(output_dir)).write_pdf(str(pdf_path))
-    except Exception as e:
-        raise WeasyRendererError(f"WeasyPrint failed: {e}") from e
+
+@traced(KIND_RENDER)
+def render_report_with_weasyprint(report: dict[str, Any], output_dir: Path) -> dict[str, Path]:
+    """
+    Render report JSON to HTML and PDF using WeasyPrint.
+
+    Renders in this process with the process-wide warmed state (see
+    _warm_state()), so only the first report pays the font and CSS set-up.
+
+    Returns dict with 'html' and 'pdf' paths.
+    """
+    html_path = _prepare_report(report, output_dir)
+
+    pdf_path = output_dir / "report.pdf"
+    _write_pdf(render_report_to_html(report, inline_css=False), str(output_dir), str(pdf_path))
 
     return {"html": html_path, "pdf": pdf_path}
+
+
+@traced(KIND_RENDER)
+def render_reports_with_weasyprint(
+    jobs: list[tuple[dict[str, Any], Path]], workers: int | None = None
+) -> list[dict[str, Path] | WeasyRendererError]:
+    """
+    Render many reports through the shared WeasyRenderService.
+
+    HTML and figures are prepared one report at a time; the PDFs are rendered
+    by `workers` warmed processes (default: WEASYPRINT_WORKERS). The service
+    outlives the call (see get_render_service()), so later batches reuse the
+    warmed workers.
+
+    Args:
+        jobs: (report JSON, output directory) pairs; use one directory per report
+        workers: WeasyPrint worker processes
+
+    Returns:
+        Per job, in order: the render_report_with_weasyprint() result or the
+        WeasyRendererError that stopped it
+    """
+    results: list[dict[str, Path] | WeasyRendererError] = []
+    service = get_render_service(workers)
+    # Prepared reports are queued right away, so workers start while the next is prepared
+    pending: list[tuple[int, Path, Path, Future[bytes]]] = []
+    for index, (report, output_dir) in enumerate(jobs):
+        try:
+            html_path = _prepare_report(report, output_dir)
+            html_str = render_report_to_html(report, inline_css=False)
+        except WeasyRendererError as e:
+            results.append(e)
+            continue
+        results.append({"html": html_path})
+        pending.append((index, html_path, output_dir, service.submit(html_str, str(output_dir))))
+
+    for index, html_path, output_dir, future in pending:
+        try:
+            pdf_path = output_dir / "report.pdf"
+            pdf_path.write_bytes(future.result())
+        except WeasyRendererError as e:
+            results[index] = e
+        except BrokenProcessPool as e:
+            results[index] = WeasyRendererError(f"WeasyPrint worker died: {e}")
+        else:
+            results[index] = {"html": html_path, "pdf": pdf_path}
+    return results
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+JSON serialization for pipeline artifacts and LLM prompts.
+
+Uses orjson when it is installed (several times faster on large extraction and
+appraisal dicts) and the standard library otherwise. Both backends produce the
+same JSON text apart from float formatting details.
+
+- dumps_prompt(): compact output for data embedded in LLM prompts. Indentation
+  is pure overhead there: on a full extraction it costs thousands of input tokens
+  per call. Non-ASCII text is kept as-is instead of \\uXXXX escapes.
+- dumps_artifact(): output for JSON artifacts on disk. Compact by default,
+  pretty-printed when PIPELINE_PRETTY_JSON is enabled for debugging.
+- loads(): parse JSON text or bytes.
+"""
+
+import json
+from typing import Any
+
+from .config import llm_settings
+
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    HAVE_ORJSON = False
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize data to JSON text.
+
+    Args:
+        data: JSON-compatible value
+        pretty: Indent with two spaces instead of compact output
+
+    Returns:
+        JSON text (UTF-8, non-ASCII characters unescaped)
+
+    Raises:
+        TypeError: If data contains values JSON cannot represent
+    """
+    if HAVE_ORJSON:
+        options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(data, option=options).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # orjson rejects e.g. integers beyond 64 bits; the stdlib handles them
+            pass
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
+
+
+def dumps_prompt(data: Any) -> str:
+    """Serialize data for an LLM prompt (always compact)."""
+    return dumps(data)
+
+
+def dumps_artifact(data: Any) -> str:
+    """Serialize a JSON artifact (pretty-printed only with PIPELINE_PRETTY_JSON)."""
+    return dumps(data, pretty=llm_settings.pretty_json_artifacts)
+
+
+def loads(text: str | bytes) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON (orjson's error is a subclass)
+    """
+    if HAVE_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
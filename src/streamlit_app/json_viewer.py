@@ -14,6 +14,8 @@ from pathlib import Path
 
 import streamlit as st
 
+from .result_checker import load_result
+
 
 def show_json_viewer(file_path: str, step_name: str, file_info: dict):
     """
@@ -29,6 +31,8 @@ def show_json_viewer(file_path: str, step_name: str, file_info: dict):
         file_info: Dictionary with file metadata containing:
             - modified: Last modified timestamp string (YYYY-MM-DD HH:MM:SS format)
             - size_kb: File size in kilobytes (float)
+            - artifact: Optional artifact store key (from get_result_file_info());
+              when present the content is loaded from the store, not file_path
 
     Example:
         >>> from src.streamlit_app import show_json_viewer
@@ -65,8 +69,11 @@ def show_json_viewer(file_path: str, step_name: str, file_info: dict):
     @st.dialog(f"{icon} {step_name}", width="large")
     def dialog_content():
         try:
-            with open(file_path) as f:
-                json_content = json.load(f)
+            if "artifact" in file_info:
+                json_content = load_result(file_info)
+            else:
+                with open(file_path) as f:
+                    json_content = json.load(f)
 
             # Display JSON with syntax highlighting
             st.json(json_content)
@@ -19,8 +19,10 @@ File Naming Conventions:
     Special case for correction step: Uses -extraction-corrected.json suffix
 
 Storage Location:
-    All result files are stored in the tmp/ directory at project root.
-    This directory is typically .gitignored to avoid committing large JSON files.
+    All result files are stored in the artifact root (PIPELINE_ARTIFACT_ROOT,
+    default tmp/ at project root). All functions go through the configured
+    artifact store (ARTIFACT_STORE), so they also work with the sqlite backend,
+    where the "path" of a result is a logical name that does not exist on disk.
 
 Example File Structure:
     tmp/
@@ -32,6 +34,21 @@ Example File Structure:
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+from ..config import llm_settings
+from ..pipeline.artifact_store import (
+    ArtifactInfo,
+    ArtifactStore,
+    artifact_filename,
+    get_artifact_store,
+)
+
+
+def _artifact_store() -> ArtifactStore:
+    """Return the configured store of the shared artifact root."""
+    root = Path(llm_settings.artifact_root)
+    return get_artifact_store(llm_settings, root, root)
 
 
 def get_identifier_from_pdf_path(pdf_path: str) -> str | None:
@@ -91,21 +108,63 @@ def check_existing_results(identifier: str | None) -> dict:
             "podcast_generation": False,
         }
 
-    tmp_dir = Path("tmp")
+    store = _artifact_store()
     results = {
-        "classification": (tmp_dir / f"{identifier}-classification.json").exists(),
-        "extraction": (tmp_dir / f"{identifier}-extraction0.json").exists(),
-        "validation": (tmp_dir / f"{identifier}-validation0.json").exists(),
-        "correction": (tmp_dir / f"{identifier}-extraction1.json").exists(),
-        "validation_correction": any(tmp_dir.glob(f"{identifier}-validation[0-9]*.json")),
-        "appraisal": any(tmp_dir.glob(f"{identifier}-appraisal[0-9]*.json")),
-        "report_generation": any(tmp_dir.glob(f"{identifier}-report[0-9]*.json"))
-        or (tmp_dir / f"{identifier}-report-best.json").exists(),
-        "podcast_generation": (tmp_dir / f"{identifier}-podcast.json").exists(),
+        "classification": store.exists(identifier, "classification"),
+        "extraction": store.exists(identifier, "extraction", 0),
+        "validation": store.exists(identifier, "validation", 0),
+        "correction": store.exists(identifier, "extraction", 1),
+        "validation_correction": bool(store.iterations(identifier, "validation")),
+        "appraisal": bool(store.iterations(identifier, "appraisal")),
+        "report_generation": bool(store.iterations(identifier, "report"))
+        or store.exists(identifier, "report", status="best"),
+        "podcast_generation": store.exists(identifier, "podcast"),
     }
     return results
 
 
+def _latest(infos: list[ArtifactInfo]) -> ArtifactInfo | None:
+    """Return the most recently written artifact, or None."""
+    return max(infos, key=lambda info: info.updated_at) if infos else None
+
+
+def _find_result(store: ArtifactStore, identifier: str, step: str) -> ArtifactInfo | None:
+    """Return the artifact that represents a step's result."""
+    # For extraction and validation: prefer BEST file, fall back to iteration 0
+    # For validation_correction: prefer BEST validation, fall back to most recent
+    if step == "extraction":
+        return store.info(identifier, "extraction", status="best") or store.info(
+            identifier, "extraction", 0
+        )
+    if step == "validation":
+        return store.info(identifier, "validation", status="best") or store.info(
+            identifier, "validation", 0
+        )
+    if step == "validation_correction":
+        return store.info(identifier, "validation", status="best") or _latest(
+            store.iterations(identifier, "validation")
+        )
+    if step == "appraisal":
+        return (
+            store.info(identifier, "appraisal", status="best")
+            or store.info(identifier, "appraisal", 0)
+            or _latest(store.iterations(identifier, "appraisal"))
+        )
+    if step == "report_generation":
+        return (
+            store.info(identifier, "report", status="best")
+            or store.info(identifier, "report", 0)
+            or _latest(store.iterations(identifier, "report"))
+        )
+    if step == "podcast_generation":
+        return store.info(identifier, "podcast")
+    if step == "classification":
+        return store.info(identifier, "classification")
+    if step == "correction":
+        return store.info(identifier, "extraction", 1)
+    return None
+
+
 def get_result_file_info(identifier: str, step: str) -> dict | None:
     """
     Get metadata about a result file if it exists.
@@ -116,9 +175,11 @@ def get_result_file_info(identifier: str, step: str) -> dict | None:
 
     Returns:
         Dictionary with file metadata if file exists:
-            - path: Full path to result file
+            - path: Full path to result file (a logical name with the sqlite store)
             - size_kb: File size in kilobytes
             - modified: Last modified timestamp (formatted string)
+            - artifact: (identifier, step, iteration, status) key in the artifact
+              store, for load_result() and delete_result()
         None if file doesn't exist or step is invalid
 
     Example:
@@ -129,100 +190,25 @@ def get_result_file_info(identifier: str, step: str) -> dict | None:
         Size: 3.2 KB
         Modified: 2025-01-09 12:34:56
     """
-    tmp_dir = Path("tmp")
+    info = _find_result(_artifact_store(), identifier, step)
+    if info is None:
+        return None
 
-    # Determine file path based on step
-    # For extraction and validation: prefer BEST file, fall back to iteration 0
-    # For validation_correction: prefer BEST validation, fall back to most recent
+    key = (info.identifier, info.step, info.iteration, info.status)
+    path = info.path or Path(llm_settings.artifact_root) / artifact_filename(*key)
+    return {
+        "path": str(path),
+        "size_kb": info.size_bytes / 1024,
+        "modified": datetime.fromtimestamp(info.updated_at).strftime("%Y-%m-%d %H:%M:%S"),
+        "artifact": key,
+    }
 
-    if step == "extraction":
-        # Try best extraction first
-        best_path = tmp_dir / f"{identifier}-extraction-best.json"
-        if best_path.exists():
-            file_path = best_path
-        else:
-            # Fallback to extraction0
-            file_path = tmp_dir / f"{identifier}-extraction0.json"
-            if not file_path.exists():
-                return None
-
-    elif step == "validation":
-        # Try best validation first
-        best_path = tmp_dir / f"{identifier}-validation-best.json"
-        if best_path.exists():
-            file_path = best_path
-        else:
-            # Fallback to validation0
-            file_path = tmp_dir / f"{identifier}-validation0.json"
-            if not file_path.exists():
-                return None
-
-    elif step == "validation_correction":
-        # Try best validation first
-        best_path = tmp_dir / f"{identifier}-validation-best.json"
-        if best_path.exists():
-            file_path = best_path
-        else:
-            # Fallback: find most recent validation iteration
-            validation_files = list(tmp_dir.glob(f"{identifier}-validation[0-9]*.json"))
-            if not validation_files:
-                return None
-            file_path = max(validation_files, key=lambda p: p.stat().st_mtime)
-
-    elif step == "appraisal":
-        # Try best appraisal first
-        best_path = tmp_dir / f"{identifier}-appraisal-best.json"
-        if best_path.exists():
-            file_path = best_path
-        else:
-            # Fallback: appraisal0 or most recent iteration
-            appraisal0 = tmp_dir / f"{identifier}-appraisal0.json"
-            if appraisal0.exists():
-                file_path = appraisal0
-            else:
-                # Find most recent appraisal iteration
-                appraisal_files = list(tmp_dir.glob(f"{identifier}-appraisal[0-9]*.json"))
-                if not appraisal_files:
-                    return None
-                file_path = max(appraisal_files, key=lambda p: p.stat().st_mtime)
-
-    elif step == "report_generation":
-        best_path = tmp_dir / f"{identifier}-report-best.json"
-        if best_path.exists():
-            file_path = best_path
-        else:
-            report0 = tmp_dir / f"{identifier}-report0.json"
-            if report0.exists():
-                file_path = report0
-            else:
-                report_files = list(tmp_dir.glob(f"{identifier}-report[0-9]*.json"))
-                if not report_files:
-                    return None
-                file_path = max(report_files, key=lambda p: p.stat().st_mtime)
-
-    elif step == "podcast_generation":
-        file_path = tmp_dir / f"{identifier}-podcast.json"
-        if not file_path.exists():
-            return None
-
-    else:
-        # Map step names to filenames for other steps
-        file_map = {
-            "classification": f"{identifier}-classification.json",
-            "correction": f"{identifier}-extraction1.json",
-        }
 
-        if step not in file_map:
-            return None
+def load_result(file_info: dict) -> Any | None:
+    """Load the result described by get_result_file_info() from the artifact store."""
+    return _artifact_store().load(*file_info["artifact"])
 
-        file_path = tmp_dir / file_map[step]
-        if not file_path.exists():
-            return None
 
-    # Get file statistics
-    stat = file_path.stat()
-    return {
-        "path": str(file_path),
-        "size_kb": stat.st_size / 1024,
-        "modified": datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
-    }
+def delete_result(file_info: dict) -> bool:
+    """Delete the result described by get_result_file_info(); False if already gone."""
+    return _artifact_store().delete(*file_info["artifact"])
@@ -261,7 +261,7 @@ def show_execution_screen():
             callback = create_progress_callback()
 
             pdf_path = Path(st.session_state.pdf_path)
-            file_manager = PipelineFileManager(pdf_path)
+            file_manager = PipelineFileManager(pdf_path, run_id=st.session_state.get("run_id"))
 
             # Step-specific iteration/threshold settings
             max_iter_setting = None
@@ -13,13 +13,13 @@ Public API:
     - display_podcast_artifacts(): Show podcast download buttons (JSON, Markdown, transcript)
 """
 
-import json
 from pathlib import Path
 
 import streamlit as st
 
 from src.pipeline.file_manager import PipelineFileManager
 from src.rendering.podcast_renderer import render_show_summary_plain_text
+from src.serialization import dumps_artifact
 
 
 def display_report_artifacts():
@@ -40,7 +40,7 @@ def display_report_artifacts():
     if not st.session_state.pdf_path:
         return
 
-    fm = PipelineFileManager(Path(st.session_state.pdf_path))
+    fm = PipelineFileManager(Path(st.session_state.pdf_path), run_id=st.session_state.get("run_id"))
     render_dir = fm.tmp_dir / "render"
     tex_file = render_dir / "report.tex"
     pdf_file = render_dir / "report.pdf"
@@ -81,7 +81,8 @@ def display_podcast_artifacts():
     download buttons plus a transcript preview/copy area.
 
     Files checked:
-        - {identifier}-podcast.json (Structured podcast data)
+        - {identifier}-podcast.json (Structured podcast data, read through the
+          artifact store so the sqlite backend works too)
         - {identifier}-podcast.md (Human-readable script)
 
     Features:
@@ -95,17 +96,20 @@ def display_podcast_artifacts():
     if not st.session_state.pdf_path:
         return
 
-    fm = PipelineFileManager(Path(st.session_state.pdf_path))
-    podcast_json = fm.tmp_dir / f"{fm.identifier}-podcast.json"
+    fm = PipelineFileManager(Path(st.session_state.pdf_path), run_id=st.session_state.get("run_id"))
+    podcast_data = fm.load_json("podcast")
     podcast_md = fm.tmp_dir / f"{fm.identifier}-podcast.md"
 
     st.markdown("### Podcast Artifacts")
     has_any = False
 
-    if podcast_json.exists():
+    if podcast_data is not None:
         has_any = True
-        with open(podcast_json, "rb") as f:
-            st.download_button("Download Podcast JSON", f, file_name=podcast_json.name)
+        st.download_button(
+            "Download Podcast JSON",
+            dumps_artifact(podcast_data),
+            file_name=fm.get_filename("podcast").name,
+        )
 
     if podcast_md.exists():
         has_any = True
@@ -119,9 +123,7 @@ def display_podcast_artifacts():
             st.markdown(content)
 
     # Copy transcript button (load from JSON for clean transcript only)
-    if podcast_json.exists():
-        with open(podcast_json) as f:
-            podcast_data = json.load(f)
+    if podcast_data is not None:
         transcript = podcast_data.get("transcript", "")
         if transcript:
             st.text_area(
@@ -20,6 +20,7 @@ import streamlit as st
 from ..json_viewer import show_json_viewer
 from ..result_checker import (
     check_existing_results,
+    delete_result,
     get_identifier_from_pdf_path,
     get_result_file_info,
 )
@@ -222,7 +223,7 @@ def show_settings_screen():
                             show_json_viewer(file_info["path"], step["name"], file_info)
                     with btn2:
                         if st.button("🗑️", key=f"delete_{step_key}", help="Delete result"):
-                            Path(file_info["path"]).unlink()
+                            delete_result(file_info)
                             st.success(f"Deleted {step['name']} results")
                             st.rerun()
 
@@ -11,6 +11,9 @@ used throughout the application to avoid repetitive checks in app.py.
 
 import streamlit as st
 
+from src.config import llm_settings
+from src.pipeline.file_manager import new_run_id
+
 
 def init_session_state():
     """
@@ -101,3 +104,8 @@ def init_session_state():
                 "critical_issues": 0,
             },
         }
+
+    # Isolated artifact directory shared by all steps of this session
+    # (PIPELINE_ISOLATED_RUNS), so concurrent sessions never overwrite each other
+    if "run_id" not in st.session_state:
+        st.session_state.run_id = new_run_id() if llm_settings.isolated_runs else None
@@ -0,0 +1,619 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""
+Structured timing, token and cost tracing for pipeline runs.
+
+A run is a tree of spans. Each span has a name, a kind, a parent, a duration
+and free-form attributes:
+
+    step        One pipeline step (classification, extraction, ...)
+    loop        An iterative validation/correction loop
+    iteration   One pass of such a loop
+    llm         One provider call, with token usage and estimated cost
+    validation  Schema validation and dual (schema + LLM) validation
+    repair      Deterministic schema repair
+    render      Report, figure and podcast rendering, LaTeX compilation
+    file_write  Pipeline artifact writes
+
+Spans nest, so durations of different kinds overlap (an llm span is also part
+of its iteration and step). Instrumented code calls span() or @traced
+unconditionally: without an active trace they do nothing.
+
+Export:
+    - <trace_path> (JSONL): one line per finished span, written as spans finish
+    - summarize_spans(): per-step time, LLM calls, tokens and cost, plus totals
+      per kind and the slowest span names
+
+Usage:
+    >>> with start_trace("paper", trace_path=Path("tmp/paper-trace.jsonl")) as tracer:
+    ...     with span("extraction", KIND_STEP):
+    ...         with span("generate_json_with_pdf", KIND_LLM, provider="openai"):
+    ...             record_llm_usage({"input_tokens": 12000, "output_tokens": 3000}, "gpt-5.1")
+    >>> tracer.summary()["llm"]["cost_usd"]
+    0.045
+
+Or summarize a finished run from disk:
+    python -m src.tracing tmp/paper-trace.jsonl
+"""
+
+import asyncio
+import functools
+import itertools
+import json
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TypeVar
+
+KIND_STEP = "step"
+KIND_LOOP = "loop"
+KIND_ITERATION = "iteration"
+KIND_LLM = "llm"
+KIND_VALIDATION = "validation"
+KIND_REPAIR = "repair"
+KIND_RENDER = "render"
+KIND_FILE_WRITE = "file_write"
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+
+# Token counters summed from provider usage dicts (see record_llm_usage)
+TOKEN_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cached_tokens",
+    "cache_creation_input_tokens",
+    "reasoning_tokens",
+)
+
+# USD per million tokens. A model matches a key exactly or as "<key>-<snapshot>"
+# (e.g. "claude-3-5-sonnet-20241022"); the longest matching key wins. Models
+# without an entry are reported as unpriced; add them via LLM_PRICING_FILE.
+DEFAULT_MODEL_PRICES: dict[str, dict[str, float]] = {
+    "gpt-4.1": {"input": 2.0, "cached_input": 0.5, "output": 8.0},
+    "gpt-5": {"input": 1.25, "cached_input": 0.125, "output": 10.0},
+    "gpt-5-mini": {"input": 0.25, "cached_input": 0.025, "output": 2.0},
+    "gpt-5.1": {"input": 1.25, "cached_input": 0.125, "output": 10.0},
+    "claude-3-5-sonnet": {"input": 3.0, "cached_input": 0.3, "output": 15.0},
+    "claude-sonnet-4": {"input": 3.0, "cached_input": 0.3, "output": 15.0},
+    "claude-sonnet-4-5": {"input": 3.0, "cached_input": 0.3, "output": 15.0},
+}
+
+# Cache writes cost this multiple of the input price unless a model sets "cache_write"
+CACHE_WRITE_PRICE_FACTOR = 1.25
+
+# Number of span names listed under "slowest" in summaries
+SLOWEST_SPAN_NAMES = 10
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    """
+    One timed unit of work.
+
+    Attributes:
+        name: What ran (step name, function name, "iteration", ...)
+        kind: One of the KIND_* constants
+        span_id: Identifier unique within the trace
+        parent_id: span_id of the enclosing span (None for top-level spans)
+        start_time: Epoch seconds when the span started
+        duration_seconds: Wall time, set when the span ends
+        status: "ok" or "error"
+        error: "<ExceptionType>: <message>" for failed spans
+        attributes: Free-form details (provider, model, tokens, iteration, ...)
+    """
+
+    name: str
+    kind: str
+    span_id: str = ""
+    parent_id: str | None = None
+    start_time: float = 0.0
+    duration_seconds: float | None = None
+    status: str = STATUS_OK
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    _started: float = field(default=0.0, repr=False)
+    _token: Token | None = field(default=None, repr=False)
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serialisable form written to the trace file."""
+        data: dict[str, Any] = {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_seconds": self.duration_seconds,
+            "status": self.status,
+        }
+        if self.error:
+            data["error"] = self.error
+        if self.attributes:
+            data["attributes"] = self.attributes
+        return data
+
+
+class _NullSpan(Span):
+    """Span handed out when no trace is active; attributes are discarded."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan(name="", kind="")
+
+_current_tracer: ContextVar["Tracer | None"] = ContextVar("pipeline_tracer", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("pipeline_span", default=None)
+
+
+def _match_price(model: str, prices: dict[str, dict[str, float]]) -> dict[str, float] | None:
+    matches = [key for key in prices if model == key or model.startswith(f"{key}-")]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost_usd(
+    model: str | None,
+    usage: dict[str, Any],
+    prices: dict[str, dict[str, float]] | None = None,
+) -> float | None:
+    """
+    Estimate the cost of one call from its usage dict.
+
+    input_tokens includes cached and cache-write tokens (the OpenAI convention,
+    which ClaudeProvider follows), so those are billed at their own rates and
+    the rest at the input rate.
+
+    Returns:
+        Cost in USD, or None if the model has no price entry
+    """
+    price = (
+        _match_price(model, DEFAULT_MODEL_PRICES if prices is None else prices) if model else None
+    )
+    if price is None:
+        return None
+    input_tokens = usage.get("input_tokens") or 0
+    cached = usage.get("cached_tokens") or 0
+    cache_write = usage.get("cache_creation_input_tokens") or 0
+    output_tokens = usage.get("output_tokens") or 0
+    uncached = max(0, input_tokens - cached - cache_write)
+    cache_write_price = price.get("cache_write", price["input"] * CACHE_WRITE_PRICE_FACTOR)
+    cost = (
+        uncached * price["input"]
+        + cached * price.get("cached_input", price["input"])
+        + cache_write * cache_write_price
+        + output_tokens * price["output"]
+    )
+    return cost / 1_000_000
+
+
+def load_model_prices(pricing_file: str | Path | None = None) -> dict[str, dict[str, float]]:
+    """
+    Return DEFAULT_MODEL_PRICES updated with the entries of a JSON pricing file.
+
+    The file maps model names to {"input", "cached_input", "output"[, "cache_write"]}
+    in USD per million tokens.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON or not a JSON object
+    """
+    prices = {model: dict(price) for model, price in DEFAULT_MODEL_PRICES.items()}
+    if pricing_file:
+        data = json.loads(Path(pricing_file).read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError(f"Pricing file {pricing_file} must contain a JSON object")
+        prices.update(data)
+    return prices
+
+
+class Tracer:
+    """
+    Collects the spans of one run and streams them to a JSONL file.
+
+    Thread-safe: spans may finish on worker threads (parallel pipeline steps,
+    asyncio.to_thread). The active tracer and span are tracked in context
+    variables, so threads started with a copied context (asyncio, or
+    contextvars.copy_context().run) attach their spans to the right parent.
+
+    Attributes:
+        run_id: Identifier stored in the summary
+        trace_path: JSONL file receiving finished spans (None = memory only)
+        prices: Model prices used for cost estimates
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        trace_path: Path | None = None,
+        prices: dict[str, dict[str, float]] | None = None,
+        append: bool = False,
+    ):
+        self.run_id = run_id
+        self.trace_path = trace_path
+        self.prices = DEFAULT_MODEL_PRICES if prices is None else prices
+        self.started_at = time.time()
+        self._spans: list[Span] = []
+        self._counters: dict[str, float] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        if trace_path is not None:
+            trace_path.parent.mkdir(parents=True, exist_ok=True)
+            if not append:
+                trace_path.write_text("", encoding="utf-8")
+
+    @property
+    def spans(self) -> list[Span]:
+        """Finished spans in the order they ended."""
+        with self._lock:
+            return list(self._spans)
+
+    @property
+    def counters(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def start_span(self, name: str, kind: str, **attributes: Any) -> Span:
+        """
+        Start a span as a child of the current span and make it current.
+
+        Prefer the span() context manager; pair every start_span() with end_span().
+        """
+        parent = _current_span.get()
+        with self._lock:
+            span_id = f"{self.run_id}:{next(self._ids)}"
+        new_span = Span(
+            name=name,
+            kind=kind,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None and parent.span_id else None,
+            start_time=time.time(),
+            attributes=attributes,
+            _started=time.perf_counter(),
+        )
+        new_span._token = _current_span.set(new_span)
+        return new_span
+
+    def end_span(self, span_obj: Span, error: BaseException | None = None) -> None:
+        """Finish a span started with start_span() and write it to the trace."""
+        span_obj.duration_seconds = time.perf_counter() - span_obj._started
+        if error is not None:
+            span_obj.status = STATUS_ERROR
+            span_obj.error = f"{type(error).__name__}: {error}"
+        if span_obj._token is not None:
+            try:
+                _current_span.reset(span_obj._token)
+            except ValueError:
+                # Ended from another context (e.g. a different thread); nothing to restore
+                pass
+            span_obj._token = None
+
+        line = json.dumps({"run_id": self.run_id, **span_obj.to_dict()}, default=str)
+        with self._lock:
+            self._spans.append(span_obj)
+            if self.trace_path is not None:
+                with open(self.trace_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add value to a named counter reported in the summary."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def llm_usage(self, root: Span | None = None) -> dict[str, Any]:
+        """
+        Total LLM calls, time, tokens and cost, optionally below one span.
+
+        Args:
+            root: Only count llm spans nested under this span (None = whole trace)
+        """
+        spans = [s.to_dict() for s in self.spans]
+        if root is not None:
+            spans = _descendants(spans, root.span_id)
+        return _llm_totals(s for s in spans if s["kind"] == KIND_LLM)
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate the finished spans; see summarize_spans()."""
+        summary = summarize_spans([s.to_dict() for s in self.spans], run_id=self.run_id)
+        summary["started_at"] = datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(
+            timespec="seconds"
+        )
+        summary["counters"] = self.counters
+        return summary
+
+
+def get_tracer() -> Tracer | None:
+    """Return the tracer active in this context, if any."""
+    return _current_tracer.get()
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span in this context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def start_trace(
+    run_id: str,
+    trace_path: Path | None = None,
+    prices: dict[str, dict[str, float]] | None = None,
+    append: bool = False,
+) -> Iterator[Tracer]:
+    """
+    Activate a new tracer for the code inside the block.
+
+    Args:
+        run_id: Identifier written to every span line and the summary
+        trace_path: JSONL file for finished spans (None = keep spans in memory only)
+        prices: Model prices for cost estimates (default: DEFAULT_MODEL_PRICES)
+        append: Append to an existing trace file instead of truncating it
+    """
+    tracer = Tracer(run_id, trace_path, prices=prices, append=append)
+    tracer_token = _current_tracer.set(tracer)
+    span_token = _current_span.set(None)
+    try:
+        yield tracer
+    finally:
+        _current_span.reset(span_token)
+        _current_tracer.reset(tracer_token)
+
+
+@contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time the block as a span of the active trace.
+
+    Yields the span so the block can add attributes with span.set(...). Without
+    an active trace a throwaway span is yielded and nothing is recorded.
+    Exceptions mark the span as failed and propagate.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+    span_obj = tracer.start_span(name, kind, **attributes)
+    try:
+        yield span_obj
+    except BaseException as e:
+        tracer.end_span(span_obj, error=e)
+        raise
+    tracer.end_span(span_obj)
+
+
+def traced(kind: str, name: str | None = None) -> Callable[[F], F]:
+    """
+    Decorator recording each call of a function (sync or async) as a span.
+
+    Args:
+        kind: Span kind (KIND_*)
+        name: Span name (default: the function name)
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name, kind):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_llm_usage(usage: dict[str, Any] | None, model: str | None = None) -> None:
+    """
+    Attach token usage (and its estimated cost) to the current llm span.
+
+    Providers call this where they parse usage from a response; it is a no-op
+    outside an llm span or without an active trace. Later calls within the same
+    span add up (e.g. a retried request).
+
+    Args:
+        usage: Provider usage dict (input_tokens, output_tokens, cached_tokens, ...)
+        model: Model that served the call, used for pricing
+    """
+    span_obj = _current_span.get()
+    tracer = _current_tracer.get()
+    if not usage or span_obj is None or tracer is None or span_obj.kind != KIND_LLM:
+        return
+    attributes = span_obj.attributes
+    for key in TOKEN_FIELDS:
+        value = usage.get(key)
+        if isinstance(value, int | float):
+            attributes[key] = attributes.get(key, 0) + value
+    if isinstance(model, str) and model:
+        attributes["model"] = model
+    cost = estimate_cost_usd(attributes.get("model"), usage, tracer.prices)
+    if cost is not None:
+        attributes["cost_usd"] = attributes.get("cost_usd", 0.0) + cost
+    attributes["usage_recorded"] = True
+
+
+def increment(name: str, value: float = 1) -> None:
+    """Add value to a counter of the active trace (no-op without one)."""
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.increment(name, value)
+
+
+def load_trace(trace_path: Path) -> list[dict[str, Any]]:
+    """Read the span dicts of a JSONL trace file."""
+    with open(trace_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _descendants(spans: list[dict[str, Any]], root_id: str) -> list[dict[str, Any]]:
+    children: dict[str | None, list[dict[str, Any]]] = {}
+    for s in spans:
+        children.setdefault(s.get("parent_id"), []).append(s)
+    found: list[dict[str, Any]] = []
+    stack = list(children.get(root_id, []))
+    while stack:
+        s = stack.pop()
+        found.append(s)
+        stack.extend(children.get(s["span_id"], []))
+    return found
+
+
+def _llm_totals(llm_spans: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    totals: dict[str, Any] = {"calls": 0, "seconds": 0.0, **dict.fromkeys(TOKEN_FIELDS, 0)}
+    cost = 0.0
+    unpriced: set[str] = set()
+    for s in llm_spans:
+        attributes = s.get("attributes", {})
+        totals["calls"] += 1
+        totals["seconds"] += s.get("duration_seconds") or 0.0
+        for key in TOKEN_FIELDS:
+            totals[key] += attributes.get(key, 0)
+        if "cost_usd" in attributes:
+            cost += attributes["cost_usd"]
+        elif attributes.get("usage_recorded"):
+            unpriced.add(str(attributes.get("model")))
+    totals["seconds"] = round(totals["seconds"], 3)
+    totals["cost_usd"] = round(cost, 4)
+    if unpriced:
+        totals["unpriced_models"] = sorted(unpriced)
+    return totals
+
+
+def summarize_spans(spans: list[dict[str, Any]], run_id: str | None = None) -> dict[str, Any]:
+    """
+    Aggregate span dicts (from Tracer.spans or load_trace()) into a run summary.
+
+    Returns:
+        {
+            "run_id": str,
+            "wall_seconds": first span start → last span end,
+            "span_count": int,
+            "steps": [{"name", "duration_seconds", "status", "llm": {...}}, ...],
+            "llm": {"calls", "seconds", <token fields>, "cost_usd"[, "unpriced_models"]},
+            "llm_by_model": {model: {...same totals...}},
+            "by_kind": {kind: {"count", "total_seconds", "max_seconds", "errors"}},
+            "slowest": [{"kind", "name", "count", "total_seconds", "max_seconds"}, ...],
+        }
+
+        Kinds nest (llm inside iteration inside step), so by_kind totals overlap.
+    """
+    if run_id is None and spans:
+        run_id = spans[0].get("run_id")
+
+    by_kind: dict[str, dict[str, Any]] = {}
+    by_name: dict[tuple[str, str], dict[str, Any]] = {}
+    for s in spans:
+        duration = s.get("duration_seconds") or 0.0
+        errored = s.get("status") == STATUS_ERROR
+        for stats in (
+            by_kind.setdefault(s["kind"], {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}),
+            by_name.setdefault(
+                (s["kind"], s["name"]), {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            ),
+        ):
+            stats["count"] += 1
+            stats["total_seconds"] += duration
+            stats["max_seconds"] = max(stats["max_seconds"], duration)
+            stats["errors"] = stats.get("errors", 0) + int(errored)
+
+    for stats in [*by_kind.values(), *by_name.values()]:
+        stats["total_seconds"] = round(stats["total_seconds"], 3)
+        stats["max_seconds"] = round(stats["max_seconds"], 3)
+
+    slowest = sorted(by_name.items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+
+    steps = []
+    for s in sorted(
+        (s for s in spans if s["kind"] == KIND_STEP), key=lambda s: s.get("start_time", 0)
+    ):
+        steps.append(
+            {
+                "name": s["name"],
+                "duration_seconds": round(s.get("duration_seconds") or 0.0, 3),
+                "status": s.get("status", STATUS_OK),
+                "llm": _llm_totals(
+                    d for d in _descendants(spans, s["span_id"]) if d["kind"] == KIND_LLM
+                ),
+            }
+        )
+
+    llm_spans = [s for s in spans if s["kind"] == KIND_LLM]
+    llm_by_model: dict[str, list[dict[str, Any]]] = {}
+    for s in llm_spans:
+        model = str(s.get("attributes", {}).get("model") or "unknown")
+        llm_by_model.setdefault(model, []).append(s)
+
+    wall_seconds = 0.0
+    if spans:
+        start = min(s.get("start_time", 0.0) for s in spans)
+        end = max(s.get("start_time", 0.0) + (s.get("duration_seconds") or 0.0) for s in spans)
+        wall_seconds = round(end - start, 3)
+
+    return {
+        "run_id": run_id,
+        "wall_seconds": wall_seconds,
+        "span_count": len(spans),
+        "steps": steps,
+        "llm": _llm_totals(llm_spans),
+        "llm_by_model": {model: _llm_totals(group) for model, group in llm_by_model.items()},
+        "by_kind": by_kind,
+        "slowest": [
+            {"kind": kind, "name": name, **stats}
+            for (kind, name), stats in slowest[:SLOWEST_SPAN_NAMES]
+        ],
+    }
+
+
+def format_summary(summary: dict[str, Any]) -> str:
+    """Render a run summary as a plain-text table (steps, then slowest span names)."""
+    lines = [f"Run {summary.get('run_id')}: {summary.get('wall_seconds', 0.0):.1f}s wall time"]
+    lines.append(
+        f"{'Step':<24}{'Time s':>10}{'LLM calls':>11}{'LLM s':>10}{'Tokens':>12}{'USD':>9}"
+    )
+    rows = [(step["name"], step["duration_seconds"], step["llm"]) for step in summary["steps"]]
+    rows.append(("total (all LLM calls)", summary.get("wall_seconds", 0.0), summary["llm"]))
+    for name, seconds, llm in rows:
+        tokens = llm.get("input_tokens", 0) + llm.get("output_tokens", 0)
+        lines.append(
+            f"{name:<24}{seconds:>10.1f}{llm['calls']:>11}{llm['seconds']:>10.1f}"
+            f"{tokens:>12,}{llm['cost_usd']:>9.2f}"
+        )
+    if summary["llm"].get("unpriced_models"):
+        lines.append(f"Unpriced models: {', '.join(summary['llm']['unpriced_models'])}")
+    lines.append("")
+    lines.append(f"{'Slowest spans':<40}{'Count':>7}{'Total s':>10}{'Max s':>9}")
+    for entry in summary["slowest"]:
+        label = f"{entry['kind']}/{entry['name']}"
+        lines.append(
+            f"{label:<40}{entry['count']:>7}{entry['total_seconds']:>10.1f}"
+            f"{entry['max_seconds']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m src.tracing <trace.jsonl>")
+        raise SystemExit(2)
+    print(format_summary(summarize_spans(load_trace(Path(sys.argv[1])))))
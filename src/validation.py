@@ -17,6 +17,8 @@ Validation Workflow:
 
 Main Functions:
     - validate_with_schema(): Validate data against JSON schema (requires jsonschema library)
+    - validate_instance(): jsonschema.validate() replacement using the shared validator cache
+    - get_validator() / warm_validator_cache(): Compiled-validator cache shared by all callers
     - validate_extraction_quality(): Comprehensive validation with quality scoring
     - create_validation_report(): Human-readable validation report
 
@@ -34,9 +36,14 @@ Note:
     Install with: pip install jsonschema
 """
 
+import hashlib
+import json
 import logging
+import threading
 from typing import Any
 
+from .tracing import KIND_VALIDATION, traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,14 +53,140 @@ class ValidationError(Exception):
     pass
 
 
+# Compiled validators, built once per distinct schema. Checking a bundled schema
+# against its metaschema takes ~0.5 s, far more than validating an extraction with it.
+# Schemas are looked up by identity first (load_schema() returns shared cached dicts),
+# then by content fingerprint, so equal schemas loaded separately share a validator.
+# Schemas must not be mutated after their first validation.
+_VALIDATORS_BY_FINGERPRINT: dict[str, Any] = {}
+_VALIDATORS_BY_ID: dict[int, tuple[dict[str, Any], Any]] = {}
+_VALIDATORS_LOCK = threading.Lock()
+_WARMUP_THREAD: threading.Thread | None = None
+
+
+def schema_fingerprint(schema: dict[str, Any]) -> str:
+    """Return a SHA-256 hex digest of the schema's canonical JSON."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_validator(schema: dict[str, Any]) -> Any:
+    """
+    Return the cached jsonschema validator for a schema, building it on first use.
+
+    The validator class follows the schema's $schema (Draft 2020-12 if absent), as
+    jsonschema.validate() does. The schema is checked against its metaschema once,
+    when the validator is built.
+
+    Raises:
+        ImportError: If jsonschema is not installed
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    with _VALIDATORS_LOCK:
+        cached = _VALIDATORS_BY_ID.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    from jsonschema import Draft202012Validator
+    from jsonschema.validators import validator_for
+
+    fingerprint = schema_fingerprint(schema)
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS_BY_FINGERPRINT.get(fingerprint)
+    if validator is None:
+        validator_class = validator_for(schema, default=Draft202012Validator)
+        validator_class.check_schema(schema)
+        with _VALIDATORS_LOCK:
+            validator = _VALIDATORS_BY_FINGERPRINT.setdefault(fingerprint, validator_class(schema))
+        logger.debug(f"Compiled {validator_class.__name__} for schema {fingerprint[:12]}")
+
+    with _VALIDATORS_LOCK:
+        # Keep a reference to the schema so its id() cannot be reused by another object
+        _VALIDATORS_BY_ID[id(schema)] = (schema, validator)
+    return validator
+
+
+def validate_instance(instance: Any, schema: dict[str, Any]) -> None:
+    """
+    Validate an instance like jsonschema.validate(), using the shared validator cache.
+
+    Raises:
+        ImportError: If jsonschema is not installed
+        jsonschema.ValidationError: The best-matching error if the instance is invalid
+        jsonschema.SchemaError: If the schema itself is invalid
+    """
+    from jsonschema.exceptions import best_match
+
+    error = best_match(get_validator(schema).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+def warm_validator_cache(schema_names: list[str] | None = None) -> int:
+    """
+    Build the validators of the pipeline schemas ahead of the first validation.
+
+    Safe to run in a background thread while the first LLM call is in flight.
+
+    Args:
+        schema_names: SCHEMA_MAPPING keys to compile (None = all)
+
+    Returns:
+        Number of validators built or already cached
+    """
+    try:
+        from jsonschema import SchemaError
+    except ImportError:
+        logger.warning("jsonschema library not installed; validator warm-up skipped")
+        return 0
+
+    from .schemas_loader import SCHEMA_MAPPING, SchemaLoadError, load_schema
+
+    warmed = 0
+    for name in schema_names or list(SCHEMA_MAPPING):
+        try:
+            get_validator(load_schema(name))
+            warmed += 1
+        except (SchemaLoadError, SchemaError) as e:
+            logger.warning(f"Could not compile validator for schema '{name}': {e}")
+    return warmed
+
+
+def start_validator_warmup() -> threading.Thread:
+    """
+    Run warm_validator_cache() once per process in a background daemon thread.
+
+    Entry points call this at startup so the metaschema checks overlap with the
+    first LLM call instead of delaying the first validation. Later calls return
+    the thread started by the first one.
+    """
+    global _WARMUP_THREAD
+    with _VALIDATORS_LOCK:
+        if _WARMUP_THREAD is None:
+            _WARMUP_THREAD = threading.Thread(
+                target=warm_validator_cache, name="validator-warmup", daemon=True
+            )
+            _WARMUP_THREAD.start()
+        return _WARMUP_THREAD
+
+
+def clear_validator_cache() -> None:
+    """Drop all compiled validators. Useful for development/testing."""
+    with _VALIDATORS_LOCK:
+        _VALIDATORS_BY_FINGERPRINT.clear()
+        _VALIDATORS_BY_ID.clear()
+
+
+@traced(KIND_VALIDATION)
 def validate_with_schema(
     data: dict[str, Any], schema: dict[str, Any], strict: bool = True
 ) -> tuple[bool, list[str]]:
     """
     Validate extracted data against a JSON schema.
 
-    Uses jsonschema library with Draft 2020-12 validator to check data
-    structure, types, required fields, and constraints.
+    Uses the shared compiled validator from get_validator() (Draft 2020-12 unless
+    the schema declares another $schema) to check data structure, types, required
+    fields, and constraints.
 
     Args:
         data: The extracted data dictionary to validate
@@ -81,7 +214,6 @@ def validate_with_schema(
     """
     try:
         import jsonschema
-        from jsonschema import Draft202012Validator
     except ImportError as e:
         logger.error("jsonschema library not installed. Install with: pip install jsonschema")
         if strict:
@@ -91,8 +223,8 @@ def validate_with_schema(
     errors = []
 
     try:
-        # Create validator
-        validator = Draft202012Validator(schema)
+        # Compiled once per schema and shared across calls
+        validator = get_validator(schema)
 
         # Validate and collect all errors
         validation_errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
@@ -6,6 +6,11 @@ and schemas. All fixtures are function-scoped by default and use
 unittest.mock for provider mocking.
 
 Fixture Categories:
+    **Isolation (autouse):**
+    - isolated_figure_cache: Per-test figure cache, figures rendered in-process
+    - isolated_latex_build: Per-test LaTeX build cache (formats, aux files)
+    - isolated_rate_limits: Per-test RPM/TPM token bucket database
+
     **Test Data:**
     - sample_pdf: Path to sample PDF file for testing
 
@@ -40,15 +45,55 @@ Note:
     - Schemas are minimal but valid JSON Schema Draft 2020-12
 """
 
+from dataclasses import replace
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
 
 import pytest
 
+from src.llm import rate_limiter
+from src.rendering import figure_generator, latex_build
 from src.schemas_loader import load_schema
 
 
+@pytest.fixture(autouse=True)
+def isolated_figure_cache(monkeypatch, tmp_path):
+    """Render report figures into a per-test cache, in-process (no shared .cache/figures)."""
+    monkeypatch.setattr(
+        figure_generator,
+        "llm_settings",
+        replace(
+            figure_generator.llm_settings,
+            figure_cache_dir=str(tmp_path / "figure_cache"),
+            figure_workers=1,
+        ),
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_latex_build(monkeypatch, tmp_path):
+    """Keep LaTeX formats and aux files in a per-test build cache (no shared .cache/latex)."""
+    monkeypatch.setattr(
+        latex_build,
+        "llm_settings",
+        replace(latex_build.llm_settings, latex_build_dir=str(tmp_path / "latex_build")),
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_rate_limits(monkeypatch, tmp_path):
+    """Keep provider token buckets in a per-test database (no shared .cache/llm_rate_limits)."""
+    get_rate_limiter = rate_limiter.get_rate_limiter
+    db_path = str(tmp_path / "llm_rate_limits.sqlite3")
+    monkeypatch.setattr(rate_limiter, "_SHARED_LIMITERS", {})
+    monkeypatch.setattr(
+        rate_limiter,
+        "get_rate_limiter",
+        lambda settings: get_rate_limiter(replace(settings, rate_limit_db=db_path)),
+    )
+
+
 @pytest.fixture
 def sample_pdf() -> Path:
     """Path to sample PDF for testing."""
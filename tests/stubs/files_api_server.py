@@ -0,0 +1,248 @@
+"""
+Local HTTP stub of the OpenAI and Anthropic Files APIs.
+
+Serves just enough of both APIs for the real SDK clients to upload PDFs and
+send requests that reference them, so the file registry can be exercised
+end-to-end without network access:
+
+    POST   /v1/files             Upload (OpenAI FileObject or Anthropic file metadata)
+    DELETE /v1/files/{id}        Delete (simulates server-side expiry)
+    POST   /v1/responses         OpenAI Responses API; 404 if a referenced file is unknown
+    POST   /v1/messages          Anthropic Messages API; 404 if a referenced file is unknown
+
+Example:
+    >>> with FilesAPIStubServer() as stub:
+    ...     client = openai.OpenAI(api_key="test", base_url=stub.openai_base_url)
+    ...     client.files.create(file=("a.pdf", b"%PDF", "application/pdf"), purpose="user_data")
+    >>> len(stub.uploads)
+    1
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlparse
+
+
+class FilesAPIStubServer:
+    """
+    In-process stub server recording uploads and requests.
+
+    Attributes:
+        files: Currently stored files, file_id -> {"api": str, "size": int}
+        uploads: Every upload in order, as {"api": str, "file_id": str}
+        requests: Every Responses/Messages request body in order
+        response_json: JSON object returned as the model output
+        message_usage: Usage block returned by the Messages API
+        response_headers: Extra headers sent with Responses/Messages replies
+        status_override: If set, Responses/Messages requests fail with this
+            status code (e.g. 429) after being recorded
+    """
+
+    def __init__(self, response_json: dict[str, Any] | None = None):
+        self.files: dict[str, dict[str, Any]] = {}
+        self.uploads: list[dict[str, Any]] = []
+        self.requests: list[dict[str, Any]] = []
+        self.response_json = response_json if response_json is not None else {"ok": True}
+        self.message_usage: dict[str, Any] = {"input_tokens": 10, "output_tokens": 5}
+        self.response_headers: dict[str, str] = {}
+        self.status_override: int | None = None
+        self._lock = threading.Lock()
+        self._counter = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def openai_base_url(self) -> str:
+        return f"{self.url}/v1"
+
+    @property
+    def anthropic_base_url(self) -> str:
+        return self.url
+
+    def expire(self, file_id: str) -> None:
+        """Forget a file so later requests referencing it get a 404."""
+        with self._lock:
+            self.files.pop(file_id, None)
+
+    def start(self) -> "FilesAPIStubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FilesAPIStubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # --- request handling -------------------------------------------------
+
+    def _store_upload(self, api: str, size: int) -> str:
+        with self._lock:
+            self._counter += 1
+            file_id = f"file-stub{self._counter}"
+            self.files[file_id] = {"api": api, "size": size}
+            self.uploads.append({"api": api, "file_id": file_id})
+            return file_id
+
+    def _known(self, file_id: str) -> bool:
+        with self._lock:
+            return file_id in self.files
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+            def _api(self) -> str:
+                return "anthropic" if "anthropic-version" in self.headers else "openai"
+
+            def _send(
+                self, status: int, body: dict[str, Any], headers: dict[str, str] | None = None
+            ) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _not_found(self, file_id: str) -> None:
+                message = f"File not found: {file_id}"
+                if self._api() == "anthropic":
+                    body = {
+                        "type": "error",
+                        "error": {"type": "not_found_error", "message": message},
+                    }
+                else:
+                    body = {"error": {"message": message, "type": "invalid_request_error"}}
+                self._send(404, body)
+
+            def _body(self) -> bytes:
+                return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            def do_POST(self) -> None:  # noqa: N802
+                body = self._body()
+                path = urlparse(self.path).path
+                if path == "/v1/files":
+                    file_id = stub._store_upload(self._api(), len(body))
+                    if self._api() == "anthropic":
+                        self._send(
+                            200,
+                            {
+                                "id": file_id,
+                                "type": "file",
+                                "filename": "paper.pdf",
+                                "mime_type": "application/pdf",
+                                "size_bytes": len(body),
+                                "created_at": "2025-01-01T00:00:00Z",
+                            },
+                        )
+                    else:
+                        self._send(
+                            200,
+                            {
+                                "id": file_id,
+                                "object": "file",
+                                "bytes": len(body),
+                                "created_at": 0,
+                                "filename": "paper.pdf",
+                                "purpose": "user_data",
+                                "status": "processed",
+                            },
+                        )
+                    return
+
+                request = json.loads(body or b"{}")
+                with stub._lock:
+                    stub.requests.append(request)
+                output_text = json.dumps(stub.response_json)
+                if stub.status_override is not None:
+                    error = {"type": "error", "error": {"type": "rate_limit_error", "message": "x"}}
+                    return self._send(stub.status_override, error, stub.response_headers)
+
+                if path == "/v1/responses":
+                    messages = request.get("input", [])
+                    # Plain-text input is a string and cannot reference files
+                    for message in messages if isinstance(messages, list) else []:
+                        for item in message.get("content", []):
+                            file_id = item.get("file_id")
+                            if file_id and not stub._known(file_id):
+                                return self._not_found(file_id)
+                    self._send(
+                        200,
+                        {
+                            "id": "resp_stub",
+                            "object": "response",
+                            "created_at": 0,
+                            "model": request.get("model", "stub"),
+                            "status": "completed",
+                            "output": [
+                                {
+                                    "type": "message",
+                                    "id": "msg_stub",
+                                    "status": "completed",
+                                    "role": "assistant",
+                                    "content": [
+                                        {
+                                            "type": "output_text",
+                                            "text": output_text,
+                                            "annotations": [],
+                                        }
+                                    ],
+                                }
+                            ],
+                            "parallel_tool_calls": False,
+                            "tool_choice": "auto",
+                            "tools": [],
+                        },
+                        stub.response_headers,
+                    )
+                    return
+
+                if path == "/v1/messages":
+                    for message in request.get("messages", []):
+                        for block in message.get("content", []):
+                            if not isinstance(block, dict):
+                                continue
+                            file_id = block.get("source", {}).get("file_id")
+                            if file_id and not stub._known(file_id):
+                                return self._not_found(file_id)
+                    self._send(
+                        200,
+                        {
+                            "id": "msg_stub",
+                            "type": "message",
+                            "role": "assistant",
+                            "model": request.get("model", "stub"),
+                            "content": [{"type": "text", "text": output_text}],
+                            "stop_reason": "end_turn",
+                            "stop_sequence": None,
+                            "usage": stub.message_usage,
+                        },
+                        stub.response_headers,
+                    )
+                    return
+
+                self._send(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+            def do_DELETE(self) -> None:  # noqa: N802
+                file_id = urlparse(self.path).path.rsplit("/", 1)[-1]
+                stub.expire(file_id)
+                self._send(200, {"id": file_id, "deleted": True})
+
+        return Handler
@@ -302,7 +302,7 @@ class TestRunSingleStepAppraisalModes:
     def dummy_file_manager(self, tmp_path):
         pdf_path = tmp_path / "dummy.pdf"
         pdf_path.touch()
-        return PipelineFileManager(pdf_path)
+        return PipelineFileManager(pdf_path, artifact_root=tmp_path)
 
     @pytest.fixture
     def base_previous_results(self):
@@ -0,0 +1,197 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for the file and SQLite artifact stores and their use by PipelineFileManager."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.config import llm_settings
+from src.pipeline import artifact_store
+from src.pipeline.artifact_store import (
+    FileArtifactStore,
+    SQLiteArtifactStore,
+    get_artifact_store,
+)
+from src.pipeline.file_manager import PipelineFileManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["files", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "files":
+        return FileArtifactStore(tmp_path)
+    return SQLiteArtifactStore(tmp_path / "artifacts.sqlite3")
+
+
+class TestArtifactStore:
+    def test_save_load_roundtrip(self, store):
+        store.save("paper", "extraction", {"title": "Ünïcode"}, iteration=0)
+
+        assert store.load("paper", "extraction", 0) == {"title": "Ünïcode"}
+        assert store.load("paper", "extraction") is None
+        assert store.load("other", "extraction", 0) is None
+
+    def test_save_replaces_previous_version(self, store):
+        store.save("paper", "appraisal", {"v": 1}, status="best")
+        store.save("paper", "appraisal", {"v": 2}, status="best")
+
+        assert store.load("paper", "appraisal", status="best") == {"v": 2}
+
+    def test_info_and_exists(self, store):
+        assert store.info("paper", "classification") is None
+        assert not store.exists("paper", "classification")
+
+        store.save("paper", "classification", {"publication_type": "x"})
+        info = store.info("paper", "classification")
+
+        assert store.exists("paper", "classification")
+        assert info.identifier == "paper"
+        assert info.iteration is None
+        assert info.size_bytes > 0
+
+    def test_iterations_sorted_and_scoped(self, store):
+        for iteration in (10, 2, 0):
+            store.save("paper", "appraisal", {"i": iteration}, iteration=iteration)
+        store.save("paper", "appraisal_validation", {}, iteration=5)
+        store.save("paper", "appraisal", {}, status="best")
+        store.save("paper-2", "appraisal", {}, iteration=7)
+
+        iterations = store.iterations("paper", "appraisal")
+
+        assert [info.iteration for info in iterations] == [0, 2, 10]
+
+    def test_find_across_papers(self, store):
+        store.save("b_paper", "appraisal", {}, status="best")
+        store.save("a_paper", "appraisal", {}, status="best")
+        store.save("c_paper", "appraisal", {}, iteration=0)
+        store.save("c_paper", "appraisal_validation", {}, status="best")
+
+        found = store.find("appraisal", status="best")
+
+        assert [info.identifier for info in found] == ["a_paper", "b_paper"]
+
+    def test_delete(self, store):
+        store.save("paper", "podcast", {})
+
+        assert store.delete("paper", "podcast") is True
+        assert store.delete("paper", "podcast") is False
+        assert not store.exists("paper", "podcast")
+
+
+class TestSQLiteArtifactStore:
+    def test_namespaces_are_isolated(self, tmp_path):
+        db = tmp_path / "artifacts.sqlite3"
+        first = SQLiteArtifactStore(db, namespace="runs/paper-abc/run-1")
+        second = SQLiteArtifactStore(db, namespace="runs/paper-abc/run-2")
+
+        first.save("paper", "classification", {"run": 1})
+
+        assert second.load("paper", "classification") is None
+        assert first.load("paper", "classification") == {"run": 1}
+
+    def test_database_uses_wal(self, tmp_path):
+        store = SQLiteArtifactStore(tmp_path / "artifacts.sqlite3")
+
+        with store._connect() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+class TestGetArtifactStore:
+    def test_files_backend_by_default(self, tmp_path):
+        settings = replace(llm_settings, artifact_store="files")
+
+        store = get_artifact_store(settings, tmp_path)
+
+        assert isinstance(store, FileArtifactStore)
+        assert store.directory == tmp_path
+
+    def test_sqlite_backend_shared_per_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(artifact_store, "_SHARED_SQLITE_STORES", {})
+        settings = replace(llm_settings, artifact_store="sqlite", artifact_store_db="")
+        run_dir = tmp_path / "runs" / "paper-abc" / "run-1"
+
+        store = get_artifact_store(settings, run_dir, tmp_path)
+
+        assert isinstance(store, SQLiteArtifactStore)
+        assert store.db_path == (tmp_path / "artifacts.sqlite3").resolve()
+        assert store.namespace == "runs/paper-abc/run-1"
+        assert get_artifact_store(settings, run_dir, tmp_path) is store
+        assert get_artifact_store(settings, tmp_path, tmp_path).namespace == ""
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError, match="ARTIFACT_STORE"):
+            get_artifact_store(replace(llm_settings, artifact_store="redis"), tmp_path)
+
+
+class TestFileManagerWithSQLiteStore:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        store = SQLiteArtifactStore(tmp_path / "artifacts.sqlite3")
+        return PipelineFileManager(
+            pdf_path, artifact_root=tmp_path / "out", isolated=False, store=store
+        )
+
+    def test_json_artifacts_not_written_as_files(self, manager):
+        path = manager.save_json({"a": 1}, "classification")
+
+        assert path == Path(manager.tmp_dir / "paper-classification.json")
+        assert not path.exists()
+        assert manager.load_json("classification") == {"a": 1}
+        assert manager.exists("classification")
+
+    def test_iteration_listings(self, manager):
+        manager.save_appraisal_iteration(1, {"v": 1}, {"score": 0.9})
+        manager.save_appraisal_iteration(0, {"v": 0})
+        manager.save_report_iteration(0, {"v": 0}, {"score": 0.9})
+
+        appraisals = manager.get_appraisal_iterations()
+        reports = manager.get_report_iterations()
+
+        assert [it["iteration_num"] for it in appraisals] == [0, 1]
+        assert [it["validation_exists"] for it in appraisals] == [False, True]
+        assert appraisals[1]["appraisal_file"].name == "paper-appraisal1.json"
+        assert reports[0]["report_exists"] is True
+        assert reports[0]["validation_file"].name == "paper-report_validation0.json"
+
+
+class TestResultCheckerWithSQLiteStore:
+    @pytest.fixture(autouse=True)
+    def store(self, tmp_path, monkeypatch):
+        from src.streamlit_app import result_checker
+
+        monkeypatch.setattr(artifact_store, "_SHARED_SQLITE_STORES", {})
+        settings = replace(
+            llm_settings,
+            artifact_store="sqlite",
+            artifact_store_db="",
+            artifact_root=str(tmp_path),
+        )
+        monkeypatch.setattr(result_checker, "llm_settings", settings)
+        return get_artifact_store(settings, tmp_path, tmp_path)
+
+    def test_file_info_load_and_delete(self, store):
+        from src.streamlit_app.result_checker import (
+            delete_result,
+            get_result_file_info,
+            load_result,
+        )
+
+        store.save("paper", "appraisal", {"v": 0}, 0)
+        store.save("paper", "appraisal", {"v": "best"}, status="best")
+
+        info = get_result_file_info("paper", "appraisal")
+
+        assert info is not None
+        assert Path(info["path"]).name == "paper-appraisal-best.json"
+        assert not Path(info["path"]).exists()
+        assert load_result(info) == {"v": "best"}
+        assert delete_result(info) is True
+        assert load_result(get_result_file_info("paper", "appraisal")) == {"v": 0}
+        assert get_result_file_info("paper", "podcast_generation") is None
@@ -0,0 +1,224 @@
+"""
+Unit tests for src/pipeline/batch.py
+
+Tests batch source loading, per-paper failure isolation and the global LLM
+request cap shared across concurrently running papers.
+"""
+
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from src.config import LLMSettings
+from src.llm.base import BaseLLMProvider, set_request_limit
+from src.pipeline import batch as batch_module
+from src.pipeline.batch import BatchItem, BatchResult, load_batch_items, run_batch
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def pdf_dir(tmp_path):
+    for name in ["b.pdf", "a.pdf", "c.pdf"]:
+        (tmp_path / name).write_bytes(b"%PDF-1.4")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def _reset_request_limit():
+    yield
+    set_request_limit(None)
+
+
+class TestLoadBatchItems:
+    def test_directory_sorted_pdfs(self, pdf_dir):
+        items = load_batch_items(pdf_dir)
+        assert [i.pdf_path.name for i in items] == ["a.pdf", "b.pdf", "c.pdf"]
+
+    def test_manifest_relative_paths_and_options(self, pdf_dir):
+        manifest = pdf_dir / "batch.jsonl"
+        manifest.write_text(
+            "\n".join(
+                [
+                    json.dumps({"pdf": "a.pdf", "max_pages": 5}),
+                    "",
+                    "# comment",
+                    json.dumps({"pdf": "b.pdf", "llm_provider": "claude"}),
+                ]
+            )
+        )
+
+        items = load_batch_items(manifest)
+
+        assert items[0].pdf_path == pdf_dir / "a.pdf"
+        assert items[0].options == {"max_pages": 5}
+        assert items[1].options == {"llm_provider": "claude"}
+
+    def test_manifest_unknown_option_rejected(self, tmp_path):
+        manifest = tmp_path / "batch.jsonl"
+        manifest.write_text(json.dumps({"pdf": "a.pdf", "bogus": 1}))
+        with pytest.raises(ValueError, match="bogus"):
+            load_batch_items(manifest)
+
+    def test_manifest_missing_pdf_field(self, tmp_path):
+        manifest = tmp_path / "batch.jsonl"
+        manifest.write_text(json.dumps({"max_pages": 1}))
+        with pytest.raises(ValueError, match="'pdf'"):
+            load_batch_items(manifest)
+
+    def test_missing_source(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_batch_items(tmp_path / "nope")
+
+
+class TestRunBatch:
+    def test_failure_is_isolated(self, pdf_dir, monkeypatch):
+        calls = []
+
+        def fake_pipeline(pdf_path, progress_callback=None, **kwargs):
+            calls.append((pdf_path.name, kwargs))
+            if pdf_path.name == "b.pdf":
+                raise RuntimeError("LLM exploded")
+            return {"classification": {"publication_type": "other"}}
+
+        monkeypatch.setattr(batch_module.orchestrator, "run_full_pipeline", fake_pipeline)
+
+        result = run_batch(pdf_dir, workers=3, llm_provider="claude")
+
+        assert [p.pdf_path.name for p in result.papers] == ["a.pdf", "b.pdf", "c.pdf"]
+        assert [p.status for p in result.papers] == ["completed", "failed", "completed"]
+        assert "LLM exploded" in result.papers[1].error
+        assert result.succeeded == 2 and result.failed == 1
+        assert all(kwargs["llm_provider"] == "claude" for _, kwargs in calls)
+
+    def test_item_options_override_defaults(self, pdf_dir, monkeypatch):
+        seen = {}
+
+        def fake_pipeline(pdf_path, progress_callback=None, **kwargs):
+            seen[pdf_path.name] = kwargs["max_pages"]
+            return {}
+
+        monkeypatch.setattr(batch_module.orchestrator, "run_full_pipeline", fake_pipeline)
+
+        run_batch(
+            [BatchItem(pdf_dir / "a.pdf", {"max_pages": 2}), pdf_dir / "b.pdf"],
+            max_pages=10,
+        )
+
+        assert seen == {"a.pdf": 2, "b.pdf": 10}
+
+    def test_duplicate_stems_rejected(self, tmp_path, monkeypatch):
+        for sub in ["x", "y"]:
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / "paper.pdf").write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(
+            batch_module.orchestrator, "run_full_pipeline", lambda pdf_path, **kw: {}
+        )
+
+        result = run_batch([tmp_path / "x" / "paper.pdf", tmp_path / "y" / "paper.pdf"])
+
+        assert [p.status for p in result.papers] == ["completed", "failed"]
+        assert "Duplicate file identifier" in result.papers[1].error
+
+    def test_duplicate_stems_allowed_for_isolated_runs(self, tmp_path, monkeypatch):
+        for sub in ["x", "y"]:
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / "paper.pdf").write_bytes(b"%PDF-1.4")
+        monkeypatch.setattr(
+            batch_module.orchestrator, "run_full_pipeline", lambda pdf_path, **kw: {}
+        )
+
+        result = run_batch(
+            [tmp_path / "x" / "paper.pdf", tmp_path / "y" / "paper.pdf"], isolated_run=True
+        )
+
+        assert [p.status for p in result.papers] == ["completed", "completed"]
+
+    def test_unknown_pipeline_option_rejected(self, pdf_dir):
+        with pytest.raises(ValueError, match="bogus"):
+            run_batch(pdf_dir, bogus=True)
+
+    def test_progress_callback_forwards_step_events(self, pdf_dir, monkeypatch):
+        events = []
+
+        def fake_pipeline(pdf_path, progress_callback=None, **kwargs):
+            progress_callback("classification", "completed", {})
+            return {}
+
+        monkeypatch.setattr(batch_module.orchestrator, "run_full_pipeline", fake_pipeline)
+
+        run_batch(
+            [pdf_dir / "a.pdf"],
+            progress_callback=lambda path, status, data: events.append((path.name, status)),
+        )
+
+        assert events == [
+            ("a.pdf", "starting"),
+            ("a.pdf", "classification:completed"),
+            ("a.pdf", "completed"),
+        ]
+
+    def test_global_llm_concurrency_cap(self, tmp_path, monkeypatch):
+        class SlowProvider(BaseLLMProvider):
+            concurrency_key = "batch-test"
+            active = 0
+            peak = 0
+            lock = threading.Lock()
+
+            def generate_text(self, prompt, system_prompt=None, **kwargs):
+                with self.request_slot_sync():
+                    with SlowProvider.lock:
+                        SlowProvider.active += 1
+                        SlowProvider.peak = max(SlowProvider.peak, SlowProvider.active)
+                    time.sleep(0.03)
+                    with SlowProvider.lock:
+                        SlowProvider.active -= 1
+                return prompt
+
+            def generate_json_with_schema(self, *args, **kwargs):
+                raise NotImplementedError
+
+            def generate_json_with_pdf(self, *args, **kwargs):
+                raise NotImplementedError
+
+        def fake_pipeline(pdf_path, progress_callback=None, **kwargs):
+            # Each paper builds its own provider, like the orchestrator's step functions
+            llm = SlowProvider(LLMSettings(max_concurrent_requests=50))
+            for i in range(3):
+                llm.generate_text(f"{pdf_path.stem}-{i}")
+            return {}
+
+        monkeypatch.setattr(batch_module.orchestrator, "run_full_pipeline", fake_pipeline)
+        pdfs = []
+        for i in range(6):
+            pdf = tmp_path / f"p{i}.pdf"
+            pdf.write_bytes(b"%PDF-1.4")
+            pdfs.append(pdf)
+
+        result = run_batch(pdfs, workers=6, max_llm_concurrency=2)
+
+        assert result.succeeded == 6
+        assert SlowProvider.peak == 2
+
+
+class TestBatchCLI:
+    def test_resume_is_forwarded(self, pdf_dir, monkeypatch):
+        import run_pipeline
+
+        captured = {}
+
+        def fake_run_batch(items, **kwargs):
+            captured.update(kwargs)
+            return BatchResult(papers=[])
+
+        monkeypatch.setattr(run_pipeline, "run_batch", fake_run_batch)
+        monkeypatch.setattr(run_pipeline, "start_validator_warmup", lambda: None)
+        monkeypatch.setattr(sys, "argv", ["run_pipeline.py", "--batch", str(pdf_dir), "--resume"])
+
+        run_pipeline.main()
+
+        assert captured["resume"] is True
@@ -0,0 +1,200 @@
+"""
+Unit tests for benchmarks/harness.py and the benchmark runner's regression gate.
+
+Covers percentile statistics, timing with warm-up, baseline comparison rules
+(threshold, noise floor, skipped or changed stages) and the CLI exit codes on a
+fast fixture stage.
+"""
+
+import json
+
+import pytest
+
+from benchmarks import run_benchmarks
+from benchmarks.harness import (
+    StageResult,
+    build_results,
+    compare_to_baseline,
+    load_results,
+    percentile,
+    summarize,
+    time_call,
+    write_results,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _results(**stages):
+    return build_results(
+        [
+            stage if isinstance(stage, StageResult) else StageResult(name, stage)
+            for name, stage in stages.items()
+        ],
+        config={},
+    )
+
+
+class TestStatistics:
+    def test_percentile_interpolates(self):
+        samples = [4.0, 1.0, 3.0, 2.0]
+
+        assert percentile(samples, 50) == pytest.approx(2.5)
+        assert percentile(samples, 95) == pytest.approx(3.85)
+        assert percentile(samples, 0) == 1.0
+        assert percentile(samples, 100) == 4.0
+
+    def test_percentile_rejects_bad_input(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+        with pytest.raises(ValueError):
+            percentile([1.0], 101)
+
+    def test_summarize(self):
+        summary = summarize([1.0, 2.0, 3.0])
+
+        assert summary["n"] == 3
+        assert summary["mean_s"] == pytest.approx(2.0)
+        assert summary["p50_s"] == pytest.approx(2.0)
+        assert (summary["min_s"], summary["max_s"]) == (1.0, 3.0)
+
+    def test_time_call_skips_warmup_and_uses_setup(self):
+        seen = []
+
+        samples = time_call(seen.append, repeat=3, warmup=2, setup=lambda: (len(seen),))
+
+        assert len(samples) == 3
+        assert seen == [0, 1, 2, 3, 4]
+
+    def test_skipped_stage_has_no_statistics(self):
+        data = StageResult.skipped("render", "WeasyPrint missing").to_dict()
+
+        assert data == {"status": "skipped", "reason": "WeasyPrint missing"}
+
+    def test_results_round_trip(self, tmp_path):
+        path = write_results(_results(stage=[0.1, 0.2]), tmp_path / "out" / "results.json")
+
+        assert load_results(path)["stages"]["stage"]["p50_s"] == pytest.approx(0.15)
+
+    def test_load_rejects_other_json(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"stages": {}}))
+
+        with pytest.raises(ValueError, match="not a benchmark results file"):
+            load_results(path)
+
+
+class TestBaselineComparison:
+    def test_regression_over_threshold(self):
+        baseline = _results(fast=[0.100], slow=[0.100])
+        current = _results(fast=[0.105], slow=[0.150])
+
+        comparisons = {c.stage: c for c in compare_to_baseline(current, baseline, 10.0)}
+
+        assert not comparisons["fast"].regressed
+        assert comparisons["slow"].regressed
+        assert comparisons["slow"].change_pct == pytest.approx(50.0)
+
+    def test_noise_floor_protects_tiny_stages(self):
+        baseline = _results(tiny=[0.001])
+        current = _results(tiny=[0.003])
+
+        (comparison,) = compare_to_baseline(current, baseline, 10.0, min_delta_s=0.005)
+
+        assert comparison.change_pct == pytest.approx(200.0)
+        assert not comparison.regressed
+
+    def test_metric_selection(self):
+        baseline = _results(stage=[1.0, 1.0, 1.0, 1.0])
+        current = _results(stage=[1.0, 1.0, 1.0, 3.0])
+
+        (p50,) = compare_to_baseline(current, baseline, 10.0, metric="p50_s")
+        (p95,) = compare_to_baseline(current, baseline, 10.0, metric="p95_s")
+
+        assert not p50.regressed
+        assert p95.regressed
+        with pytest.raises(ValueError, match="Unknown metric"):
+            compare_to_baseline(current, baseline, 10.0, metric="p99_s")
+
+    def test_incomparable_stages_never_regress(self):
+        baseline = _results(
+            skipped_now=[0.1],
+            skipped_before=StageResult.skipped("skipped_before", "missing dependency"),
+            variant=StageResult("variant", [0.1], params={"compile_pdf": True}),
+            removed=[0.1],
+        )
+        current = _results(
+            skipped_now=StageResult.skipped("skipped_now", "missing dependency"),
+            skipped_before=[5.0],
+            variant=StageResult("variant", [5.0], params={"compile_pdf": False}),
+            added=[5.0],
+        )
+
+        comparisons = {c.stage: c for c in compare_to_baseline(current, baseline, 10.0)}
+
+        assert not any(c.regressed for c in comparisons.values())
+        assert comparisons["skipped_now"].note == "skipped in this run"
+        assert comparisons["skipped_before"].note == "skipped in baseline"
+        assert comparisons["variant"].note == "stage parameters differ"
+        assert comparisons["added"].note == "not in baseline"
+        assert comparisons["removed"].note == "missing from this run"
+
+
+class TestRunner:
+    @pytest.fixture(autouse=True)
+    def _restore_env(self, monkeypatch):
+        # The runner points the replay provider at the corpus via environment variables
+        for name in ("LLM_REPLAY_DIR", "LLM_REPLAY_MODE", "LLM_REPLAY_LATENCY_SCALE"):
+            monkeypatch.setenv(name, "")
+
+    def _run(self, tmp_path, *extra):
+        return run_benchmarks.main(
+            [
+                "--only",
+                "schema_repair",
+                "--repeat",
+                "2",
+                "--warmup",
+                "0",
+                "--corpus",
+                str(tmp_path / "corpus"),
+                "--output",
+                str(tmp_path / "latest.json"),
+                *extra,
+            ]
+        )
+
+    def _baseline(self, tmp_path, p50_s):
+        results = _results(repair_schema_violations=[p50_s])
+        results["stages"]["repair_schema_violations"]["params"] = {
+            "publication_type": "interventional_trial"
+        }
+        return write_results(results, tmp_path / "baseline.json")
+
+    def test_writes_results(self, tmp_path):
+        assert self._run(tmp_path) == 0
+
+        stage = load_results(tmp_path / "latest.json")["stages"]["repair_schema_violations"]
+        assert stage["status"] == "ok"
+        assert stage["n"] == 2
+
+    def test_regression_fails(self, tmp_path):
+        baseline = self._baseline(tmp_path, 1e-9)
+
+        code = self._run(tmp_path, "--baseline", str(baseline), "--min-delta-ms", "0")
+
+        assert code == 1
+
+    def test_within_budget_passes(self, tmp_path):
+        baseline = self._baseline(tmp_path, 60.0)
+
+        assert self._run(tmp_path, "--baseline", str(baseline)) == 0
+
+    def test_update_baseline(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+
+        assert self._run(tmp_path, "--baseline", str(baseline), "--update-baseline") == 0
+        assert "repair_schema_violations" in load_results(baseline)["stages"]
+
+    def test_unreadable_baseline(self, tmp_path):
+        assert self._run(tmp_path, "--baseline", str(tmp_path / "missing.json")) == 2
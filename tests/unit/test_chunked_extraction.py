@@ -0,0 +1,242 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for page-chunked parallel extraction (src/pipeline/chunked_extraction.py)."""
+
+import threading
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.pipeline import chunked_extraction
+from src.pipeline.chunked_extraction import (
+    merge_extractions,
+    page_windows,
+    plan_chunks,
+    run_chunked_extraction,
+)
+from src.tracing import KIND_STEP, current_span, span, start_trace
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "metadata": {
+            "type": "object",
+            "properties": {"title": {"type": "string"}, "keywords": {"type": "array"}},
+        },
+        "outcomes": {"type": "array", "items": {"$ref": "#/$defs/Outcome"}},
+        "notes": {"type": "array", "items": {"type": "object"}},
+    },
+    "$defs": {
+        "Outcome": {
+            "type": "object",
+            "properties": {
+                "study_id": {"type": "string"},
+                "outcome_id": {"type": "string"},
+                "name": {"type": "string"},
+                "results": {"type": "array", "items": {"$ref": "#/$defs/Result"}},
+            },
+        },
+        "Result": {
+            "type": "object",
+            "properties": {"arm_id": {"type": "string"}, "n": {"type": "integer"}},
+        },
+    },
+}
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    def apply(**overrides):
+        monkeypatch.setattr(
+            chunked_extraction,
+            "llm_settings",
+            replace(chunked_extraction.llm_settings, **overrides),
+        )
+
+    return apply
+
+
+class TestPageWindows:
+    def test_overlapping_windows_cover_all_pages(self):
+        assert page_windows(40, 12, 2) == [(1, 12), (11, 22), (21, 32), (31, 40)]
+        assert page_windows(30, 12, 2) == [(1, 12), (11, 22), (21, 30)]
+
+    def test_short_document_is_one_window(self):
+        assert page_windows(10, 12, 2) == [(1, 10)]
+        assert page_windows(10, 0, 2) == [(1, 10)]
+        assert page_windows(0, 12, 2) == []
+
+    def test_overlap_never_stalls(self):
+        assert page_windows(5, 2, 5) == [(1, 2), (2, 3), (3, 4), (4, 5)]
+
+
+class TestPlanChunks:
+    def test_disabled_by_default(self, settings, monkeypatch):
+        settings(extraction_chunk_pages=0)
+        count = MagicMock()
+        monkeypatch.setattr(chunked_extraction, "count_pages", count)
+
+        assert plan_chunks(Path("paper.pdf"), None) == []
+        count.assert_not_called()
+
+    def test_windows_respect_max_pages(self, settings, monkeypatch):
+        settings(extraction_chunk_pages=10, extraction_chunk_overlap=1)
+        monkeypatch.setattr(chunked_extraction, "count_pages", lambda _: 50)
+
+        assert plan_chunks(Path("paper.pdf"), 25) == [(1, 10), (10, 19), (19, 25)]
+        assert plan_chunks(Path("paper.pdf"), 8) == []
+
+    def test_unknown_page_count_falls_back_to_single_call(self, settings, monkeypatch):
+        settings(extraction_chunk_pages=10)
+        monkeypatch.setattr(chunked_extraction, "count_pages", lambda _: None)
+
+        assert plan_chunks(Path("paper.pdf"), None) == []
+
+
+class TestMergeExtractions:
+    def test_arrays_merge_by_id_field(self):
+        first = {
+            "outcomes": [
+                {"outcome_id": "O1", "name": "Pain", "results": [{"arm_id": "A", "n": 10}]},
+            ]
+        }
+        second = {
+            "outcomes": [
+                {"outcome_id": "O1", "results": [{"arm_id": "B", "n": 12}]},
+                {"outcome_id": "O2", "name": "Nausea"},
+            ]
+        }
+
+        merged = merge_extractions([first, second], SCHEMA)
+
+        assert merged["outcomes"] == [
+            {
+                "outcome_id": "O1",
+                "name": "Pain",
+                "results": [{"arm_id": "A", "n": 10}, {"arm_id": "B", "n": 12}],
+            },
+            {"outcome_id": "O2", "name": "Nausea"},
+        ]
+
+    def test_earliest_scalar_wins_and_gaps_are_filled(self):
+        first = {"metadata": {"title": "Trial", "keywords": ["pain", "opioids"]}}
+        second = {"metadata": {"title": "Trial (continued)", "keywords": ["opioids", "PONV"]}}
+        third = {"metadata": {"title": None}, "outcomes": []}
+
+        merged = merge_extractions([third, first, second], SCHEMA)
+
+        assert merged["metadata"] == {"title": "Trial", "keywords": ["pain", "opioids", "PONV"]}
+
+    def test_items_without_id_are_deduplicated_by_content(self):
+        note = {"text": "Table 2 continues on next page"}
+
+        merged = merge_extractions(
+            [{"notes": [note]}, {"notes": [dict(note), {"text": "x"}]}], SCHEMA
+        )
+
+        assert merged["notes"] == [note, {"text": "x"}]
+
+    def test_usage_is_summed_and_metadata_kept(self):
+        parts = [
+            {
+                "a": 1,
+                "usage": {"input_tokens": 100, "output_tokens": 10},
+                "_metadata": {"model": "m"},
+            },
+            {
+                "a": 2,
+                "usage": {"input_tokens": 50, "output_tokens": 5},
+                "_metadata": {"model": "m"},
+            },
+        ]
+
+        merged = merge_extractions(parts, SCHEMA)
+
+        assert merged["a"] == 1
+        assert merged["usage"] == {"input_tokens": 150, "output_tokens": 15}
+        assert merged["_metadata"] == {"model": "m", "chunks": 2}
+
+
+class TestRunChunkedExtraction:
+    def test_windows_run_in_parallel_and_merge_in_page_order(self, settings, monkeypatch):
+        settings(max_concurrent_requests=4)
+        monkeypatch.setattr(
+            chunked_extraction,
+            "slice_pdf_pages",
+            lambda path, first, last, _: Path(f"slice-{first}-{last}.pdf"),
+        )
+        barrier = threading.Barrier(2, timeout=5)
+
+        def generate(pdf_path, context, **kwargs):
+            barrier.wait()  # both windows must be in flight at once
+            first = pdf_path.name.split("-")[1]
+            assert f"pages {first}-" in context
+            return {"metadata": {"title": f"from page {first}"}, "usage": {"total_tokens": 1}}
+
+        llm = MagicMock()
+        llm.generate_json_with_pdf.side_effect = generate
+
+        merged = run_chunked_extraction(
+            llm, Path("paper.pdf"), [(1, 10), (10, 19)], SCHEMA, "prompt", "x_extraction", None
+        )
+
+        assert merged["metadata"]["title"] == "from page 1"
+        assert merged["usage"] == {"total_tokens": 2}
+        assert llm.generate_json_with_pdf.call_count == 2
+
+    def test_windows_see_the_callers_span(self, settings, monkeypatch):
+        settings(max_concurrent_requests=4)
+        monkeypatch.setattr(
+            chunked_extraction, "slice_pdf_pages", lambda path, first, last, _: Path(path)
+        )
+        parents = []
+        llm = MagicMock()
+        llm.generate_json_with_pdf.side_effect = lambda *args, **kwargs: (
+            parents.append(current_span()) or {}
+        )
+
+        with start_trace("run"):
+            with span("extraction", KIND_STEP) as step:
+                run_chunked_extraction(
+                    llm, Path("paper.pdf"), [(1, 10), (10, 19)], SCHEMA, "p", "x", None
+                )
+
+        assert parents == [step, step]
+
+
+class TestExtractionStep:
+    def test_step_uses_chunks_for_long_pdfs(self, monkeypatch, tmp_path):
+        from src.pipeline.steps import extraction
+
+        monkeypatch.setattr(extraction, "plan_chunks", lambda *_: [(1, 10), (10, 15)])
+        chunked = MagicMock(return_value={"outcomes": [], "_metadata": {"model": "m"}})
+        monkeypatch.setattr(extraction, "run_chunked_extraction", chunked)
+        monkeypatch.setattr(extraction, "load_extraction_prompt", lambda _: "prompt")
+        monkeypatch.setattr(extraction, "load_schema", lambda _: SCHEMA)
+        monkeypatch.setattr(
+            extraction,
+            "validate_schema_compatibility",
+            lambda _: {"warnings": [], "estimated_tokens": 1},
+        )
+        file_manager = MagicMock()
+        file_manager.save_json.return_value = tmp_path / "extraction.json"
+        llm = MagicMock()
+
+        result = extraction.run_extraction_step(
+            tmp_path / "paper.pdf",
+            None,
+            {"publication_type": "interventional_trial"},
+            llm,
+            file_manager,
+            None,
+        )
+
+        llm.generate_json_with_pdf.assert_not_called()
+        assert chunked.call_args.args[2] == [(1, 10), (10, 15)]
+        assert result["_pipeline_metadata"]["page_windows"] == [[1, 10], [10, 15]]
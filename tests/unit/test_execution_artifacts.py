@@ -72,7 +72,7 @@ def test_display_report_artifacts_no_files_shows_info(monkeypatch, tmp_path):
     monkeypatch.setattr(artifacts, "st", stub)
 
     class FakeFM:
-        def __init__(self, pdf):
+        def __init__(self, pdf, run_id=None):
             self.identifier = pdf.stem
             self.tmp_dir = tmp_path / "tmp"
             self.tmp_dir.mkdir(exist_ok=True)
@@ -7,12 +7,17 @@ Unit tests for figure generation (Phase 5).
 """
 
 import importlib.util
+from dataclasses import replace
+from pathlib import Path
 
 import pytest
 
+from src.rendering import figure_generator
 from src.rendering.figure_generator import (
     FigureGenerationError,
+    figure_cache_key,
     generate_figure,
+    generate_figures,
 )
 
 # Skip tests that require matplotlib if it's not installed
@@ -272,3 +277,131 @@ class TestFigureGenerationError:
         """Test that the exception can be raised with a custom message."""
         with pytest.raises(FigureGenerationError, match="Custom error message"):
             raise FigureGenerationError("Custom error message")
+
+
+def _rob_block(label, judgement="Low"):
+    return {
+        "type": "figure",
+        "figure_kind": "rob_traffic_light",
+        "label": label,
+        "data": {"domains": ["Randomization"], "judgements": [judgement]},
+    }
+
+
+def _use_settings(monkeypatch, **overrides):
+    monkeypatch.setattr(
+        figure_generator,
+        "llm_settings",
+        replace(figure_generator.llm_settings, **overrides),
+    )
+
+
+class TestFigureCacheKey:
+    def test_key_depends_on_kind_data_and_style_version(self, monkeypatch):
+        key = figure_cache_key(_rob_block("a"))
+
+        assert figure_cache_key(_rob_block("b")) == key  # label is not part of the content
+        assert figure_cache_key(_rob_block("a", "High")) != key
+        assert figure_cache_key({**_rob_block("a"), "figure_kind": "forest"}) != key
+        monkeypatch.setattr(figure_generator, "FIGURE_STYLE_VERSION", 2)
+        assert figure_cache_key(_rob_block("a")) != key
+
+
+@requires_matplotlib
+class TestFigureCache:
+    def test_cached_figure_is_copied_not_redrawn(self, monkeypatch, tmp_path):
+        renders = []
+        render = figure_generator._render
+        monkeypatch.setattr(
+            figure_generator, "_render", lambda *args: renders.append(args) or render(*args)
+        )
+
+        first = generate_figure(_rob_block("fig_rob"), tmp_path / "run1")
+        second = generate_figure(_rob_block("fig_rob"), tmp_path / "run2")
+
+        assert len(renders) == 1
+        assert first.read_bytes() == second.read_bytes()
+        assert second == tmp_path / "run2" / "fig_rob.png"
+
+    def test_without_cache_every_figure_is_drawn(self, monkeypatch, tmp_path):
+        _use_settings(monkeypatch, figure_cache_dir="")
+        renders = []
+        render = figure_generator._render
+        monkeypatch.setattr(
+            figure_generator, "_render", lambda *args: renders.append(args) or render(*args)
+        )
+
+        results = generate_figures([_rob_block("a"), _rob_block("b")], tmp_path)
+
+        assert results == [tmp_path / "a.png", tmp_path / "b.png"]
+        assert len(renders) == 2
+
+    def test_failed_render_without_cache_leaves_no_temp_file(self, monkeypatch, tmp_path):
+        _use_settings(monkeypatch, figure_cache_dir="")
+        temp_dir = tmp_path / "temp"
+        temp_dir.mkdir()
+        monkeypatch.setattr(figure_generator.tempfile, "tempdir", str(temp_dir))
+
+        def broken(data, path):
+            raise ValueError("bad data")
+
+        monkeypatch.setitem(figure_generator._RENDERERS, "rob_traffic_light", broken)
+
+        with pytest.raises(ValueError, match="bad data"):
+            generate_figure(_rob_block("a"), tmp_path / "out")
+        assert list(temp_dir.iterdir()) == []
+
+
+@requires_matplotlib
+class TestGenerateFigures:
+    def test_misses_render_in_process_pool(self, monkeypatch, tmp_path):
+        _use_settings(monkeypatch, figure_workers=2)
+        blocks = [_rob_block("fig_low"), _rob_block("fig_high", "High"), _rob_block("fig_dup")]
+
+        results = generate_figures(blocks, tmp_path)
+
+        assert results == [
+            tmp_path / "fig_low.png",
+            tmp_path / "fig_high.png",
+            tmp_path / "fig_dup.png",
+        ]
+        assert results[0].read_bytes() == results[2].read_bytes()
+        assert results[0].read_bytes() != results[1].read_bytes()
+        cache_dir = Path(figure_generator.llm_settings.figure_cache_dir)
+        assert len(list(cache_dir.glob("*.png"))) == 2
+
+    def test_failures_are_returned_per_block(self, tmp_path):
+        results = generate_figures(
+            [{"figure_kind": "unknown", "label": "bad"}, _rob_block("good")], tmp_path
+        )
+
+        assert isinstance(results[0], FigureGenerationError)
+        assert results[1] == tmp_path / "good.png"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_renderer_exception_is_returned_per_block(self, monkeypatch, tmp_path, workers):
+        _use_settings(monkeypatch, figure_workers=workers)
+        malformed = {
+            "figure_kind": "forest",
+            "label": "bad",
+            "data": {"outcomes": [{"name": "Mortality", "effect": 0.8, "ci": None}]},
+        }
+
+        results = generate_figures([malformed, _rob_block("good")], tmp_path)
+
+        assert isinstance(results[0], FigureGenerationError)
+        assert "Failed to render forest" in str(results[0])
+        assert results[1] == tmp_path / "good.png"
+        assert results[1].exists()
+
+    def test_pool_failure_falls_back_to_serial(self, monkeypatch, tmp_path):
+        _use_settings(monkeypatch, figure_workers=4)
+
+        def broken_pool(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        monkeypatch.setattr(figure_generator, "_render_in_pool", broken_pool)
+
+        results = generate_figures([_rob_block("a"), _rob_block("b", "High")], tmp_path)
+
+        assert all(path.exists() for path in results)
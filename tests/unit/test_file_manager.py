@@ -206,3 +206,79 @@ class TestPipelineFileManager:
         assert loaded == data
         assert loaded["quality_score"] == 0.95
         assert loaded["nested"]["field"] == "value"
+
+
+class TestRunIsolation:
+    """Test artifact root, isolated run directories and atomic writes."""
+
+    def test_artifact_root_used_for_shared_runs(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 a")
+
+        root = tmp_path / "artifacts"
+        manager = PipelineFileManager(pdf_path, artifact_root=root, isolated=False)
+
+        assert manager.run_id is None
+        assert manager.tmp_dir == root
+        assert manager.tmp_dir.is_dir()
+
+    def test_isolated_runs_do_not_share_files(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 a")
+
+        first = PipelineFileManager(pdf_path, artifact_root=tmp_path, isolated=True)
+        second = PipelineFileManager(pdf_path, artifact_root=tmp_path, isolated=True)
+        first.save_json({"run": 1}, "classification")
+        second.save_json({"run": 2}, "classification")
+
+        assert first.run_id != second.run_id
+        assert first.load_json("classification") == {"run": 1}
+        assert second.load_json("classification") == {"run": 2}
+
+    def test_same_stem_different_content_gets_own_directory(self, tmp_path):
+        a = tmp_path / "a" / "paper.pdf"
+        b = tmp_path / "b" / "paper.pdf"
+        for path, content in ((a, b"%PDF-1.4 a"), (b, b"%PDF-1.4 b")):
+            path.parent.mkdir()
+            path.write_bytes(content)
+
+        first = PipelineFileManager(a, artifact_root=tmp_path, run_id="run-1")
+        second = PipelineFileManager(b, artifact_root=tmp_path, run_id="run-1")
+
+        assert first.tmp_dir != second.tmp_dir
+        assert first.tmp_dir.parent.name.startswith("paper-")
+        assert first.tmp_dir.name == "run-1"
+
+    def test_run_id_reopens_existing_run(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 a")
+
+        PipelineFileManager(pdf_path, artifact_root=tmp_path, isolated=True)
+        first = PipelineFileManager(pdf_path, artifact_root=tmp_path, run_id="run-1")
+        first.save_json({"done": True}, "extraction", status="best")
+        reopened = PipelineFileManager(pdf_path, artifact_root=tmp_path, run_id="run-1")
+
+        assert reopened.load_json("extraction", status="best") == {"done": True}
+
+    def test_save_json_leaves_no_temp_files(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 a")
+        manager = PipelineFileManager(pdf_path, artifact_root=tmp_path / "out", isolated=False)
+
+        manager.save_json({"a": 1}, "classification")
+        manager.save_json({"a": 2}, "classification")
+
+        assert [p.name for p in manager.tmp_dir.iterdir()] == ["paper-classification.json"]
+        assert manager.load_json("classification") == {"a": 2}
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 a")
+        manager = PipelineFileManager(pdf_path, artifact_root=tmp_path / "out", isolated=False)
+        manager.save_json({"a": 1}, "classification")
+
+        with pytest.raises(TypeError):
+            manager.save_json({"a": object()}, "classification")
+
+        assert manager.load_json("classification") == {"a": 1}
+        assert len(list(manager.tmp_dir.iterdir())) == 1
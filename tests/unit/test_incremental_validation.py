@@ -0,0 +1,188 @@
+"""
+Unit tests for src/pipeline/incremental_validation.py and incremental run_dual_validation.
+
+Covers section diffing, issue attribution, when incremental validation applies,
+merging cached and partial verdicts, and that run_dual_validation only sends
+changed sections to the LLM when given a ValidationCache.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from rich.console import Console
+
+from src.pipeline.incremental_validation import (
+    ValidationCache,
+    changed_sections,
+    issue_section,
+    merge_section_validation,
+    plan_incremental,
+)
+from src.pipeline.validation_runner import run_dual_validation
+
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "metadata": {"title": "Trial"},
+    "population": {"n": 100},
+    "outcomes": [{"name": "death"}],
+    "results": {"hr": 0.8},
+}
+
+
+def _issue(path, severity="moderate", issue_id="I001"):
+    return {
+        "issue_id": issue_id,
+        "type": "accuracy_error",
+        "severity": severity,
+        "category": "other",
+        "field_path": path,
+        "description": f"Problem at {path}",
+    }
+
+
+def _verdict(issues, completeness=0.8, accuracy=0.8, status="warning"):
+    return {
+        "verification_summary": {
+            "overall_status": status,
+            "completeness_score": completeness,
+            "accuracy_score": accuracy,
+            "schema_compliance_score": 1.0,
+            "total_issues": len(issues),
+            "critical_issues": sum(i["severity"] == "critical" for i in issues),
+        },
+        "issues": issues,
+        "field_validation": {"required_fields_complete": True},
+        "completeness_analysis": {"outcomes_captured": "1/2"},
+        "recommendations": ["Check results"],
+    }
+
+
+class TestDiffing:
+    def test_changed_sections(self):
+        current = {**EXTRACTION, "results": {"hr": 0.7}, "figures": [], "_metadata": {"x": 1}}
+        del current["population"]
+
+        assert changed_sections(EXTRACTION, current) == ["figures", "population", "results"]
+        assert changed_sections(EXTRACTION, {**EXTRACTION, "correction_notes": "x"}) == []
+
+    @pytest.mark.parametrize(
+        "path, section",
+        [
+            ("outcomes[0].name", "outcomes"),
+            ("/results/hr", "results"),
+            ("$.metadata.title", "metadata"),
+            ("", None),
+        ],
+    )
+    def test_issue_section(self, path, section):
+        assert issue_section({"field_path": path}) == section
+
+
+class TestPlanning:
+    def test_no_cache_or_baseline_means_full(self):
+        assert plan_incremental(None, EXTRACTION) is None
+        assert plan_incremental(ValidationCache(), EXTRACTION) is None
+
+    def test_picks_closest_baseline(self):
+        cache = ValidationCache()
+        cache.store(EXTRACTION, _verdict([_issue("results.hr")]))
+        cache.store({**EXTRACTION, "metadata": {"title": "Other"}}, _verdict([]))
+
+        verdict, changed = plan_incremental(cache, {**EXTRACTION, "results": {"hr": 0.7}})
+
+        assert changed == ["results"]
+        assert verdict["issues"][0]["field_path"] == "results.hr"
+        assert plan_incremental(cache, dict(EXTRACTION))[1] == []
+
+    def test_large_or_unattributable_changes_need_full_validation(self):
+        cache = ValidationCache()
+        cache.store(EXTRACTION, _verdict([]))
+        changed_most = {**EXTRACTION, "population": {}, "outcomes": [], "results": {}}
+        assert plan_incremental(cache, changed_most) is None
+
+        cache = ValidationCache()
+        cache.store(EXTRACTION, _verdict([_issue("")]))
+        assert plan_incremental(cache, {**EXTRACTION, "results": {}}) is None
+
+    def test_cache_is_bounded(self):
+        cache = ValidationCache(max_entries=2)
+        for n in range(3):
+            cache.store({**EXTRACTION, "results": {"hr": n}}, _verdict([]))
+
+        assert len(cache) == 2
+
+
+class TestMerge:
+    def test_merge_replaces_changed_section_issues_and_blends_scores(self):
+        cached = _verdict(
+            [_issue("results.hr", "critical"), _issue("outcomes[0]", issue_id="I002")],
+            completeness=0.6,
+            accuracy=0.6,
+            status="failed",
+        )
+        partial = _verdict([], completeness=1.0, accuracy=1.0, status="passed")
+        partial["_metadata"] = {"model": "gpt-5.1"}
+
+        merged = merge_section_validation(cached, partial, EXTRACTION, ["results"])
+
+        assert [i["field_path"] for i in merged["issues"]] == ["outcomes[0]"]
+        assert merged["issues"][0]["issue_id"] == "I001"
+        summary = merged["verification_summary"]
+        assert (summary["critical_issues"], summary["total_issues"]) == (0, 1)
+        assert summary["overall_status"] == "warning"
+        assert 0.6 < summary["completeness_score"] < 1.0
+        assert merged["_metadata"] == {"model": "gpt-5.1"}
+        assert merged["verification_metadata"]["incremental"]["validated_sections"] == ["results"]
+
+
+class TestIncrementalDualValidation:
+    @pytest.fixture(autouse=True)
+    def _schema_ok(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.pipeline.validation_runner.validate_extraction_quality",
+            lambda data, schema, strict: {"quality_score": 1.0, "schema_compliant": True},
+        )
+
+    def _validate(self, extraction, llm, cache):
+        return run_dual_validation(
+            extraction_result=extraction,
+            pdf_path=MagicMock(),
+            max_pages=None,
+            publication_type="interventional_trial",
+            llm=llm,
+            console=Console(quiet=True),
+            cache=cache,
+        )
+
+    def test_only_changed_sections_are_sent(self):
+        llm = MagicMock()
+        llm.generate_json_with_pdf.side_effect = [
+            _verdict([_issue("results.hr", "critical")], status="failed"),
+            _verdict([], completeness=1.0, accuracy=1.0, status="passed"),
+        ]
+        cache = ValidationCache()
+
+        first = self._validate(EXTRACTION, llm, cache)
+        second = self._validate({**EXTRACTION, "results": {"hr": 0.75}}, llm, cache)
+        third = self._validate({**EXTRACTION, "results": {"hr": 0.75}}, llm, cache)
+
+        assert first["verification_summary"]["critical_issues"] == 1
+        assert second["verification_summary"]["critical_issues"] == 0
+        assert second["schema_validation"]["quality_score"] == 1.0
+        partial_context = llm.generate_json_with_pdf.call_args_list[1].kwargs["context"]
+        assert '"hr":0.75' in partial_context
+        assert '"population"' not in partial_context
+        assert "PARTIAL RE-VALIDATION" in partial_context
+        assert llm.generate_json_with_pdf.call_count == 2
+        assert third["issues"] == second["issues"]
+
+    def test_without_cache_every_call_is_full(self):
+        llm = MagicMock()
+        llm.generate_json_with_pdf.return_value = _verdict([])
+
+        self._validate(EXTRACTION, llm, None)
+        self._validate(EXTRACTION, llm, None)
+
+        assert llm.generate_json_with_pdf.call_count == 2
+        assert '"population"' in llm.generate_json_with_pdf.call_args.kwargs["context"]
@@ -0,0 +1,225 @@
+"""
+Unit tests for src/pipeline/json_patch.py and patch-mode correction steps.
+
+Covers the RFC 6902 operations, JSON Pointer escaping and array append, atomic
+failure, the per-operation schema guard, and the appraisal correction step in
+patch mode including its fallback to full-document regeneration.
+"""
+
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import pytest
+
+import src.config
+from src.pipeline.json_patch import (
+    PATCH_RESPONSE_SCHEMA,
+    JsonPatchError,
+    apply_json_patch,
+    apply_patch_with_schema_guard,
+    correct_with_patch,
+    parse_pointer,
+)
+from src.pipeline.steps.appraisal import run_appraisal_correction_step
+from src.validation import validate_instance
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "sample_size": {"type": "integer", "minimum": 1},
+        "outcomes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "effect": {"type": "number"}},
+                "required": ["name", "effect"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["title", "outcomes"],
+    "additionalProperties": False,
+}
+
+
+def _document():
+    return {"title": "Trial", "sample_size": 10, "outcomes": [{"name": "death", "effect": 0.8}]}
+
+
+class TestApplyJsonPatch:
+    def test_all_operations(self):
+        document = {"a": {"b": 1}, "list": [1, 2, 3]}
+
+        patched = apply_json_patch(
+            document,
+            [
+                {"op": "add", "path": "/a/c", "value": 2},
+                {"op": "replace", "path": "/a/b", "value": 10},
+                {"op": "remove", "path": "/list/0"},
+                {"op": "add", "path": "/list/-", "value": 4},
+                {"op": "add", "path": "/list/0", "value": 0},
+                {"op": "copy", "from": "/a", "path": "/copied"},
+                {"op": "move", "from": "/copied/c", "path": "/moved"},
+                {"op": "test", "path": "/list", "value": [0, 2, 3, 4]},
+            ],
+        )
+
+        assert patched == {
+            "a": {"b": 10, "c": 2},
+            "list": [0, 2, 3, 4],
+            "copied": {"b": 10},
+            "moved": 2,
+        }
+        assert document == {"a": {"b": 1}, "list": [1, 2, 3]}
+
+    def test_pointer_escaping(self):
+        assert parse_pointer("") == []
+        assert parse_pointer("/a~1b/c~0d/~01") == ["a/b", "c~d", "~1"]
+
+        patched = apply_json_patch({"a/b": 1, "m~n": 2}, [{"op": "remove", "path": "/a~1b"}])
+        assert patched == {"m~n": 2}
+        with pytest.raises(JsonPatchError, match="must start with"):
+            parse_pointer("a/b")
+
+    def test_patch_is_atomic(self):
+        document = {"a": 1}
+
+        with pytest.raises(JsonPatchError, match="does not exist"):
+            apply_json_patch(
+                document,
+                [{"op": "replace", "path": "/a", "value": 2}, {"op": "remove", "path": "/b"}],
+            )
+        assert document == {"a": 1}
+
+    @pytest.mark.parametrize(
+        "operation, match",
+        [
+            ({"op": "test", "path": "/list/0", "value": 9}, "Test failed"),
+            ({"op": "add", "path": "/list/5", "value": 9}, "out of range"),
+            ({"op": "add", "path": "/list/01", "value": 9}, "Invalid array index"),
+            ({"op": "replace", "path": "/list"}, "missing 'value'"),
+            ({"op": "move", "from": "/obj", "path": "/obj/inner"}, "own child"),
+            ({"op": "upsert", "path": "/obj", "value": 1}, "Unknown patch operation"),
+        ],
+    )
+    def test_invalid_operations(self, operation, match):
+        with pytest.raises(JsonPatchError, match=match):
+            apply_json_patch({"list": [1], "obj": {}}, [operation])
+
+
+class TestSchemaGuard:
+    def test_rejects_only_operations_that_break_the_schema(self):
+        result = apply_patch_with_schema_guard(
+            _document(),
+            [
+                {"op": "replace", "path": "/sample_size", "value": 0},
+                {"op": "add", "path": "/outcomes/-", "value": {"name": "stroke"}},
+                {"op": "remove", "path": "/missing"},
+                {"op": "replace", "path": "/title", "value": "Corrected trial"},
+            ],
+            SCHEMA,
+        )
+
+        assert result.document["title"] == "Corrected trial"
+        assert result.document["sample_size"] == 10
+        assert len(result.document["outcomes"]) == 1
+        assert [op["path"] for op in result.applied] == ["/title"]
+        assert len(result.rejected) == 3
+        assert result.summary()["patch_operations_rejected"] == 3
+
+    def test_existing_errors_do_not_block_fixes(self):
+        document = _document()
+        document["sample_size"] = 0
+        document["outcomes"][0]["extra"] = True
+
+        result = apply_patch_with_schema_guard(
+            document,
+            [
+                {"op": "replace", "path": "/title", "value": "Still invalid elsewhere"},
+                {"op": "remove", "path": "/outcomes/0/extra"},
+                {"op": "replace", "path": "/sample_size", "value": 120},
+            ],
+            SCHEMA,
+        )
+
+        assert len(result.applied) == 3
+        validate_instance(result.document, SCHEMA)
+
+    def test_correct_with_patch_attaches_response_metadata(self):
+        response = {
+            "operations": [{"op": "replace", "path": "/sample_size", "value": 12}],
+            "correction_notes": "Fixed sample size",
+        }
+        validate_instance(response, PATCH_RESPONSE_SCHEMA)
+        response["_metadata"] = {"model": "gpt-5.1"}
+
+        corrected, result = correct_with_patch(_document(), SCHEMA, lambda schema: response)
+
+        assert corrected["sample_size"] == 12
+        assert corrected["correction_notes"] == "Fixed sample size"
+        assert corrected["_metadata"] == {"model": "gpt-5.1"}
+        assert len(result.applied) == 1
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"operations": [], "correction_notes": ""},
+            {"operations": [{"op": "remove", "path": "/title"}], "correction_notes": "x"},
+            {"corrected": True},
+        ],
+    )
+    def test_unusable_patch_returns_none(self, response):
+        assert correct_with_patch(_document(), SCHEMA, lambda schema: response) is None
+
+
+class TestPatchCorrectionStep:
+    @pytest.fixture
+    def patch_mode(self, monkeypatch):
+        monkeypatch.setattr(
+            src.config, "llm_settings", replace(src.config.llm_settings, correction_mode="patch")
+        )
+        monkeypatch.setattr("src.pipeline.steps.appraisal.load_schema", lambda name: SCHEMA)
+
+    def _run(self, llm):
+        return run_appraisal_correction_step(
+            appraisal_result={**_document(), "_metadata": {"model": "old"}},
+            validation_result={"validation_summary": {"overall_status": "needs_correction"}},
+            extraction_result={},
+            llm=llm,
+            file_manager=MagicMock(),
+            progress_callback=None,
+        )
+
+    def test_applies_patch_instead_of_regenerating(self, patch_mode):
+        llm = MagicMock()
+        llm.generate_json_with_schema.return_value = {
+            "operations": [{"op": "replace", "path": "/outcomes/0/effect", "value": 0.75}],
+            "correction_notes": "Corrected hazard ratio",
+        }
+
+        corrected = self._run(llm)
+
+        assert corrected["outcomes"][0]["effect"] == 0.75
+        assert corrected["_pipeline_metadata"]["correction_mode"] == "patch"
+        assert corrected["_pipeline_metadata"]["patch_operations_applied"] == 1
+        (call,) = llm.generate_json_with_schema.call_args_list
+        assert call.kwargs["schema"] is PATCH_RESPONSE_SCHEMA
+        assert call.kwargs["schema_name"] == "appraisal_correction_patch"
+        assert "JSON PATCH" in call.kwargs["system_prompt"]
+
+    def test_falls_back_to_full_regeneration(self, patch_mode):
+        llm = MagicMock()
+        llm.generate_json_with_schema.side_effect = [
+            {"operations": [{"op": "remove", "path": "/outcomes"}], "correction_notes": "x"},
+            {**_document(), "title": "Regenerated"},
+        ]
+
+        corrected = self._run(llm)
+
+        assert corrected["title"] == "Regenerated"
+        assert "correction_mode" not in corrected["_pipeline_metadata"]
+        schemas = [call.kwargs["schema"] for call in llm.generate_json_with_schema.call_args_list]
+        assert schemas == [PATCH_RESPONSE_SCHEMA, SCHEMA]
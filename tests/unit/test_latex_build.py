@@ -0,0 +1,194 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for the LaTeX build cache (src/rendering/latex_build.py) and batch rendering."""
+
+import subprocess
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.rendering import latex_build, latex_renderer
+from src.rendering.latex_build import (
+    FORMAT_PREAMBLE_MARKER,
+    PREAMBLE_INPUT,
+    ensure_format,
+    sync_template_files,
+)
+from src.rendering.latex_renderer import (
+    LatexRenderError,
+    render_report_to_pdf,
+    render_reports_to_pdf,
+)
+
+pytestmark = pytest.mark.unit
+
+TEMPLATE_DIR = Path(latex_renderer.__file__).parent.parent.parent / "templates" / "latex" / "vetrix"
+
+
+def _report(title: str) -> dict:
+    return {
+        "metadata": {"title": title},
+        "sections": [
+            {
+                "title": "Summary",
+                "blocks": [{"type": "text", "style": "paragraph", "content": ["Hello"]}],
+            }
+        ],
+    }
+
+
+class FakeEngine:
+    """Stands in for xelatex: builds formats, writes PDFs and aux files, records calls."""
+
+    def __init__(self):
+        self.calls: list[tuple[list[str], str]] = []
+        self.had_aux: list[bool] = []
+        self.format_builds_fail = False
+        self.format_loads_fail = False
+
+    def __call__(self, cmd, cwd=None, check=False, **kwargs):
+        cwd = Path(cwd) if cwd else Path.cwd()
+        tex = (cwd / cmd[-1]).read_text(encoding="utf-8")
+        self.calls.append((cmd, tex))
+        if "-ini" in cmd:
+            if self.format_builds_fail:
+                return subprocess.CompletedProcess(cmd, 1, stdout=b"! LaTeX Error", stderr=b"")
+            jobname = next(arg for arg in cmd if arg.startswith("-jobname="))[9:]
+            (cwd / f"{jobname}.fmt").write_bytes(b"format")
+            return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+        if self.format_loads_fail and any(arg.startswith("-fmt=") for arg in cmd):
+            raise subprocess.CalledProcessError(1, cmd, output=b"", stderr=b"bad format")
+        if "FAIL" in tex:
+            raise subprocess.CalledProcessError(1, cmd, output=b"", stderr=b"! Undefined")
+        stem = Path(cmd[-1]).stem
+        self.had_aux.append((cwd / f"{stem}.aux").exists())
+        (cwd / f"{stem}.pdf").write_bytes(b"%PDF")
+        (cwd / f"{stem}.aux").write_text("\\relax", encoding="utf-8")
+        return subprocess.CompletedProcess(cmd, 0, stdout=b"", stderr=b"")
+
+    def compiles(self):
+        return [(cmd, tex) for cmd, tex in self.calls if "-ini" not in cmd]
+
+    def format_builds(self):
+        return [cmd for cmd, _ in self.calls if "-ini" in cmd]
+
+
+@pytest.fixture
+def fake_engine(monkeypatch):
+    engine = FakeEngine()
+    monkeypatch.setattr(subprocess, "run", engine)
+    monkeypatch.setattr(latex_renderer.shutil, "which", lambda name: f"/usr/bin/{name}")
+    return engine
+
+
+class TestSyncTemplateFiles:
+    def test_copies_only_missing_or_changed_files(self, tmp_path):
+        template = tmp_path / "template"
+        template.mkdir()
+        (template / "main.tex").write_text("main")
+        (template / "preamble.tex").write_text("preamble")
+        (template / "sections.tex").write_text("sections")
+        out = tmp_path / "out"
+        out.mkdir()
+
+        assert sorted(sync_template_files(template, out, skip=("main.tex",))) == [
+            "preamble.tex",
+            "sections.tex",
+        ]
+        assert not (out / "main.tex").exists()
+        assert sync_template_files(template, out, skip=("main.tex",)) == []
+
+        (template / "sections.tex").write_text("sections, edited")
+        assert sync_template_files(template, out, skip=("main.tex",)) == ["sections.tex"]
+        assert (out / "sections.tex").read_text() == "sections, edited"
+
+
+class TestPreambleFormat:
+    def test_format_is_built_once_and_reused(self, fake_engine):
+        first = ensure_format(TEMPLATE_DIR, "xelatex")
+        second = ensure_format(TEMPLATE_DIR, "xelatex")
+
+        assert first is not None and first.exists()
+        assert second == first
+        assert len(fake_engine.format_builds()) == 1
+
+    def test_failed_build_is_remembered(self, fake_engine):
+        fake_engine.format_builds_fail = True
+
+        assert ensure_format(TEMPLATE_DIR, "xelatex") is None
+        assert ensure_format(TEMPLATE_DIR, "xelatex") is None
+        assert len(fake_engine.format_builds()) == 1
+
+    def test_disabled_or_unsupported(self, fake_engine, monkeypatch):
+        assert ensure_format(TEMPLATE_DIR, "lualatex") is None
+        monkeypatch.setattr(
+            latex_build, "llm_settings", replace(latex_build.llm_settings, latex_build_dir="")
+        )
+        assert ensure_format(TEMPLATE_DIR, "xelatex") is None
+        assert fake_engine.format_builds() == []
+
+
+class TestCompile:
+    def test_compiles_with_format_and_keeps_standalone_tex(self, fake_engine, tmp_path):
+        result = render_report_to_pdf(_report("A"), tmp_path / "a", enable_figures=False)
+
+        cmd, compiled_tex = fake_engine.compiles()[0]
+        assert "-fmt=preamble" in cmd
+        assert compiled_tex.startswith(FORMAT_PREAMBLE_MARKER)
+        assert (tmp_path / "a" / "preamble.fmt").exists()
+        assert result["pdf"].exists()
+        # The .tex left behind still compiles without the format
+        assert result["tex"].read_text().startswith(PREAMBLE_INPUT)
+
+    def test_falls_back_when_format_does_not_load(self, fake_engine, tmp_path):
+        fake_engine.format_loads_fail = True
+
+        render_report_to_pdf(_report("A"), tmp_path / "a", enable_figures=False)
+        render_report_to_pdf(_report("A"), tmp_path / "b", enable_figures=False)
+
+        commands = [cmd for cmd, _ in fake_engine.compiles()]
+        assert ["-fmt=preamble" in cmd for cmd in commands] == [True, False, False]
+
+    def test_aux_files_carry_over_to_the_next_render(self, fake_engine, tmp_path):
+        render_report_to_pdf(_report("A"), tmp_path / "first", enable_figures=False)
+        render_report_to_pdf(_report("A"), tmp_path / "second", enable_figures=False)
+        render_report_to_pdf(_report("B"), tmp_path / "other", enable_figures=False)
+
+        assert fake_engine.had_aux == [False, True, False]
+
+    def test_compile_error_raises(self, fake_engine, tmp_path):
+        report = _report("A")
+        report["sections"][0]["blocks"][0]["content"] = ["FAIL"]
+
+        with pytest.raises(LatexRenderError, match="Undefined"):
+            render_report_to_pdf(report, tmp_path / "a", enable_figures=False)
+
+
+class TestBatch:
+    def test_renders_all_reports_and_isolates_failures(self, fake_engine, tmp_path):
+        reports = [_report(f"R{i}") for i in range(4)]
+        reports[2]["sections"][0]["blocks"][0]["content"] = ["FAIL"]
+        jobs = [(report, tmp_path / f"r{i}") for i, report in enumerate(reports)]
+
+        results = render_reports_to_pdf(jobs, enable_figures=False, workers=3)
+
+        assert isinstance(results[2], LatexRenderError)
+        for i in (0, 1, 3):
+            assert results[i]["pdf"] == tmp_path / f"r{i}" / "report.pdf"
+            assert results[i]["pdf"].exists()
+        assert len(fake_engine.format_builds()) == 1
+
+    def test_without_compile_only_writes_tex(self, fake_engine, tmp_path):
+        results = render_reports_to_pdf(
+            [(_report("A"), tmp_path / "a")], compile_pdf=False, enable_figures=False
+        )
+
+        assert results == [{"tex": tmp_path / "a" / "report.tex"}]
+        assert fake_engine.calls == []
+
+    def test_rejects_unknown_engine(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid LaTeX engine"):
+            render_reports_to_pdf([(_report("A"), tmp_path)], engine="tex; rm -rf /")
@@ -0,0 +1,81 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for deferred imports (src/lazy_import.py) and the import-time benchmark."""
+
+import sys
+import types
+
+import pytest
+
+from benchmarks.import_time import deferred_modules_loaded, measure_import
+from src.lazy_import import LazyModule, is_available, is_loaded, lazy_import
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    module = types.ModuleType("fake_heavy_sdk")
+    module.Client = object
+    calls = []
+
+    def import_module(name):
+        calls.append(name)
+        return module
+
+    monkeypatch.setattr("src.lazy_import.importlib.import_module", import_module)
+    return module, calls
+
+
+class TestLazyModule:
+    def test_imports_on_first_attribute_access_only(self, fake_module):
+        module, calls = fake_module
+
+        proxy = lazy_import("fake_heavy_sdk")
+        assert isinstance(proxy, types.ModuleType)
+        assert not is_loaded(proxy)
+        assert calls == []
+
+        assert proxy.Client is object
+        assert proxy.Client is object
+        assert calls == ["fake_heavy_sdk"]
+        assert is_loaded(proxy)
+
+    def test_writes_go_to_the_real_module(self, fake_module, monkeypatch):
+        module, _ = fake_module
+        proxy = lazy_import("fake_heavy_sdk")
+
+        monkeypatch.setattr(proxy, "Client", int)
+        assert module.Client is int
+        monkeypatch.undo()
+        assert module.Client is object
+
+    def test_missing_module_raises_on_use(self):
+        proxy = LazyModule("definitely_not_an_installed_module")
+
+        with pytest.raises(ImportError):
+            _ = proxy.anything
+        assert not is_available("definitely_not_an_installed_module")
+        assert is_available("json")
+
+    def test_regular_modules_count_as_loaded(self):
+        assert is_loaded(sys)
+
+
+class TestColdImports:
+    @pytest.mark.parametrize("module", ["src.pipeline", "src.pipeline.orchestrator"])
+    def test_entry_points_defer_heavy_dependencies(self, module):
+        seconds, loaded = measure_import(module)
+
+        assert seconds > 0
+        assert deferred_modules_loaded(loaded) == []
+
+    def test_package_exports_load_on_first_use(self):
+        import src.pipeline
+
+        assert src.pipeline.run_full_pipeline.__module__ == "src.pipeline.orchestrator"
+        assert "run_batch" in dir(src.pipeline)
+        with pytest.raises(AttributeError):
+            _ = src.pipeline.not_exported
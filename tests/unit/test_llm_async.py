@@ -0,0 +1,158 @@
+"""
+Unit tests for the async provider interface and shared request semaphore.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import LLMSettings
+from src.llm.base import BaseLLMProvider, get_provider_semaphore
+from src.llm.claude_provider import ClaudeProvider
+from src.llm.openai_provider import OpenAIProvider
+
+pytestmark = pytest.mark.unit
+
+
+class SlowSyncProvider(BaseLLMProvider):
+    """Sync-only provider that records peak concurrency."""
+
+    concurrency_key = "slow-sync"
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _work(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+
+    def generate_text(self, prompt, system_prompt=None, **kwargs):
+        self._work()
+        return prompt
+
+    def generate_json_with_schema(self, prompt, schema, system_prompt=None, **kwargs):
+        self._work()
+        return {"prompt": prompt}
+
+    def generate_json_with_pdf(self, pdf_path, schema, system_prompt=None, **kwargs):
+        self._work()
+        return {"pdf": str(pdf_path)}
+
+
+class FakeAsyncEndpoint:
+    """Async create() stub that records requests and returns a canned response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    async def create(self, **request):
+        self.requests.append(request)
+        await asyncio.sleep(0)
+        return self.response
+
+
+class TestProviderSemaphore:
+    def test_shared_per_key_within_loop(self):
+        async def _run():
+            a = get_provider_semaphore("k", 2)
+            b = get_provider_semaphore("k", 5)
+            c = get_provider_semaphore("other", 2)
+            return a, b, c
+
+        a, b, c = asyncio.run(_run())
+        assert a is b
+        assert a is not c
+
+    def test_default_async_methods_respect_limit(self):
+        provider = SlowSyncProvider(LLMSettings(max_concurrent_requests=2))
+
+        async def _run():
+            tasks = [provider.generate_text_async(f"p{i}") for i in range(6)]
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(_run())
+
+        assert results == [f"p{i}" for i in range(6)]
+        assert provider.peak == 2
+
+    def test_default_async_json_delegates_to_sync(self):
+        provider = SlowSyncProvider(LLMSettings())
+
+        result = asyncio.run(provider.generate_json_with_schema_async("x", {}))
+
+        assert result == {"prompt": "x"}
+
+
+class TestOpenAIAsync:
+    def _make_provider(self, response):
+        provider = OpenAIProvider.__new__(OpenAIProvider)
+        # Inline base64 path; the Files API path is covered in test_file_registry.py
+        provider.settings = LLMSettings(openai_api_key="dummy-key", files_api_enabled=False)
+        provider.client = None
+        provider._async_client = SimpleNamespace(responses=FakeAsyncEndpoint(response))
+        return provider
+
+    def test_generate_json_with_schema_async(self):
+        response = SimpleNamespace(output_text='{"a": 1}', output=[], id="resp_1", model="m")
+        provider = self._make_provider(response)
+
+        result = asyncio.run(
+            provider.generate_json_with_schema_async(
+                "prompt", {"title": "My Schema"}, reasoning_effort="low"
+            )
+        )
+
+        assert result["a"] == 1
+        request = provider._async_client.responses.requests[0]
+        assert request["input"] == "prompt"
+        assert request["reasoning"] == {"effort": "low"}
+        assert request["text"]["format"]["name"] == "My_Schema"
+
+    def test_generate_json_with_pdf_async(self, tmp_path):
+        pdf = tmp_path / "paper.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        response = SimpleNamespace(output_text='{"ok": true}', output=[])
+        provider = self._make_provider(response)
+
+        result = asyncio.run(provider.generate_json_with_pdf_async(pdf, {}, max_pages=3))
+
+        assert result["ok"] is True
+        content = provider._async_client.responses.requests[0]["input"][0]["content"]
+        assert content[0]["type"] == "input_file"
+        assert "first 3 pages" in content[1]["text"]
+
+
+class TestClaudeAsync:
+    def test_generate_json_with_schema_async(self):
+        provider = ClaudeProvider.__new__(ClaudeProvider)
+        provider.settings = LLMSettings(anthropic_api_key="dummy-key")
+        provider.client = None
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text='```json\n{"name": "x"}\n```')],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+            id="msg_1",
+            model="claude",
+            stop_reason="end_turn",
+        )
+        provider._async_client = SimpleNamespace(messages=FakeAsyncEndpoint(response))
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+        result = asyncio.run(provider.generate_json_with_schema_async("prompt", schema))
+
+        assert result["name"] == "x"
+        assert result["usage"]["total_tokens"] == 15
+        assert result["_metadata"]["stop_reason"] == "end_turn"
+        request = provider._async_client.messages.requests[0]
+        system_text = "".join(block["text"] for block in request["system"])
+        assert "conforms to this JSON schema" in system_text
@@ -28,6 +28,7 @@ from src.pipeline.iterative.loop_runner import (
 )
 from src.pipeline.quality import MetricType, QualityThresholds
 from src.pipeline.quality.metrics import QualityMetrics
+from src.tracing import KIND_ITERATION, KIND_LOOP, start_trace
 
 
 class TestIterativeLoopConfig:
@@ -213,6 +214,36 @@ class TestIterativeLoopRunner:
         assert validate_fn.call_count == 2
         assert correct_fn.call_count == 1
 
+    def test_loop_and_iterations_traced(self):
+        """Test the loop and each pass are recorded as spans when a trace is active."""
+        config = IterativeLoopConfig(
+            metric_type=MetricType.EXTRACTION,
+            max_iterations=3,
+            show_banner=False,
+        )
+        validation_fail = self._create_validation_result(
+            completeness=0.80, accuracy=0.85, schema_compliance=0.90
+        )
+        validation_pass = self._create_validation_result()
+        runner = IterativeLoopRunner(
+            config=config,
+            initial_result={"data": "test"},
+            validate_fn=MagicMock(side_effect=[validation_fail, validation_pass]),
+            correct_fn=MagicMock(return_value={"data": "corrected"}),
+            console_instance=Console(file=StringIO()),
+        )
+
+        with start_trace("run") as tracer:
+            runner.run()
+
+        loop_span = next(s for s in tracer.spans if s.kind == KIND_LOOP)
+        iterations = [s for s in tracer.spans if s.kind == KIND_ITERATION]
+        assert loop_span.name == "extraction_loop"
+        assert loop_span.attributes["final_status"] == FINAL_STATUS_PASSED
+        assert loop_span.attributes["iterations"] == 2
+        assert [s.attributes["iteration"] for s in iterations] == [0, 1]
+        assert {s.parent_id for s in iterations} == {loop_span.span_id}
+
     def test_max_iterations_reached(self):
         """Test loop that reaches max iterations."""
         config = IterativeLoopConfig(
@@ -1883,3 +1914,97 @@ class TestReadableOutput:
         assert "Schema:" in output
         assert "Accuracy" not in output
         assert "Quality:" in output
+
+
+class TestParallelCandidates:
+    """Test speculative parallel correction candidates (candidates > 1)."""
+
+    def _validation(self, completeness: float, accuracy: float, schema: float) -> dict:
+        return {
+            "verification_summary": {
+                "completeness_score": completeness,
+                "accuracy_score": accuracy,
+                "schema_compliance_score": schema,
+                "critical_issues": 0,
+                "overall_status": "passed",
+            },
+            "schema_validation": {"quality_score": schema, "validation_errors": []},
+        }
+
+    def _runner(self, correct_fn, candidates: int = 3) -> IterativeLoopRunner:
+        config = IterativeLoopConfig(
+            metric_type=MetricType.EXTRACTION,
+            max_iterations=3,
+            show_banner=False,
+            candidates=candidates,
+        )
+        return IterativeLoopRunner(
+            config=config,
+            initial_result={"candidate": "initial"},
+            validate_fn=MagicMock(return_value=self._validation(0.70, 0.75, 0.90)),
+            correct_fn=correct_fn,
+            console_instance=Console(file=StringIO()),
+        )
+
+    def test_best_candidate_kept_in_one_round(self):
+        """All candidates run with distinct hints and the best validated one wins."""
+        seen_hints = []
+        outcomes = {
+            None: self._validation(0.80, 0.85, 0.95),
+            "Fix schema": self._validation(0.85, 0.88, 1.0),
+            "Completeness": self._validation(0.98, 0.99, 1.0),
+        }
+
+        def correct(result, validation):
+            hint = validation.get("_correction_hints")
+            seen_hints.append(hint)
+            key = next((k for k in outcomes if k and hint and k in hint), None)
+            return {"candidate": key}, outcomes[key]
+
+        result = self._runner(correct).run()
+
+        assert result.final_status == FINAL_STATUS_PASSED
+        assert result.best_result == {"candidate": "Completeness"}
+        assert result.iteration_count == 2
+        assert len(seen_hints) == 3
+        assert None in seen_hints
+        assert len(set(seen_hints)) == 3
+
+    def test_schema_valid_candidate_preferred(self):
+        """A candidate below the schema quality threshold never beats a valid one."""
+
+        def correct(result, validation):
+            if validation.get("_correction_hints"):
+                return {"candidate": "valid"}, self._validation(0.85, 0.85, 0.90)
+            return {"candidate": "invalid"}, self._validation(1.0, 1.0, 0.30)
+
+        runner = self._runner(correct, candidates=2)
+        corrected, _ = runner._run_candidates({"candidate": "initial"}, {})
+
+        assert corrected == {"candidate": "valid"}
+
+    def test_failed_candidates_are_skipped(self):
+        """One crashing candidate does not fail the iteration; all crashing does."""
+
+        def correct(result, validation):
+            if validation.get("_correction_hints"):
+                raise RuntimeError("provider timeout")
+            return {"candidate": "plain"}, self._validation(0.98, 0.99, 1.0)
+
+        result = self._runner(correct).run()
+        assert result.best_result == {"candidate": "plain"}
+
+        failing = self._runner(MagicMock(side_effect=RuntimeError("down")), candidates=2).run()
+        assert failing.final_status == FINAL_STATUS_FAILED
+        assert "down" in failing.error
+
+    def test_selected_candidate_recorded_on_iteration_span(self):
+        def correct(result, validation):
+            return {"candidate": "x"}, self._validation(0.98, 0.99, 1.0)
+
+        with start_trace("run") as tracer:
+            self._runner(correct, candidates=2).run()
+
+        iteration = [s for s in tracer.spans if s.kind == KIND_ITERATION][0]
+        assert iteration.attributes["candidates"] == 2
+        assert iteration.attributes["selected_candidate"] == 0
@@ -0,0 +1,168 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for local PDF page slicing (src/llm/pdf_slicer.py)."""
+
+from pathlib import Path
+
+import openai
+import pytest
+
+from src.config import LLMSettings
+from src.llm import file_registry, pdf_slicer
+from src.llm.claude_provider import ClaudeProvider
+from src.llm.file_registry import FileHandleRegistry
+from src.llm.openai_provider import OpenAIProvider
+from src.llm.pdf_slicer import count_pages, slice_pdf, slice_pdf_pages
+from tests.stubs.files_api_server import FilesAPIStubServer
+
+pypdf = pytest.importorskip("pypdf")
+
+pytestmark = pytest.mark.unit
+
+
+def _write_pdf(path, pages):
+    writer = pypdf.PdfWriter()
+    for index in range(pages):
+        writer.add_blank_page(width=200 + index, height=200)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
+
+
+def _widths(path):
+    return [int(page.mediabox.width) for page in pypdf.PdfReader(str(path)).pages]
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return LLMSettings(pdf_slicing=True, pdf_slice_dir=str(tmp_path / "slices"))
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    return _write_pdf(tmp_path / "paper.pdf", 8)
+
+
+class TestSlicePdf:
+    def test_keeps_only_first_pages(self, pdf_file, settings):
+        sliced = slice_pdf(pdf_file, 3, settings)
+
+        assert sliced != pdf_file
+        assert sliced.parent == Path(settings.pdf_slice_dir)
+        assert _widths(sliced) == [200, 201, 202]
+
+    def test_page_range(self, pdf_file, settings):
+        sliced = slice_pdf_pages(pdf_file, 4, 6, settings)
+
+        assert _widths(sliced) == [203, 204, 205]
+        assert sliced.name.endswith("-p4-6.pdf")
+
+    def test_slice_is_cached_by_hash_and_range(self, pdf_file, settings, monkeypatch, tmp_path):
+        writes = []
+        write_slice = pdf_slicer._write_slice
+        monkeypatch.setattr(
+            pdf_slicer, "_write_slice", lambda *args: writes.append(args) or write_slice(*args)
+        )
+        copy = _write_pdf(tmp_path / "renamed.pdf", 8)
+
+        first = slice_pdf(pdf_file, 3, settings)
+        assert slice_pdf(copy, 3, settings) == first
+        assert slice_pdf(pdf_file, 4, settings) != first
+        assert len(writes) == 2
+
+    def test_whole_document_range_returns_original(self, pdf_file, settings):
+        assert slice_pdf(pdf_file, 8, settings) == pdf_file
+        assert slice_pdf(pdf_file, 50, settings) == pdf_file
+        assert slice_pdf(pdf_file, None, settings) == pdf_file
+
+    def test_disabled_or_unparseable_returns_original(self, pdf_file, settings, tmp_path):
+        disabled = LLMSettings(pdf_slicing=False, pdf_slice_dir=settings.pdf_slice_dir)
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"%PDF-1.4 not really a pdf")
+
+        assert slice_pdf(pdf_file, 2, disabled) == pdf_file
+        assert slice_pdf(broken, 2, settings) == broken
+
+    def test_without_pypdf_returns_original(self, pdf_file, settings, monkeypatch):
+        monkeypatch.setattr(pdf_slicer, "HAVE_PYPDF", False)
+
+        assert slice_pdf(pdf_file, 2, settings) == pdf_file
+        assert count_pages(pdf_file) is None
+
+    def test_strip_removes_thumbnails(self, tmp_path):
+        writer = pypdf.PdfWriter()
+        for _ in range(3):
+            page = writer.add_blank_page(width=200, height=200)
+            page[pypdf.generic.NameObject("/Thumb")] = writer._add_object(
+                pypdf.generic.StreamObject()
+            )
+        source = tmp_path / "thumbs.pdf"
+        with open(source, "wb") as f:
+            writer.write(f)
+        settings = LLMSettings(pdf_slice_dir=str(tmp_path / "slices"), pdf_slice_strip=True)
+
+        sliced = slice_pdf(source, 2, settings)
+
+        assert sliced.name.endswith("-p1-2-stripped.pdf")
+        assert all("/Thumb" not in page for page in pypdf.PdfReader(str(sliced)).pages)
+
+    def test_count_pages(self, pdf_file):
+        assert count_pages(pdf_file) == 8
+
+
+class TestProviderUploadsSlice:
+    def test_openai_uploads_only_requested_pages(self, pdf_file, settings, monkeypatch):
+        monkeypatch.setattr(file_registry, "_SHARED_REGISTRY", FileHandleRegistry())
+        with FilesAPIStubServer(response_json={"name": "x"}) as stub:
+            provider = OpenAIProvider.__new__(OpenAIProvider)
+            provider.settings = LLMSettings(
+                openai_api_key="test",
+                files_api_enabled=True,
+                pdf_slicing=True,
+                pdf_slice_dir=settings.pdf_slice_dir,
+            )
+            provider.client = openai.OpenAI(
+                api_key="test", base_url=stub.openai_base_url, max_retries=0
+            )
+
+            provider.generate_json_with_pdf(pdf_file, {}, max_pages=2)
+            provider.generate_json_with_pdf(pdf_file, {})
+
+            sizes = [stub.files[upload["file_id"]]["size"] for upload in stub.uploads]
+
+        assert len(sizes) == 2
+        assert sizes[0] < sizes[1]
+
+    @pytest.mark.parametrize("slicing", [True, False])
+    def test_openai_page_instruction_only_for_unsliced_pdf(self, pdf_file, settings, slicing):
+        provider = OpenAIProvider.__new__(OpenAIProvider)
+        provider.settings = LLMSettings(pdf_slicing=slicing, pdf_slice_dir=settings.pdf_slice_dir)
+
+        (message,) = provider._build_pdf_input(pdf_file, 2)
+
+        texts = [item["text"] for item in message["content"] if item["type"] == "input_text"]
+        assert texts == ([] if slicing else ["Process only the first 2 pages of this PDF."])
+
+    @pytest.mark.parametrize("slicing", [True, False])
+    def test_claude_page_instruction_only_for_unsliced_pdf(
+        self, pdf_file, settings, slicing, monkeypatch
+    ):
+        provider = ClaudeProvider.__new__(ClaudeProvider)
+        provider.settings = LLMSettings(
+            pdf_slicing=slicing,
+            pdf_slice_dir=settings.pdf_slice_dir,
+            anthropic_prompt_caching=False,
+        )
+        requests = []
+        monkeypatch.setattr(
+            provider,
+            "_create_pdf_message",
+            lambda path, context, **request: requests.append(request),
+        )
+        monkeypatch.setattr(provider, "_parse_json_response", lambda *args: {})
+
+        provider.generate_json_with_pdf(pdf_file, {}, max_pages=2)
+
+        assert ("Process only the first 2 pages" in requests[0]["system"]) is not slicing
@@ -12,6 +12,7 @@ from src.pipeline import orchestrator
 def test_run_full_pipeline_passes_report_flags(monkeypatch, tmp_path):
     """Ensure report renderer/compile/figure flags flow through the full pipeline."""
 
+    monkeypatch.chdir(tmp_path)  # run artifacts go to tmp/ relative to the working directory
     pdf_path = Path(tmp_path / "paper.pdf")
     pdf_path.write_text("dummy")
 
@@ -75,6 +76,7 @@ def test_run_full_pipeline_passes_report_flags(monkeypatch, tmp_path):
 def test_run_full_pipeline_passes_verbose_flag(monkeypatch, tmp_path):
     """Ensure verbose flag flows through run_full_pipeline to run_single_step."""
 
+    monkeypatch.chdir(tmp_path)  # run artifacts go to tmp/ relative to the working directory
     pdf_path = Path(tmp_path / "paper.pdf")
     pdf_path.write_text("dummy")
 
@@ -0,0 +1,182 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for dependency-graph scheduling in run_full_pipeline."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.pipeline import orchestrator
+
+pytestmark = pytest.mark.unit
+
+
+def _fake_results(step_name):
+    if step_name == orchestrator.STEP_CLASSIFICATION:
+        return {"publication_type": "interventional_trial"}
+    if step_name == orchestrator.STEP_EXTRACTION:
+        return {"data": {}}
+    if step_name == orchestrator.STEP_VALIDATION_CORRECTION:
+        return {"final_status": "passed"}
+    if step_name == orchestrator.STEP_APPRAISAL:
+        return {"final_status": "passed"}
+    return {"status": "completed"}
+
+
+@pytest.fixture
+def pdf_path(tmp_path, monkeypatch):
+    # Artifacts and traces go to ./tmp: keep them out of the repository
+    monkeypatch.chdir(tmp_path)
+    path = Path(tmp_path / "paper.pdf")
+    path.write_text("dummy")
+    return path
+
+
+def _install_fake_steps(monkeypatch, on_step=None):
+    """Replace run_single_step with a recorder; returns the list of (event, step) tuples."""
+    log: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def fake_run_single_step(step_name, progress_callback=None, previous_results=None, **kw):
+        with lock:
+            log.append(("start", step_name))
+        if progress_callback:
+            progress_callback(step_name, "starting", {})
+        if on_step:
+            on_step(step_name, previous_results)
+        with lock:
+            log.append(("end", step_name))
+        if progress_callback:
+            progress_callback(step_name, "completed", {})
+        return _fake_results(step_name)
+
+    monkeypatch.setattr(orchestrator, "run_single_step", fake_run_single_step)
+    return log
+
+
+def test_report_and_podcast_run_concurrently(monkeypatch, pdf_path):
+    # Both steps must be inside the barrier at the same time or it times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def on_step(step_name, previous_results):
+        if step_name in (orchestrator.STEP_REPORT_GENERATION, orchestrator.STEP_PODCAST_GENERATION):
+            assert orchestrator.STEP_APPRAISAL in previous_results
+            barrier.wait()
+
+    _install_fake_steps(monkeypatch, on_step)
+
+    results = orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+    assert set(results) == set(orchestrator.ALL_PIPELINE_STEPS)
+
+
+def test_sequential_when_single_worker(monkeypatch, pdf_path):
+    log = _install_fake_steps(monkeypatch)
+
+    orchestrator.run_full_pipeline(pdf_path=pdf_path, max_parallel_steps=1)
+
+    expected = []
+    for step in orchestrator.ALL_PIPELINE_STEPS:
+        expected += [("start", step), ("end", step)]
+    assert log == expected
+
+
+def test_linear_prefix_preserves_order(monkeypatch, pdf_path):
+    log = _install_fake_steps(monkeypatch)
+
+    orchestrator.run_full_pipeline(pdf_path=pdf_path)
+
+    order = [step for event, step in log if event == "start"]
+    assert order[:4] == orchestrator.ALL_PIPELINE_STEPS[:4]
+    # Appraisal only starts after validation_correction has finished
+    assert log.index(("end", orchestrator.STEP_VALIDATION_CORRECTION)) < log.index(
+        ("start", orchestrator.STEP_APPRAISAL)
+    )
+
+
+def test_failed_validation_skips_downstream_steps(monkeypatch, pdf_path):
+    def fake_run_single_step(step_name, **kw):
+        if step_name == orchestrator.STEP_VALIDATION_CORRECTION:
+            return {"final_status": "failed_schema_validation"}
+        return _fake_results(step_name)
+
+    monkeypatch.setattr(orchestrator, "run_single_step", fake_run_single_step)
+    events = []
+
+    results = orchestrator.run_full_pipeline(
+        pdf_path=pdf_path,
+        progress_callback=lambda step, status, data: events.append((step, status)),
+    )
+
+    assert orchestrator.STEP_APPRAISAL not in results
+    assert (orchestrator.STEP_APPRAISAL, "skipped") in events
+    assert (orchestrator.STEP_REPORT_GENERATION, "skipped") in events
+    assert (orchestrator.STEP_PODCAST_GENERATION, "skipped") in events
+
+
+def test_error_in_parallel_step_is_raised_after_siblings_finish(monkeypatch, pdf_path):
+    finished = []
+
+    def on_step(step_name, previous_results):
+        if step_name == orchestrator.STEP_REPORT_GENERATION:
+            raise RuntimeError("render failed")
+        if step_name == orchestrator.STEP_PODCAST_GENERATION:
+            finished.append(step_name)
+
+    _install_fake_steps(monkeypatch, on_step)
+
+    with pytest.raises(RuntimeError, match="render failed"):
+        orchestrator.run_full_pipeline(pdf_path=pdf_path)
+
+    assert finished == [orchestrator.STEP_PODCAST_GENERATION]
+
+
+def test_steps_to_run_filter_does_not_block_downstream(monkeypatch, pdf_path):
+    log = _install_fake_steps(monkeypatch)
+
+    orchestrator.run_full_pipeline(
+        pdf_path=pdf_path,
+        steps_to_run=["classification", "extraction", "appraisal", "podcast_generation"],
+    )
+
+    started = {step for event, step in log if event == "start"}
+    assert started == {"classification", "extraction", "appraisal", "podcast_generation"}
+
+
+def test_breakpoint_stops_scheduling(monkeypatch, pdf_path):
+    log = _install_fake_steps(monkeypatch)
+
+    results = orchestrator.run_full_pipeline(
+        pdf_path=pdf_path, breakpoint_after_step=orchestrator.STEP_EXTRACTION
+    )
+
+    assert set(results) == {"classification", "extraction"}
+    assert ("start", orchestrator.STEP_VALIDATION_CORRECTION) not in log
+
+
+def test_breakpoint_does_not_start_concurrent_sibling(monkeypatch, pdf_path):
+    # Report and podcast become ready together; the podcast comes after the breakpoint
+    log = _install_fake_steps(monkeypatch)
+
+    results = orchestrator.run_full_pipeline(
+        pdf_path=pdf_path, breakpoint_after_step=orchestrator.STEP_REPORT_GENERATION
+    )
+
+    assert orchestrator.STEP_REPORT_GENERATION in results
+    assert orchestrator.STEP_PODCAST_GENERATION not in results
+    assert ("start", orchestrator.STEP_PODCAST_GENERATION) not in log
+
+
+def test_invalid_max_parallel_steps(pdf_path):
+    with pytest.raises(ValueError, match="max_parallel_steps"):
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, max_parallel_steps=0)
+
+
+def test_dependency_error_messages_unchanged():
+    with pytest.raises(ValueError, match="^Podcast generation step requires appraisal step$"):
+        orchestrator._validate_step_dependencies(["classification", "podcast_generation"])
+    with pytest.raises(ValueError, match="^Validation step requires extraction step$"):
+        orchestrator._validate_step_dependencies(["validation"])
@@ -1044,3 +1044,53 @@ def test_uppercase_OR_still_flagged(
     issues = result["validation"]["issues"]
     abbr_issues = [i for i in issues if "abbreviation" in i.lower() and "OR" in i]
     assert abbr_issues != [], "Uppercase 'OR' abbreviation should still be flagged"
+
+
+@patch("src.pipeline.podcast_logic.load_podcast_summary_prompt", side_effect=Exception("skip"))
+@patch("src.pipeline.podcast_logic.load_schema")
+@patch("src.pipeline.podcast_logic.load_podcast_generation_prompt")
+@patch("src.pipeline.podcast_logic.get_llm_provider")
+def test_prompt_excludes_classification_run_metadata(
+    mock_get_llm, mock_load_prompt, mock_load_schema, _mock_summary, mock_file_manager, mock_llm
+):
+    """Run metadata (timestamps, durations) must not make the prompt differ between runs."""
+    mock_get_llm.return_value = mock_llm
+    mock_load_schema.return_value = {"type": "object"}
+    mock_load_prompt.return_value = "Generate podcast"
+
+    run_podcast_generation(
+        extraction_result={"interventions": [{"name": "Drug"}], "outcomes": []},
+        appraisal_result={"grade": {"certainty_overall": "high"}},
+        classification_result={
+            "publication_type": "interventional_trial",
+            "_pipeline_metadata": {"timestamp": "2025-01-01T00:00:00+00:00"},
+        },
+        llm_provider="openai",
+        file_manager=mock_file_manager,
+    )
+
+    prompt = mock_llm.generate_json_with_schema.call_args.kwargs["prompt"]
+    assert "interventional_trial" in prompt
+    assert "_pipeline_metadata" not in prompt
+
+
+@patch("src.pipeline.orchestrator.run_podcast_generation")
+def test_podcast_step_uses_best_appraisal(mock_run, mock_file_manager, tmp_path):
+    """The podcast step receives best_appraisal, not the loop result with iteration history."""
+    from src.pipeline.orchestrator import run_single_step
+
+    best = {"grade": {"certainty_overall": "high"}}
+    run_single_step(
+        step_name="podcast_generation",
+        pdf_path=tmp_path / "paper.pdf",
+        max_pages=None,
+        llm_provider="openai",
+        file_manager=mock_file_manager,
+        previous_results={
+            "classification": {"publication_type": "interventional_trial"},
+            "extraction": {"outcomes": []},
+            "appraisal": {"best_appraisal": best, "iterations": [{"timestamp": "t"}]},
+        },
+    )
+
+    assert mock_run.call_args.kwargs["appraisal_result"] == best
@@ -0,0 +1,160 @@
+"""
+Unit tests for Anthropic prompt caching in src/llm/claude_provider.py
+
+Checks that instructions, schema and PDF are sent as cache_control breakpoints
+with per-iteration context after them, that disabling caching restores the
+plain string layout, and that cache read/write tokens are reported in usage.
+"""
+
+from types import SimpleNamespace
+
+import anthropic
+import pytest
+
+from src.config import LLMSettings
+from src.llm import file_registry
+from src.llm.claude_provider import ClaudeProvider, _usage_to_dict
+from src.llm.file_registry import FileHandleRegistry
+from tests.stubs.files_api_server import FilesAPIStubServer
+
+pytestmark = pytest.mark.unit
+
+EPHEMERAL = {"type": "ephemeral"}
+SCHEMA = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4 test paper")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(file_registry, "_SHARED_REGISTRY", FileHandleRegistry())
+
+
+@pytest.fixture
+def stub():
+    with FilesAPIStubServer(response_json={"name": "x"}) as server:
+        yield server
+
+
+def _provider(stub=None, **settings):
+    provider = ClaudeProvider.__new__(ClaudeProvider)
+    provider.settings = LLMSettings(anthropic_api_key="test", **settings)
+    if stub is not None:
+        provider.client = anthropic.Anthropic(
+            api_key="test", base_url=stub.anthropic_base_url, max_retries=0
+        )
+    return provider
+
+
+def _request(provider, pdf_file, context=None, max_pages=None):
+    system = provider._schema_system_prompt(SCHEMA, "Correct the extraction.", max_pages)
+    return provider._pdf_request(
+        pdf_file, context, model="claude-test", max_tokens=100, system=system
+    )
+
+
+class TestCacheBreakpoints:
+    def test_system_blocks_marked_cacheable(self, pdf_file):
+        provider = _provider(files_api_enabled=False)
+
+        system = _request(provider, pdf_file, max_pages=4)["system"]
+
+        assert system[0] == {
+            "type": "text",
+            "text": "Correct the extraction.",
+            "cache_control": EPHEMERAL,
+        }
+        assert "conforms to this JSON schema" in system[1]["text"]
+        assert "first 4 pages" in system[1]["text"]
+        assert system[1]["cache_control"] == EPHEMERAL
+
+    def test_context_follows_cached_document(self, pdf_file):
+        provider = _provider(files_api_enabled=False)
+
+        request = _request(provider, pdf_file, context="VALIDATION_REPORT: {}")
+
+        content = request["messages"][0]["content"]
+        assert content[0]["type"] == "document"
+        assert content[0]["cache_control"] == EPHEMERAL
+        assert content[1] == {"type": "text", "text": "VALIDATION_REPORT: {}"}
+        assert "cache_control" not in content[2]
+        # Context never leaks into the cached system prefix
+        assert all("VALIDATION_REPORT" not in block["text"] for block in request["system"])
+
+    def test_prefix_identical_across_iterations(self, pdf_file):
+        provider = _provider(files_api_enabled=False)
+
+        first = _request(provider, pdf_file, context="iteration 1")
+        second = _request(provider, pdf_file, context="iteration 2")
+
+        assert first["system"] == second["system"]
+        assert first["messages"][0]["content"][0] == second["messages"][0]["content"][0]
+
+    def test_disabled_keeps_plain_system_string(self, pdf_file):
+        provider = _provider(files_api_enabled=False, anthropic_prompt_caching=False)
+
+        request = _request(provider, pdf_file, context="VALIDATION_REPORT: {}")
+
+        assert isinstance(request["system"], str)
+        assert request["system"].startswith("Correct the extraction.\n\nYou must return")
+        assert request["system"].endswith("\n\nVALIDATION_REPORT: {}")
+        content = request["messages"][0]["content"]
+        assert len(content) == 2
+        assert "cache_control" not in content[0]
+
+    def test_cached_request_end_to_end(self, stub, pdf_file):
+        stub.message_usage = {
+            "input_tokens": 50,
+            "output_tokens": 5,
+            "cache_read_input_tokens": 30000,
+            "cache_creation_input_tokens": 0,
+        }
+        provider = _provider(stub)
+
+        response = provider._create_pdf_message(
+            pdf_file,
+            "iteration context",
+            model="claude-test",
+            max_tokens=100,
+            system=provider._schema_system_prompt(SCHEMA, "Extract."),
+        )
+        result = provider._parse_json_response(response, SCHEMA, "ok")
+
+        sent = stub.requests[-1]
+        assert sent["messages"][0]["content"][0]["cache_control"] == EPHEMERAL
+        assert sent["messages"][0]["content"][1]["text"] == "iteration context"
+        assert result["usage"]["cached_tokens"] == 30000
+        assert result["usage"]["input_tokens"] == 30050
+
+
+class TestUsage:
+    def test_cache_tokens_reported(self):
+        usage = SimpleNamespace(
+            input_tokens=100,
+            output_tokens=20,
+            cache_read_input_tokens=0,
+            cache_creation_input_tokens=25000,
+        )
+
+        assert _usage_to_dict(usage) == {
+            "input_tokens": 25100,
+            "output_tokens": 20,
+            "total_tokens": 25120,
+            "cached_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 25000,
+        }
+
+    def test_without_cache_fields_unchanged(self):
+        usage = SimpleNamespace(input_tokens=10, output_tokens=5)
+
+        assert _usage_to_dict(usage) == {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_tokens": 15,
+        }
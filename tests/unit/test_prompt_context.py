@@ -0,0 +1,153 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for the compact prompt-context encoder (src/pipeline/prompt_context.py)."""
+
+import json
+import logging
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.pipeline import prompt_context
+from src.pipeline.prompt_context import (
+    build_key_aliases,
+    drop_empty,
+    encode_prompt_context,
+    estimate_tokens,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _outcome(index):
+    return {
+        "outcome_id": f"o{index}",
+        "effect": {"value": 0.5 + index, "lower": 0.1, "upper": 0.9},
+        "notes": "",
+        "ontology_terms": [{"system": "MeSH", "code": f"D00{index}"}],
+        "provenance": {"method": "llm_assisted", "confidence": 0.9},
+        "source_refs": [{"anchor": f"Table {index}", "page": index}],
+        "table_source": {"page": index},
+        "secondary_endpoints_considered": [],
+    }
+
+
+EXTRACTION = {
+    "metadata": {"title": "Trial", "doi": None, "keywords": []},
+    "results": {"outcomes": [_outcome(i) for i in range(1, 6)], "is_primary": False, "n": 0},
+}
+
+
+class TestDropEmpty:
+    def test_removes_empty_values_recursively(self):
+        assert drop_empty({"a": {"b": [None, {}, ""]}, "c": [], "d": 1}) == {"d": 1}
+
+    def test_keeps_false_and_zero(self):
+        assert drop_empty({"flag": False, "count": 0, "ratio": 0.0}) == {
+            "flag": False,
+            "count": 0,
+            "ratio": 0.0,
+        }
+
+
+class TestEstimateTokens:
+    def test_claude_counts_more_tokens_than_gpt(self):
+        text = "x" * 700
+
+        assert estimate_tokens(text, "claude-sonnet-4") > estimate_tokens(text, "gpt-5.5")
+        assert estimate_tokens("", "gpt-5.5") == 0
+
+
+class TestEncodePromptContext:
+    def test_references_are_minified_without_empty_fields(self):
+        encoded = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=0)
+
+        text = encoded["extraction"]
+        assert "\n" not in text and ": " not in text
+        assert '"notes"' not in text and '"doi"' not in text
+        assert json.loads(text)["results"]["is_primary"] is False
+        assert encoded.trimmed == ()
+        assert encoded.legend == ""
+
+    def test_fixed_sections_are_not_altered(self):
+        document = {"issues": [], "notes": None, "provenance": {"method": "x"}}
+
+        encoded = encode_prompt_context(
+            {"extraction": EXTRACTION}, fixed={"report": document}, max_tokens=1
+        )
+
+        assert json.loads(encoded["report"]) == document
+
+    def test_over_budget_trims_tiers_in_order(self):
+        full = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=0)
+        without_tier_1 = full.estimated_tokens - 50
+
+        encoded = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=without_tier_1)
+
+        assert encoded.trimmed == ("provenance",)
+        assert encoded.estimated_tokens <= without_tier_1
+        assert '"ontology_terms"' in encoded["extraction"]
+        assert '"source_refs"' in encoded["extraction"]
+
+    def test_last_tier_removes_source_anchors_but_keeps_values(self):
+        encoded = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=200)
+
+        assert set(encoded.trimmed) == {
+            "provenance",
+            "ontology_terms",
+            "source_refs",
+            "table_source",
+        }
+        outcome = json.loads(encoded["extraction"])["results"]["outcomes"][0]
+        assert outcome == {"outcome_id": "o1", "effect": {"value": 1.5, "lower": 0.1, "upper": 0.9}}
+
+    def test_unreachable_budget_logs_warning(self, caplog):
+        with caplog.at_level(logging.WARNING, logger=prompt_context.__name__):
+            encoded = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=5)
+
+        assert encoded.estimated_tokens > 5
+        assert "exceeds the budget" in caplog.text
+
+    def test_key_aliases_with_legend(self):
+        encoded = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=0, key_aliases=True)
+        plain = encode_prompt_context({"extraction": EXTRACTION}, max_tokens=0)
+
+        assert '"ontology_terms"' not in encoded["extraction"]
+        assert "EXTRACTION_JSON" in encoded.legend
+        legend = json.loads(encoded.legend.splitlines()[1])
+        assert legend[encoded.aliases["ontology_terms"]] == "ontology_terms"
+        assert len(encoded["extraction"]) < len(plain["extraction"])
+
+    def test_aliases_never_collide_with_real_keys(self):
+        sections = {"a": [{"k0": 1, "very_long_key_name": i} for i in range(3)]}
+
+        assert build_key_aliases(sections) == {"very_long_key_name": "k1"}
+
+    def test_defaults_come_from_settings(self, monkeypatch):
+        settings = prompt_context.llm_settings
+        monkeypatch.setattr(
+            prompt_context, "llm_settings", replace(settings, prompt_key_aliases=True)
+        )
+        assert encode_prompt_context({"extraction": EXTRACTION}).aliases
+
+        monkeypatch.setattr(
+            prompt_context, "llm_settings", replace(settings, prompt_context_max_tokens=300)
+        )
+        assert encode_prompt_context({"extraction": EXTRACTION}).trimmed == ("provenance",)
+
+
+class TestPromptsUseEncoder:
+    def test_appraisal_prompt_uses_compact_extraction(self):
+        from src.pipeline.steps import appraisal
+
+        llm = MagicMock()
+        llm.generate_json_with_schema.return_value = {"risk_of_bias": {}}
+        with patch.object(appraisal, "load_appraisal_prompt", return_value="prompt"):
+            appraisal.run_appraisal_step(EXTRACTION, "interventional_trial", llm, MagicMock(), None)
+
+        prompt = llm.generate_json_with_schema.call_args.kwargs["prompt"]
+        assert prompt.startswith("EXTRACTION_JSON:\n{")
+        assert json.loads(prompt.split("\n", 1)[1]) == drop_empty(EXTRACTION)
@@ -0,0 +1,225 @@
+"""
+Unit tests for src/llm/rate_limiter.py
+
+Covers token-bucket pacing with an injected clock, budget sharing through the
+SQLite file, header seeding, and the SDK event hooks against the local stub server.
+"""
+
+import asyncio
+import json
+
+import anthropic
+import openai
+import pytest
+
+from src.config import LLMSettings
+from src.llm.rate_limiter import (
+    INLINE_FILE_TOKENS,
+    RateLimiter,
+    estimate_request_tokens,
+    get_rate_limiter,
+    rate_limited_http_client,
+)
+from tests.stubs.files_api_server import FilesAPIStubServer
+
+pytestmark = pytest.mark.unit
+
+OPENAI_HEADERS = {
+    "x-ratelimit-limit-requests": "500",
+    "x-ratelimit-remaining-requests": "0",
+    "x-ratelimit-limit-tokens": "30000",
+    "x-ratelimit-remaining-tokens": "29000",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "limits.sqlite3"
+
+
+def _limiter(db_path, clock, **kwargs):
+    return RateLimiter(db_path, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestTokenBuckets:
+    def test_unknown_limits_never_wait(self, db_path, clock):
+        limiter = _limiter(db_path, clock)
+
+        assert limiter.acquire("openai", "gpt-test", tokens=10**6) == 0.0
+        assert limiter.state("openai", "gpt-test") is None
+
+    def test_rpm_paces_requests(self, db_path, clock):
+        limiter = _limiter(db_path, clock, default_rpm=2)
+
+        assert limiter.acquire("openai", "gpt-test") == 0.0
+        assert limiter.acquire("openai", "gpt-test") == 0.0
+        assert limiter.acquire("openai", "gpt-test") == pytest.approx(30.0)
+
+    def test_tpm_paces_by_tokens(self, db_path, clock):
+        limiter = _limiter(db_path, clock, default_tpm=1000)
+
+        limiter.acquire("openai", "gpt-test", tokens=800)
+        waited = limiter.acquire("openai", "gpt-test", tokens=600)
+
+        # 400 missing tokens at 1000/60 tokens per second
+        assert waited == pytest.approx(24.0)
+
+    def test_oversized_request_needs_only_full_bucket(self, db_path, clock):
+        limiter = _limiter(db_path, clock, default_tpm=1000)
+
+        assert limiter.acquire("openai", "gpt-test", tokens=5000) == 0.0
+        assert limiter.acquire("openai", "gpt-test", tokens=5000) == pytest.approx(60.0)
+
+    def test_keys_are_per_provider_and_model(self, db_path, clock):
+        limiter = _limiter(db_path, clock, default_rpm=1)
+
+        limiter.acquire("openai", "gpt-a")
+
+        assert limiter.try_acquire("openai", "gpt-b") == 0.0
+        assert limiter.try_acquire("claude", "gpt-a") == 0.0
+        assert limiter.try_acquire("openai", "gpt-a") > 0
+
+    def test_budget_shared_through_database(self, db_path, clock):
+        # Separate instances stand in for separate CLI processes on one machine
+        first = _limiter(db_path, clock, default_rpm=1)
+        second = _limiter(db_path, clock, default_rpm=1)
+
+        assert first.try_acquire("openai", "gpt-test") == 0.0
+        assert second.try_acquire("openai", "gpt-test") == pytest.approx(60.0)
+
+
+class TestHeaders:
+    def test_openai_headers_seed_limits(self, db_path, clock):
+        limiter = _limiter(db_path, clock)
+
+        limiter.update_from_headers("openai", "gpt-test", OPENAI_HEADERS)
+
+        state = limiter.state("openai", "gpt-test")
+        assert (state.rpm, state.tpm) == (500, 30000)
+        assert (state.requests, state.tokens) == (0, 29000)
+        assert limiter.try_acquire("openai", "gpt-test") == pytest.approx(60.0 / 500)
+
+    def test_anthropic_headers(self, db_path, clock):
+        limiter = _limiter(db_path, clock)
+
+        limiter.update_from_headers(
+            "claude",
+            "claude-test",
+            {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-requests-remaining": "49",
+                "anthropic-ratelimit-tokens-limit": "40000",
+                "anthropic-ratelimit-tokens-remaining": "1000",
+            },
+        )
+
+        state = limiter.state("claude", "claude-test")
+        assert (state.rpm, state.tpm, state.requests, state.tokens) == (50, 40000, 49, 1000)
+
+    def test_retry_after_blocks_key(self, db_path, clock):
+        limiter = _limiter(db_path, clock, default_rpm=100)
+
+        limiter.update_from_headers("openai", "gpt-test", {"retry-after": "20"}, status_code=429)
+
+        assert limiter.try_acquire("openai", "gpt-test") == pytest.approx(20.0)
+        clock.now += 20
+        assert limiter.try_acquire("openai", "gpt-test") == 0.0
+
+    def test_estimate_request_tokens(self):
+        body = {"model": "m", "max_output_tokens": 1000}
+        assert estimate_request_tokens(body, body_size=4000) == 2000
+
+    def test_inline_pdf_counts_flat_cost(self, db_path, clock):
+        pdf = "data:application/pdf;base64," + "A" * 10_000_000
+        body = {
+            "model": "gpt-test",
+            "input": [{"role": "user", "content": [{"type": "input_file", "file_data": pdf}]}],
+        }
+        content = json.dumps(body)
+        tokens = estimate_request_tokens(body, len(content))
+        assert tokens == (len(content) - len(pdf)) // 4 + INLINE_FILE_TOKENS
+
+        limiter = _limiter(db_path, clock)
+        headers = {**OPENAI_HEADERS, "x-ratelimit-remaining-requests": "500"}
+        limiter.update_from_headers("openai", "gpt-test", headers)
+        assert limiter.acquire("openai", "gpt-test", tokens) == 0.0
+        # The first PDF call must not drain the bucket for the next one
+        assert limiter.acquire("openai", "gpt-test", tokens) == 0.0
+
+
+class TestSDKHooks:
+    def test_openai_client_learns_and_paces(self, db_path, clock):
+        limiter = _limiter(db_path, clock)
+        with FilesAPIStubServer() as stub:
+            stub.response_headers = OPENAI_HEADERS
+            client = openai.OpenAI(
+                api_key="test",
+                base_url=stub.openai_base_url,
+                max_retries=0,
+                http_client=openai.DefaultHttpxClient(event_hooks=limiter.event_hooks("openai")),
+            )
+
+            client.responses.create(model="gpt-test", input="hi")
+            assert clock.sleeps == []
+            # The server reported no requests left, so the next call waits for a refill
+            client.responses.create(model="gpt-test", input="hi")
+
+        assert limiter.state("openai", "gpt-test").rpm == 500
+        assert sum(clock.sleeps) == pytest.approx(60.0 / 500)
+
+    def test_async_anthropic_client_records_429(self, db_path, clock):
+        limiter = _limiter(db_path, clock)
+
+        async def call(client):
+            with pytest.raises(anthropic.RateLimitError):
+                await client.messages.create(
+                    model="claude-test",
+                    max_tokens=10,
+                    messages=[{"role": "user", "content": "hi"}],
+                )
+
+        with FilesAPIStubServer() as stub:
+            stub.status_override = 429
+            stub.response_headers = {"retry-after": "15"}
+            client = anthropic.AsyncAnthropic(
+                api_key="test",
+                base_url=stub.anthropic_base_url,
+                max_retries=0,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    event_hooks=limiter.async_event_hooks("claude")
+                ),
+            )
+            asyncio.run(call(client))
+
+        assert limiter.try_acquire("claude", "claude-test") == pytest.approx(15.0)
+
+    def test_disabled_uses_sdk_default_client(self, db_path):
+        settings = LLMSettings(rate_limit_enabled=False, rate_limit_db=str(db_path))
+
+        assert get_rate_limiter(settings) is None
+        assert rate_limited_http_client(settings, "openai", openai.DefaultHttpxClient) is None
+        assert not db_path.exists()
+
+    def test_shared_limiter_per_database(self, db_path):
+        settings = LLMSettings(rate_limit_db=str(db_path))
+
+        assert get_rate_limiter(settings) is get_rate_limiter(settings)
+        assert db_path.exists()
@@ -0,0 +1,217 @@
+"""
+Unit tests for src/llm/replay_provider.py
+
+Tests recording through a wrapped provider, offline replay (ordering, misses,
+synthetic latency) and registration in get_llm_provider.
+"""
+
+import asyncio
+
+import pytest
+
+from src.config import LLMSettings
+from src.llm import get_llm_provider, replay_provider
+from src.llm.base import BaseLLMProvider, LLMError, LLMProviderError
+from src.llm.openai_provider import OpenAIProvider
+from src.llm.replay_provider import ReplayProvider, ReplayStore
+from src.pipeline.utils import _get_provider_name
+
+pytestmark = pytest.mark.unit
+
+SCHEMA = {"type": "object", "properties": {"answer": {"type": "string"}}}
+
+
+class CountingProvider(BaseLLMProvider):
+    """Real-provider stand-in returning a different response per call."""
+
+    def __init__(self, settings=None):
+        super().__init__(settings or LLMSettings())
+        self.calls = 0
+
+    def generate_text(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        return f"text:{prompt}:{self.calls}"
+
+    def generate_json_with_schema(
+        self, prompt, schema, system_prompt=None, schema_name=None, reasoning_effort=None, **kw
+    ):
+        self.calls += 1
+        return {"answer": prompt, "call": self.calls}
+
+    def generate_json_with_pdf(
+        self,
+        pdf_path,
+        schema,
+        system_prompt=None,
+        max_pages=None,
+        schema_name=None,
+        reasoning_effort=None,
+        **kw,
+    ):
+        self.calls += 1
+        return {"pdf": True, "call": self.calls, "usage": {"input_tokens": 10}}
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return LLMSettings(replay_dir=str(tmp_path / "replay"))
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4 paper")
+    return path
+
+
+def _recorder(settings):
+    inner = CountingProvider(settings)
+    return ReplayProvider(settings, inner, ReplayStore(settings.replay_dir)), inner
+
+
+def _player(settings):
+    return ReplayProvider(settings, store=ReplayStore(settings.replay_dir))
+
+
+class TestRecordReplay:
+    def test_replay_serves_recorded_responses(self, settings, pdf_file):
+        recorder, inner = _recorder(settings)
+        recorded = [
+            recorder.generate_text("hello", system_prompt="s"),
+            recorder.generate_json_with_schema("q", SCHEMA, schema_name="x"),
+            recorder.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=3, context="ctx"),
+        ]
+
+        player = _player(settings)
+        replayed = [
+            player.generate_text("hello", system_prompt="s"),
+            player.generate_json_with_schema("q", SCHEMA, schema_name="x"),
+            player.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=3, context="ctx"),
+        ]
+
+        assert replayed == recorded
+        assert inner.calls == 3
+
+    def test_repeated_requests_replay_in_order(self, settings):
+        recorder, _ = _recorder(settings)
+        first = recorder.generate_json_with_schema("same", SCHEMA)
+        second = recorder.generate_json_with_schema("same", SCHEMA)
+
+        player = _player(settings)
+
+        assert player.generate_json_with_schema("same", SCHEMA) == first
+        assert player.generate_json_with_schema("same", SCHEMA) == second
+        # More occurrences than recorded reuse the last response
+        assert player.generate_json_with_schema("same", SCHEMA) == second
+
+    def test_shared_store_continues_across_provider_instances(self, settings):
+        recorder, _ = _recorder(settings)
+        first = recorder.generate_text("same")
+        second = recorder.generate_text("same")
+
+        store = ReplayStore(settings.replay_dir)
+        assert ReplayProvider(settings, store=store).generate_text("same") == first
+        assert ReplayProvider(settings, store=store).generate_text("same") == second
+
+    def test_rerecording_replaces_old_responses(self, settings):
+        _recorder(settings)[0].generate_text("same")
+        recorder, inner = _recorder(settings)
+        inner.calls = 10
+        fresh = recorder.generate_text("same")
+
+        assert _player(settings).generate_text("same") == fresh == "text:same:11"
+
+    def test_request_changes_miss(self, settings, pdf_file):
+        recorder, _ = _recorder(settings)
+        recorder.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=3)
+
+        player = _player(settings)
+        with pytest.raises(LLMProviderError, match="No recorded json_with_pdf response"):
+            player.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=4)
+        with pytest.raises(LLMProviderError, match="No recorded json_with_pdf response"):
+            player.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=3, context="changed")
+        pdf_file.write_bytes(b"%PDF-1.4 revised")
+        with pytest.raises(LLMProviderError, match="LLM_REPLAY_MODE=record"):
+            player.generate_json_with_pdf(pdf_file, SCHEMA, max_pages=3)
+
+    def test_replayed_values_are_copies(self, settings):
+        _recorder(settings)[0].generate_json_with_schema("q", SCHEMA)
+        store = ReplayStore(settings.replay_dir)
+
+        result = ReplayProvider(settings, store=store).generate_json_with_schema("q", SCHEMA)
+        result["answer"] = "mutated"
+        store.reset()
+
+        assert ReplayProvider(settings, store=store).generate_json_with_schema("q", SCHEMA) == {
+            "answer": "q",
+            "call": 1,
+        }
+
+    def test_async_methods(self, settings, pdf_file):
+        recorder, _ = _recorder(settings)
+        recorded = asyncio.run(recorder.generate_json_with_pdf_async(pdf_file, SCHEMA))
+
+        replayed = asyncio.run(_player(settings).generate_json_with_pdf_async(pdf_file, SCHEMA))
+
+        assert replayed == recorded
+
+
+class TestLatency:
+    def _record_with_latency(self, settings, latency):
+        store = ReplayStore(settings.replay_dir)
+        key = ReplayProvider._text_key("hi", None, {})
+        store.record(key, "text", {"value": "hello", "latency_s": latency})
+
+    def test_recorded_latency_scaled(self, tmp_path, monkeypatch):
+        settings = LLMSettings(
+            replay_dir=str(tmp_path), replay_latency_scale=0.5, replay_latency_ms=100
+        )
+        self._record_with_latency(settings, 2.0)
+        sleeps = []
+        monkeypatch.setattr(replay_provider.time, "sleep", sleeps.append)
+
+        assert _player(settings).generate_text("hi") == "hello"
+        assert sleeps == [pytest.approx(1.1)]
+
+    def test_default_replay_is_instant(self, settings, monkeypatch):
+        self._record_with_latency(settings, 2.0)
+        sleeps = []
+        monkeypatch.setattr(replay_provider.time, "sleep", sleeps.append)
+
+        _player(settings).generate_text("hi")
+
+        assert sleeps == [0.0]
+
+
+class TestFactory:
+    def test_replay_mode(self, settings):
+        llm = get_llm_provider("replay", settings)
+
+        assert isinstance(llm, ReplayProvider)
+        assert llm.mode == "replay"
+        assert _get_provider_name(llm) == "replay"
+
+    def test_record_mode_wraps_real_provider(self, tmp_path):
+        settings = LLMSettings(
+            replay_dir=str(tmp_path),
+            replay_mode="record",
+            openai_api_key="test",
+            rate_limit_enabled=False,
+            response_cache_enabled=True,
+            response_cache_dir=str(tmp_path / "cache"),
+        )
+
+        llm = get_llm_provider("replay", settings)
+
+        assert llm.mode == "record"
+        assert _get_provider_name(llm) == "openai"
+        # The response cache wraps the recorded provider, not the recorder
+        assert isinstance(llm.wrapped.wrapped, OpenAIProvider)
+
+    def test_invalid_settings(self, tmp_path):
+        with pytest.raises(LLMError, match="replay mode"):
+            get_llm_provider("replay", LLMSettings(replay_mode="bogus"))
+        with pytest.raises(LLMError, match="real provider"):
+            get_llm_provider(
+                "replay", LLMSettings(replay_mode="record", replay_record_provider="replay")
+            )
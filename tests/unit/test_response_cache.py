@@ -0,0 +1,241 @@
+"""
+Unit tests for src/llm/response_cache.py
+
+Tests the content-addressed LLM response cache and the CachedLLMProvider wrapper.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from src.config import LLMSettings
+from src.llm.base import BaseLLMProvider, LLMProviderError
+from src.llm.response_cache import (
+    CachedLLMProvider,
+    ResponseCache,
+    get_response_cache,
+    make_cache_key,
+)
+from src.pipeline.utils import _get_provider_name
+
+pytestmark = pytest.mark.unit
+
+
+class FakeOpenAIProvider(BaseLLMProvider):
+    """Counting provider stub that returns a new dict per call."""
+
+    def __init__(self, settings=None, fail=False):
+        super().__init__(settings or LLMSettings())
+        self.calls = 0
+        self.fail = fail
+
+    def generate_text(self, prompt, system_prompt=None, **kwargs):
+        self.calls += 1
+        return f"text:{prompt}"
+
+    def generate_json_with_schema(
+        self, prompt, schema, system_prompt=None, schema_name=None, reasoning_effort=None, **kw
+    ):
+        self.calls += 1
+        if self.fail:
+            raise LLMProviderError("boom")
+        return {"answer": prompt, "call": self.calls}
+
+    def generate_json_with_pdf(
+        self,
+        pdf_path,
+        schema,
+        system_prompt=None,
+        max_pages=None,
+        schema_name=None,
+        reasoning_effort=None,
+        **kw,
+    ):
+        self.calls += 1
+        return {"pdf": str(pdf_path), "call": self.calls}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4 original")
+    return path
+
+
+class TestMakeCacheKey:
+    def test_order_independent(self):
+        schema_a = {"type": "object", "properties": {"a": {}, "b": {}}}
+        schema_b = {"properties": {"b": {}, "a": {}}, "type": "object"}
+        assert make_cache_key(schema=schema_a, model="m") == make_cache_key(
+            model="m", schema=schema_b
+        )
+
+    def test_any_component_changes_key(self):
+        base = {"model": "m", "temperature": 0.0, "reasoning_effort": "low", "prompt": "p"}
+        key = make_cache_key(**base)
+        for field, value in [
+            ("model", "m2"),
+            ("temperature", 0.5),
+            ("reasoning_effort", "high"),
+            ("prompt", "q"),
+        ]:
+            assert make_cache_key(**{**base, field: value}) != key
+
+
+class TestResponseCache:
+    def test_miss_then_hit(self, cache):
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, {"x": 1})
+        assert cache.get("ab" * 32) == {"x": 1}
+
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.writes == 1
+        assert stats.hit_rate == 0.5
+
+    def test_get_returns_independent_copy(self, cache):
+        cache.put("cd" * 32, {"nested": {"x": 1}})
+        first = cache.get("cd" * 32)
+        first["nested"]["x"] = 99
+        assert cache.get("cd" * 32) == {"nested": {"x": 1}}
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_age_seconds=60)
+        key = "ef" * 32
+        cache.put(key, {"x": 1})
+        entry = cache._entry_path(key)
+        # Rewrite with a timestamp older than max age
+        entry.write_text('{"created_at": %f, "kind": "", "value": {"x": 1}}' % (time.time() - 120))
+
+        assert cache.get(key) is None
+        assert not entry.exists()
+        assert cache.stats().expired == 1
+
+    def test_size_limit_evicts_oldest(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_size_bytes=300)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, {"payload": "x" * 100})
+            path = cache._entry_path(key)
+            os.utime(path, (1000 + i, 1000 + i))
+
+        cache.put("99" * 32, {"payload": "x" * 100})
+
+        assert cache.size_bytes() <= 300
+        assert not cache._entry_path(keys[0]).exists()
+        assert cache._entry_path("99" * 32).exists()
+        assert cache.stats().evictions >= 1
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        key = "aa" * 32
+        path = cache._entry_path(key)
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert cache.get(key) is None
+        assert not path.exists()
+
+    def test_clear(self, cache):
+        cache.put("aa" * 32, 1)
+        cache.put("bb" * 32, 2)
+        assert cache.clear() == 2
+        assert cache.get("aa" * 32) is None
+
+    def test_in_flight_temp_files_are_not_entries(self, cache):
+        cache.put("aa" * 32, 1)
+        temp = cache._entry_path("aa" * 32).parent / ".tmp-abc.json"
+        temp.write_text('{"partial"')
+
+        assert cache.size_bytes() == cache._entry_path("aa" * 32).stat().st_size
+        assert cache.clear() == 1
+        assert temp.exists()
+
+
+class TestCachedLLMProvider:
+    def test_json_with_schema_served_from_cache(self, cache):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        first = llm.generate_json_with_schema("p", {"type": "object"}, reasoning_effort="low")
+        second = llm.generate_json_with_schema("p", {"type": "object"}, reasoning_effort="low")
+
+        assert first == second == {"answer": "p", "call": 1}
+        assert inner.calls == 1
+        assert llm.cache_stats().hits == 1
+
+    def test_reasoning_effort_is_part_of_key(self, cache):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        llm.generate_json_with_schema("p", {}, reasoning_effort="low")
+        llm.generate_json_with_schema("p", {}, reasoning_effort="high")
+
+        assert inner.calls == 2
+
+    def test_pdf_key_uses_file_contents(self, cache, pdf_file):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        llm.generate_json_with_pdf(pdf_file, {}, system_prompt="s")
+        llm.generate_json_with_pdf(pdf_file, {}, system_prompt="s")
+        assert inner.calls == 1
+
+        pdf_file.write_bytes(b"%PDF-1.4 modified")
+        llm.generate_json_with_pdf(pdf_file, {}, system_prompt="s")
+        assert inner.calls == 2
+
+    def test_pdf_context_is_part_of_key(self, cache, pdf_file):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        llm.generate_json_with_pdf(pdf_file, {}, context="report 1")
+        llm.generate_json_with_pdf(pdf_file, {}, context="report 1")
+        llm.generate_json_with_pdf(pdf_file, {}, context="report 2")
+
+        assert inner.calls == 2
+
+    def test_text_generation_cached(self, cache):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        assert llm.generate_text("hi") == "text:hi"
+        assert llm.generate_text("hi") == "text:hi"
+        assert inner.calls == 1
+
+    def test_errors_are_not_cached(self, cache):
+        inner = FakeOpenAIProvider(fail=True)
+        llm = CachedLLMProvider(inner, cache)
+
+        for _ in range(2):
+            with pytest.raises(LLMProviderError):
+                llm.generate_json_with_schema("p", {})
+
+        assert inner.calls == 2
+        assert cache.stats().writes == 0
+
+    def test_async_methods_share_cache(self, cache):
+        inner = FakeOpenAIProvider()
+        llm = CachedLLMProvider(inner, cache)
+
+        llm.generate_json_with_schema("p", {})
+        result = asyncio.run(llm.generate_json_with_schema_async("p", {}))
+
+        assert result == {"answer": "p", "call": 1}
+        assert inner.calls == 1
+
+    def test_provider_name_unwraps(self, cache):
+        llm = CachedLLMProvider(FakeOpenAIProvider(), cache)
+        assert _get_provider_name(llm) == "openai"
+
+
+def test_get_response_cache_is_shared_per_dir(tmp_path):
+    settings = LLMSettings(response_cache_dir=str(tmp_path / "c"))
+    assert get_response_cache(settings) is get_response_cache(settings)
@@ -0,0 +1,268 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for per-step input manifests and run_full_pipeline(resume=True)."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.pipeline import orchestrator, run_manifest
+from src.pipeline.file_manager import PipelineFileManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def pdf_path(tmp_path, monkeypatch):
+    # PipelineFileManager writes to tmp/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    path = Path(tmp_path / "paper.pdf")
+    path.write_bytes(b"%PDF-1.4 dummy")
+    return path
+
+
+def _inputs(pdf_path, step="classification", upstream=None, options=None, publication_type=None):
+    return run_manifest.build_step_inputs(
+        step,
+        pdf_path,
+        "openai",
+        publication_type,
+        upstream or {},
+        options or {"max_pages": None},
+    )
+
+
+class TestManifest:
+    def test_unchanged_inputs_reuse_result(self, pdf_path):
+        fm = PipelineFileManager(pdf_path)
+        inputs = _inputs(pdf_path)
+        run_manifest.save_step_manifest(fm, "classification", inputs, {"publication_type": "x"})
+
+        result, reason = run_manifest.load_resumable_result(fm, "classification", inputs)
+
+        assert result == {"publication_type": "x"}
+        assert reason == "unchanged"
+
+    def test_no_manifest(self, pdf_path):
+        fm = PipelineFileManager(pdf_path)
+
+        result, reason = run_manifest.load_resumable_result(fm, "classification", _inputs(pdf_path))
+
+        assert result is None
+        assert reason == "no manifest"
+
+    def test_changed_pdf_invalidates(self, pdf_path):
+        fm = PipelineFileManager(pdf_path)
+        run_manifest.save_step_manifest(fm, "classification", _inputs(pdf_path), {"a": 1})
+
+        pdf_path.write_bytes(b"%PDF-1.4 different content")
+        result, reason = run_manifest.load_resumable_result(fm, "classification", _inputs(pdf_path))
+
+        assert result is None
+        assert reason == "changed: pdf"
+
+    def test_changed_prompt_invalidates(self, pdf_path, monkeypatch):
+        fm = PipelineFileManager(pdf_path)
+        inputs = _inputs(pdf_path, "podcast_generation")
+        run_manifest.save_step_manifest(fm, "podcast_generation", inputs, {"a": 1})
+
+        monkeypatch.setitem(
+            run_manifest._STEP_PROMPTS["podcast_generation"],
+            "podcast_generation",
+            lambda _: "edited prompt",
+        )
+        result, reason = run_manifest.load_resumable_result(
+            fm, "podcast_generation", _inputs(pdf_path, "podcast_generation")
+        )
+
+        assert result is None
+        assert reason == "changed: prompts"
+
+    def test_changed_model_and_upstream_listed(self, pdf_path, monkeypatch):
+        fm = PipelineFileManager(pdf_path)
+        stored = _inputs(pdf_path, upstream={"extraction": "a"})
+        run_manifest.save_step_manifest(fm, "classification", stored, {"a": 1})
+
+        settings = replace(run_manifest.llm_settings, openai_model="other-model")
+        monkeypatch.setattr(run_manifest, "llm_settings", settings)
+        result, reason = run_manifest.load_resumable_result(
+            fm, "classification", _inputs(pdf_path, upstream={"extraction": "b"})
+        )
+
+        assert result is None
+        assert reason == "changed: model, upstream"
+
+    def test_modified_result_snapshot_invalidates(self, pdf_path):
+        fm = PipelineFileManager(pdf_path)
+        inputs = _inputs(pdf_path)
+        run_manifest.save_step_manifest(fm, "classification", inputs, {"a": 1})
+
+        fm.get_filename("classification", status=run_manifest.RESUME_STATUS).write_text("{}")
+        result, reason = run_manifest.load_resumable_result(fm, "classification", inputs)
+
+        assert result is None
+        assert reason == "result modified"
+
+    def test_missing_prompt_recorded_as_none(self, pdf_path):
+        inputs = _inputs(pdf_path, "extraction", publication_type="no_such_type")
+
+        assert inputs["prompts"] == {"extraction": None}
+        assert inputs["schemas"] == {"no_such_type": None}
+
+    def test_output_digest_follows_result(self, pdf_path):
+        fm = PipelineFileManager(pdf_path)
+        assert run_manifest.output_digest(fm, "classification") is None
+
+        run_manifest.save_step_manifest(fm, "classification", _inputs(pdf_path), {"a": 1})
+        first = run_manifest.output_digest(fm, "classification")
+        run_manifest.save_step_manifest(fm, "classification", _inputs(pdf_path), {"a": 2})
+
+        assert first is not None
+        assert run_manifest.output_digest(fm, "classification") != first
+
+
+def _fake_results(step_name):
+    if step_name == orchestrator.STEP_CLASSIFICATION:
+        return {"publication_type": "interventional_trial"}
+    if step_name in (orchestrator.STEP_VALIDATION_CORRECTION, orchestrator.STEP_APPRAISAL):
+        return {"final_status": "passed"}
+    return {"step": step_name}
+
+
+def _install_fake_steps(monkeypatch):
+    """Fake every step implementation behind run_single_step; returns the executed steps."""
+    executed: list[str] = []
+
+    def fake_run_single_step(step_name, **kwargs):
+        executed.append(step_name)
+        return _fake_results(step_name)
+
+    monkeypatch.setattr(orchestrator, "_run_single_step", fake_run_single_step)
+    return executed
+
+
+class TestResume:
+    def test_resume_skips_unchanged_steps(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+        first = orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+        assert executed == orchestrator.ALL_PIPELINE_STEPS
+
+        events = []
+        executed.clear()
+        second = orchestrator.run_full_pipeline(
+            pdf_path=pdf_path,
+            llm_provider="openai",
+            resume=True,
+            progress_callback=lambda step, status, data: events.append((step, status, data)),
+        )
+
+        assert executed == []
+        assert second.keys() == first.keys()
+        assert second[orchestrator.STEP_CLASSIFICATION] == {
+            "publication_type": "interventional_trial"
+        }
+        assert (orchestrator.STEP_APPRAISAL, "skipped", {"reason": "resumed"}) in events
+
+    def test_changed_option_reruns_step_and_dependents(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+        executed.clear()
+        orchestrator.run_full_pipeline(
+            pdf_path=pdf_path, llm_provider="openai", resume=True, report_language="nl"
+        )
+
+        # The report language only affects the report; the podcast is reused
+        assert executed == [orchestrator.STEP_REPORT_GENERATION]
+
+    def test_rerun_step_invalidates_dependents(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+        def new_appraisal(step_name, **kwargs):
+            executed.append(step_name)
+            if step_name == orchestrator.STEP_APPRAISAL:
+                return {"final_status": "passed", "risk_of_bias": "low"}
+            return _fake_results(step_name)
+
+        monkeypatch.setattr(orchestrator, "_run_single_step", new_appraisal)
+        monkeypatch.setitem(
+            run_manifest._STEP_PROMPTS["appraisal"], "appraisal", lambda _: "edited prompt"
+        )
+        executed.clear()
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai", resume=True)
+
+        assert executed[0] == orchestrator.STEP_APPRAISAL
+        assert sorted(executed[1:]) == [
+            orchestrator.STEP_PODCAST_GENERATION,
+            orchestrator.STEP_REPORT_GENERATION,
+        ]
+
+    def test_identical_rerun_output_keeps_dependents(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+        monkeypatch.setitem(
+            run_manifest._STEP_PROMPTS["appraisal"], "appraisal", lambda _: "edited prompt"
+        )
+        executed.clear()
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai", resume=True)
+
+        # Upstream outputs are compared by content, so an unchanged appraisal stops here
+        assert executed == [orchestrator.STEP_APPRAISAL]
+
+    def test_failed_result_is_not_resumed(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+
+        def failing(step_name, **kwargs):
+            executed.append(step_name)
+            if step_name == orchestrator.STEP_PODCAST_GENERATION:
+                return {"final_status": "failed_llm_error"}
+            return _fake_results(step_name)
+
+        monkeypatch.setattr(orchestrator, "_run_single_step", failing)
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+        executed.clear()
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai", resume=True)
+
+        assert executed == [orchestrator.STEP_PODCAST_GENERATION]
+
+    def test_changed_loop_default_reruns_loop_step(self, monkeypatch, pdf_path):
+        executed = _install_fake_steps(monkeypatch)
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai")
+
+        stricter = replace(orchestrator.REPORT_THRESHOLDS, completeness_score=0.99)
+        monkeypatch.setitem(
+            orchestrator._DEFAULT_LOOP_THRESHOLDS, orchestrator.STEP_REPORT_GENERATION, stricter
+        )
+        executed.clear()
+        orchestrator.run_full_pipeline(pdf_path=pdf_path, llm_provider="openai", resume=True)
+
+        assert executed == [orchestrator.STEP_REPORT_GENERATION]
+
+
+class TestStepOptions:
+    def test_loop_options_record_effective_values(self):
+        defaults = orchestrator._step_options(orchestrator.STEP_APPRAISAL, None)
+
+        assert defaults["max_correction_iterations"] == 3
+        assert defaults["iterative_correction"] is True
+        assert defaults["quality_thresholds"]["evidence_support_score"] == 0.90
+        assert orchestrator._step_options(orchestrator.STEP_APPRAISAL, None, 3) == defaults
+        assert orchestrator._step_options(orchestrator.STEP_APPRAISAL, None, 5) != defaults
+
+    def test_report_records_iterative_flag(self):
+        iterative = orchestrator._step_options(orchestrator.STEP_REPORT_GENERATION, None)
+        single_pass = orchestrator._step_options(
+            orchestrator.STEP_REPORT_GENERATION, None, enable_iterative_correction=False
+        )
+
+        assert single_pass["iterative_correction"] is False
+        assert single_pass != iterative
+
+    def test_steps_without_loop_have_no_loop_options(self):
+        assert orchestrator._step_options(orchestrator.STEP_EXTRACTION, 10) == {"max_pages": 10}
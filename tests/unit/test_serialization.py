@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Tolboom Medical
+# Licensed under Prosperity Public License 3.0.0
+# Commercial use requires separate license - see LICENSE and COMMERCIAL_LICENSE.md
+
+"""Tests for the JSON serialization backend (src/serialization.py)."""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from src import serialization
+from src.pipeline.file_manager import PipelineFileManager
+
+pytestmark = pytest.mark.unit
+
+DATA = {
+    "title": "Effect of café au lait on β-blockers",
+    "n": 120,
+    "ratio": 0.25,
+    "arms": [{"name": "A", "events": None}, {"name": "B", "blinded": True}],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if not serialization.HAVE_ORJSON:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization, "HAVE_ORJSON", False)
+    return request.param
+
+
+def _pretty_artifacts(monkeypatch, enabled):
+    settings = replace(serialization.llm_settings, pretty_json_artifacts=enabled)
+    monkeypatch.setattr(serialization, "llm_settings", settings)
+
+
+class TestDumps:
+    def test_prompt_output_is_compact_and_unescaped(self, backend):
+        text = serialization.dumps_prompt(DATA)
+
+        assert "\n" not in text
+        assert ", " not in text and '": ' not in text
+        assert "café" in text and "β" in text
+        assert json.loads(text) == DATA
+
+    def test_backends_produce_identical_text(self, monkeypatch):
+        if not serialization.HAVE_ORJSON:
+            pytest.skip("orjson not installed")
+        fast = serialization.dumps(DATA), serialization.dumps(DATA, pretty=True)
+
+        monkeypatch.setattr(serialization, "HAVE_ORJSON", False)
+        slow = serialization.dumps(DATA), serialization.dumps(DATA, pretty=True)
+
+        assert fast == slow
+
+    def test_prompt_is_smaller_than_indented_json(self):
+        assert len(serialization.dumps_prompt(DATA)) < len(json.dumps(DATA, indent=2)) * 0.8
+
+    def test_artifacts_compact_by_default(self, backend, monkeypatch):
+        _pretty_artifacts(monkeypatch, False)
+
+        assert "\n" not in serialization.dumps_artifact(DATA)
+
+    def test_artifacts_pretty_with_debug_flag(self, backend, monkeypatch):
+        _pretty_artifacts(monkeypatch, True)
+
+        assert serialization.dumps_artifact(DATA) == json.dumps(DATA, indent=2, ensure_ascii=False)
+
+    def test_non_string_keys_and_big_integers(self, backend):
+        assert json.loads(serialization.dumps({1: "a"})) == {"1": "a"}
+        assert json.loads(serialization.dumps({"big": 2**70})) == {"big": 2**70}
+
+    def test_unserializable_value_raises_type_error(self, backend):
+        with pytest.raises(TypeError):
+            serialization.dumps({"value": object()})
+
+
+class TestLoads:
+    def test_round_trip_text_and_bytes(self, backend):
+        text = serialization.dumps(DATA)
+
+        assert serialization.loads(text) == DATA
+        assert serialization.loads(text.encode("utf-8")) == DATA
+
+    def test_invalid_json_raises_decode_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{not json")
+
+
+class TestArtifactFiles:
+    def test_save_json_follows_debug_flag(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "paper.pdf").write_bytes(b"%PDF-1.4 dummy")
+        fm = PipelineFileManager(tmp_path / "paper.pdf")
+
+        _pretty_artifacts(monkeypatch, False)
+        compact = fm.save_json(DATA, "extraction")
+        assert compact.read_text(encoding="utf-8").count("\n") == 0
+
+        _pretty_artifacts(monkeypatch, True)
+        pretty = fm.save_json(DATA, "extraction")
+        assert pretty.read_text(encoding="utf-8").count("\n") > 1
+        assert fm.load_json("extraction") == DATA
@@ -0,0 +1,316 @@
+"""
+Unit tests for src/tracing.py and the tracing hooks in providers and the loop runner.
+
+Covers span nesting and JSONL export, no-op behaviour without a trace, error
+status, token/cost accounting, price matching, the traced_llm_call decorator
+(outermost span wins, cache hits are not billed), per-step summaries and
+context propagation into worker threads, and the trace of run_full_pipeline().
+"""
+
+import asyncio
+import contextvars
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+
+import run_pipeline
+from src.llm.base import traced_llm_call
+from src.pipeline import orchestrator
+from src.pipeline.file_manager import PipelineFileManager
+from src.tracing import (
+    KIND_ITERATION,
+    KIND_LLM,
+    KIND_LOOP,
+    KIND_STEP,
+    STATUS_ERROR,
+    current_span,
+    estimate_cost_usd,
+    format_summary,
+    increment,
+    load_model_prices,
+    load_trace,
+    record_llm_usage,
+    span,
+    start_trace,
+    summarize_spans,
+    traced,
+)
+
+pytestmark = pytest.mark.unit
+
+PRICES = {"gpt-5.1": {"input": 1.0, "cached_input": 0.1, "output": 10.0}}
+
+
+class FakeProvider:
+    """Minimal provider exposing what traced_llm_call reads."""
+
+    trace_name = "fake"
+
+    def __init__(self, result=None, inner=None):
+        self.result = result if result is not None else {"ok": True}
+        self.inner = inner
+
+    @traced_llm_call
+    def generate_json_with_schema(self, prompt, schema, **kwargs):
+        if self.inner is not None:
+            return self.inner.generate_json_with_schema(prompt, schema, **kwargs)
+        record_llm_usage({"input_tokens": 1000, "output_tokens": 100}, "gpt-5.1")
+        return self.result
+
+    @traced_llm_call
+    async def generate_json_with_schema_async(self, prompt, schema, **kwargs):
+        record_llm_usage({"input_tokens": 10, "output_tokens": 1}, "gpt-5.1")
+        return self.result
+
+
+class TestSpans:
+    def test_nested_spans_written_as_jsonl(self, tmp_path):
+        trace_path = tmp_path / "trace.jsonl"
+
+        with start_trace("run-1", trace_path=trace_path):
+            with span("extraction", KIND_STEP) as step:
+                with span("generate_json_with_pdf", KIND_LLM, provider="openai") as call:
+                    call.set(model="gpt-5.1")
+
+        lines = load_trace(trace_path)
+        assert [line["name"] for line in lines] == ["generate_json_with_pdf", "extraction"]
+        assert lines[0]["parent_id"] == step.span_id
+        assert lines[1]["parent_id"] is None
+        assert lines[0]["attributes"] == {"provider": "openai", "model": "gpt-5.1"}
+        assert {line["run_id"] for line in lines} == {"run-1"}
+
+    def test_append_keeps_previous_spans(self, tmp_path):
+        trace_path = tmp_path / "trace.jsonl"
+        for run_id, append in (("first", False), ("second", True)):
+            with start_trace(run_id, trace_path=trace_path, append=append):
+                with span("classification", KIND_STEP):
+                    pass
+
+        assert [line["run_id"] for line in load_trace(trace_path)] == ["first", "second"]
+
+    def test_no_trace_is_a_no_op(self):
+        with span("extraction", KIND_STEP) as step:
+            step.set(ignored=True)
+            assert current_span() is None
+        increment("anything")
+
+        assert record_llm_usage({"input_tokens": 5}, "gpt-5.1") is None
+
+    def test_exception_marks_span_failed(self):
+        with start_trace("run") as tracer:
+            with pytest.raises(ValueError):
+                with span("render_report_to_pdf", "render"):
+                    raise ValueError("boom")
+
+        (failed,) = tracer.spans
+        assert failed.status == STATUS_ERROR
+        assert failed.error == "ValueError: boom"
+        assert current_span() is None
+
+    def test_traced_decorator_sync_and_async(self):
+        @traced("repair")
+        def repair(value):
+            return value + 1
+
+        @traced("render", name="render_async")
+        async def render():
+            return "done"
+
+        with start_trace("run") as tracer:
+            assert repair(1) == 2
+            assert asyncio.run(render()) == "done"
+
+        assert [(s.kind, s.name) for s in tracer.spans] == [
+            ("repair", "repair"),
+            ("render", "render_async"),
+        ]
+
+    def test_context_propagates_to_worker_threads(self):
+        with start_trace("run") as tracer:
+            with span("pipeline_step", KIND_STEP) as step:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    futures = [
+                        pool.submit(contextvars.copy_context().run, span_in_thread, n)
+                        for n in range(2)
+                    ]
+                    for future in futures:
+                        future.result()
+
+        children = [s for s in tracer.spans if s.kind == KIND_LLM]
+        assert len(children) == 2
+        assert {s.parent_id for s in children} == {step.span_id}
+
+
+def span_in_thread(n):
+    with span(f"call_{n}", KIND_LLM):
+        pass
+
+
+class TestUsageAndCost:
+    def test_record_llm_usage_sums_tokens_and_prices(self):
+        with start_trace("run", prices=PRICES) as tracer:
+            with span("generate_text", KIND_LLM) as call:
+                record_llm_usage({"input_tokens": 1_000_000, "cached_tokens": 500_000}, "gpt-5.1")
+                record_llm_usage({"output_tokens": 100_000})
+
+        assert call.attributes["input_tokens"] == 1_000_000
+        assert call.attributes["output_tokens"] == 100_000
+        # 500k uncached input at $1 + 500k cached at $0.10 + 100k output at $10
+        assert call.attributes["cost_usd"] == pytest.approx(0.5 + 0.05 + 1.0)
+        assert tracer.llm_usage()["cost_usd"] == pytest.approx(1.55)
+
+    def test_usage_outside_llm_span_is_ignored(self):
+        with start_trace("run") as tracer:
+            with span("extraction", KIND_STEP) as step:
+                record_llm_usage({"input_tokens": 10}, "gpt-5.1")
+
+        assert "input_tokens" not in step.attributes
+        assert tracer.llm_usage()["calls"] == 0
+
+    def test_price_matching_prefers_longest_key(self):
+        prices = {
+            "gpt-5": {"input": 1.0, "output": 1.0},
+            "gpt-5-mini": {"input": 0.1, "output": 0.1},
+        }
+        usage = {"input_tokens": 1_000_000}
+
+        assert estimate_cost_usd("gpt-5-mini-2025-08-07", usage, prices) == pytest.approx(0.1)
+        assert estimate_cost_usd("gpt-5-2025-08-07", usage, prices) == pytest.approx(1.0)
+        assert estimate_cost_usd("gpt-50", usage, prices) is None
+
+    def test_pricing_file_overrides_defaults(self, tmp_path):
+        pricing_file = tmp_path / "prices.json"
+        pricing_file.write_text(json.dumps({"gpt-5.5": {"input": 5.0, "output": 40.0}}))
+
+        prices = load_model_prices(pricing_file)
+
+        assert prices["gpt-5.5"]["output"] == 40.0
+        assert "gpt-5.1" in prices
+
+        pricing_file.write_text("[]")
+        with pytest.raises(ValueError):
+            load_model_prices(pricing_file)
+
+
+class TestTracedLLMCall:
+    def test_records_llm_span_with_usage(self):
+        with start_trace("run", prices=PRICES) as tracer:
+            FakeProvider().generate_json_with_schema("p", {}, schema_name="extraction")
+            asyncio.run(FakeProvider().generate_json_with_schema_async("p", {}))
+
+        sync_span, async_span = tracer.spans
+        assert sync_span.name == async_span.name == "generate_json_with_schema"
+        assert sync_span.attributes["provider"] == "fake"
+        assert sync_span.attributes["schema_name"] == "extraction"
+        assert sync_span.attributes["input_tokens"] == 1000
+        assert async_span.attributes["output_tokens"] == 1
+
+    def test_only_outermost_provider_records_a_span(self):
+        wrapper = FakeProvider(inner=FakeProvider())
+
+        with start_trace("run") as tracer:
+            wrapper.generate_json_with_schema("p", {})
+
+        (call,) = tracer.spans
+        assert call.attributes["input_tokens"] == 1000
+
+    def test_falls_back_to_result_usage_but_not_for_cache_hits(self):
+        class Replayed(FakeProvider):
+            @traced_llm_call
+            def generate_json_with_schema(self, prompt, schema, **kwargs):
+                if kwargs.get("cached"):
+                    current_span().set(response_cache="hit")
+                return {
+                    "usage": {"input_tokens": 7, "output_tokens": 3},
+                    "_metadata": {"model": "gpt-5.1"},
+                }
+
+        with start_trace("run", prices=PRICES) as tracer:
+            Replayed().generate_json_with_schema("p", {})
+            Replayed().generate_json_with_schema("p", {}, cached=True)
+
+        replayed, hit = tracer.spans
+        assert replayed.attributes["input_tokens"] == 7
+        assert replayed.attributes["model"] == "gpt-5.1"
+        assert "input_tokens" not in hit.attributes
+        assert hit.attributes["model"] == "gpt-5.1"
+
+
+class TestSummary:
+    def test_per_step_llm_totals(self, tmp_path):
+        trace_path = tmp_path / "trace.jsonl"
+        with start_trace("run", trace_path=trace_path, prices=PRICES) as tracer:
+            for step_name, calls in (("classification", 1), ("extraction", 2)):
+                with span(step_name, KIND_STEP):
+                    with span("validation_loop", KIND_LOOP):
+                        with span("iteration", KIND_ITERATION, iteration=0):
+                            for _ in range(calls):
+                                FakeProvider().generate_json_with_schema("p", {})
+            increment("llm.response_cache.hits", 2)
+
+        summary = tracer.summary()
+        steps = {step["name"]: step for step in summary["steps"]}
+        assert steps["classification"]["llm"]["calls"] == 1
+        assert steps["extraction"]["llm"]["calls"] == 2
+        assert steps["extraction"]["llm"]["input_tokens"] == 2000
+        assert summary["llm"]["calls"] == 3
+        assert summary["llm_by_model"]["gpt-5.1"]["calls"] == 3
+        assert summary["by_kind"][KIND_ITERATION]["count"] == 2
+        assert summary["counters"] == {"llm.response_cache.hits": 2}
+
+        from_disk = summarize_spans(load_trace(trace_path))
+        assert from_disk["steps"] == summary["steps"]
+        assert "extraction" in format_summary(from_disk)
+
+    def test_unpriced_models_are_listed(self):
+        with start_trace("run", prices={}) as tracer:
+            FakeProvider().generate_json_with_schema("p", {})
+
+        assert tracer.summary()["llm"]["unpriced_models"] == ["gpt-5.1"]
+
+
+class TestPipelineTrace:
+    @pytest.fixture
+    def pdf_path(self, tmp_path, monkeypatch):
+        # Artifacts go to ./tmp: keep them out of the repository
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(
+            orchestrator, "_run_single_step", lambda step_name, **kwargs: {"step": step_name}
+        )
+        path = tmp_path / "paper.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        return path
+
+    def _run(self, pdf_path):
+        return orchestrator.run_full_pipeline(
+            pdf_path=pdf_path, breakpoint_after_step=orchestrator.STEP_CLASSIFICATION
+        )
+
+    def test_summary_saved_without_trace_file_by_default(self, pdf_path):
+        self._run(pdf_path)
+
+        fm = PipelineFileManager(pdf_path)
+        assert fm.load_json("trace_summary")["steps"][0]["name"] == "classification"
+        assert not (fm.tmp_dir / "paper-trace.jsonl").exists()
+
+    def test_trace_file_is_opt_in(self, pdf_path, monkeypatch):
+        settings = replace(orchestrator.llm_settings, trace_file=True)
+        monkeypatch.setattr(orchestrator, "llm_settings", settings)
+
+        self._run(pdf_path)
+
+        trace = load_trace(PipelineFileManager(pdf_path).tmp_dir / "paper-trace.jsonl")
+        assert [s["name"] for s in trace if s["kind"] == KIND_STEP] == ["classification"]
+
+    def test_run_records_into_active_pipeline_trace(self, pdf_path, capsys):
+        with orchestrator.start_pipeline_trace(PipelineFileManager(pdf_path)) as tracer:
+            self._run(pdf_path)
+
+        assert tracer.trace_path is None
+        assert [s.name for s in tracer.spans if s.kind == KIND_STEP] == ["classification"]
+        run_pipeline.print_time_breakdown(tracer.summary(), tracer.trace_path)
+        output = capsys.readouterr().out
+        assert "Where the time went" in output
+        assert "Span trace" not in output
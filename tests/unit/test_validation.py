@@ -4,13 +4,21 @@ Unit tests for src/validation.py
 Tests validation logic for extracted data quality assurance.
 """
 
+import copy
+
+import jsonschema
 import pytest
 
+from src.schemas_loader import SCHEMA_MAPPING, load_schema
 from src.validation import (
     ValidationError,
     check_required_fields,
+    clear_validator_cache,
+    get_validator,
     validate_extraction_quality,
+    validate_instance,
     validate_with_schema,
+    warm_validator_cache,
 )
 
 pytestmark = pytest.mark.unit
@@ -93,6 +101,66 @@ class TestValidateWithSchema:
         assert errors == []
 
 
+class TestValidatorCache:
+    """Test the compiled-validator cache shared by all schema validation."""
+
+    SCHEMA = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}},
+        "required": ["name"],
+    }
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        clear_validator_cache()
+        yield
+        clear_validator_cache()
+
+    def test_validator_built_once_per_schema(self):
+        """Test the same and equal schemas share one validator."""
+        validator = get_validator(self.SCHEMA)
+
+        assert get_validator(self.SCHEMA) is validator
+        assert get_validator(copy.deepcopy(self.SCHEMA)) is validator
+        assert get_validator({**self.SCHEMA, "required": []}) is not validator
+
+    def test_draft_follows_schema_declaration(self):
+        """Test the validator class follows $schema, defaulting to Draft 2020-12."""
+        draft7 = {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}
+
+        assert isinstance(get_validator(draft7), jsonschema.Draft7Validator)
+        assert isinstance(get_validator(self.SCHEMA), jsonschema.Draft202012Validator)
+
+    def test_validate_instance_matches_jsonschema_validate(self):
+        """Test validate_instance raises the same best-match error as jsonschema.validate."""
+        data = {"age": -1}
+
+        with pytest.raises(jsonschema.ValidationError) as expected:
+            jsonschema.validate(data, self.SCHEMA)
+        with pytest.raises(jsonschema.ValidationError) as actual:
+            validate_instance(data, self.SCHEMA)
+
+        assert actual.value.message == expected.value.message
+        validate_instance({"name": "Jane", "age": 3}, self.SCHEMA)
+
+    def test_invalid_schema_rejected(self):
+        """Test an invalid schema raises SchemaError and is reported by validate_with_schema."""
+        bad_schema = {"type": "not-a-type"}
+
+        with pytest.raises(jsonschema.SchemaError):
+            get_validator(bad_schema)
+        is_valid, errors = validate_with_schema({}, bad_schema, strict=False)
+        assert not is_valid
+        assert errors[0].startswith("Invalid schema")
+
+    def test_warm_up_compiles_all_pipeline_schemas(self):
+        """Test warm-up builds a validator for every SCHEMA_MAPPING entry."""
+        assert warm_validator_cache() == len(SCHEMA_MAPPING)
+
+        schema = load_schema("classification")
+        assert get_validator(schema) is get_validator(copy.deepcopy(schema))
+
+
 class TestCheckRequiredFields:
     """Test the check_required_fields() function."""
 
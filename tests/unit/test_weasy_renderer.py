@@ -8,6 +8,7 @@ Unit tests for WeasyPrint renderer fixes.
 Tests cover:
 - Figure generation integration
 - Error handling during figure generation
+- Warmed fonts/CSS and the batch render service
 """
 
 from unittest.mock import MagicMock, patch
@@ -15,7 +16,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.rendering.figure_generator import FigureGenerationError
-from src.rendering.weasy_renderer import WeasyRendererError, render_report_with_weasyprint
+from src.rendering.weasy_renderer import (
+    REPORT_CSS,
+    WeasyRendererError,
+    WeasyRenderService,
+    _import_weasyprint,
+    close_render_services,
+    get_render_service,
+    render_report_to_html,
+    render_report_with_weasyprint,
+    render_reports_with_weasyprint,
+)
 
 
 class TestWeasyPrintFigures:
@@ -46,18 +57,19 @@ class TestWeasyPrintFigures:
         # Mock dependencies
         with (
             patch("src.rendering.weasy_renderer._import_weasyprint") as mock_import,
-            patch("src.rendering.weasy_renderer.generate_figure") as mock_gen_fig,
+            patch("src.rendering.weasy_renderer.generate_figures") as mock_gen_figs,
         ):
             # Setup mocks
             mock_html_cls = MagicMock()
             mock_import.return_value = mock_html_cls
-            mock_gen_fig.return_value = tmp_path / "figures" / "fig1.png"
+            mock_gen_figs.return_value = [tmp_path / "figures" / "fig1.png"]
 
             # Execute
             render_report_with_weasyprint(mock_report, tmp_path)
 
-            # Verify generate_figure was called
-            mock_gen_fig.assert_called_once()
+            # Verify the figure block was passed to generate_figures
+            mock_gen_figs.assert_called_once()
+            assert mock_gen_figs.call_args.args[0] == [mock_report["sections"][0]["blocks"][0]]
 
             # Verify block file path was updated
             block = mock_report["sections"][0]["blocks"][0]
@@ -68,13 +80,13 @@ class TestWeasyPrintFigures:
 
         with (
             patch("src.rendering.weasy_renderer._import_weasyprint") as mock_import,
-            patch("src.rendering.weasy_renderer.generate_figure") as mock_gen_fig,
+            patch("src.rendering.weasy_renderer.generate_figures") as mock_gen_figs,
             patch("builtins.print") as mock_print,
         ):
             # Setup mocks
             mock_html_cls = MagicMock()
             mock_import.return_value = mock_html_cls
-            mock_gen_fig.side_effect = FigureGenerationError("Generation failed")
+            mock_gen_figs.return_value = [FigureGenerationError("Generation failed")]
 
             # Execute - should not raise exception
             try:
@@ -84,8 +96,9 @@ class TestWeasyPrintFigures:
                 # but we want to ensure generate_figure was called and error logged
                 pass
 
-            # Verify generate_figure was called
-            mock_gen_fig.assert_called_once()
+            # Verify the figure block was passed to generate_figures
+            mock_gen_figs.assert_called_once()
+            assert mock_gen_figs.call_args.args[0] == [mock_report["sections"][0]["blocks"][0]]
 
             # Verify error was logged
             mock_print.assert_any_call("Failed to generate figure: Generation failed")
@@ -98,12 +111,111 @@ class TestWeasyPrintFigures:
 
         with (
             patch("src.rendering.weasy_renderer._import_weasyprint") as mock_import,
-            patch("src.rendering.weasy_renderer.generate_figure") as mock_gen_fig,
+            patch("src.rendering.weasy_renderer.generate_figures") as mock_gen_figs,
         ):
             mock_html_cls = MagicMock()
             mock_import.return_value = mock_html_cls
 
             render_report_with_weasyprint(mock_report, tmp_path)
 
-            # Verify generate_figure was NOT called
-            mock_gen_fig.assert_not_called()
+            # Verify no figure was passed to generate_figures
+            assert all(call.args[0] == [] for call in mock_gen_figs.call_args_list)
+
+
+@pytest.fixture
+def fake_weasyprint(monkeypatch):
+    """Stand-in WeasyPrint module; the process-wide warmed state starts empty."""
+    module = MagicMock()
+    module.HTML.return_value.write_pdf.return_value = b"%PDF-fake"
+    monkeypatch.setattr("src.rendering.weasy_renderer._warm", None)
+    monkeypatch.setattr("src.rendering.weasy_renderer._import_weasyprint", lambda: module)
+    return module
+
+
+def _report(title, blocks=None):
+    return {
+        "metadata": {"title": title},
+        "sections": [{"title": "Summary", "blocks": blocks or []}],
+    }
+
+
+class TestWeasyRenderService:
+    """Warmed font configuration and stylesheet, batch rendering."""
+
+    def test_fonts_and_css_are_prepared_once(self, tmp_path, fake_weasyprint):
+        render_report_with_weasyprint(_report("A"), tmp_path / "a")
+        render_report_with_weasyprint(_report("B"), tmp_path / "b")
+
+        fake_weasyprint.text.fonts.FontConfiguration.assert_called_once_with()
+        fake_weasyprint.CSS.assert_called_once()
+        assert fake_weasyprint.CSS.call_args.kwargs["string"] == REPORT_CSS
+        assert fake_weasyprint.HTML.call_count == 2
+        write_kwargs = fake_weasyprint.HTML.return_value.write_pdf.call_args.kwargs
+        assert write_kwargs["stylesheets"] == [fake_weasyprint.CSS.return_value]
+        assert write_kwargs["font_config"] is fake_weasyprint.text.fonts.FontConfiguration()
+
+    def test_pdf_html_leaves_css_to_the_stylesheet(self, tmp_path, fake_weasyprint):
+        result = render_report_with_weasyprint(_report("A"), tmp_path)
+
+        # report.html stays standalone; the PDF input relies on the parsed REPORT_CSS
+        assert "<style>" in result["html"].read_text()
+        pdf_html = fake_weasyprint.HTML.call_args.kwargs["string"]
+        assert "<style>" not in pdf_html
+        assert pdf_html == render_report_to_html(_report("A"), inline_css=False)
+
+    def test_in_process_service_returns_pdf_bytes(self, tmp_path, fake_weasyprint):
+        with WeasyRenderService(workers=1) as service:
+            assert service.render("<p>x</p>", str(tmp_path)) == b"%PDF-fake"
+
+            fake_weasyprint.HTML.return_value.write_pdf.side_effect = ValueError("bad css")
+            with pytest.raises(WeasyRendererError, match="bad css"):
+                service.render("<p>x</p>", str(tmp_path))
+
+    def test_batch_writes_pdfs_and_isolates_failures(self, tmp_path, fake_weasyprint):
+        # Figure generation fails, so the block has no file and HTML rendering raises
+        broken = _report("B", blocks=[{"type": "figure", "figure_kind": "forest"}])
+        jobs = [
+            (_report("A"), tmp_path / "a"),
+            (broken, tmp_path / "b"),
+            (_report("C"), tmp_path / "c"),
+        ]
+
+        with patch(
+            "src.rendering.weasy_renderer.generate_figures",
+            side_effect=lambda blocks, _: [FigureGenerationError("no data")] * len(blocks),
+        ):
+            results = render_reports_with_weasyprint(jobs, workers=1)
+
+        assert isinstance(results[1], WeasyRendererError)
+        for index, name in ((0, "a"), (2, "c")):
+            assert results[index]["pdf"] == tmp_path / name / "report.pdf"
+            assert results[index]["pdf"].read_bytes() == b"%PDF-fake"
+            assert results[index]["html"].exists()
+
+    def test_batch_service_outlives_the_call(self, tmp_path, fake_weasyprint):
+        close_render_services()
+        render_reports_with_weasyprint([(_report("A"), tmp_path / "a")], workers=1)
+        service = get_render_service(1)
+
+        render_reports_with_weasyprint([(_report("B"), tmp_path / "b")], workers=1)
+
+        assert get_render_service(1) is service
+        close_render_services()
+        assert get_render_service(1) is not service
+        close_render_services()
+
+    def test_worker_processes_report_errors_per_document(self, tmp_path):
+        # Spawned workers import the real WeasyPrint; without it (or its system
+        # libraries) every document fails with the friendly error, nothing hangs
+        try:
+            _import_weasyprint()
+        except WeasyRendererError:
+            pass
+        else:
+            pytest.skip("WeasyPrint works here; error path not exercised")
+
+        with WeasyRenderService(workers=2) as service:
+            futures = [service.submit("<p>x</p>", str(tmp_path)) for _ in range(3)]
+            for future in futures:
+                with pytest.raises(WeasyRendererError, match="not installed"):
+                    future.result()